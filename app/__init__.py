@@ -21,32 +21,14 @@ def create_app():
         eventos_logger.error(f"Erro ao inicializar gerenciador de autenticação: {e}")
         app.config['AUTH_MANAGER'] = None
     
-    # Inicializa gerenciador de histórico
-    try:
-        from .utils.GerenciadorHistorico import GerenciadorHistorico
-        app.config['GERENCIADOR_HISTORICO'] = GerenciadorHistorico.get_instance()
-        eventos_logger.info("Gerenciador de histórico iniciado")
-    except Exception as e:
-        eventos_logger.error(f"Erro ao inicializar gerenciador de histórico: {e}")
-        app.config['GERENCIADOR_HISTORICO'] = None
-    
-    # Inicializa gerenciador de feriados
-    try:
-        from .utils.GerenciadorFeriados import GerenciadorFeriados
-        app.config['GERENCIADOR_FERIADOS'] = GerenciadorFeriados.get_instance()
-        eventos_logger.info("Gerenciador de feriados iniciado")
-    except Exception as e:
-        eventos_logger.error(f"Erro ao inicializar gerenciador de feriados: {e}")
-        app.config['GERENCIADOR_FERIADOS'] = None
-    
-    # Inicializa gerenciador de eventos
-    try:
-        from .utils.GerenciadorEventos import GerenciadorEventos
-        app.config['GERENCIADOR_EVENTOS'] = GerenciadorEventos.get_instance()
-        eventos_logger.info("Gerenciador de eventos iniciado")
-    except Exception as e:
-        eventos_logger.error(f"Erro ao inicializar gerenciador de eventos: {e}")
-        app.config['GERENCIADOR_EVENTOS'] = None
+    # Serviços compartilhados: cada conjunto de dados é carregado uma vez e
+    # todos os componentes recebem os mesmos gerenciadores
+    from .utils.ServicosAplicacao import ServicosAplicacao
+    servicos = ServicosAplicacao.montar(eventos_logger)
+    app.config['SERVICOS'] = servicos
+    app.config['GERENCIADOR_HISTORICO'] = servicos.historico
+    app.config['GERENCIADOR_FERIADOS'] = servicos.feriados
+    app.config['GERENCIADOR_EVENTOS'] = servicos.eventos
     
     # Inicializa integração CLP Plenário/Feriados
     try:
@@ -79,10 +61,48 @@ def create_app():
         eventos_logger.error(f"Erro ao inicializar integração CLP Auditório: {e}")
         app.config['INTEGRACAO_CLP_AUDITORIO'] = None
     
+    # Registro de controladores CLP (um sincronizador por CLP habilitado)
+    try:
+        from .utils.RegistroControladoresCLP import RegistroControladoresCLP
+        registro_clp = RegistroControladoresCLP.get_instance()
+        registro_clp.vincular_gerenciadores(app.config['GERENCIADOR_FERIADOS'], app.config['GERENCIADOR_EVENTOS'])
+        app.config['REGISTRO_CLP'] = registro_clp
+        eventos_logger.info(f"Registro de CLPs iniciado: {registro_clp.chaves()}")
+    except Exception as e:
+        eventos_logger.error(f"Erro ao inicializar registro de CLPs: {e}")
+        app.config['REGISTRO_CLP'] = None
+    
+    # Eleição de líder: com vários processos, só o líder executa as tarefas em segundo plano
+    try:
+        from .utils.LiderancaProcessos import LiderancaProcessos
+        lideranca = LiderancaProcessos.get_instance()
+        # Antes de cada tarefa, o líder relê os dados gravados pelos seguidores
+        lideranca.antes_de_executar(servicos.recarregar_alterados)
+        lideranca.iniciar()
+        eventos_logger.info(f"Eleição de líder iniciada (líder: {lideranca.eh_lider})")
+    except Exception as e:
+        eventos_logger.error(f"Erro ao iniciar eleição de líder: {e}")
+    
+    if app.config['REGISTRO_CLP']:
+        # Inicia monitores de conectividade dos CLPs (status servido a partir do cache)
+        for chave, sincronizador in app.config['REGISTRO_CLP'].sincronizadores().items():
+            try:
+                sincronizador.monitor_saude.iniciar()
+            except Exception as e:
+                eventos_logger.error(f"Erro ao iniciar monitor de conectividade do CLP '{chave}': {e}")
+        
+        # Inicializa fila de autosync CLP (retoma sincronizações pendentes)
+        try:
+            from .utils.AutoSyncCLP import AutoSyncCLP
+            AutoSyncCLP.get_instance().iniciar(app.config['REGISTRO_CLP'].sincronizadores())
+            eventos_logger.info("Fila de autosync CLP iniciada")
+        except Exception as e:
+            eventos_logger.error(f"Erro ao inicializar fila de autosync CLP: {e}")
+    
     # Inicializa agendador CLP
     try:
         from .utils.AgendadorCLP import AgendadorCLP
-        agendador = AgendadorCLP.get_instance()
+        agendador = AgendadorCLP.get_instance(servicos.sincronizador_tce)
         if app.config['GERENCIADOR_FERIADOS'] and app.config['GERENCIADOR_EVENTOS']:
             agendador.inicializar_gerenciadores(
                 app.config['GERENCIADOR_FERIADOS'],
@@ -95,12 +115,28 @@ def create_app():
     except Exception as e:
         eventos_logger.error(f"Erro ao inicializar agendador CLP: {e}")
     
+    # Retenção diária dos históricos (execuções do agendador, alterações, notificações)
+    try:
+        from .utils.retencao_historico import agendar_retencao
+        agendar_retencao()
+        eventos_logger.info("Retenção de históricos agendada")
+    except Exception as e:
+        eventos_logger.error(f"Erro ao agendar retenção de históricos: {e}")
+    
     # Inicializa sistema de notificações de eventos
     try:
-        from .utils.GerenciadorNotificacaoEventos import GerenciadorNotificacaoEventos
-        gerenciador_notificacao = GerenciadorNotificacaoEventos.get_instance()
+        gerenciador_notificacao = servicos.notificacoes
+        if gerenciador_notificacao is None:
+            raise RuntimeError("gerenciador de notificações de eventos indisponível")
         gerenciador_notificacao.iniciar_scheduler_lembretes()
         eventos_logger.info("Sistema de notificações de eventos iniciado (lembretes agendados)")
+        from .utils.FilaNotificacoes import FilaNotificacoes
+        FilaNotificacoes.get_instance().iniciar()
+        if gerenciador_notificacao.notificacao_eventos:
+            from .utils.DespachanteNotificacoes import DespachanteNotificacoes
+            DespachanteNotificacoes.get_instance().iniciar(gerenciador_notificacao.notificacao_eventos.transmitir)
+            from .utils.AcompanhamentoEntregas import AcompanhamentoEntregas
+            AcompanhamentoEntregas.get_instance().iniciar()
     except Exception as e:
         eventos_logger.error(f"Erro ao inicializar sistema de notificações: {e}")
 
@@ -139,6 +175,7 @@ def create_app():
     from .routes.api_auth import api_auth_bp
     from .routes.api_historico import api_historico_bp
     from .routes.api_notificacoes import api_notificacoes_bp
+    from .routes.api_agendador import api_agendador_bp
     from .routes.api_public import api_public_bp
     from .routes.web import web_bp
     
@@ -155,6 +192,7 @@ def create_app():
     app.register_blueprint(api_historico_bp, url_prefix=f'{ROUTES_PREFIX}/api')
     app.register_blueprint(api_notificacoes_bp, url_prefix=f'{ROUTES_PREFIX}/api')
     eventos_logger.info(f"Blueprint api_notificacoes registrado com url_prefix: {ROUTES_PREFIX}/api")
+    app.register_blueprint(api_agendador_bp, url_prefix=f'{ROUTES_PREFIX}/api')
     
     # API Pública (sem autenticação)
     app.register_blueprint(api_public_bp, url_prefix=f'{ROUTES_PREFIX}/api')
@@ -165,6 +203,11 @@ def create_app():
     # Rota de status da API
     @app.route(f'{ROUTES_PREFIX}/api/status')
     def api_status():
+        from .utils.MetricasSincronizacao import MetricasSincronizacao
+        from .utils.LiderancaProcessos import LiderancaProcessos
+        from .utils.FilaNotificacoes import FilaNotificacoes
+        from .utils.DespachanteNotificacoes import DespachanteNotificacoes
+        from .utils.AcompanhamentoEntregas import AcompanhamentoEntregas
         try:
             from .utils.AgendadorCLP import AgendadorCLP
             agendador_status = AgendadorCLP.get_instance().status()
@@ -186,9 +229,20 @@ def create_app():
                 'habilitada': agendador_status.get('status_tce', {}).get('SYNC_ENABLED', False),
                 'proximo_horario': agendador_status.get('proximo_horario_tce'),
                 'agendador_ativo': agendador_status.get('executando', False)
-            }
+            },
+            'lideranca': LiderancaProcessos.get_instance().status(),
+            'notificacoes': FilaNotificacoes.get_instance().status(),
+            'despachante_notificacoes': DespachanteNotificacoes.get_instance().status(),
+            'acompanhamento_entregas': AcompanhamentoEntregas.get_instance().status(),
+            'metricas_sincronizacao': MetricasSincronizacao.get_instance().resumo_compacto()
         })
     
+    # Métricas detalhadas das sincronizações (durações por fase, histogramas, taxa de sucesso)
+    @app.route(f'{ROUTES_PREFIX}/api/metricas')
+    def api_metricas():
+        from .utils.MetricasSincronizacao import MetricasSincronizacao
+        return jsonify(MetricasSincronizacao.get_instance().resumo_geral())
+    
     # Rota de debug para listar todas as rotas (somente em dev)
     @app.route(f'{ROUTES_PREFIX}/api/debug/routes')
     def debug_routes():
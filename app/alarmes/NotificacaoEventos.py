@@ -2,10 +2,8 @@ import logging
 from datetime import datetime
 from app.alarmes.ClassesSistema import ConfigNotificacao
 from app.utils.GerenciadorFeriados import GerenciadorFeriados
-from app.utils.GerenciadorHistoricoNotificacoes import GerenciadorHistoricoNotificacoes
+from app.utils.tempo_minutos import minutos_do_dia, para_minutos
 import requests
-import threading
-import time
 from app.config import WHATSAPP_API
 import urllib3
 
@@ -29,16 +27,19 @@ class NotificacaoEventos:
     def __init__(
         self,
         config_notificacao: ConfigNotificacao,
+        gerenciador_feriados: GerenciadorFeriados = None,
     ):
         """
         Construtor da classe NotificacaoEventos.
 
         Args:
             config_notificacao (ConfigNotificacao): Objeto com configurações de notificação.
+            gerenciador_feriados (GerenciadorFeriados): Gerenciador compartilhado da aplicação
+                (padrão: a instância única, sem recarregar feriados.json).
         """
         self.config_notificacao = config_notificacao
-        self.gerenciador_feriados = GerenciadorFeriados()
-        self.historico_notificacoes = GerenciadorHistoricoNotificacoes.get_instance()
+        self.gerenciador_feriados = (gerenciador_feriados if gerenciador_feriados is not None
+                                     else GerenciadorFeriados.get_instance())
     # A lista de técnicos e verificação de disponibilidade local foram removidas;
     # o filtro por disponibilidade é realizado pela própria API externa via parâmetro.
 
@@ -87,9 +88,9 @@ class NotificacaoEventos:
                 return False
             horario_inicio_str, horario_fim_str = self.config_notificacao.horario_dias_semana
 
-        horario_inicio = datetime.strptime(horario_inicio_str, '%H:%M').time()
-        horario_fim = datetime.strptime(horario_fim_str, '%H:%M').time()
-        now_time = agora.time()
+        horario_inicio = para_minutos(horario_inicio_str)
+        horario_fim = para_minutos(horario_fim_str)
+        now_time = minutos_do_dia(agora)
 
         if horario_inicio <= horario_fim:
             dentro_horario = horario_inicio <= now_time <= horario_fim
@@ -230,6 +231,61 @@ class NotificacaoEventos:
             apenas_disponiveis=True
         )
 
+    def notificar_lote_eventos(self, criados: list, alterados: list, removidos: list,
+                               origem: str = 'Sincronização automática') -> None:
+        """
+        Notifica técnicos com um único resumo de várias alterações aplicadas de
+        uma vez (ex.: sincronização da pauta do TCE), em vez de uma mensagem
+        por evento.
+        
+        Args:
+            criados (list): Eventos criados.
+            alterados (list): Pares (evento_anterior, evento_atual).
+            removidos (list): Eventos removidos.
+            origem (str): Descrição de quem aplicou as alterações.
+        """
+        if not (criados or alterados or removidos):
+            return
+
+        agora = datetime.now()
+        if not self.verificar_horario_data_alarme(agora):
+            logger.info("Fora do horário de notificação para alterações em lote.")
+            return
+
+        def linha(ev):
+            return (f"• {ev['dia']:02d}/{ev['mes']:02d}/{ev['ano']} "
+                    f"{ev.get('hora_inicio','--:--')}–{ev.get('hora_fim','--:--')} - "
+                    f"{ev.get('nome','')} ({ev.get('local','')})")
+
+        def ordenar(eventos):
+            return sorted(eventos, key=lambda ev: (ev['ano'], ev['mes'], ev['dia'], ev.get('hora_inicio', '')))
+
+        secoes = []
+        if criados:
+            secoes.append("🗓️ *Novos eventos:*\n" + "\n".join(linha(ev) for ev in ordenar(criados)))
+        if alterados:
+            secoes.append("🔄 *Eventos atualizados:*\n" + "\n".join(linha(ev) for ev in ordenar([a for _, a in alterados])))
+        if removidos:
+            secoes.append("❌ *Eventos cancelados:*\n" + "\n".join(linha(ev) for ev in ordenar(removidos)))
+
+        mensagem = (
+            f"📢 *ALTERAÇÕES NA AGENDA DE EVENTOS*\n\n"
+            f"ℹ️ {origem}: {len(criados)} novo(s), {len(alterados)} atualizado(s), "
+            f"{len(removidos)} cancelado(s).\n\n"
+            + "\n\n".join(secoes)
+        )
+
+        locais = sorted({(ev.get('local') or '').strip() for ev in
+                         list(criados) + [a for _, a in alterados] + list(removidos)} - {''})
+        assunto_dinamico = (f"TCE-GO: Aviso de Eventos - {', '.join(locais)} (Resumo)" if locais
+                            else "TCE-GO: Aviso de Eventos - Resumo")
+
+        self.enviar_notificacao_funcao_eventos(
+            assunto=assunto_dinamico,
+            mensagem=mensagem,
+            apenas_disponiveis=True
+        )
+
     def notificar_lembrete_evento(self, evento_dados: dict) -> None:
         """
         Envia lembrete do evento um dia antes via WhatsApp (função EVENTOS).
@@ -310,10 +366,11 @@ class NotificacaoEventos:
 
     # Mantemos opcionalmente o envio via WhatsApp por função (API externa),
     # mas o fluxo principal usa e-mail por função.
-
-    # Variáveis para controlar o intervalo entre chamadas (mantido para evitar flood)
-    _tempo_ultima_chamada_whatsapp = None
-    _lock_api_whatsapp = threading.Lock()
+    #
+    # Os métodos enviar_* apenas gravam a intenção na saída persistente
+    # (SaidaNotificacoes); a chamada à API é feita por transmitir(), a partir do
+    # DespachanteNotificacoes, com novas tentativas em backoff exponencial e
+    # respeitando o limite de taxa de cada endpoint (LimitadorTaxa).
 
     def enviar_whatsapp_por_funcao(self, mensagem: str) -> None:
         """
@@ -323,127 +380,7 @@ class NotificacaoEventos:
         Args:
             mensagem (str): Texto a ser enviado (pode conter \n para quebras de linha).
         """
-        TEMPO_ATRASO_API = 2  # pequena contenção para evitar floods
-        NUM_MAX_TENTATIVAS = 1  # apenas uma tentativa imediata
-
-        url = f"{WHATSAPP_API['HOST']}/helpdeskmonitor/api/whatsapp/send-by-function"
-        headers = {
-            'Authorization': f"Bearer {WHATSAPP_API['TOKEN']}",
-            'Content-Type': 'application/json'
-        }
-
-        payload = {
-            'funcao': 'EVENTOS',
-            'mensagem': mensagem,
-            'origem': 'EventosFeriados'
-        }
-        
-        with self._lock_api_whatsapp:
-            now = datetime.now()
-            if self._tempo_ultima_chamada_whatsapp is not None:
-                elapsed = (now - self._tempo_ultima_chamada_whatsapp).total_seconds()
-                if elapsed < TEMPO_ATRASO_API:
-                    time.sleep(TEMPO_ATRASO_API - elapsed)
-
-            try:
-                inicio_req = datetime.now()
-                req_id = f"WAFUNC-{int(inicio_req.timestamp()*1000)}"
-                log_payload = {
-                    'funcao': 'EVENTOS',
-                    'origem': payload['origem'],
-                    'mensagem_len': len(payload['mensagem'])
-                }
-                logger.info(
-                    "%s | POST %s | Envio WhatsApp função=EVENTOS | payload=%s",
-                    req_id, url, log_payload
-                )
-                resp = requests.post(url, json=payload, headers=headers, timeout=WHATSAPP_API.get('TIMEOUT', 30), verify=False)
-                self._tempo_ultima_chamada_whatsapp = datetime.now()
-                duracao_ms = int((datetime.now() - inicio_req).total_seconds() * 1000)
-
-                conteudo_curto = (resp.text[:500] + '...') if len(resp.text) > 500 else resp.text
-                # Se for 202 Accepted, tentar exibir task_id e status_url
-                if resp.status_code == 202:
-                    try:
-                        body = resp.json()
-                        logger.info(
-                            "%s | Aceito async (202) | task_id=%s | status_url=%s | detalhes=%s",
-                            req_id, body.get('task_id'), body.get('status_url'), body.get('detalhes')
-                        )
-                    except Exception:
-                        logger.info("%s | 202 sem JSON parseável | trecho=%s", req_id, conteudo_curto)
-
-                if resp.ok:
-                    logger.info(
-                        "%s | Sucesso envio WhatsApp | status=%s | duracao_ms=%s | resposta=%s",
-                        req_id, resp.status_code, duracao_ms, conteudo_curto
-                    )
-                    # Registrar no histórico
-                    self.historico_notificacoes.registrar_notificacao(
-                        tipo='whatsapp_funcao',
-                        canal='whatsapp',
-                        mensagem=mensagem,
-                        status='sucesso',
-                        destinatarios=['EVENTOS'],
-                        detalhes={
-                            'funcao': 'EVENTOS',
-                            'origem': payload['origem']
-                        },
-                        duracao_ms=duracao_ms,
-                        response_code=resp.status_code
-                    )
-                    return
-
-                # Em caso de falha, tentar extrair JSON para log estruturado
-                erro_json = None
-                try:
-                    erro_json = resp.json()
-                except Exception:
-                    pass
-                logger.error(
-                    "%s | Falha envio WhatsApp | status=%s | duracao_ms=%s | corpo=%s | erro_json=%s",
-                    req_id, resp.status_code, duracao_ms, conteudo_curto, erro_json
-                )
-                
-                # Registrar falha no histórico
-                self.historico_notificacoes.registrar_notificacao(
-                    tipo='whatsapp_funcao',
-                    canal='whatsapp',
-                    mensagem=mensagem,
-                    status='erro',
-                    destinatarios=['EVENTOS'],
-                    detalhes={
-                        'funcao': 'EVENTOS',
-                        'origem': payload['origem']
-                    },
-                    duracao_ms=duracao_ms,
-                    response_code=resp.status_code,
-                    error_message=conteudo_curto
-                )
-
-                # Agendar uma segunda tentativa única para 5 minutos depois
-                logger.warning("%s | Agendando segunda tentativa em 5 minutos (status=%s)", req_id, resp.status_code)
-                timer = threading.Timer(300, self._segunda_tentativa_whatsapp_por_funcao, args=(mensagem,))
-                timer.daemon = True
-                timer.start()
-            except requests.RequestException as e:
-                logger.error("Erro na chamada da API WhatsApp por função (imediata) | excecao=%s", e)
-                # Registrar erro no histórico
-                self.historico_notificacoes.registrar_notificacao(
-                    tipo='whatsapp_funcao',
-                    canal='whatsapp',
-                    mensagem=mensagem,
-                    status='erro',
-                    destinatarios=['EVENTOS'],
-                    detalhes={
-                        'funcao': 'EVENTOS'
-                    },
-                    error_message=str(e)
-                )
-                # Agendar segunda tentativa em 5 minutos
-                timer = threading.Timer(300, self._segunda_tentativa_whatsapp_por_funcao, args=(mensagem,))
-                timer.daemon = True
-                timer.start()
+        self._registrar_envio('whatsapp', 'EVENTOS', mensagem)
 
     def enviar_whatsapp_limpeza(self, mensagem: str) -> None:
         """
@@ -453,324 +390,126 @@ class NotificacaoEventos:
         Args:
             mensagem (str): Texto a ser enviado (pode conter \n para quebras de linha).
         """
-        TEMPO_ATRASO_API = 2  # pequena contenção para evitar floods
-        NUM_MAX_TENTATIVAS = 1  # apenas uma tentativa imediata
+        self._registrar_envio('whatsapp', 'LIMPEZA', mensagem)
+
+    def enviar_email_por_funcao(self, assunto: str, mensagem: str, apenas_disponiveis: bool = True) -> None:
+        """
+        Envia e-mail via API para todos os técnicos com a função EVENTOS.
+        """
+        if apenas_disponiveis is None:
+            apenas_disponiveis = WHATSAPP_API.get('APENAS_DISPONIVEIS', True)
+        self._registrar_envio('email', 'EVENTOS', mensagem, assunto=assunto,
+                              opcoes={'apenas_disponiveis': apenas_disponiveis})
+
+    def _registrar_envio(self, canal: str, funcao: str, mensagem: str, assunto: str = None,
+                         opcoes: dict = None) -> None:
+        """Grava o envio na saída persistente e acorda o despachante"""
+        from app.config import NOTIFICACOES_CONFIG
+        from app.utils.SaidaNotificacoes import SaidaNotificacoes
+        from app.utils.DespachanteNotificacoes import DespachanteNotificacoes
+
+        saida_id = SaidaNotificacoes.get_instance().registrar(
+            canal, funcao, mensagem, NOTIFICACOES_CONFIG['MAX_TENTATIVAS'], assunto=assunto, opcoes=opcoes
+        )
+        if saida_id is None:
+            logger.error(f"Envio {canal} função={funcao} não registrado na saída de notificações")
+            return
+        logger.info(f"Envio {canal} função={funcao} registrado na saída de notificações (id={saida_id})")
+        DespachanteNotificacoes.get_instance().acordar()
 
-        url = f"{WHATSAPP_API['HOST']}/helpdeskmonitor/api/whatsapp/send-by-function"
+    def transmitir(self, envio: dict) -> dict:
+        """
+        Faz uma tentativa de envio de uma linha da saída de notificações.
+        O limite de taxa do endpoint (canal) é reservado antes pelo despachante.
+
+        Args:
+            envio (dict): Linha reservada de SaidaNotificacoes (canal, funcao,
+                          assunto, mensagem, opcoes, tentativas, ...)
+
+        Returns:
+            dict: {'ok', 'status_code', 'duracao_ms', 'erro', 'retentar', 'detalhes'};
+            'retentar' é False para recusas definitivas da API (4xx exceto 408/429).
+        """
+        canal = envio['canal']
+        funcao = envio['funcao']
         headers = {
             'Authorization': f"Bearer {WHATSAPP_API['TOKEN']}",
             'Content-Type': 'application/json'
         }
-
-        payload = {
-            'funcao': 'LIMPEZA',
-            'mensagem': mensagem,
-            'origem': 'EventosFeriados'
-        }
-        
-        with self._lock_api_whatsapp:
-            now = datetime.now()
-            if self._tempo_ultima_chamada_whatsapp is not None:
-                elapsed = (now - self._tempo_ultima_chamada_whatsapp).total_seconds()
-                if elapsed < TEMPO_ATRASO_API:
-                    time.sleep(TEMPO_ATRASO_API - elapsed)
-
-            try:
-                inicio_req = datetime.now()
-                req_id = f"WALIMPEZA-{int(inicio_req.timestamp()*1000)}"
-                log_payload = {
-                    'funcao': 'LIMPEZA',
-                    'origem': payload['origem'],
-                    'mensagem_len': len(payload['mensagem'])
-                }
-                logger.info(
-                    "%s | POST %s | Envio WhatsApp função=LIMPEZA | payload=%s",
-                    req_id, url, log_payload
-                )
-                resp = requests.post(url, json=payload, headers=headers, timeout=WHATSAPP_API.get('TIMEOUT', 30), verify=False)
-                self._tempo_ultima_chamada_whatsapp = datetime.now()
-                duracao_ms = int((datetime.now() - inicio_req).total_seconds() * 1000)
-
-                conteudo_curto = (resp.text[:500] + '...') if len(resp.text) > 500 else resp.text
-                # Se for 202 Accepted, tentar exibir task_id e status_url
-                if resp.status_code == 202:
-                    try:
-                        body = resp.json()
-                        logger.info(
-                            "%s | Aceito async (202) | task_id=%s | status_url=%s | detalhes=%s",
-                            req_id, body.get('task_id'), body.get('status_url'), body.get('detalhes')
-                        )
-                    except Exception:
-                        logger.info("%s | 202 sem JSON parseável | trecho=%s", req_id, conteudo_curto)
-
-                if resp.ok:
-                    logger.info(
-                        "%s | Sucesso envio WhatsApp | status=%s | duracao_ms=%s | resposta=%s",
-                        req_id, resp.status_code, duracao_ms, conteudo_curto
-                    )
-                    # Registrar no histórico
-                    self.historico_notificacoes.registrar_notificacao(
-                        tipo='whatsapp_funcao',
-                        canal='whatsapp',
-                        mensagem=mensagem,
-                        status='sucesso',
-                        destinatarios=['LIMPEZA'],
-                        detalhes={
-                            'funcao': 'LIMPEZA',
-                            'origem': payload['origem']
-                        },
-                        duracao_ms=duracao_ms,
-                        response_code=resp.status_code
-                    )
-                    return
-
-                # Em caso de falha, tentar extrair JSON para log estruturado
-                erro_json = None
-                try:
-                    erro_json = resp.json()
-                except Exception:
-                    pass
-                logger.error(
-                    "%s | Falha envio WhatsApp | status=%s | duracao_ms=%s | corpo=%s | erro_json=%s",
-                    req_id, resp.status_code, duracao_ms, conteudo_curto, erro_json
-                )
-                
-                # Registrar falha no histórico
-                self.historico_notificacoes.registrar_notificacao(
-                    tipo='whatsapp_funcao',
-                    canal='whatsapp',
-                    mensagem=mensagem,
-                    status='erro',
-                    destinatarios=['LIMPEZA'],
-                    detalhes={
-                        'funcao': 'LIMPEZA',
-                        'origem': payload['origem']
-                    },
-                    duracao_ms=duracao_ms,
-                    response_code=resp.status_code,
-                    error_message=conteudo_curto
-                )
-
-                # Agendar uma segunda tentativa única para 5 minutos depois
-                logger.warning("%s | Agendando segunda tentativa em 5 minutos (status=%s)", req_id, resp.status_code)
-                timer = threading.Timer(300, self._segunda_tentativa_whatsapp_limpeza, args=(mensagem,))
-                timer.daemon = True
-                timer.start()
-            except requests.RequestException as e:
-                logger.error("Erro na chamada da API WhatsApp LIMPEZA (imediata) | excecao=%s", e)
-                # Registrar erro no histórico
-                self.historico_notificacoes.registrar_notificacao(
-                    tipo='whatsapp_funcao',
-                    canal='whatsapp',
-                    mensagem=mensagem,
-                    status='erro',
-                    destinatarios=['LIMPEZA'],
-                    detalhes={
-                        'funcao': 'LIMPEZA'
-                    },
-                    error_message=str(e)
-                )
-                # Agendar segunda tentativa em 5 minutos
-                timer = threading.Timer(300, self._segunda_tentativa_whatsapp_limpeza, args=(mensagem,))
-                timer.daemon = True
-                timer.start()
-
-    def _segunda_tentativa_whatsapp_limpeza(self, mensagem: str) -> None:
-        """Executa uma segunda tentativa única após 5 minutos para equipe de limpeza."""
-        try:
-            inicio_req = datetime.now()
-            req_id = f"WALIMPEZA-RETRY-{int(inicio_req.timestamp()*1000)}"
-            url = f"{WHATSAPP_API['HOST']}/helpdeskmonitor/api/whatsapp/send-by-function"
-            headers = {
-                'Authorization': f"Bearer {WHATSAPP_API['TOKEN']}",
-                'Content-Type': 'application/json'
-            }
+        if canal == 'email':
+            url = f"{WHATSAPP_API['HOST']}/helpdeskmonitor/api/email/send-by-function"
             payload = {
-                'funcao': 'LIMPEZA',
-                'mensagem': mensagem,
-                'origem': 'EventosFeriados'
-            }
-            log_payload = {
-                'funcao': 'LIMPEZA',
-                'origem': payload['origem'],
-                'mensagem_len': len(payload['mensagem'])
+                'funcao': funcao,
+                'assunto': envio['assunto'],
+                'mensagem': envio['mensagem'],
+                'apenas_disponiveis': envio['opcoes'].get('apenas_disponiveis', True),
+                'async': WHATSAPP_API.get('ASYNC', True)
             }
-            logger.info(
-                "%s | Segunda tentativa POST %s | payload=%s",
-                req_id, url, log_payload
-            )
-            resp = requests.post(url, json=payload, headers=headers, timeout=WHATSAPP_API.get('TIMEOUT', 30), verify=False)
-            duracao_ms = int((datetime.now() - inicio_req).total_seconds() * 1000)
-            conteudo_curto = (resp.text[:500] + '...') if len(resp.text) > 500 else resp.text
-            if resp.ok:
-                logger.info(
-                    "%s | Segunda tentativa sucesso | status=%s | duracao_ms=%s | resposta=%s",
-                    req_id, resp.status_code, duracao_ms, conteudo_curto
-                )
-            else:
-                erro_json = None
-                try:
-                    erro_json = resp.json()
-                except Exception:
-                    pass
-                logger.error(
-                    "%s | Segunda tentativa falhou | status=%s | duracao_ms=%s | corpo=%s | erro_json=%s",
-                    req_id, resp.status_code, duracao_ms, conteudo_curto, erro_json
-                )
-        except requests.RequestException as e:
-            logger.error("Segunda tentativa erro de exceção na chamada WhatsApp LIMPEZA | excecao=%s", e)
-
-    def _segunda_tentativa_whatsapp_por_funcao(self, mensagem: str) -> None:
-        """Executa uma segunda tentativa única após 5 minutos."""
-        try:
-            inicio_req = datetime.now()
-            req_id = f"WAFUNC-RETRY-{int(inicio_req.timestamp()*1000)}"
+            prefixo = 'EMAIL'
+        else:
             url = f"{WHATSAPP_API['HOST']}/helpdeskmonitor/api/whatsapp/send-by-function"
-            headers = {
-                'Authorization': f"Bearer {WHATSAPP_API['TOKEN']}",
-                'Content-Type': 'application/json'
-            }
             payload = {
-                'funcao': 'EVENTOS',
-                'mensagem': mensagem,
+                'funcao': funcao,
+                'mensagem': envio['mensagem'],
                 'origem': 'EventosFeriados'
             }
-            log_payload = {
-                'funcao': 'EVENTOS',
-                'origem': payload['origem'],
-                'mensagem_len': len(payload['mensagem'])
-            }
-            logger.info(
-                "%s | Segunda tentativa POST %s | payload=%s",
-                req_id, url, log_payload
-            )
+            prefixo = 'WAFUNC' if funcao == 'EVENTOS' else f"WA{funcao}"
+
+        inicio_req = datetime.now()
+        req_id = f"{prefixo}-{envio['id']}-T{envio['tentativas']}"
+        log_payload = {k: v for k, v in payload.items() if k != 'mensagem'}
+        log_payload['mensagem_len'] = len(payload['mensagem'])
+        logger.info(
+            "%s | POST %s | Envio %s função=%s | payload=%s",
+            req_id, url, canal, funcao, log_payload
+        )
+        try:
             resp = requests.post(url, json=payload, headers=headers, timeout=WHATSAPP_API.get('TIMEOUT', 30), verify=False)
-            duracao_ms = int((datetime.now() - inicio_req).total_seconds() * 1000)
-            conteudo_curto = (resp.text[:500] + '...') if len(resp.text) > 500 else resp.text
-            if resp.ok:
-                logger.info(
-                    "%s | Segunda tentativa sucesso | status=%s | duracao_ms=%s | resposta=%s",
-                    req_id, resp.status_code, duracao_ms, conteudo_curto
-                )
-            else:
-                erro_json = None
-                try:
-                    erro_json = resp.json()
-                except Exception:
-                    pass
-                logger.error(
-                    "%s | Segunda tentativa falhou | status=%s | duracao_ms=%s | corpo=%s | erro_json=%s",
-                    req_id, resp.status_code, duracao_ms, conteudo_curto, erro_json
-                )
         except requests.RequestException as e:
-            logger.error("Segunda tentativa erro de exceção na chamada WhatsApp | excecao=%s", e)
-    def enviar_email_por_funcao(self, assunto: str, mensagem: str, apenas_disponiveis: bool = True) -> None:
-        """
-        Envia e-mail via API para todos os técnicos com a função EVENTOS.
-        """
-        TEMPO_ATRASO_API = 2
-        url = f"{WHATSAPP_API['HOST']}/helpdeskmonitor/api/email/send-by-function"
-        headers = {
-            'Authorization': f"Bearer {WHATSAPP_API['TOKEN']}",
-            'Content-Type': 'application/json'
-        }
-        payload = {
-            'funcao': 'EVENTOS',
-            'assunto': assunto,
-            'mensagem': mensagem,
-            'apenas_disponiveis': apenas_disponiveis if apenas_disponiveis is not None else WHATSAPP_API.get('APENAS_DISPONIVEIS', True),
-            'async': WHATSAPP_API.get('ASYNC', True)
-        }
+            logger.error("%s | Erro na chamada da API %s por função | excecao=%s", req_id, canal, e)
+            return {
+                'ok': False,
+                'duracao_ms': int((datetime.now() - inicio_req).total_seconds() * 1000),
+                'erro': str(e),
+                'retentar': True
+            }
+
+        duracao_ms = int((datetime.now() - inicio_req).total_seconds() * 1000)
+        conteudo_curto = (resp.text[:500] + '...') if len(resp.text) > 500 else resp.text
 
-        with self._lock_api_whatsapp:
-            now = datetime.now()
-            if self._tempo_ultima_chamada_whatsapp is not None:
-                elapsed = (now - self._tempo_ultima_chamada_whatsapp).total_seconds()
-                if elapsed < TEMPO_ATRASO_API:
-                    time.sleep(TEMPO_ATRASO_API - elapsed)
-
-            try:
-                inicio_req = datetime.now()
-                log_payload = {
-                    'funcao': 'EVENTOS',
-                    'apenas_disponiveis': payload['apenas_disponiveis'],
-                    'assunto': payload['assunto'],
-                    'mensagem_len': len(payload['mensagem'])
-                }
-                logger.info(
-                    "Chamando API Email por função: POST %s | headers=Authorization: Bearer **** | payload=%s",
-                    url,
-                    log_payload
-                )
-                resp = requests.post(url, json=payload, headers=headers, timeout=WHATSAPP_API.get('TIMEOUT', 30), verify=False)
-                self._tempo_ultima_chamada_whatsapp = datetime.now()
-                duracao_ms = int((datetime.now() - inicio_req).total_seconds() * 1000)
-
-                conteudo_curto = (resp.text[:500] + '...') if len(resp.text) > 500 else resp.text
-                if resp.status_code == 202:
-                    try:
-                        body = resp.json()
-                        logger.info(
-                            "Envio de e-mail aceito (assíncrono): task_id=%s | status_url=%s | detalhes=%s",
-                            body.get('task_id'), body.get('status_url'), body.get('detalhes')
-                        )
-                    except Exception:
-                        logger.info("Resposta 202 sem JSON parseável: %s", conteudo_curto)
-                
-                if resp.ok:
+        if resp.ok:
+            detalhes = {}
+            # Se for 202 Accepted, guardar task_id e status_url no histórico
+            if resp.status_code == 202:
+                try:
+                    body = resp.json()
+                    detalhes = {'task_id': body.get('task_id'), 'status_url': body.get('status_url')}
                     logger.info(
-                        "Resultado API Email por função: status=%s | ok=%s | resposta=%s",
-                        resp.status_code, resp.ok, conteudo_curto
-                    )
-                    # Registrar no histórico
-                    self.historico_notificacoes.registrar_notificacao(
-                        tipo='email_funcao',
-                        canal='email',
-                        mensagem=mensagem,
-                        assunto=assunto,
-                        status='sucesso',
-                        destinatarios=['EVENTOS'],
-                        detalhes={
-                            'funcao': 'EVENTOS',
-                            'apenas_disponiveis': apenas_disponiveis
-                        },
-                        duracao_ms=duracao_ms,
-                        response_code=resp.status_code
+                        "%s | Aceito async (202) | task_id=%s | status_url=%s | detalhes=%s",
+                        req_id, body.get('task_id'), body.get('status_url'), body.get('detalhes')
                     )
-                else:
-                    logger.error(
-                        "Falha API Email por função: status=%s | resposta=%s",
-                        resp.status_code, conteudo_curto
-                    )
-                    # Registrar erro no histórico
-                    self.historico_notificacoes.registrar_notificacao(
-                        tipo='email_funcao',
-                        canal='email',
-                        mensagem=mensagem,
-                        assunto=assunto,
-                        status='erro',
-                        destinatarios=['EVENTOS'],
-                        detalhes={
-                            'funcao': 'EVENTOS',
-                            'apenas_disponiveis': apenas_disponiveis
-                        },
-                        duracao_ms=duracao_ms,
-                        response_code=resp.status_code,
-                        error_message=conteudo_curto
-                    )
-            except requests.RequestException as e:
-                logger.error("Erro na chamada da API Email por função: %s", e)
-                # Registrar erro no histórico
-                self.historico_notificacoes.registrar_notificacao(
-                    tipo='email_funcao',
-                    canal='email',
-                    mensagem=mensagem,
-                    assunto=assunto,
-                    status='erro',
-                    destinatarios=['EVENTOS'],
-                    detalhes={
-                        'funcao': 'EVENTOS',
-                        'apenas_disponiveis': apenas_disponiveis
-                    },
-                    error_message=str(e)
-                )
+                except Exception:
+                    logger.info("%s | 202 sem JSON parseável | trecho=%s", req_id, conteudo_curto)
+            logger.info(
+                "%s | Sucesso envio %s | status=%s | duracao_ms=%s | resposta=%s",
+                req_id, canal, resp.status_code, duracao_ms, conteudo_curto
+            )
+            return {'ok': True, 'status_code': resp.status_code, 'duracao_ms': duracao_ms, 'detalhes': detalhes}
+
+        # Em caso de falha, tentar extrair JSON para log estruturado
+        erro_json = None
+        try:
+            erro_json = resp.json()
+        except Exception:
+            pass
+        logger.error(
+            "%s | Falha envio %s | status=%s | duracao_ms=%s | corpo=%s | erro_json=%s",
+            req_id, canal, resp.status_code, duracao_ms, conteudo_curto, erro_json
+        )
+        return {
+            'ok': False,
+            'status_code': resp.status_code,
+            'duracao_ms': duracao_ms,
+            'erro': conteudo_curto,
+            'retentar': resp.status_code >= 500 or resp.status_code in (408, 429)
+        }
@@ -28,9 +28,24 @@ from .settings import (
     # Configurações CLP
     CLP_CONFIG,
     CLP_AUDITORIO_CONFIG,
+    CLP_MINI_AUDITORIO_CONFIG,
+    CLP_SALA_CONFERENCIAS_CONFIG,
+    CLP_CONTROLADORES,
+    CLP_AUTOSYNC_CONFIG,
+    
+    # Sincronização TCE
+    TCE_CONFIG,
+    
+    # Métricas de sincronização
+    METRICAS_CONFIG,
+    
+    # Agendador de tarefas
+    AGENDADOR_CONFIG,
+    LIDERANCA_CONFIG,
     
     # Configurações WhatsApp
     WHATSAPP_API,
+    NOTIFICACOES_CONFIG,
     
     # Configurações de formato
     DATE_FORMAT,
@@ -0,0 +1,48 @@
+# app/routes/api_agendador.py
+"""
+API de inspeção do agendador de tarefas em segundo plano
+"""
+from flask import Blueprint, request, jsonify
+import logging
+from ..utils.auth_decorators import require_auth_api
+
+api_agendador_bp = Blueprint('api_agendador', __name__)
+logger = logging.getLogger('EventosFeriados.api_agendador')
+
+
+@api_agendador_bp.route('/agendador/jobs', methods=['GET'])
+@require_auth_api
+def listar_jobs():
+    """
+    Lista as tarefas em segundo plano (sincronizações CLP/TCE, lembretes,
+    limpeza, retenção) com próximo disparo, últimas execuções e fila atual
+
+    Query Parameters:
+    - limite: execuções por tarefa no histórico (padrão: 10, máximo: 100)
+    - prefixo: filtra pelo início do nome (ex.: 'clp.', 'lembretes.1h.')
+    """
+    try:
+        from ..utils.AgendadorTarefas import AgendadorTarefas
+        from ..utils.AutoSyncCLP import AutoSyncCLP
+        from ..utils.FilaNotificacoes import FilaNotificacoes
+
+        limite = max(1, min(request.args.get('limite', 10, type=int), 100))
+        prefixo = request.args.get('prefixo', '')
+
+        agendador = AgendadorTarefas.get_instance()
+        jobs = agendador.jobs(limite, prefixo)
+        fila = agendador.fila()
+        fila['autosync_pendentes'] = len(AutoSyncCLP.get_instance().fila.listar_pendentes())
+        fila['notificacoes'] = FilaNotificacoes.get_instance().status()
+
+        return jsonify({
+            'executando': agendador.status()['executando'],
+            'lider': agendador.lideranca.eh_lider,
+            'fila': fila,
+            'total': len(jobs),
+            'jobs': jobs
+        })
+
+    except Exception as e:
+        logger.error(f"Erro ao listar tarefas do agendador: {e}")
+        return jsonify({'erro': 'Erro interno'}), 500
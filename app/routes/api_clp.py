@@ -244,6 +244,21 @@ def executar_sincronizacao():
         logger.error(f"Erro ao executar sincronização: {e}")
         return jsonify({'erro': 'Erro interno'}), 500
 
+@api_clp_bp.route('/clp/sincronizacao/plano', methods=['GET'])
+@require_auth_api
+def plano_sincronizacao():
+    """Simula a sincronização (dry-run) e retorna as operações e diferenças, sem acessar o CLP"""
+    try:
+        integracao = get_integracao_clp()
+        if not integracao:
+            return jsonify({'erro': 'Serviço indisponível'}), 503
+        
+        return jsonify(integracao.planejar_sincronizacao())
+        
+    except Exception as e:
+        logger.error(f"Erro ao planejar sincronização: {e}")
+        return jsonify({'erro': 'Erro interno'}), 500
+
 @api_clp_bp.route('/clp/conectividade', methods=['GET'])
 @require_auth_api
 def verificar_conectividade():
@@ -276,14 +291,123 @@ def status_agendador():
     """Obtém status do agendador automático"""
     try:
         from ..utils.AgendadorCLP import AgendadorCLP
+        from ..utils.AutoSyncCLP import AutoSyncCLP
         agendador = AgendadorCLP.get_instance()
         status = agendador.status()
+        status['autosync'] = AutoSyncCLP.get_instance().status()
         return jsonify(status)
         
     except Exception as e:
         logger.error(f"Erro ao obter status do agendador: {e}")
         return jsonify({'erro': 'Erro interno'}), 500
 
+def get_sincronizador_controlador(chave):
+    """Obtém o sincronizador de um CLP do registro (None se indisponível)"""
+    registro = current_app.config.get('REGISTRO_CLP')
+    return registro.obter_sincronizador(chave) if registro else None
+
+@api_clp_bp.route('/clp/controladores', methods=['GET'])
+@require_auth_api
+def listar_controladores():
+    """Lista os CLPs registrados com status de sincronização e conectividade (cache)"""
+    try:
+        registro = current_app.config.get('REGISTRO_CLP')
+        if not registro:
+            return jsonify({'erro': 'Serviço indisponível'}), 503
+
+        controladores = registro.listar()
+        return jsonify({'total': len(controladores), 'controladores': controladores})
+
+    except Exception as e:
+        logger.error(f"Erro ao listar controladores CLP: {e}")
+        return jsonify({'erro': 'Erro interno'}), 500
+
+@api_clp_bp.route('/clp/controladores/<chave>/sincronizar', methods=['POST'])
+@require_auth_api
+def sincronizar_controlador(chave):
+    """Executa sincronização manual de um CLP do registro"""
+    try:
+        sincronizador = get_sincronizador_controlador(chave)
+        if not sincronizador:
+            return jsonify({'erro': f"CLP '{chave}' não registrado"}), 404
+
+        resultado = sincronizador.sincronizar()
+        return jsonify(resultado), 200 if resultado['sucesso'] else 400
+
+    except Exception as e:
+        logger.error(f"Erro ao sincronizar CLP '{chave}': {e}")
+        return jsonify({'erro': 'Erro interno'}), 500
+
+@api_clp_bp.route('/clp/controladores/<chave>/plano', methods=['GET'])
+@require_auth_api
+def plano_controlador(chave):
+    """Simula a sincronização (dry-run) de um CLP do registro"""
+    try:
+        sincronizador = get_sincronizador_controlador(chave)
+        if not sincronizador:
+            return jsonify({'erro': f"CLP '{chave}' não registrado"}), 404
+
+        return jsonify(sincronizador.planejar())
+
+    except Exception as e:
+        logger.error(f"Erro ao planejar sincronização do CLP '{chave}': {e}")
+        return jsonify({'erro': 'Erro interno'}), 500
+
+def _restaurar_snapshot(sincronizador, versao):
+    """Resposta padrão da restauração de snapshot (404 se a versão não existe)"""
+    resultado = sincronizador.restaurar_snapshot(versao)
+    if not resultado.pop('encontrado'):
+        return jsonify({'erro': resultado['erro']}), 404
+    return jsonify(resultado), 200 if resultado['sucesso'] else 400
+
+@api_clp_bp.route('/clp/snapshots', methods=['GET'])
+@require_auth_api
+def listar_snapshots():
+    """Lista os snapshots das matrizes gravadas (?clp=<chave>, padrão Plenário)"""
+    chave = request.args.get('clp', 'plenario')
+    try:
+        sincronizador = get_sincronizador_controlador(chave)
+        if not sincronizador:
+            return jsonify({'erro': f"CLP '{chave}' não registrado"}), 404
+
+        snapshots = sincronizador.listar_snapshots()
+        return jsonify({'clp': chave, 'total': len(snapshots), 'snapshots': snapshots})
+
+    except Exception as e:
+        logger.error(f"Erro ao listar snapshots do CLP '{chave}': {e}")
+        return jsonify({'erro': 'Erro interno'}), 500
+
+@api_clp_bp.route('/clp/restaurar/<int:versao>', methods=['POST'])
+@require_auth_api
+def restaurar_snapshot(versao):
+    """Reenvia ao CLP a matriz de tags de um snapshot (?clp=<chave>, padrão Plenário)"""
+    chave = request.args.get('clp', 'plenario')
+    try:
+        sincronizador = get_sincronizador_controlador(chave)
+        if not sincronizador:
+            return jsonify({'erro': f"CLP '{chave}' não registrado"}), 404
+
+        return _restaurar_snapshot(sincronizador, versao)
+
+    except Exception as e:
+        logger.error(f"Erro ao restaurar snapshot {versao} do CLP '{chave}': {e}")
+        return jsonify({'erro': 'Erro interno'}), 500
+
+@api_clp_bp.route('/clp/controladores/<chave>/restaurar/<int:versao>', methods=['POST'])
+@require_auth_api
+def restaurar_snapshot_controlador(chave, versao):
+    """Reenvia a um CLP do registro a matriz de tags de um snapshot"""
+    try:
+        sincronizador = get_sincronizador_controlador(chave)
+        if not sincronizador:
+            return jsonify({'erro': f"CLP '{chave}' não registrado"}), 404
+
+        return _restaurar_snapshot(sincronizador, versao)
+
+    except Exception as e:
+        logger.error(f"Erro ao restaurar snapshot {versao} do CLP '{chave}': {e}")
+        return jsonify({'erro': 'Erro interno'}), 500
+
 @api_clp_bp.route('/clp/teste-tag', methods=['GET'])
 @require_auth_api
 def teste_tag():
@@ -394,6 +518,10 @@ def limpar_feriados():
             except Exception as e:
                 erros.append(f"Slot {i}: {str(e)}")
         
+        if not erros:
+            # Registrar a limpeza no estado confirmado (evita que o watchdog de reset a desfaça)
+            sincronizador.estado.atualizar([op for i in range(max_feriados) for op in sincronizador._operacoes_feriado(i)])
+        
         return jsonify({
             'sucesso': len(erros) == 0,
             'slots_limpos': slots_limpos,
@@ -518,6 +646,10 @@ def limpar_eventos_plenario():
                 erros.append(erro)
                 logger.error(erro)
         
+        if not erros:
+            # Registrar a limpeza no estado confirmado (evita que o watchdog de reset a desfaça)
+            sincronizador.estado.atualizar([op for i in range(max_eventos) for op in sincronizador._operacoes_evento(i)])
+        
         return jsonify({
             'sucesso': len(erros) == 0,
             'eventos_limpos': eventos_limpos,
@@ -80,6 +80,21 @@ def executar_sincronizacao_auditorio():
         logger.error(f"Erro na sincronização CLP Auditório: {e}")
         return jsonify({'erro': str(e)}), 500
 
+@api_clp_auditorio_bp.route('/clp-auditorio/sincronizacao/plano', methods=['GET'])
+@require_auth_api
+def plano_sincronizacao_auditorio():
+    """Simula a sincronização do CLP Auditório (dry-run), sem acessar o CLP"""
+    try:
+        integracao = get_integracao_clp_auditorio()
+        if not integracao:
+            return jsonify({'erro': 'Serviço indisponível'}), 503
+        
+        return jsonify(integracao.planejar_sincronizacao())
+        
+    except Exception as e:
+        logger.error(f"Erro ao planejar sincronização CLP Auditório: {e}")
+        return jsonify({'erro': 'Erro interno'}), 500
+
 @api_clp_auditorio_bp.route('/clp-auditorio/data/<int:dia>/<int:mes>/<int:ano>', methods=['GET'])
 @require_auth_api
 def obter_status_data_auditorio(dia: int, mes: int, ano: int):
@@ -231,7 +246,7 @@ def listar_locais_auditorio():
                 'Foyer do Auditório': 'FA'
             },
             'clp_ip': integracao.sincronizador.config['CLP_IP'],
-            'tags_eventos': integracao.sincronizador.config['TAGS_EVENTOS_AUDITORIO']
+            'tags_eventos': integracao.sincronizador.config['TAGS_EVENTOS']
         })
         
     except Exception as e:
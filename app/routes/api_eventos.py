@@ -3,8 +3,8 @@ from flask import Blueprint, request, jsonify, current_app
 from datetime import datetime
 import logging
 from ..utils.auth_decorators import require_auth_api
-from app.utils.GerenciadorNotificacaoEventos import GerenciadorNotificacaoEventos
 from app.utils.AutoSyncCLP import AutoSyncCLP
+from app.utils.RegistroControladoresCLP import RegistroControladoresCLP
 
 api_eventos_bp = Blueprint('api_eventos', __name__)
 logger = logging.getLogger('EventosFeriados.api_eventos')
@@ -97,12 +97,7 @@ def adicionar_evento():
 
         # Disparar autosync debounced para o CLP do local
         try:
-            integracao_plenario = current_app.config.get('INTEGRACAO_CLP')
-            integracao_auditorio = current_app.config.get('INTEGRACAO_CLP_AUDITORIO')
-            aud_locais = []
-            if integracao_auditorio and getattr(integracao_auditorio, 'sincronizador', None):
-                aud_locais = integracao_auditorio.sincronizador.config.get('LOCAIS_GERENCIADOS', [])
-            AutoSyncCLP.get_instance().trigger_for_local(novo_evento.get('local'), integracao_plenario, integracao_auditorio, aud_locais)
+            AutoSyncCLP.get_instance().trigger_for_local(novo_evento.get('local'))
         except Exception as e:
             logger.error(f"Falha ao agendar autosync após adicionar evento: {e}")
         
@@ -139,12 +134,7 @@ def atualizar_evento(evento_id):
         
         # Disparar autosync debounced para o CLP do local
         try:
-            integracao_plenario = current_app.config.get('INTEGRACAO_CLP')
-            integracao_auditorio = current_app.config.get('INTEGRACAO_CLP_AUDITORIO')
-            aud_locais = []
-            if integracao_auditorio and getattr(integracao_auditorio, 'sincronizador', None):
-                aud_locais = integracao_auditorio.sincronizador.config.get('LOCAIS_GERENCIADOS', [])
-            AutoSyncCLP.get_instance().trigger_for_local(evento_atualizado.get('local'), integracao_plenario, integracao_auditorio, aud_locais)
+            AutoSyncCLP.get_instance().trigger_for_local(evento_atualizado.get('local'))
         except Exception as e:
             logger.error(f"Falha ao agendar autosync após atualizar evento: {e}")
 
@@ -181,12 +171,7 @@ def remover_evento(evento_id):
         # Disparar autosync debounced para o CLP do local
         try:
             if sucesso and local_evento:
-                integracao_plenario = current_app.config.get('INTEGRACAO_CLP')
-                integracao_auditorio = current_app.config.get('INTEGRACAO_CLP_AUDITORIO')
-                aud_locais = []
-                if integracao_auditorio and getattr(integracao_auditorio, 'sincronizador', None):
-                    aud_locais = integracao_auditorio.sincronizador.config.get('LOCAIS_GERENCIADOS', [])
-                AutoSyncCLP.get_instance().trigger_for_local(local_evento, integracao_plenario, integracao_auditorio, aud_locais)
+                AutoSyncCLP.get_instance().trigger_for_local(local_evento)
         except Exception as e:
             logger.error(f"Falha ao agendar autosync após remover evento: {e}")
 
@@ -333,7 +318,7 @@ def forcar_notificacao_whatsapp(evento_id):
             )
 
         # Enviar via WhatsApp por função EVENTOS
-        ger_notif = GerenciadorNotificacaoEventos.get_instance()
+        ger_notif = current_app.config['SERVICOS'].notificacoes
         if not ger_notif or not ger_notif.notificacao_eventos:
             return jsonify({'erro': 'Sistema de notificação indisponível'}), 503
 
@@ -378,37 +363,9 @@ def encerrar_evento(evento_id):
         logger.info(f"Encerrando evento '{evento['nome']}' do local '{local}'...")
         
         # Determinar qual CLP gerencia este local
-        integracao_plenario = current_app.config.get('INTEGRACAO_CLP')
-        integracao_auditorio = current_app.config.get('INTEGRACAO_CLP_AUDITORIO')
+        sincronizador = RegistroControladoresCLP.get_instance().sincronizador_por_local(local)
         
-        locais_auditorio = []
-        if integracao_auditorio and hasattr(integracao_auditorio, 'sincronizador'):
-            locais_auditorio = integracao_auditorio.sincronizador.config.get('LOCAIS_GERENCIADOS', [])
-        
-        sucesso = False
-        erros = []
-        clp_afetado = None
-        
-        # Remover eventos do CLP correspondente ao local
-        if local in locais_auditorio:
-            # CLP Auditório
-            clp_afetado = 'Auditório'
-            if integracao_auditorio and hasattr(integracao_auditorio, 'sincronizador'):
-                sucesso, erros = integracao_auditorio.sincronizador.remover_eventos_do_dia(dia, mes)
-                logger.info(f"Resultado remoção CLP Auditório: sucesso={sucesso}, erros={erros}")
-            else:
-                erros.append('Integração com CLP Auditório não disponível')
-                logger.error('Integração com CLP Auditório não disponível')
-        elif local == 'Plenário':
-            # CLP Plenário
-            clp_afetado = 'Plenário'
-            if integracao_plenario and hasattr(integracao_plenario, 'sincronizador'):
-                sucesso, erros = integracao_plenario.sincronizador.remover_eventos_do_dia(dia, mes)
-                logger.info(f"Resultado remoção CLP Plenário: sucesso={sucesso}, erros={erros}")
-            else:
-                erros.append('Integração com CLP Plenário não disponível')
-                logger.error('Integração com CLP Plenário não disponível')
-        else:
+        if sincronizador is None:
             # Local sem automação predial
             logger.info(f"Local '{local}' não possui automação predial integrada ao sistema")
             return jsonify({
@@ -419,6 +376,11 @@ def encerrar_evento(evento_id):
                 'sem_automacao': True
             })
         
+        # Remover eventos do CLP correspondente ao local
+        clp_afetado = sincronizador.nome
+        sucesso, erros = sincronizador.remover_eventos_do_dia(dia, mes)
+        logger.info(f"Resultado remoção CLP {clp_afetado}: sucesso={sucesso}, erros={erros}")
+        
         if sucesso:
             logger.info(f"Evento '{evento['nome']}' encerrado com sucesso no CLP {clp_afetado}")
             return jsonify({
@@ -467,12 +429,7 @@ def reativar_evento(evento_id):
         
         # Disparar autosync para reprogramar no CLP
         try:
-            integracao_plenario = current_app.config.get('INTEGRACAO_CLP')
-            integracao_auditorio = current_app.config.get('INTEGRACAO_CLP_AUDITORIO')
-            aud_locais = []
-            if integracao_auditorio and getattr(integracao_auditorio, 'sincronizador', None):
-                aud_locais = integracao_auditorio.sincronizador.config.get('LOCAIS_GERENCIADOS', [])
-            AutoSyncCLP.get_instance().trigger_for_local(evento.get('local'), integracao_plenario, integracao_auditorio, aud_locais)
+            AutoSyncCLP.get_instance().trigger_for_local(evento.get('local'))
         except Exception as e:
             logger.error(f"Falha ao agendar autosync após reativar evento: {e}")
         
@@ -115,6 +115,37 @@ def obter_estatisticas():
             'error': 'Erro ao obter estatísticas'
         }), 500
 
+@api_notificacoes_bp.route('/notificacoes/saida', methods=['GET'])
+@require_auth
+def listar_saida():
+    """
+    Lista os envios da saída persistente (pendentes, em envio, enviados, falhos)
+
+    Query Parameters:
+        - status: filtrar por status (pendente, enviando, enviado, falhou)
+        - limite: número máximo de registros (padrão: 100, máximo: 500)
+    """
+    try:
+        from ..utils.SaidaNotificacoes import SaidaNotificacoes
+
+        status = request.args.get('status')
+        limite = max(1, min(request.args.get('limite', 100, type=int), 500))
+
+        saida = SaidaNotificacoes.get_instance()
+
+        return jsonify({
+            'success': True,
+            'data': saida.listar(status=status, limite=limite),
+            'resumo': saida.resumo()
+        }), 200
+
+    except Exception as e:
+        logger.error(f"Erro ao listar saída de notificações: {e}")
+        return jsonify({
+            'success': False,
+            'error': 'Erro ao listar saída de notificações'
+        }), 500
+
 @api_notificacoes_bp.route('/notificacoes/limpar-antigos', methods=['POST'])
 @require_auth
 def limpar_antigos():
@@ -1,28 +1,74 @@
 # app/routes/api_tce.py
-from flask import Blueprint, jsonify, request
+from flask import Blueprint, jsonify, request, current_app
+from datetime import datetime
 import logging
-from ..utils.SincronizadorTCE import SincronizadorTCE
 from ..utils.AgendadorCLP import AgendadorCLP
+from ..utils.tempo_minutos import horario_valido, normalizar
 
 api_tce = Blueprint('api_tce', __name__)
 logger = logging.getLogger('EventosFeriados.api_tce')
 
+def _ler_ano_mes(valor: str):
+    """'AAAA-MM' -> (ano, mes)"""
+    try:
+        data = datetime.strptime(valor, '%Y-%m')
+    except (TypeError, ValueError):
+        raise ValueError(f"Mês inválido: '{valor}'. Use AAAA-MM")
+    return data.year, data.month
+
 @api_tce.route('/sincronizar', methods=['POST'])
 def sincronizar_tce():
-    """Executa sincronização manual dos eventos do TCE"""
+    """
+    Executa sincronização manual dos eventos do TCE
+    
+    Query Parameters (intervalo, consultas em paralelo):
+    - de: mês inicial (AAAA-MM)
+    - ate: mês final, inclusive (AAAA-MM; padrão: igual a 'de')
+    
+    JSON Body (opcional): mes/ano de um único mês e 'forcar'
+    """
     try:
-        data = request.get_json() or {}
+        data = request.get_json(silent=True) or {}
         mes = data.get('mes')
         ano = data.get('ano')
-        
-        sincronizador = SincronizadorTCE.get_instance()
+        forcar = bool(data.get('forcar', False))  # ignora o atalho de pauta inalterada
+        
+        sincronizador = current_app.config['SERVICOS'].sincronizador_tce
+        if sincronizador is None:
+            return jsonify({'status': 'erro', 'erro': 'Sincronizador TCE indisponível'}), 503
+        
+        if request.args.get('de'):
+            try:
+                de = _ler_ano_mes(request.args['de'])
+                ate = _ler_ano_mes(request.args.get('ate', request.args['de']))
+                resultado = sincronizador.sincronizar_intervalo(de, ate, forcar)
+            except ValueError as e:
+                return jsonify({
+                    'status': 'erro',
+                    'erro': str(e)
+                }), 400
+            
+            if resultado['sucesso']:
+                logger.info(f"Sincronização TCE de {resultado['de']} a {resultado['ate']} executada via API")
+                return jsonify({
+                    'status': 'sucesso',
+                    'dados': resultado
+                }), 200
+            
+            # Falha parcial: o detalhe por mês mostra quais meses foram aplicados
+            logger.error(f"Erro na sincronização TCE de intervalo via API: {resultado['erro']}")
+            return jsonify({
+                'status': 'erro',
+                'erro': resultado['erro'],
+                'dados': resultado
+            }), 400
         
         if mes and ano:
             # Sincronizar mês específico
-            resultado = sincronizador.sincronizar_mes(mes, ano)
+            resultado = sincronizador.sincronizar_mes(mes, ano, forcar)
         else:
             # Sincronizar período atual (mês atual + próximo)
-            resultado = sincronizador.sincronizar_periodo_atual()
+            resultado = sincronizador.sincronizar_periodo_atual(forcar)
         
         if resultado['sucesso']:
             logger.info("Sincronização TCE executada via API")
@@ -82,14 +128,12 @@ def configurar_tce():
         horario = data.get('horario', '08:00')
         
         # Validar formato do horário
-        try:
-            from datetime import datetime
-            datetime.strptime(horario, '%H:%M')
-        except ValueError:
+        if not horario_valido(horario):
             return jsonify({
                 'status': 'erro',
                 'erro': 'Formato de horário inválido. Use HH:MM'
             }), 400
+        horario = normalizar(horario)
         
         agendador = AgendadorCLP.get_instance()
         agendador.configurar_tce(habilitado, horario)
@@ -115,12 +159,10 @@ def configurar_tce():
 def listar_eventos_tce():
     """Lista eventos sincronizados do TCE"""
     try:
-        from ..utils.GerenciadorEventos import GerenciadorEventos
-        
         mes = request.args.get('mes', type=int)
         ano = request.args.get('ano', type=int)
         
-        gerenciador = GerenciadorEventos.get_instance()
+        gerenciador = current_app.config['GERENCIADOR_EVENTOS']
         eventos = gerenciador.listar_eventos(ano=ano, mes=mes, local='Plenário')
         
         # Filtrar apenas eventos do TCE
@@ -145,8 +187,6 @@ def listar_eventos_tce():
 def remover_evento_tce(evento_id):
     """Remove um evento específico do TCE"""
     try:
-        from ..utils.GerenciadorEventos import GerenciadorEventos
-        
         # Verificar se é um evento do TCE
         if not evento_id.startswith('tce_tribunal_pleno'):
             return jsonify({
@@ -154,7 +194,7 @@ def remover_evento_tce(evento_id):
                 'erro': 'Este endpoint só permite remover eventos do TCE'
             }), 400
         
-        gerenciador = GerenciadorEventos.get_instance()
+        gerenciador = current_app.config['GERENCIADOR_EVENTOS']
         evento = gerenciador.obter_evento(evento_id)
         
         if not evento:
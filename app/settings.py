@@ -118,13 +118,23 @@ CLP_CONFIG = {
     'SYNC_ENABLED': get_bool_env('CLP_SYNC_ENABLED', True),
     'STATUS_FILE': f"{ROOT_DATA}/clp_status.json",
     'BACKUP_FILE': f"{ROOT_DATA}/clp_backup.json",
+    'ESTADO_FILE': f"{ROOT_DATA}/clp_estado.json",
+    'SNAPSHOTS_DIR': f"{ROOT_DATA}/clp_snapshots/plenario",
+    'SNAPSHOTS_MANTIDOS': get_int_env('CLP_SNAPSHOTS_MANTIDOS', 20),
+    
+    # Identificação no registro de controladores
+    'CHAVE': 'plenario',
+    'NOME': 'Plenário',
+    'HABILITADO': True,
+    'LOCAIS_GERENCIADOS': ['Plenário'],
     
     # Mapeamento das tags do CLP (hardcoded - estrutura do CLP)
     'TAGS_FERIADOS': {
         'DIA': 'N33',   # N33:0 a N33:19 - dias dos feriados
         'MES': 'N34'    # N34:0 a N34:19 - meses dos feriados
     },
-    'TAGS_EVENTOS_PLENARIO': {
+    'FERIADOS_ENVIADOS': 10,  # Feriados mais próximos/recentes enviados a cada sincronização
+    'TAGS_EVENTOS': {
         'DIA': 'N60',          # N60:0-9 - dias dos eventos  
         'MES': 'N61',          # N61:0-9 - meses dos eventos
         'HORA_INICIO': 'N62',  # N62:0-9 - hora de início
@@ -132,7 +142,18 @@ CLP_CONFIG = {
         'HORA_FIM': 'N64',     # N64:0-9 - hora de fim
         'MIN_FIM': 'N65'       # N65:0-9 - minuto de fim
     },
-    'MAX_EVENTOS': get_int_env('CLP_MAX_EVENTOS_PLENARIO', 10)
+    'MAX_EVENTOS': get_int_env('CLP_MAX_EVENTOS_PLENARIO', 10),
+    'AJUSTE_HORARIO': None,  # Eventos do Plenário seguem o horário original
+    
+    # Verificação pós-escrita (read-back das tags gravadas)
+    'VERIFICAR_ESCRITA': get_bool_env('CLP_VERIFICAR_ESCRITA', True),
+    'LEITURAS_PARALELAS': get_int_env('CLP_LEITURAS_PARALELAS', 8),
+    
+    # Intervalo (segundos) da verificação de conectividade em segundo plano
+    'HEALTH_INTERVALO': get_int_env('CLP_HEALTH_INTERVAL', 60),
+    
+    # Watchdog de reset: a sonda de saúde confere tags sentinela com o último estado confirmado
+    'WATCHDOG_RESET': get_bool_env('CLP_WATCHDOG_RESET', True)
 }
 
 # =============================================================================
@@ -150,9 +171,18 @@ CLP_AUDITORIO_CONFIG = {
     'SYNC_ENABLED': get_bool_env('CLP_SYNC_ENABLED', True),
     'STATUS_FILE': f"{ROOT_DATA}/clp_auditorio_status.json",
     'BACKUP_FILE': f"{ROOT_DATA}/clp_auditorio_backup.json",
+    'ESTADO_FILE': f"{ROOT_DATA}/clp_auditorio_estado.json",
+    'SNAPSHOTS_DIR': f"{ROOT_DATA}/clp_snapshots/auditorio",
+    'SNAPSHOTS_MANTIDOS': get_int_env('CLP_SNAPSHOTS_MANTIDOS', 20),
+    
+    # Identificação no registro de controladores
+    'CHAVE': 'auditorio',
+    'NOME': 'Auditório',
+    'HABILITADO': True,
     
     # Mapeamento das tags do CLP Auditório (hardcoded - estrutura do CLP)
-    'TAGS_EVENTOS_AUDITORIO': {
+    'TAGS_FERIADOS': None,
+    'TAGS_EVENTOS': {
         'DIA': 'N91',          # N91:0-9 - dias dos eventos  
         'MES': 'N92',          # N92:0-9 - meses dos eventos
         'HORA_INICIO': 'N93',  # N93:0-9 - hora de início (ajustado -1h)
@@ -161,9 +191,142 @@ CLP_AUDITORIO_CONFIG = {
         'MIN_FIM': 'N96'       # N96:0-9 - minuto de fim
     },
     
-    'AUDITORIO_HORA_MINIMA': os.getenv('CLP_AUD_MIN_HORA', '05:30'),
+    # Preparação da infraestrutura: liga 1h antes e desliga 1h depois do evento
+    'AJUSTE_HORARIO': {
+        'ANTES_MINUTOS': 60,
+        'DEPOIS_MINUTOS': 60,
+        'HORA_MINIMA': os.getenv('CLP_AUD_MIN_HORA', '05:30'),
+        'HORA_MAXIMA': '23:59'
+    },
     'MAX_EVENTOS': get_int_env('CLP_MAX_EVENTOS_AUDITORIO', 10),
-    'LOCAIS_GERENCIADOS': os.getenv('CLP_AUD_LOCAIS', 'Auditório Nobre,Foyer do Auditório').split(',')
+    'LOCAIS_GERENCIADOS': os.getenv('CLP_AUD_LOCAIS', 'Auditório Nobre,Foyer do Auditório').split(','),
+    
+    # Verificação pós-escrita (read-back das tags gravadas)
+    'VERIFICAR_ESCRITA': get_bool_env('CLP_VERIFICAR_ESCRITA', True),
+    'LEITURAS_PARALELAS': get_int_env('CLP_LEITURAS_PARALELAS', 8),
+    
+    # Intervalo (segundos) da verificação de conectividade em segundo plano
+    'HEALTH_INTERVALO': get_int_env('CLP_HEALTH_INTERVAL', 60),
+    
+    # Watchdog de reset: a sonda de saúde confere tags sentinela com o último estado confirmado
+    'WATCHDOG_RESET': get_bool_env('CLP_WATCHDOG_RESET', True)
+}
+
+# =============================================================================
+# CLPs ADICIONAIS (Mini-Auditório, Sala de Conferências)
+# =============================================================================
+
+# Ordem das tags de eventos em {PREFIXO}_TAGS_EVENTOS
+CAMPOS_TAGS_EVENTOS = ('DIA', 'MES', 'HORA_INICIO', 'MIN_INICIO', 'HORA_FIM', 'MIN_FIM')
+
+def _config_clp_adicional(prefixo: str, chave: str, nome: str, locais_padrao: str) -> dict:
+    """
+    Monta a configuração de um CLP de eventos a partir das variáveis {prefixo}_*.
+    
+    O controlador só é habilitado quando o IP e as 6 tags de eventos estiverem
+    configurados. Credenciais, gateway e horários são os mesmos do Plenário.
+    """
+    ip = os.getenv(f'{prefixo}_IP', '').strip()
+    tags = [tag.strip() for tag in os.getenv(f'{prefixo}_TAGS_EVENTOS', '').split(',') if tag.strip()]
+    ajuste = get_int_env(f'{prefixo}_AJUSTE_MINUTOS', 0)
+    
+    config = {campo: CLP_CONFIG[campo] for campo in (
+        'API_BASE_URL', 'AUTH_USER', 'AUTH_PASS', 'TIMEOUT', 'RETRY_COUNT', 'SYNC_TIMES',
+        'SYNC_ENABLED', 'VERIFICAR_ESCRITA', 'LEITURAS_PARALELAS', 'HEALTH_INTERVALO',
+        'SNAPSHOTS_MANTIDOS', 'WATCHDOG_RESET'
+    )}
+    config.update({
+        'CHAVE': chave,
+        'NOME': nome,
+        'HABILITADO': bool(ip) and len(tags) == len(CAMPOS_TAGS_EVENTOS),
+        'CLP_IP': ip,
+        'LOCAIS_GERENCIADOS': os.getenv(f'{prefixo}_LOCAIS', locais_padrao).split(','),
+        'TAGS_FERIADOS': None,
+        'TAGS_EVENTOS': dict(zip(CAMPOS_TAGS_EVENTOS, tags)),
+        'MAX_EVENTOS': get_int_env(f'{prefixo}_MAX_EVENTOS', 10),
+        'AJUSTE_HORARIO': {
+            'ANTES_MINUTOS': ajuste,
+            'DEPOIS_MINUTOS': ajuste,
+            'HORA_MINIMA': os.getenv(f'{prefixo}_MIN_HORA', '05:30'),
+            'HORA_MAXIMA': '23:59'
+        } if ajuste else None,
+        'STATUS_FILE': f"{ROOT_DATA}/clp_{chave}_status.json",
+        'BACKUP_FILE': f"{ROOT_DATA}/clp_{chave}_backup.json",
+        'ESTADO_FILE': f"{ROOT_DATA}/clp_{chave}_estado.json",
+        'SNAPSHOTS_DIR': f"{ROOT_DATA}/clp_snapshots/{chave}"
+    })
+    return config
+
+CLP_MINI_AUDITORIO_CONFIG = _config_clp_adicional('CLP_MINI_AUDITORIO', 'mini_auditorio', 'Mini-Auditório', 'Mini-Auditório')
+CLP_SALA_CONFERENCIAS_CONFIG = _config_clp_adicional('CLP_SALA_CONFERENCIAS', 'sala_conferencias', 'Sala de Conferências', 'Sala de Conferências')
+
+# Registro de controladores: a sincronização, o agendador, o autosync e o
+# encerramento antecipado percorrem esta tabela (chave -> configuração)
+CLP_CONTROLADORES = {
+    config_clp['CHAVE']: config_clp
+    for config_clp in (CLP_CONFIG, CLP_AUDITORIO_CONFIG, CLP_MINI_AUDITORIO_CONFIG, CLP_SALA_CONFERENCIAS_CONFIG)
+}
+
+# =============================================================================
+# CONFIGURAÇÕES AUTOSYNC CLP (fila persistente de sincronizações)
+# =============================================================================
+
+CLP_AUTOSYNC_CONFIG = {
+    'DEBOUNCE': float(os.getenv('CLP_AUTOSYNC_DEBOUNCE', '5')),  # segundos
+    'BACKOFF_BASE': get_int_env('CLP_AUTOSYNC_BACKOFF_BASE', 30),  # segundos
+    'BACKOFF_MAX': get_int_env('CLP_AUTOSYNC_BACKOFF_MAX', 1800),  # segundos
+    # Tentativas de um mesmo pedido antes de descartá-lo
+    'MAX_TENTATIVAS': get_int_env('CLP_AUTOSYNC_MAX_TENTATIVAS', 10),
+    # Releitura da fila (pedidos gravados por outros processos)
+    'INTERVALO_CONSULTA': get_int_env('CLP_AUTOSYNC_INTERVALO_CONSULTA', 5)  # segundos
+}
+
+# =============================================================================
+# SINCRONIZAÇÃO TCE (pauta do Tribunal Pleno)
+# =============================================================================
+
+TCE_CONFIG = {
+    'TIMEOUT': get_int_env('TCE_TIMEOUT', 30),  # segundos por requisição
+    'CONSULTAS_PARALELAS': get_int_env('TCE_CONSULTAS_PARALELAS', 4),  # meses consultados ao mesmo tempo
+    'MAX_MESES_INTERVALO': get_int_env('TCE_MAX_MESES_INTERVALO', 24),  # limite de POST /tce/sincronizar?de=&ate=
+    # Última resposta de cada mês (ETag/Last-Modified + hash) para requisições condicionais
+    'CACHE_DIR': f"{ROOT_DATA}/tce_cache"
+}
+
+# =============================================================================
+# MÉTRICAS DE SINCRONIZAÇÃO (CLP e TCE)
+# =============================================================================
+
+METRICAS_CONFIG = {
+    'AMOSTRAS_POR_SERIE': get_int_env('METRICAS_AMOSTRAS', 200),  # janela móvel por série
+    # Limites superiores (ms) das faixas do histograma de duração
+    'FAIXAS_DURACAO_MS': [10, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000]
+}
+
+# =============================================================================
+# AGENDADOR DE TAREFAS (sincronizações diárias, lembretes e temporizadores)
+# =============================================================================
+
+AGENDADOR_CONFIG = {
+    'TRABALHADORES': get_int_env('AGENDADOR_TRABALHADORES', 4),  # execuções simultâneas
+    # Disparo perdido com o serviço fora do ar: 'executar' (uma vez), 'ignorar' ou 'janela'
+    'RECUPERACAO': os.getenv('AGENDADOR_RECUPERACAO', 'janela').strip().lower(),
+    'JANELA_RECUPERACAO_MINUTOS': get_int_env('AGENDADOR_JANELA_RECUPERACAO_MINUTOS', 240),
+    # Tarefa diária de retenção (execuções do agendador, envios concluídos da saída)
+    'HORARIO_RETENCAO': os.getenv('AGENDADOR_HORARIO_RETENCAO', '03:00'),
+    'RETENCAO_EXECUCOES_DIAS': get_int_env('RETENCAO_EXECUCOES_DIAS', 30),
+    'RETENCAO_SAIDA_NOTIFICACOES_DIAS': get_int_env('RETENCAO_SAIDA_NOTIFICACOES_DIAS', 30),
+    # Históricos de auditoria: 0 = não apaga (só pelos endpoints de administração)
+    'RETENCAO_HISTORICO_DIAS': get_int_env('RETENCAO_HISTORICO_DIAS', 0),
+    'RETENCAO_NOTIFICACOES_DIAS': get_int_env('RETENCAO_NOTIFICACOES_DIAS', 0)
+}
+
+# Com vários processos, só o líder (concessão renovada no SQLite) executa as tarefas
+# em segundo plano: sincronizações agendadas, lembretes e fila de autosync
+LIDERANCA_CONFIG = {
+    'HABILITADA': get_bool_env('LIDERANCA_HABILITADA', True),
+    'CONCESSAO_SEGUNDOS': get_int_env('LIDERANCA_CONCESSAO_SEGUNDOS', 30),
+    'HEARTBEAT_SEGUNDOS': get_int_env('LIDERANCA_HEARTBEAT_SEGUNDOS', 10)
 }
 
 # =============================================================================
@@ -179,6 +342,38 @@ WHATSAPP_API = {
     'TIMEOUT': get_int_env('WHATSAPP_API_TIMEOUT', 60)
 }
 
+# Envio das notificações (e-mail/WhatsApp por função): pool fixo alimentado por fila limitada
+NOTIFICACOES_CONFIG = {
+    'TRABALHADORES': get_int_env('NOTIFICACOES_TRABALHADORES', 2),
+    'CAPACIDADE_FILA': get_int_env('NOTIFICACOES_CAPACIDADE_FILA', 100),
+    # Fila cheia: quanto o chamador espera por uma vaga antes de descartar o envio
+    'ESPERA_FILA_CHEIA_SEGUNDOS': get_int_env('NOTIFICACOES_ESPERA_FILA_CHEIA_SEGUNDOS', 5),
+    # Saída persistente: tentativas por envio e backoff exponencial entre elas
+    'MAX_TENTATIVAS': get_int_env('NOTIFICACOES_MAX_TENTATIVAS', 5),
+    'BACKOFF_BASE_SEGUNDOS': get_int_env('NOTIFICACOES_BACKOFF_BASE_SEGUNDOS', 60),
+    'BACKOFF_MAX_SEGUNDOS': get_int_env('NOTIFICACOES_BACKOFF_MAX_SEGUNDOS', 3600),
+    # Validade da reserva de um envio (retomado por outro processo se expirar)
+    'RESERVA_SEGUNDOS': get_int_env('NOTIFICACOES_RESERVA_SEGUNDOS', 300),
+    # Releitura da saída para enxergar envios gravados por outros processos
+    'INTERVALO_CONSULTA_SEGUNDOS': get_int_env('NOTIFICACOES_INTERVALO_CONSULTA_SEGUNDOS', 15),
+    # Acompanhamento das entregas assíncronas (202): intervalo adaptativo e prazo
+    'ACOMPANHAMENTO_INTERVALO_INICIAL_SEGUNDOS': get_int_env('NOTIFICACOES_ACOMPANHAMENTO_INTERVALO_INICIAL_SEGUNDOS', 10),
+    'ACOMPANHAMENTO_INTERVALO_MAX_SEGUNDOS': get_int_env('NOTIFICACOES_ACOMPANHAMENTO_INTERVALO_MAX_SEGUNDOS', 600),
+    'ACOMPANHAMENTO_PRAZO_HORAS': get_int_env('NOTIFICACOES_ACOMPANHAMENTO_PRAZO_HORAS', 24),
+    # Limite de taxa por endpoint da API (balde de tokens): envios por minuto e rajada
+    'LIMITES_TAXA': {
+        'whatsapp': {
+            'POR_MINUTO': get_int_env('NOTIFICACOES_WHATSAPP_POR_MINUTO', 30),
+            'RAJADA': get_int_env('NOTIFICACOES_WHATSAPP_RAJADA', 1)
+        },
+        'email': {
+            'POR_MINUTO': get_int_env('NOTIFICACOES_EMAIL_POR_MINUTO', 30),
+            'RAJADA': get_int_env('NOTIFICACOES_EMAIL_RAJADA', 1)
+        },
+        'padrao': {'POR_MINUTO': 30, 'RAJADA': 1}
+    }
+}
+
 # =============================================================================
 # CONFIGURAÇÕES DE PAGINAÇÃO E CACHE
 # =============================================================================
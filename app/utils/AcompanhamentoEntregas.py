@@ -0,0 +1,315 @@
+# app/utils/AcompanhamentoEntregas.py
+"""
+Acompanhamento das entregas aceitas de forma assíncrona pela API de envio
+
+Quando a API do HelpDesk Monitor responde 202 (task_id + status_url), o envio
+é concluído na saída com o registro do histórico em 'aceito' e uma linha em
+acompanhamento_entregas, gravada na mesma transação. Uma thread no processo
+líder consulta as status_url vencidas em rodadas, numa única sessão HTTP
+(conexão reaproveitada), com intervalo adaptativo por tarefa: começa em
+NOTIFICACOES_ACOMPANHAMENTO_INTERVALO_INICIAL_SEGUNDOS e dobra a cada consulta
+sem resultado até NOTIFICACOES_ACOMPANHAMENTO_INTERVALO_MAX_SEGUNDOS. O
+resultado final ('sucesso'/'erro') e a latência de ponta a ponta (pedido de
+envio até a confirmação) vão para o mesmo registro do histórico. Tarefas sem
+resposta final dentro de NOTIFICACOES_ACOMPANHAMENTO_PRAZO_HORAS ficam como
+'aceito', com a entrega marcada como não confirmada.
+"""
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from threading import Thread, Condition, Lock
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import requests
+
+from ..config import NOTIFICACOES_CONFIG, WHATSAPP_API
+from .GerenciadorHistoricoNotificacoes import GerenciadorHistoricoNotificacoes
+from .LiderancaProcessos import LiderancaProcessos
+
+# Valores do campo 'status' da API de tarefas (comparados em minúsculas)
+STATUS_ENTREGUE = {'concluido', 'concluída', 'concluida', 'sucesso', 'success', 'completed', 'done', 'sent', 'enviado'}
+STATUS_FALHOU = {'erro', 'error', 'falhou', 'failed', 'failure', 'cancelado', 'cancelled', 'canceled'}
+
+CONSULTAS_POR_RODADA = 50
+
+
+class AcompanhamentoEntregas:
+    """Consulta o status das entregas assíncronas e fecha o registro do histórico (singleton)"""
+
+    _instance = None
+    _inst_lock = Lock()
+
+    def __init__(self, historico: GerenciadorHistoricoNotificacoes = None):
+        self.logger = logging.getLogger('EventosFeriados.AcompanhamentoEntregas')
+        self.config = NOTIFICACOES_CONFIG
+        self.historico = historico or GerenciadorHistoricoNotificacoes.get_instance()
+        self.db_path = self.historico.db_path
+        self._init_database()
+
+        self.lideranca = LiderancaProcessos.get_instance()
+        self.lideranca.ao_assumir(self.acordar)
+        self._cond = Condition()
+        self._worker: Optional[Thread] = None
+        self._executando = False
+        self._acordado = False
+
+        self._consultas = 0
+        self._confirmadas = 0
+        self._falhas = 0
+        self._expiradas = 0
+
+    @classmethod
+    def get_instance(cls) -> 'AcompanhamentoEntregas':
+        if cls._instance is None:
+            with cls._inst_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _conectar(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        """Cria a tabela de acompanhamento se não existir"""
+        try:
+            conn = self._conectar()
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS acompanhamento_entregas (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    historico_id INTEGER NOT NULL,
+                    canal TEXT NOT NULL,
+                    task_id TEXT,
+                    status_url TEXT NOT NULL,
+                    solicitado_em TEXT NOT NULL,
+                    aceito_em TEXT NOT NULL,
+                    proxima_consulta TEXT NOT NULL,
+                    consultas INTEGER NOT NULL DEFAULT 0,
+                    ultimo_status TEXT,
+                    ultimo_erro TEXT
+                )
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_acompanhamento_proxima
+                ON acompanhamento_entregas(proxima_consulta)
+            ''')
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            self.logger.error(f"Erro ao inicializar acompanhamento de entregas: {e}")
+            raise
+
+    def inserir_registro(self, cursor: sqlite3.Cursor, historico_id: int, canal: str,
+                         task_id: Optional[str], status_url: str, solicitado_em: str) -> int:
+        """Passa a acompanhar uma tarefa aceita (na transação do chamador)"""
+        agora = datetime.now()
+        primeira = agora + timedelta(seconds=self.config['ACOMPANHAMENTO_INTERVALO_INICIAL_SEGUNDOS'])
+        cursor.execute('''
+            INSERT INTO acompanhamento_entregas (
+                historico_id, canal, task_id, status_url, solicitado_em, aceito_em, proxima_consulta
+            ) VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', (historico_id, canal, task_id, status_url, solicitado_em, agora.isoformat(), primeira.isoformat()))
+        return cursor.lastrowid
+
+    # ------------------------------------------------------------------
+    # Thread de consulta
+    # ------------------------------------------------------------------
+
+    def iniciar(self):
+        """Inicia a thread de consulta (só consulta enquanto o processo for líder)"""
+        with self._cond:
+            if self._executando:
+                return
+            self._executando = True
+
+        pendentes = self.contar_pendentes()
+        if pendentes:
+            self.logger.info(f"Retomando acompanhamento de {pendentes} entregas assíncronas")
+
+        self._worker = Thread(target=self._loop_worker, name='acompanhamento-entregas', daemon=True)
+        self._worker.start()
+
+    def acordar(self):
+        with self._cond:
+            self._acordado = True
+            self._cond.notify_all()
+
+    def parar(self):
+        with self._cond:
+            self._executando = False
+            self._cond.notify_all()
+
+    def _loop_worker(self):
+        sessao = requests.Session()
+        sessao.headers['Authorization'] = f"Bearer {WHATSAPP_API['TOKEN']}"
+        while True:
+            with self._cond:
+                if not self._executando:
+                    return
+                self._acordado = False
+                if not self.lideranca.eh_lider:
+                    # Seguidor: o líder consulta as tarefas gravadas por todos
+                    self._cond.wait()
+                    continue
+
+            try:
+                vencidas = self._listar_vencidas()
+                if vencidas:
+                    self._aplicar_resultados([self._consultar(sessao, tarefa) for tarefa in vencidas])
+                    continue
+            except Exception as e:
+                self.logger.error(f"Erro na rodada de acompanhamento de entregas: {e}")
+
+            espera = self.config['INTERVALO_CONSULTA_SEGUNDOS']
+            proxima = self._proxima_consulta()
+            if proxima is not None:
+                espera = min(espera, (proxima - datetime.now()).total_seconds())
+            with self._cond:
+                if self._executando and not self._acordado:
+                    self._cond.wait(timeout=max(espera, 0.5))
+
+    def _listar_vencidas(self) -> List[Dict]:
+        conn = self._conectar()
+        rows = conn.execute('''
+            SELECT * FROM acompanhamento_entregas
+            WHERE proxima_consulta <= ?
+            ORDER BY proxima_consulta ASC
+            LIMIT ?
+        ''', (datetime.now().isoformat(), CONSULTAS_POR_RODADA)).fetchall()
+        conn.close()
+        return [dict(row) for row in rows]
+
+    def _proxima_consulta(self) -> Optional[datetime]:
+        try:
+            conn = self._conectar()
+            row = conn.execute("SELECT MIN(proxima_consulta) FROM acompanhamento_entregas").fetchone()
+            conn.close()
+            return datetime.fromisoformat(row[0]) if row and row[0] else None
+        except Exception as e:
+            self.logger.error(f"Erro ao consultar acompanhamento de entregas: {e}")
+            return None
+
+    def _consultar(self, sessao: requests.Session, tarefa: Dict) -> Tuple[Dict, str, Dict]:
+        """
+        Consulta uma status_url
+
+        Returns:
+            (tarefa, situação, dados): situação 'entregue', 'falhou', 'pendente'
+            ou 'indisponivel' (erro na consulta ou tarefa desconhecida pela API)
+        """
+        url = urljoin(f"{WHATSAPP_API['HOST']}/", tarefa['status_url'])
+        try:
+            resp = sessao.get(url, timeout=WHATSAPP_API.get('TIMEOUT', 30), verify=False)
+        except requests.RequestException as e:
+            return tarefa, 'indisponivel', {'erro': str(e)}
+        finally:
+            self._consultas += 1
+
+        if resp.status_code == 404:
+            return tarefa, 'indisponivel', {'erro': 'tarefa não encontrada na API (404)', 'definitivo': True}
+        try:
+            corpo = resp.json()
+        except ValueError:
+            corpo = {}
+        if not resp.ok or not isinstance(corpo, dict):
+            return tarefa, 'indisponivel', {'erro': f"HTTP {resp.status_code}: {resp.text[:200]}"}
+
+        status = str(corpo.get('status', '')).lower()
+        if status in STATUS_ENTREGUE:
+            return tarefa, 'entregue', corpo
+        if status in STATUS_FALHOU:
+            return tarefa, 'falhou', corpo
+        return tarefa, 'pendente', corpo
+
+    @staticmethod
+    def _instante_conclusao(corpo: Dict) -> datetime:
+        """Horário de conclusão informado pela API (no fuso local, sem tzinfo), se houver; senão agora"""
+        for campo in ('concluido_em', 'finalizado_em', 'completed_at', 'finished_at'):
+            valor = corpo.get(campo)
+            if valor:
+                try:
+                    instante = datetime.fromisoformat(str(valor).replace('Z', '+00:00'))
+                except ValueError:
+                    continue
+                if instante.tzinfo is not None:
+                    # solicitado_em é local sem fuso: converte antes de descartar o fuso
+                    instante = instante.astimezone().replace(tzinfo=None)
+                return instante
+        return datetime.now()
+
+    def _proximo_intervalo(self, consultas: int) -> float:
+        return min(self.config['ACOMPANHAMENTO_INTERVALO_INICIAL_SEGUNDOS'] * (2 ** consultas),
+                   self.config['ACOMPANHAMENTO_INTERVALO_MAX_SEGUNDOS'])
+
+    def _aplicar_resultados(self, resultados: List[Tuple[Dict, str, Dict]]):
+        """Grava o resultado da rodada numa única transação"""
+        agora = datetime.now()
+        prazo = timedelta(hours=self.config['ACOMPANHAMENTO_PRAZO_HORAS'])
+        conn = self._conectar()
+        with conn:
+            cursor = conn.cursor()
+            for tarefa, situacao, dados in resultados:
+                consultas = tarefa['consultas'] + 1
+                detalhes = {'entrega_consultas': consultas}
+                if 'status' in dados:
+                    detalhes['entrega_status'] = dados['status']
+
+                if situacao in ('entregue', 'falhou'):
+                    concluido_em = self._instante_conclusao(dados)
+                    solicitado_em = datetime.fromisoformat(tarefa['solicitado_em'])
+                    detalhes['entrega'] = 'confirmada' if situacao == 'entregue' else 'falhou'
+                    detalhes['latencia_entrega_ms'] = max(int((concluido_em - solicitado_em).total_seconds() * 1000), 0)
+                    erro = None
+                    if situacao == 'falhou':
+                        erro = str(dados.get('erro') or dados.get('error') or dados.get('mensagem') or dados['status'])[:500]
+                    self.historico.atualizar_registro(
+                        cursor, tarefa['historico_id'], 'sucesso' if situacao == 'entregue' else 'erro',
+                        detalhes, error_message=erro
+                    )
+                    cursor.execute("DELETE FROM acompanhamento_entregas WHERE id = ?", (tarefa['id'],))
+                    if situacao == 'entregue':
+                        self._confirmadas += 1
+                    else:
+                        self._falhas += 1
+                        self.logger.warning(f"Entrega {tarefa['canal']} task_id={tarefa['task_id']} falhou: {erro}")
+                    continue
+
+                expirou = agora - datetime.fromisoformat(tarefa['aceito_em']) >= prazo
+                if expirou or dados.get('definitivo'):
+                    detalhes['entrega'] = 'nao_confirmada'
+                    self.historico.atualizar_registro(cursor, tarefa['historico_id'], 'aceito', detalhes)
+                    cursor.execute("DELETE FROM acompanhamento_entregas WHERE id = ?", (tarefa['id'],))
+                    self._expiradas += 1
+                    self.logger.warning(f"Entrega {tarefa['canal']} task_id={tarefa['task_id']} sem confirmação: "
+                                        f"{dados.get('erro') or 'prazo de acompanhamento esgotado'}")
+                    continue
+
+                proxima = agora + timedelta(seconds=self._proximo_intervalo(consultas))
+                cursor.execute('''
+                    UPDATE acompanhamento_entregas
+                    SET consultas = ?, proxima_consulta = ?, ultimo_status = ?, ultimo_erro = ?
+                    WHERE id = ?
+                ''', (consultas, proxima.isoformat(), dados.get('status'), dados.get('erro'), tarefa['id']))
+        conn.close()
+
+    def contar_pendentes(self) -> int:
+        try:
+            conn = self._conectar()
+            total = conn.execute("SELECT COUNT(*) FROM acompanhamento_entregas").fetchone()[0]
+            conn.close()
+            return total
+        except Exception as e:
+            self.logger.error(f"Erro ao contar acompanhamento de entregas: {e}")
+            return 0
+
+    def status(self) -> Dict:
+        return {
+            'ativo': bool(self._worker and self._worker.is_alive()),
+            'pendentes': self.contar_pendentes(),
+            'consultas': self._consultas,
+            'confirmadas': self._confirmadas,
+            'falhas': self._falhas,
+            'nao_confirmadas': self._expiradas
+        }
@@ -1,29 +1,28 @@
 # app/utils/AgendadorCLP.py
 import threading
-import time
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
-from .SincronizadorCLP import SincronizadorCLP
-from .SincronizadorCLPAuditorio import SincronizadorCLPAuditorio
+from .RegistroControladoresCLP import RegistroControladoresCLP
 from .SincronizadorTCE import SincronizadorTCE
+from .AgendadorTarefas import AgendadorTarefas
 
 class AgendadorCLP:
     """
-    Classe responsável por agendar e executar sincronizações automáticas com CLPs e TCE
-    Executa em thread separada para não bloquear a aplicação
-    Gerencia tanto o CLP do Plenário quanto o CLP do Auditório e eventos do TCE
+    Classe responsável por agendar as sincronizações automáticas com CLPs e TCE
+    Registra uma tarefa diária por CLP do registro de controladores (SYNC_TIMES)
+    e uma para o TCE no agendador de tarefas, que dispara cada uma no horário exato
     """
     
     _instance = None
     _lock = threading.Lock()
     
-    def __init__(self):
+    def __init__(self, sincronizador_tce: Optional[SincronizadorTCE] = None):
         self.logger = logging.getLogger('EventosFeriados.AgendadorCLP')
-        self.sincronizador_plenario = SincronizadorCLP.get_instance()
-        self.sincronizador_auditorio = SincronizadorCLPAuditorio.get_instance()
-        self.sincronizador_tce = SincronizadorTCE.get_instance()
-        self.thread_agendador: Optional[threading.Thread] = None
+        self.registro = RegistroControladoresCLP.get_instance()
+        self.sincronizador_tce = (sincronizador_tce if sincronizador_tce is not None
+                                  else SincronizadorTCE.get_instance())
+        self.tarefas = AgendadorTarefas.get_instance()
         self.executando = False
         self.gerenciador_feriados = None
         self.gerenciador_eventos = None
@@ -35,152 +34,101 @@ class AgendadorCLP:
             'ultima_sincronizacao': None
         }
         
+        # Última sincronização TCE bem-sucedida sobrevive a reinícios (registro de tarefas)
+        estado_tce = self.tarefas.registro.obter('tce')
+        if estado_tce and estado_tce['ultimo_resultado'] == 'sucesso':
+            self.tce_config['ultima_sincronizacao'] = estado_tce['ultimo_inicio']
+        
     @classmethod
-    def get_instance(cls):
-        """Retorna a instância única do agendador (Singleton)"""
+    def get_instance(cls, sincronizador_tce: Optional[SincronizadorTCE] = None):
+        """Retorna a instância única do agendador (Singleton); o sincronizador vale só na criação"""
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
-                    cls._instance = cls()
+                    cls._instance = cls(sincronizador_tce)
         return cls._instance
     
     def inicializar_gerenciadores(self, gerenciador_feriados, gerenciador_eventos):
         """Inicializa as referências aos gerenciadores"""
         self.gerenciador_feriados = gerenciador_feriados
         self.gerenciador_eventos = gerenciador_eventos
+        self.registro.vincular_gerenciadores(gerenciador_feriados, gerenciador_eventos)
         self.logger.info("Gerenciadores inicializados no agendador CLP")
     
-    def _deve_sincronizar_tce(self) -> bool:
-        """Verifica se deve executar sincronização do TCE"""
-        if not self.tce_config['SYNC_ENABLED']:
-            return False
-        
-        agora = datetime.now()
-        hora_sync = datetime.strptime(self.tce_config['SYNC_TIME'], '%H:%M').time()
-        
-        # Verificar se estamos no horário de sincronização (com tolerância de 1 minuto)
-        if not (agora.time().hour == hora_sync.hour and 
-                abs(agora.time().minute - hora_sync.minute) <= 1):
-            return False
-        
-        # Verificar se já sincronizou hoje neste horário
-        ultima_sync = self.tce_config['ultima_sincronizacao']
-        if ultima_sync:
-            try:
-                dt_ultima = datetime.fromisoformat(ultima_sync)
-                if (dt_ultima.date() == agora.date() and 
-                    dt_ultima.time().hour == hora_sync.hour):
-                    return False  # Já sincronizou hoje neste horário
-            except:
-                pass  # Se der erro no parse, continua para sincronizar
+    @staticmethod
+    def _nome_tarefa(clp_tipo: str) -> str:
+        return 'tce' if clp_tipo == 'tce' else f'clp.{clp_tipo}'
+    
+    def _agendar_tce(self):
+        """Registra (ou remove) a tarefa diária de sincronização do TCE"""
+        if self.tce_config['SYNC_ENABLED']:
+            self.tarefas.agendar_diario('tce', [self.tce_config['SYNC_TIME']], self._executar_sincronizacao_tce)
+        else:
+            self.tarefas.cancelar('tce')
+    
+    def _agendar_controladores(self):
+        """Registra uma tarefa diária por CLP com sincronização automática habilitada"""
+        for chave, sincronizador in self.registro.sincronizadores().items():
+            if sincronizador.config['SYNC_ENABLED']:
+                self.tarefas.agendar_diario(self._nome_tarefa(chave), sincronizador.config['SYNC_TIMES'],
+                                            self._executar_sincronizacao_clp, (chave,))
+            else:
+                self.tarefas.cancelar(self._nome_tarefa(chave))
+    
+    def _executar_sincronizacao_tce(self):
+        """Tarefa agendada: sincronização automática do TCE"""
+        self.logger.info("Executando sincronização automática TCE")
+        resultado = self.sincronizador_tce.sincronizar_periodo_atual()
         
-        return True
+        if resultado['sucesso']:
+            self.logger.info(f"Sincronização automática TCE concluída: {resultado['total_eventos_criados']} eventos processados")
+            self.tce_config['ultima_sincronizacao'] = datetime.now().isoformat()
+        else:
+            self.logger.error(f"Falha na sincronização automática TCE: {resultado.get('erro', 'Erro desconhecido')}")
+        return resultado
     
-    def _loop_agendador(self):
-        """Loop principal do agendador executado em thread separada"""
-        self.logger.info("Agendador iniciado (CLP Plenário + CLP Auditório + TCE)")
+    def _executar_sincronizacao_clp(self, chave: str):
+        """Tarefa agendada: sincronização automática de um CLP do registro"""
+        sincronizador = self.registro.obter_sincronizador(chave)
+        if sincronizador is None:
+            self.logger.warning(f"CLP '{chave}' não está mais registrado; sincronização automática ignorada")
+            return
+        
+        if not self.gerenciador_eventos:
+            self.logger.warning(f"Gerenciadores não inicializados para sincronização automática CLP {sincronizador.nome}")
+            return
         
-        while self.executando:
-            try:
-                # Verificar se deve executar sincronização do TCE
-                if self._deve_sincronizar_tce():
-                    self.logger.info("Executando sincronização automática TCE")
-                    resultado = self.sincronizador_tce.sincronizar_periodo_atual()
-                    
-                    if resultado['sucesso']:
-                        self.logger.info(f"Sincronização automática TCE concluída: {resultado['total_eventos_criados']} eventos processados")
-                        self.tce_config['ultima_sincronizacao'] = datetime.now().isoformat()
-                    else:
-                        self.logger.error(f"Falha na sincronização automática TCE: {resultado.get('erro', 'Erro desconhecido')}")
-                
-                # Verificar se deve executar sincronização do CLP Plenário
-                if self.sincronizador_plenario.deve_sincronizar_automaticamente():
-                    if self.gerenciador_feriados and self.gerenciador_eventos:
-                        self.logger.info("Executando sincronização automática CLP Plenário")
-                        resultado = self.sincronizador_plenario.sincronizar_manual(
-                            self.gerenciador_feriados, 
-                            self.gerenciador_eventos
-                        )
-                        
-                        if resultado['sucesso']:
-                            self.logger.info(f"Sincronização automática CLP Plenário concluída: {resultado['dados_sincronizados']} itens")
-                        else:
-                            self.logger.error(f"Falha na sincronização automática CLP Plenário: {resultado.get('erro', 'Erro desconhecido')}")
-                    else:
-                        self.logger.warning("Gerenciadores não inicializados para sincronização automática CLP Plenário")
-                
-                # Verificar se deve executar sincronização do CLP Auditório
-                if self.sincronizador_auditorio.config['SYNC_ENABLED']:
-                    # Usar a mesma lógica de horários do CLP Plenário
-                    deve_sincronizar = False
-                    agora = datetime.now()
-                    
-                    for horario in self.sincronizador_auditorio.config['SYNC_TIMES']:
-                        try:
-                            hora_sync = datetime.strptime(horario.strip(), '%H:%M').time()
-                            
-                            # Verificar se estamos no horário de sincronização (com tolerância de 1 minuto)
-                            if (agora.time().hour == hora_sync.hour and 
-                                abs(agora.time().minute - hora_sync.minute) <= 1):
-                                
-                                # Verificar se já sincronizou hoje neste horário
-                                ultima_sync = self.sincronizador_auditorio.ultimo_status.get('ultima_sincronizacao')
-                                if ultima_sync:
-                                    try:
-                                        dt_ultima = datetime.fromisoformat(ultima_sync)
-                                        if (dt_ultima.date() == agora.date() and 
-                                            dt_ultima.time().hour == hora_sync.hour):
-                                            continue  # Já sincronizou hoje neste horário
-                                    except:
-                                        pass  # Se der erro no parse, continua para sincronizar
-                                
-                                deve_sincronizar = True
-                                break
-                        except Exception as e:
-                            self.logger.error(f"Erro ao processar horário de sincronização '{horario}': {e}")
-                    
-                    if deve_sincronizar and self.gerenciador_eventos:
-                        self.logger.info("Executando sincronização automática CLP Auditório")
-                        resultado = self.sincronizador_auditorio.sincronizar_manual(self.gerenciador_eventos)
-                        
-                        if resultado['sucesso']:
-                            self.logger.info(f"Sincronização automática CLP Auditório concluída: {resultado['dados_sincronizados']} itens")
-                        else:
-                            self.logger.error(f"Falha na sincronização automática CLP Auditório: {resultado.get('erro', 'Erro desconhecido')}")
-                
-                # Dormir por 1 minuto antes da próxima verificação
-                time.sleep(60)
-                
-            except Exception as e:
-                self.logger.error(f"Erro no loop do agendador: {e}")
-                time.sleep(60)  # Continuar mesmo com erro
+        self.logger.info(f"Executando sincronização automática CLP {sincronizador.nome}")
+        resultado = sincronizador.sincronizar()
         
-        self.logger.info("Agendador finalizado")
+        if resultado['sucesso']:
+            self.logger.info(f"Sincronização automática CLP {sincronizador.nome} concluída: {resultado['dados_sincronizados']} itens")
+        else:
+            self.logger.error(f"Falha na sincronização automática CLP {sincronizador.nome}: {resultado.get('erro', 'Erro desconhecido')}")
+        return resultado
     
     def iniciar(self):
-        """Inicia o agendador em thread separada"""
+        """Registra as sincronizações diárias e inicia o agendador de tarefas"""
         if self.executando:
             self.logger.warning("Agendador já está executando")
             return
         
         self.executando = True
-        self.thread_agendador = threading.Thread(
-            target=self._loop_agendador,
-            name="AgendadorCLP",
-            daemon=True
-        )
-        self.thread_agendador.start()
-        self.logger.info("Agendador iniciado em thread separada")
+        self._agendar_controladores()
+        self._agendar_tce()
+        self.tarefas.iniciar()
+        self.logger.info(f"Agendador iniciado (CLPs {self.registro.chaves()} + TCE)")
     
     def parar(self):
-        """Para o agendador"""
+        """Remove as sincronizações diárias do agendador de tarefas"""
         if not self.executando:
             self.logger.warning("Agendador não está executando")
             return
         
         self.executando = False
-        if self.thread_agendador and self.thread_agendador.is_alive():
-            self.thread_agendador.join(timeout=5)
+        for chave in self.registro.chaves():
+            self.tarefas.cancelar(self._nome_tarefa(chave))
+        self.tarefas.cancelar('tce')
         
         self.logger.info("Agendador parado")
     
@@ -188,6 +136,8 @@ class AgendadorCLP:
         """Configura a sincronização do TCE"""
         self.tce_config['SYNC_ENABLED'] = habilitado
         self.tce_config['SYNC_TIME'] = horario
+        if self.executando:
+            self._agendar_tce()
         self.logger.info(f"Configuração TCE atualizada - Habilitado: {habilitado}, Horário: {horario}")
     
     def sincronizar_tce_manual(self) -> dict:
@@ -205,55 +155,32 @@ class AgendadorCLP:
     
     def status(self) -> dict:
         """Retorna o status do agendador"""
+        plenario = self.registro.obter_sincronizador('plenario')
+        auditorio = self.registro.obter_sincronizador('auditorio')
         return {
             'executando': self.executando,
-            'thread_ativa': self.thread_agendador.is_alive() if self.thread_agendador else False,
+            'thread_ativa': self.tarefas.status()['executando'],
             'gerenciadores_inicializados': bool(self.gerenciador_feriados and self.gerenciador_eventos),
             'proximo_horario_plenario': self._calcular_proximo_horario('plenario'),
             'proximo_horario_auditorio': self._calcular_proximo_horario('auditorio'),
             'proximo_horario_tce': self._calcular_proximo_horario('tce'),
-            'status_plenario': self.sincronizador_plenario.ultimo_status,
-            'status_auditorio': self.sincronizador_auditorio.ultimo_status,
-            'status_tce': self.tce_config
+            'status_plenario': plenario.ultimo_status if plenario else None,
+            'status_auditorio': auditorio.ultimo_status if auditorio else None,
+            'status_tce': self.tce_config,
+            'controladores': {
+                chave: {
+                    'nome': sincronizador.nome,
+                    'proximo_horario': self._calcular_proximo_horario(chave),
+                    'status': sincronizador.ultimo_status
+                }
+                for chave, sincronizador in self.registro.sincronizadores().items()
+            }
         }
     
     def _calcular_proximo_horario(self, clp_tipo: str) -> Optional[str]:
-        """Calcula o próximo horário de sincronização"""
-        agora = datetime.now()
-        
-        if clp_tipo == 'tce':
-            if not self.tce_config['SYNC_ENABLED']:
-                return None
-            
-            hora, minuto = map(int, self.tce_config['SYNC_TIME'].split(':'))
-            proximo = agora.replace(hour=hora, minute=minuto, second=0, microsecond=0)
-            
-            if proximo <= agora:
-                proximo += timedelta(days=1)
-            
-            return proximo.strftime('%H:%M' + (' (amanhã)' if proximo.date() > agora.date() else ''))
-        
-        elif clp_tipo == 'plenario':
-            sincronizador = self.sincronizador_plenario
-        else:  # auditorio
-            sincronizador = self.sincronizador_auditorio
-            
-        if not sincronizador.config['SYNC_ENABLED']:
+        """Próximo horário de sincronização, conforme o agendador de tarefas"""
+        proximo = self.tarefas.proxima_execucao(self._nome_tarefa(clp_tipo))
+        if proximo is None:
             return None
         
-        horarios = sincronizador.config['SYNC_TIMES']
-        
-        for horario in horarios:
-            hora, minuto = map(int, horario.split(':'))
-            proximo = agora.replace(hour=hora, minute=minuto, second=0, microsecond=0)
-            
-            if proximo > agora:
-                return proximo.strftime('%H:%M')
-        
-        # Se não há horário hoje, pegar o primeiro de amanhã
-        if horarios:
-            hora, minuto = map(int, horarios[0].split(':'))
-            proximo = (agora + timedelta(days=1)).replace(hour=hora, minute=minuto, second=0, microsecond=0)
-            return proximo.strftime('%H:%M (amanhã)')
-        
-        return None
+        return proximo.strftime('%H:%M' + (' (amanhã)' if proximo.date() > datetime.now().date() else ''))
@@ -0,0 +1,560 @@
+# app/utils/AgendadorTarefas.py
+"""
+Agendador único das tarefas em segundo plano
+
+As próximas execuções (sincronizações diárias dos CLPs e do TCE, lembretes,
+temporizadores de disparo único) ficam em um heap ordenado pelo instante de
+disparo, e a thread do agendador dorme exatamente até a primeira delas, sem
+acordar a cada minuto. Cada disparo roda em um pool limitado de threads e uma
+tarefa nunca executa em paralelo consigo mesma.
+
+O estado das tarefas diárias e de disparo único fica no RegistroTarefasAgendadas
+(SQLite). Ao registrar uma tarefa pela primeira vez no processo, o agendador
+verifica se um disparo previsto ficou sem executar enquanto o serviço estava
+parado e aplica a política de recuperação: 'executar' (roda uma vez agora),
+'ignorar' ou 'janela' (roda só se o atraso couber na janela configurada).
+
+Com vários processos, todos registram as mesmas tarefas, mas só o líder
+(LiderancaProcessos) as executa, depois de reler os dados gravados pelos
+seguidores (LiderancaProcessos.preparar_execucao). Num seguidor o disparo apenas avança para a
+próxima ocorrência; ao assumir a liderança, o processo reaplica a recuperação
+aos disparos que o líder anterior deixou sem executar.
+"""
+import heapq
+import itertools
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from threading import Condition, Lock, Thread
+from typing import Callable, Dict, Iterable, List, Optional
+
+from ..config import AGENDADOR_CONFIG
+from .LiderancaProcessos import LiderancaProcessos
+from .RegistroTarefasAgendadas import RegistroTarefasAgendadas
+from .tempo_minutos import MINUTOS_POR_DIA, hora_minuto, para_hhmm, para_minutos
+
+# Espera máxima entre reavaliações do heap (acompanha ajustes no relógio do sistema)
+ESPERA_MAXIMA_SEGUNDOS = 3600
+
+POLITICAS_RECUPERACAO = ('executar', 'ignorar', 'janela')
+
+
+class Tarefa:
+    """Tarefa agendada: diária (horários HH:MM), em intervalo fixo ou de disparo único"""
+
+    def __init__(self, nome: str, funcao: Callable, args: tuple, tipo: str,
+                 horarios: Optional[List[int]] = None, intervalo: Optional[float] = None):
+        self.nome = nome
+        self.funcao = funcao
+        self.args = args
+        self.tipo = tipo  # 'diaria', 'intervalo' ou 'unica'
+        self.horarios = sorted(set(horarios or []))  # minutos desde 00:00
+        self.intervalo = intervalo  # segundos
+        self.proxima: Optional[datetime] = None
+        self.recuperando: Optional[datetime] = None  # disparo perdido executado agora
+        self.recuperacao: Optional[str] = None  # política própria (None = padrão do agendador)
+        self.janela_minutos: Optional[int] = None
+        self.geracao = 0  # invalida entradas antigas do heap ao reagendar/cancelar
+        self.execucoes = 0
+        self.falhas = 0
+        self.ignoradas = 0
+        self.ultima_execucao: Optional[datetime] = None
+        self.ultima_duracao_ms: Optional[float] = None
+        self.ultimo_erro: Optional[str] = None
+
+    def calcular_proxima(self, referencia: datetime) -> Optional[datetime]:
+        """Próximo disparo estritamente depois da referência (None para tarefa única)"""
+        if self.tipo == 'diaria':
+            for dias in (0, 1):
+                dia = referencia.date() + timedelta(days=dias)
+                for minuto in self.horarios:
+                    hora, minuto_hora = hora_minuto(minuto)
+                    candidato = datetime(dia.year, dia.month, dia.day, hora, minuto_hora)
+                    if candidato > referencia:
+                        return candidato
+            return None
+        if self.tipo == 'intervalo':
+            return referencia + timedelta(seconds=self.intervalo)
+        return None
+
+    def calcular_anterior(self, referencia: datetime) -> Optional[datetime]:
+        """Último disparo diário previsto até a referência (inclusive)"""
+        for dias in (0, 1):
+            dia = referencia.date() - timedelta(days=dias)
+            for minuto in reversed(self.horarios):
+                hora, minuto_hora = hora_minuto(minuto)
+                candidato = datetime(dia.year, dia.month, dia.day, hora, minuto_hora)
+                if candidato <= referencia:
+                    return candidato
+        return None
+
+    @property
+    def persistente(self) -> bool:
+        return self.tipo != 'intervalo'
+
+    def intervalo_minimo_segundos(self) -> Optional[float]:
+        """Menor distância entre dois disparos consecutivos (None para tarefa única)"""
+        if self.tipo == 'intervalo':
+            return self.intervalo
+        if self.tipo == 'diaria' and self.horarios:
+            seguintes = self.horarios[1:] + [self.horarios[0] + MINUTOS_POR_DIA]
+            return min(b - a for a, b in zip(self.horarios, seguintes)) * 60
+        return None
+
+    def para_dict(self) -> Dict:
+        return {
+            'nome': self.nome,
+            'tipo': self.tipo,
+            'horarios': [para_hhmm(m) for m in self.horarios] if self.tipo == 'diaria' else None,
+            'intervalo_segundos': self.intervalo,
+            'proxima_execucao': self.proxima.isoformat() if self.proxima else None,
+            'execucoes': self.execucoes,
+            'falhas': self.falhas,
+            'ignoradas_por_sobreposicao': self.ignoradas,
+            'ultima_execucao': self.ultima_execucao.isoformat() if self.ultima_execucao else None,
+            'ultima_duracao_ms': self.ultima_duracao_ms,
+            'ultimo_erro': self.ultimo_erro
+        }
+
+
+class AgendadorTarefas:
+    """Heap de prazos + pool limitado de execução, compartilhado por todos os agendamentos"""
+
+    _instance = None
+    _lock = Lock()
+
+    def __init__(self):
+        self.logger = logging.getLogger('EventosFeriados.AgendadorTarefas')
+        self.trabalhadores = max(1, AGENDADOR_CONFIG['TRABALHADORES'])
+        self._tarefas: Dict[str, Tarefa] = {}
+        self._heap: List[tuple] = []  # (instante, sequência, nome, geração)
+        self._sequencia = itertools.count()
+        self._em_execucao = set()  # nomes das tarefas enviadas ao pool
+        self._ativas = 0  # execuções que já ocupam um trabalhador do pool
+        self._avaliadas = set()  # tarefas já conferidas quanto a disparos perdidos neste processo
+        self.recuperacao = AGENDADOR_CONFIG['RECUPERACAO']
+        if self.recuperacao not in POLITICAS_RECUPERACAO:
+            self.logger.error(f"Política de recuperação inválida: '{self.recuperacao}'. Usando 'janela'")
+            self.recuperacao = 'janela'
+        self.janela_recuperacao = AGENDADOR_CONFIG['JANELA_RECUPERACAO_MINUTOS']
+        self.registro = RegistroTarefasAgendadas.get_instance()
+        removidas = self.registro.limpar_unicas_antigas()
+        if removidas:
+            self.logger.info(f"{removidas} temporizadores antigos removidos do registro de tarefas")
+        self._cond = Condition()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[Thread] = None
+        self.executando = False
+        self.lideranca = LiderancaProcessos.get_instance()
+        self.lideranca.ao_assumir(self._recuperar_apos_promocao)
+
+    @classmethod
+    def get_instance(cls) -> 'AgendadorTarefas':
+        """Retorna a instância única do agendador (Singleton)"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    # ------------------------------------------------------------------
+    # Registro de tarefas
+    # ------------------------------------------------------------------
+
+    def _disparo_perdido(self, tarefa: Tarefa, agora: datetime, quando: Optional[datetime]) -> Optional[datetime]:
+        """Disparo previsto que não chegou a executar (serviço parado), conforme o registro persistido"""
+        estado = self.registro.obter(tarefa.nome)
+        if not estado or estado['tipo'] != tarefa.tipo:
+            return None  # tarefa nova: não há como saber o que foi perdido
+
+        if tarefa.tipo == 'diaria':
+            perdido = tarefa.calcular_anterior(agora)
+            if perdido is None or datetime.fromisoformat(estado['criada_em']) > perdido:
+                return None
+        else:
+            if quando is None or quando > agora or estado['proxima_execucao'] != quando.isoformat():
+                return None
+            perdido = quando
+
+        ultima = estado['ultima_prevista']
+        if ultima and datetime.fromisoformat(ultima) >= perdido:
+            return None
+        return perdido
+
+    def _deve_recuperar(self, tarefa: Tarefa, perdido: datetime, agora: datetime) -> bool:
+        nome = tarefa.nome
+        politica = tarefa.recuperacao or self.recuperacao
+        janela = self.janela_recuperacao if tarefa.janela_minutos is None else tarefa.janela_minutos
+        atraso = agora - perdido
+
+        if politica == 'executar':
+            executar = True
+        elif politica == 'janela':
+            executar = atraso <= timedelta(minutes=janela)
+        else:
+            executar = False
+
+        if not executar:
+            decisao = 'ignorado'
+        elif self.lideranca.eh_lider:
+            decisao = 'executando agora'
+        else:
+            decisao = 'aguardando o processo líder'
+        self.logger.warning(f"Tarefa '{nome}' perdeu o disparo de {perdido:%d/%m %H:%M} "
+                            f"(atraso de {atraso.total_seconds() / 60:.0f} min, política '{politica}'): {decisao}")
+        return executar
+
+    def _registrar(self, tarefa: Tarefa, proxima: Optional[datetime], recuperacao: Optional[str] = None,
+                   janela_minutos: Optional[int] = None) -> Optional[datetime]:
+        agora = datetime.now()
+        tarefa.recuperacao = recuperacao
+        tarefa.janela_minutos = janela_minutos
+
+        if tarefa.persistente:
+            with self._cond:
+                primeira_vez = tarefa.nome not in self._avaliadas
+                self._avaliadas.add(tarefa.nome)
+                anterior = self._tarefas.get(tarefa.nome)
+                pendente = anterior.recuperando if anterior is not None else None
+            if primeira_vez:
+                perdido = self._disparo_perdido(tarefa, agora, proxima if tarefa.tipo == 'unica' else None)
+                if perdido and self._deve_recuperar(tarefa, perdido, agora):
+                    tarefa.recuperando = perdido
+                    proxima = agora
+            elif pendente is not None and tarefa.tipo == 'unica' and proxima is not None and proxima <= agora:
+                # Recuperação ainda não disparada (ex.: vários eventos na mesma data)
+                tarefa.recuperando = pendente
+                proxima = agora
+
+        if tarefa.tipo == 'unica' and proxima is not None and proxima <= agora and tarefa.recuperando is None:
+            # Temporizador no passado sem recuperação pendente: nada a agendar
+            self.cancelar(tarefa.nome)
+            return None
+
+        if tarefa.persistente:
+            # Antes de enfileirar: uma execução imediata não pode ter seu resultado sobrescrito
+            self.registro.registrar(tarefa.nome, tarefa.tipo, tarefa.recuperando or proxima)
+
+        with self._cond:
+            anterior = self._tarefas.get(tarefa.nome)
+            if anterior is not None:
+                # Reagendamento: mantém o histórico de execuções da tarefa
+                tarefa.geracao = anterior.geracao + 1
+                tarefa.execucoes = anterior.execucoes
+                tarefa.falhas = anterior.falhas
+                tarefa.ignoradas = anterior.ignoradas
+                tarefa.ultima_execucao = anterior.ultima_execucao
+                tarefa.ultima_duracao_ms = anterior.ultima_duracao_ms
+                tarefa.ultimo_erro = anterior.ultimo_erro
+            self._tarefas[tarefa.nome] = tarefa
+            self._enfileirar(tarefa, proxima)
+        return proxima
+
+    def _enfileirar(self, tarefa: Tarefa, proxima: Optional[datetime]):
+        """Coloca o próximo disparo no heap e acorda a thread se ele for o mais próximo (com _cond)"""
+        tarefa.proxima = proxima
+        if proxima is None:
+            return
+        entrada = (proxima.timestamp(), next(self._sequencia), tarefa.nome, tarefa.geracao)
+        heapq.heappush(self._heap, entrada)
+        if self._heap[0] is entrada:
+            self._cond.notify()
+
+    def agendar_diario(self, nome: str, horarios: Iterable[str], funcao: Callable, args: tuple = (),
+                       recuperacao: Optional[str] = None, janela_minutos: Optional[int] = None) -> Optional[datetime]:
+        """
+        Agenda uma tarefa em horários fixos do dia ('HH:MM'), substituindo outra de mesmo nome
+
+        Args:
+            recuperacao: Política para disparo perdido ('executar', 'ignorar', 'janela');
+                         padrão AGENDADOR_RECUPERACAO
+            janela_minutos: Atraso máximo aceito pela política 'janela'
+
+        Returns:
+            Instante do próximo disparo, ou None se nenhum horário for válido
+        """
+        minutos = []
+        for horario in horarios:
+            try:
+                minutos.append(para_minutos(horario))
+            except ValueError:
+                self.logger.error(f"Horário inválido para a tarefa '{nome}': '{horario}'")
+
+        if not minutos:
+            self.cancelar(nome)
+            return None
+
+        tarefa = Tarefa(nome, funcao, args, 'diaria', horarios=minutos)
+        proxima = self._registrar(tarefa, tarefa.calcular_proxima(datetime.now()), recuperacao, janela_minutos)
+        self.logger.info(f"Tarefa '{nome}' agendada diariamente às "
+                         f"{', '.join(para_hhmm(m) for m in tarefa.horarios)} (próxima: {proxima:%d/%m %H:%M})")
+        return proxima
+
+    def agendar_intervalo(self, nome: str, segundos: float, funcao: Callable, args: tuple = (),
+                          primeira_em: Optional[datetime] = None) -> datetime:
+        """Agenda uma tarefa repetida a cada N segundos, substituindo outra de mesmo nome"""
+        tarefa = Tarefa(nome, funcao, args, 'intervalo', intervalo=segundos)
+        proxima = primeira_em or tarefa.calcular_proxima(datetime.now())
+        self.logger.info(f"Tarefa '{nome}' agendada a cada {segundos:.0f}s")
+        return self._registrar(tarefa, proxima)
+
+    def agendar_unico(self, nome: str, quando: datetime, funcao: Callable, args: tuple = (),
+                      recuperacao: Optional[str] = None, janela_minutos: Optional[int] = None) -> Optional[datetime]:
+        """
+        Agenda um disparo único (temporizador), substituindo outro de mesmo nome
+
+        Um instante já passado só é agendado se for um disparo perdido pendente
+        no registro e a política de recuperação permitir.
+        """
+        tarefa = Tarefa(nome, funcao, args, 'unica')
+        self.logger.debug(f"Tarefa '{nome}' agendada para {quando.isoformat()}")
+        return self._registrar(tarefa, quando, recuperacao, janela_minutos)
+
+    def cancelar(self, nome: str) -> bool:
+        """Remove a tarefa; entradas já no heap são descartadas ao vencer"""
+        with self._cond:
+            tarefa = self._tarefas.pop(nome, None)
+            if tarefa is None:
+                return False
+            tarefa.geracao += 1
+            tarefa.proxima = None
+        if tarefa.persistente:
+            self.registro.remover(nome)
+        self.logger.info(f"Tarefa '{nome}' cancelada")
+        return True
+
+    def cancelar_prefixo(self, prefixo: str) -> int:
+        """Remove todas as tarefas cujo nome começa com o prefixo (ex.: 'lembretes.')"""
+        with self._cond:
+            nomes = [nome for nome in self._tarefas if nome.startswith(prefixo)]
+            for nome in nomes:
+                tarefa = self._tarefas.pop(nome)
+                tarefa.geracao += 1
+                tarefa.proxima = None
+        for nome in nomes:
+            self.registro.remover(nome)
+        if nomes:
+            self.logger.info(f"{len(nomes)} tarefas '{prefixo}*' canceladas")
+        return len(nomes)
+
+    def proxima_execucao(self, nome: str) -> Optional[datetime]:
+        with self._cond:
+            tarefa = self._tarefas.get(nome)
+            return tarefa.proxima if tarefa else None
+
+    def listar(self) -> List[Dict]:
+        """Tarefas registradas, da próxima a disparar para a última"""
+        with self._cond:
+            tarefas = [dict(t.para_dict(), executando=t.nome in self._em_execucao)
+                       for t in self._tarefas.values()]
+        return sorted(tarefas, key=lambda t: (t['proxima_execucao'] is None, t['proxima_execucao'] or '', t['nome']))
+
+    def _recuperar_apos_promocao(self):
+        """Ao assumir a liderança: recupera disparos que nenhum processo executou"""
+        agora = datetime.now()
+        with self._cond:
+            tarefas = [t for t in self._tarefas.values() if t.persistente]
+
+        recuperadas = 0
+        for tarefa in tarefas:
+            quando = None
+            if tarefa.tipo == 'unica':
+                quando = tarefa.recuperando or tarefa.proxima
+                if quando is None or quando > agora:
+                    continue
+
+            perdido = self._disparo_perdido(tarefa, agora, quando)
+            executar = perdido is not None and self._deve_recuperar(tarefa, perdido, agora)
+            with self._cond:
+                if self._tarefas.get(tarefa.nome) is not tarefa:
+                    continue  # reagendada ou cancelada enquanto consultava o registro
+                if executar:
+                    tarefa.recuperando = perdido
+                    self._enfileirar(tarefa, agora)
+                    recuperadas += 1
+                elif tarefa.tipo == 'unica':
+                    # Já executada pelo líder anterior (ou recuperação recusada)
+                    del self._tarefas[tarefa.nome]
+                    tarefa.geracao += 1
+                    tarefa.proxima = None
+
+        if recuperadas:
+            self.logger.info(f"{recuperadas} disparos perdidos recuperados ao assumir a liderança")
+
+    # ------------------------------------------------------------------
+    # Execução
+    # ------------------------------------------------------------------
+
+    def iniciar(self):
+        """Inicia a thread do agendador e o pool de execução"""
+        with self._cond:
+            if self.executando:
+                return
+            self.executando = True
+            self._executor = ThreadPoolExecutor(max_workers=self.trabalhadores, thread_name_prefix='tarefa')
+
+        self._thread = Thread(target=self._loop, name='AgendadorTarefas', daemon=True)
+        self._thread.start()
+        self.logger.info(f"Agendador de tarefas iniciado ({self.trabalhadores} execuções simultâneas)")
+
+    def parar(self):
+        """Para a thread do agendador; execuções em andamento terminam normalmente"""
+        with self._cond:
+            if not self.executando:
+                return
+            self.executando = False
+            self._cond.notify_all()
+
+        if self._thread and self._thread.is_alive():
+            self._thread.join(timeout=5)
+        if self._executor:
+            self._executor.shutdown(wait=False)
+        self.logger.info("Agendador de tarefas parado")
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                if not self.executando:
+                    return
+
+                if not self._heap:
+                    self._cond.wait()
+                    continue
+
+                instante, _, nome, geracao = self._heap[0]
+                restante = instante - time.time()
+                if restante > 0:
+                    self._cond.wait(timeout=min(restante, ESPERA_MAXIMA_SEGUNDOS))
+                    continue
+
+                heapq.heappop(self._heap)
+                tarefa = self._tarefas.get(nome)
+                if tarefa is None or tarefa.geracao != geracao:
+                    continue  # cancelada ou reagendada
+
+                self._preparar_disparo(tarefa)
+
+    def _preparar_disparo(self, tarefa: Tarefa):
+        """Agenda a ocorrência seguinte e envia a atual ao pool (chamado com _cond)"""
+        agendada = tarefa.proxima or datetime.now()
+        agora = datetime.now()
+
+        if not self.lideranca.eh_lider:
+            # Seguidor: não executa. A tarefa única continua registrada (fora do heap)
+            # para ser recuperada caso este processo assuma a liderança.
+            if tarefa.tipo != 'unica':
+                tarefa.recuperando = None  # reavaliado pelo registro na promoção
+                proxima = tarefa.calcular_proxima(max(agendada, agora))
+                self._enfileirar(tarefa, proxima)
+            self.logger.debug(f"Disparo de '{tarefa.nome}' deixado para o processo líder")
+            return
+
+        prevista = tarefa.recuperando or agendada
+        tarefa.recuperando = None
+
+        if tarefa.tipo == 'unica':
+            del self._tarefas[tarefa.nome]
+            tarefa.proxima = None
+        else:
+            # A partir do instante previsto (sem deriva); se ficou para trás, a partir de agora
+            proxima = tarefa.calcular_proxima(agendada)
+            if proxima is not None and proxima <= agora:
+                proxima = tarefa.calcular_proxima(agora)
+            self._enfileirar(tarefa, proxima)
+
+        if tarefa.nome in self._em_execucao:
+            tarefa.ignoradas += 1
+            self.logger.warning(f"Tarefa '{tarefa.nome}' ainda em execução; disparo de "
+                                f"{agendada:%H:%M:%S} ignorado")
+            return
+
+        self._em_execucao.add(tarefa.nome)
+        self._executor.submit(self._executar, tarefa, prevista)
+
+    def _executar(self, tarefa: Tarefa, prevista: datetime):
+        """
+        Roda a tarefa no pool. Exceções e retornos {'sucesso': False, ...}
+        contam como falha.
+        """
+        with self._cond:
+            self._ativas += 1
+        iniciada_em = datetime.now()
+        if tarefa.persistente:
+            self.registro.iniciar_execucao(tarefa.nome, prevista, iniciada_em)
+
+        inicio = time.monotonic()
+        erro = None
+        try:
+            self.lideranca.preparar_execucao()
+            resultado = tarefa.funcao(*tarefa.args)
+            if isinstance(resultado, dict) and resultado.get('sucesso') is False:
+                erro = str(resultado.get('erro') or 'falha informada pela tarefa')
+        except Exception as e:
+            erro = str(e)
+            self.logger.error(f"Erro na tarefa '{tarefa.nome}': {e}")
+        finally:
+            duracao_ms = round((time.monotonic() - inicio) * 1000, 2)
+            with self._cond:
+                self._ativas -= 1
+                self._em_execucao.discard(tarefa.nome)
+                # Estatísticas na tarefa registrada agora (pode ter sido reagendada durante a execução)
+                registrada = self._tarefas.get(tarefa.nome) or tarefa
+                registrada.execucoes += 1
+                registrada.ultima_execucao = datetime.now()
+                registrada.ultima_duracao_ms = duracao_ms
+                registrada.ultimo_erro = erro
+                if erro:
+                    registrada.falhas += 1
+                proxima = registrada.proxima
+
+            self.registro.concluir_execucao(tarefa.nome, prevista, iniciada_em, erro is None,
+                                            duracao_ms, erro, proxima)
+
+    def fila(self) -> Dict:
+        """Profundidade atual: disparos no heap, execuções no pool e à espera de trabalhador"""
+        with self._cond:
+            agendadas = sum(1 for _, _, nome, geracao in self._heap
+                            if nome in self._tarefas and self._tarefas[nome].geracao == geracao)
+            em_execucao = len(self._em_execucao)
+            ativas = self._ativas
+        return {
+            'disparos_agendados': agendadas,
+            'executando': ativas,
+            'aguardando_trabalhador': max(0, em_execucao - ativas),
+            'trabalhadores': self.trabalhadores
+        }
+
+    def jobs(self, limite_historico: int = 10, prefixo: str = '') -> List[Dict]:
+        """
+        Tarefas registradas com as últimas execuções (duração e resultado)
+
+        'uso_intervalo_pct' compara a maior duração recente com o menor espaço
+        entre disparos: perto de 100% a tarefa começa a se sobrepor a si mesma.
+        """
+        historico = self.registro.ultimas_execucoes(limite_historico, prefixo)
+        with self._cond:
+            tarefas = [(t, t.nome in self._em_execucao) for t in self._tarefas.values()
+                       if t.nome.startswith(prefixo)]
+            itens = [(t.para_dict(), executando, t.intervalo_minimo_segundos()) for t, executando in tarefas]
+
+        jobs = []
+        for item, executando, intervalo in itens:
+            execucoes = historico.get(item['nome'], [])
+            duracoes = [e['duracao_ms'] for e in execucoes if e['duracao_ms'] is not None]
+            item['executando'] = executando
+            item['historico'] = execucoes
+            item['duracao_media_ms'] = round(sum(duracoes) / len(duracoes), 2) if duracoes else None
+            item['duracao_max_ms'] = max(duracoes) if duracoes else None
+            item['uso_intervalo_pct'] = (round(max(duracoes) / (intervalo * 1000) * 100, 2)
+                                         if duracoes and intervalo else None)
+            jobs.append(item)
+        return sorted(jobs, key=lambda t: (t['proxima_execucao'] is None, t['proxima_execucao'] or '', t['nome']))
+
+    def status(self) -> Dict:
+        return {
+            'executando': self.executando and self._thread is not None and self._thread.is_alive(),
+            'trabalhadores': self.trabalhadores,
+            'lider': self.lideranca.eh_lider,
+            'tarefas': self.listar()
+        }
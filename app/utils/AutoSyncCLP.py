@@ -1,55 +1,49 @@
 import logging
-import os
-from threading import Timer, Lock
-from typing import Optional
+from threading import Thread, Condition, Lock
+from typing import Optional, Dict
 from datetime import datetime
 
-
-class _DebouncedTask:
-    def __init__(self, delay_seconds: float):
-        self.delay = delay_seconds
-        self._timer: Optional[Timer] = None
-        self._lock = Lock()
-
-    def schedule(self, func):
-        with self._lock:
-            if self._timer is not None:
-                try:
-                    self._timer.cancel()
-                except Exception:
-                    pass
-                self._timer = None
-
-            self._timer = Timer(self.delay, func)
-            self._timer.daemon = True
-            self._timer.start()
+from .FilaSincronizacaoCLP import FilaSincronizacaoCLP
+from .LiderancaProcessos import LiderancaProcessos
 
 
 class AutoSyncCLP:
     """Gerencia disparos de sincronização de CLP com debounce por destino.
 
-    Destinos: 'plenario', 'auditorio'.
+    Destinos: chaves do registro de controladores (RegistroControladoresCLP),
+    ex.: 'plenario', 'auditorio', 'mini_auditorio'.
+
+    Os pedidos são gravados na fila persistente (FilaSincronizacaoCLP), onde
+    pedidos repetidos para o mesmo destino são coalescidos. Um worker drena a
+    fila respeitando o debounce, com novas tentativas em backoff exponencial
+    quando a sincronização falha, até CLP_AUTOSYNC_MAX_TENTATIVAS (o pedido é
+    então descartado). Pendências são retomadas após reinício; pedidos de
+    destinos sem integrador ficam na fila sem atrasar os demais.
+
+    Com vários processos, todos gravam pedidos na fila compartilhada, mas só o
+    líder (LiderancaProcessos) a drena; a fila é relida periodicamente para
+    enxergar pedidos gravados pelos seguidores.
     """
 
     _instance = None
     _inst_lock = Lock()
 
     def __init__(self, delay_seconds: Optional[float] = None):
+        from ..config import CLP_AUTOSYNC_CONFIG
+
         self.logger = logging.getLogger('EventosFeriados.AutoSyncCLP')
+        self.config = CLP_AUTOSYNC_CONFIG
         # Debounce configurável por env (default 5s)
-        if delay_seconds is None:
-            try:
-                delay_seconds = float(os.environ.get('CLP_AUTOSYNC_DEBOUNCE', '5'))
-            except Exception:
-                delay_seconds = 5.0
-        self.delay = delay_seconds
+        self.delay = delay_seconds if delay_seconds is not None else self.config['DEBOUNCE']
         self.logger.info(f"AutoSyncCLP iniciado com debounce de {self.delay}s")
 
-        self._tasks = {
-            'plenario': _DebouncedTask(self.delay),
-            'auditorio': _DebouncedTask(self.delay),
-        }
-        self._lock = Lock()
+        self.fila = FilaSincronizacaoCLP.get_instance()
+        self.lideranca = LiderancaProcessos.get_instance()
+        self.lideranca.ao_assumir(self._acordar)
+        self._integradores: Dict[str, object] = {}
+        self._cond = Condition()
+        self._worker: Optional[Thread] = None
+        self._executando = False
 
     @classmethod
     def get_instance(cls) -> 'AutoSyncCLP':
@@ -59,43 +53,145 @@ class AutoSyncCLP:
                     cls._instance = cls()
         return cls._instance
 
-    def _schedule(self, destino: str, integrador):
-        if integrador is None:
-            self.logger.warning(f"Integrador para '{destino}' indisponível. Ignorando autosync.")
+    def registrar_integrador(self, destino: str, integrador):
+        """Associa o integrador responsável por sincronizar um destino"""
+        if integrador is not None:
+            self._integradores[destino] = integrador
+
+    def iniciar(self, integradores: Optional[Dict[str, object]] = None):
+        """Inicia o worker da fila, retomando intenções pendentes de execuções anteriores"""
+        for destino, integrador in (integradores or {}).items():
+            self.registrar_integrador(destino, integrador)
+
+        with self._cond:
+            if self._executando:
+                return
+            self._executando = True
+
+        pendentes = self.fila.listar_pendentes()
+        if pendentes:
+            self.logger.info(f"Retomando {len(pendentes)} sincronizações pendentes: "
+                             f"{[p['destino'] for p in pendentes]}")
+
+        self._worker = Thread(target=self._loop_worker, name='autosync-clp', daemon=True)
+        self._worker.start()
+
+    def _acordar(self):
+        with self._cond:
+            self._cond.notify_all()
+
+    def parar(self):
+        """Sinaliza o encerramento do worker"""
+        with self._cond:
+            self._executando = False
+            self._cond.notify_all()
+
+    def _calcular_backoff(self, tentativas: int) -> float:
+        """Backoff exponencial limitado: base, 2*base, 4*base, ... até o máximo"""
+        return min(self.config['BACKOFF_BASE'] * (2 ** max(tentativas - 1, 0)), self.config['BACKOFF_MAX'])
+
+    def _loop_worker(self):
+        while True:
+            with self._cond:
+                if not self._executando:
+                    return
+
+                if not self.lideranca.eh_lider:
+                    # Seguidor: os pedidos ficam na fila para o processo líder
+                    self._cond.wait()
+                    continue
+
+                # Só destinos com integrador: um pedido órfão não bloqueia os demais
+                intencao = self.fila.proxima(list(self._integradores))
+                if intencao is None:
+                    self._cond.wait(timeout=self.config['INTERVALO_CONSULTA'])
+                    continue
+
+                restante = (datetime.fromisoformat(intencao['disponivel_em']) - datetime.now()).total_seconds()
+                if restante > 0:
+                    self._cond.wait(timeout=min(restante, self.config['INTERVALO_CONSULTA']))
+                    continue
+
+            self._executar(intencao)
+
+    def _executar(self, intencao: Dict):
+        destino = intencao['destino']
+        versao = intencao['versao']
+        integrador = self._integradores[destino]
+
+        try:
+            self.logger.info(f"Executando autosync para '{destino}' às {datetime.now().isoformat()} "
+                             f"({intencao['pedidos']} pedidos coalescidos, tentativa {intencao['tentativas'] + 1})")
+            # Pedido de um seguidor: os dados alterados por ele estão só no arquivo
+            self.lideranca.preparar_execucao()
+            res = integrador.sincronizar_dados()
+            sucesso = res.get('sucesso', False)
+            erro = res.get('erro') or '; '.join(res.get('erros') or []) or 'falha desconhecida'
+        except Exception as e:
+            sucesso = False
+            erro = str(e)
+
+        if sucesso:
+            self.fila.concluir(destino, versao)
+            self.logger.info(f"Autosync '{destino}' concluído: {res.get('dados_sincronizados')}")
             return
 
-        def _run():
-            try:
-                self.logger.info(f"Executando autosync debounced para '{destino}' às {datetime.now().isoformat()}")
-                res = integrador.sincronizar_dados()
-                if not res.get('sucesso', False):
-                    self.logger.error(f"Autosync '{destino}' falhou: {res}")
-                else:
-                    self.logger.info(f"Autosync '{destino}' concluído: {res.get('dados_sincronizados')}")
-            except Exception as e:
-                self.logger.error(f"Erro no autosync '{destino}': {e}")
-
-        task = self._tasks.get(destino)
-        if not task:
-            self.logger.error(f"Destino desconhecido para autosync: {destino}")
+        tentativas = intencao['tentativas'] + 1
+        if tentativas >= self.config['MAX_TENTATIVAS']:
+            if self.fila.descartar(destino, versao):
+                self.logger.error(f"Autosync '{destino}' descartado após {tentativas} tentativas: {erro}")
+            else:
+                self.logger.warning(f"Autosync '{destino}' esgotou {tentativas} tentativas: {erro}. "
+                                    f"Novo pedido recebido durante a execução mantido na fila")
             return
-        task.schedule(_run)
 
-    def trigger_for_local(self, local: Optional[str], integracao_plenario, integracao_auditorio, aud_locais: Optional[list] = None):
-        """Agenda sincronização para o CLP correspondente ao local do evento."""
+        atraso = self._calcular_backoff(tentativas)
+        self.fila.registrar_falha(destino, versao, erro, atraso)
+        self.logger.error(f"Autosync '{destino}' falhou (tentativa {tentativas}): {erro}. "
+                          f"Nova tentativa em {atraso:.0f}s")
+
+    def _schedule(self, destino: str, integrador, motivo: Optional[str] = None,
+                  atraso: Optional[float] = None):
+        self.registrar_integrador(destino, integrador)
+
+        if destino not in self._integradores:
+            self.logger.warning(f"Integrador para '{destino}' indisponível. Pedido mantido na fila.")
+
+        if self.fila.enfileirar(destino, motivo, self.delay if atraso is None else atraso):
+            with self._cond:
+                self._cond.notify_all()
+
+    def trigger_imediato(self, destino: str, integrador, motivo: Optional[str] = None):
+        """Agenda sincronização do destino sem debounce (ex.: reset do CLP detectado)"""
+        try:
+            self._schedule(destino, integrador, motivo, atraso=0)
+        except Exception as e:
+            self.logger.error(f"Erro ao agendar sincronização imediata para '{destino}': {e}")
+
+    def trigger_for_local(self, local: Optional[str]):
+        """Agenda sincronização para o CLP que atende o local do evento."""
         try:
             if not local:
                 return
 
-            # Locais do auditório podem ser passados (config) para evitar import circular
-            aud_locais = aud_locais or ['Auditório Nobre', 'Foyer do Auditório']
+            from .RegistroControladoresCLP import RegistroControladoresCLP
+            registro = RegistroControladoresCLP.get_instance()
+            destino = registro.controlador_por_local(local)
 
-            if local in aud_locais:
-                self._schedule('auditorio', integracao_auditorio)
-            elif local == 'Plenário':
-                self._schedule('plenario', integracao_plenario)
+            if destino:
+                self._schedule(destino, registro.obter_sincronizador(destino), f"alteração em '{local}'")
             else:
-                # Outros locais não são controlados pelos CLPs atuais
+                # Local sem CLP registrado
                 self.logger.debug(f"Autosync ignorado para local '{local}' (sem CLP mapeado)")
         except Exception as e:
             self.logger.error(f"Erro ao agendar autosync para local '{local}': {e}")
+
+    def status(self) -> Dict:
+        """Resumo do worker e das intenções pendentes"""
+        return {
+            'executando': self._executando and self._worker is not None and self._worker.is_alive(),
+            'lider': self.lideranca.eh_lider,
+            'debounce_segundos': self.delay,
+            'destinos_registrados': sorted(self._integradores.keys()),
+            'pendentes': self.fila.listar_pendentes()
+        }
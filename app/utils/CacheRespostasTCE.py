@@ -0,0 +1,116 @@
+# app/utils/CacheRespostasTCE.py
+"""
+Cache em disco das respostas da API de pauta do TCE, um arquivo por mês
+
+Cada entrada guarda o JSON recebido, os validadores HTTP (ETag e
+Last-Modified) para a próxima requisição condicional e o SHA-256 do conteúdo
+em forma canônica. Guarda também a assinatura do último processamento
+concluído (hash da pauta + estado local dos eventos TCE do mês), que permite ao
+SincronizadorTCE pular todo o pipeline quando nada mudou de nenhum dos lados.
+"""
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from threading import Lock
+from typing import Dict, List, Optional
+
+
+class CacheRespostasTCE:
+    """Respostas da pauta do TCE por mês (arquivo JSON por mês, gravação atômica)"""
+
+    def __init__(self, diretorio: str, logger: Optional[logging.Logger] = None):
+        self.diretorio = diretorio
+        self.logger = logger or logging.getLogger('EventosFeriados.CacheRespostasTCE')
+        self._lock = Lock()
+
+    @staticmethod
+    def checksum(dados) -> str:
+        """SHA-256 do JSON em forma canônica (chaves ordenadas, sem espaços)"""
+        canonico = json.dumps(dados, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+        return hashlib.sha256(canonico.encode('utf-8')).hexdigest()
+
+    def _arquivo(self, mes: int, ano: int) -> str:
+        return os.path.join(self.diretorio, f"pauta_{ano}_{mes:02d}.json")
+
+    def carregar(self, mes: int, ano: int) -> Optional[Dict]:
+        """Entrada do mês, ou None se não houver (ou se o arquivo estiver corrompido)"""
+        arquivo = self._arquivo(mes, ano)
+        if not os.path.exists(arquivo):
+            return None
+        try:
+            with open(arquivo, 'r', encoding='utf-8') as f:
+                entrada = json.load(f)
+        except Exception as e:
+            self.logger.error(f"Erro ao ler cache da pauta TCE {mes:02d}/{ano}: {e}")
+            return None
+
+        if entrada.get('sha256') != self.checksum(entrada.get('dados')):
+            self.logger.warning(f"Cache da pauta TCE {mes:02d}/{ano} com checksum divergente; descartado")
+            return None
+        return entrada
+
+    def _gravar(self, mes: int, ano: int, entrada: Dict) -> bool:
+        try:
+            os.makedirs(self.diretorio, exist_ok=True)
+            arquivo = self._arquivo(mes, ano)
+            temporario = f"{arquivo}.tmp"
+            with open(temporario, 'w', encoding='utf-8') as f:
+                json.dump(entrada, f, ensure_ascii=False, separators=(',', ':'))
+            os.replace(temporario, arquivo)
+            return True
+        except Exception as e:
+            self.logger.error(f"Erro ao gravar cache da pauta TCE {mes:02d}/{ano}: {e}")
+            return False
+
+    def salvar(self, mes: int, ano: int, url: str, dados: List[Dict], sha256: str,
+               etag: Optional[str], last_modified: Optional[str]) -> bool:
+        """Grava uma resposta 200, preservando a assinatura do último processamento"""
+        with self._lock:
+            anterior = self.carregar(mes, ano) or {}
+            agora = datetime.now().isoformat()
+            return self._gravar(mes, ano, {
+                'url': url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'sha256': sha256,
+                'obtido_em': agora,
+                'validado_em': agora,
+                'processado': anterior.get('processado'),
+                'dados': dados
+            })
+
+    def confirmar(self, mes: int, ano: int) -> bool:
+        """Resposta 304: o conteúdo em cache continua válido"""
+        with self._lock:
+            entrada = self.carregar(mes, ano)
+            if entrada is None:
+                return False
+            entrada['validado_em'] = datetime.now().isoformat()
+            return self._gravar(mes, ano, entrada)
+
+    def assinatura_processada(self, mes: int, ano: int) -> Optional[Dict]:
+        """{'sha256', 'local'} do último processamento concluído do mês"""
+        entrada = self.carregar(mes, ano)
+        return entrada.get('processado') if entrada else None
+
+    def marcar_processado(self, mes: int, ano: int, sha256: str, assinatura_local: str) -> bool:
+        with self._lock:
+            entrada = self.carregar(mes, ano)
+            if entrada is None or entrada['sha256'] != sha256:
+                return False  # resposta mais nova gravada no meio do processamento
+            entrada['processado'] = {
+                'sha256': sha256,
+                'local': assinatura_local,
+                'em': datetime.now().isoformat()
+            }
+            return self._gravar(mes, ano, entrada)
+
+    def desmarcar_processado(self, mes: int, ano: int) -> bool:
+        """Esquece o último processamento do mês: a próxima sincronização o reprocessa"""
+        with self._lock:
+            entrada = self.carregar(mes, ano)
+            if entrada is None or entrada.pop('processado', None) is None:
+                return False
+            return self._gravar(mes, ano, entrada)
@@ -0,0 +1,280 @@
+# app/utils/ClienteCLP.py
+"""
+Cliente HTTP da API de automação (scadaweb) usado pelos sincronizadores de CLP.
+
+Centraliza a correção de redirecionamentos, a escrita em lote, a leitura de tags
+(em lote quando o gateway suporta, ou em paralelo como alternativa) e a
+verificação pós-escrita dos valores realmente mantidos pelo controlador.
+"""
+import json
+import logging
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, List, Optional, Tuple
+
+CODIGOS_REDIRECIONAMENTO = (301, 302, 303, 307, 308)
+
+
+class ClienteCLP:
+    """Operações de leitura/escrita de tags em um CLP através do gateway scadaweb"""
+
+    def __init__(self, session: requests.Session, config: Dict, logger: Optional[logging.Logger] = None):
+        self.session = session
+        self.config = config
+        self.logger = logger or logging.getLogger('EventosFeriados.ClienteCLP')
+        # None = ainda não testado, True/False = gateway suporta (ou não) tag_read_batch
+        self._leitura_batch_disponivel: Optional[bool] = None
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def _corrigir_redirect(self, redirect_url: str) -> Optional[str]:
+        """Retorna a URL de destino corrigida ou None se o domínio for desconhecido"""
+        if 'automacao.tce.go.br' in redirect_url and 'automacao.tce.go.gov.br' not in redirect_url:
+            return redirect_url.replace('automacao.tce.go.br', 'automacao.tce.go.gov.br')
+        if 'automacao.tce.go.gov.br' in redirect_url:
+            return redirect_url
+        return None
+
+    def requisitar(self, metodo: str, url: str, descricao: str = "requisição",
+                   timeout: Optional[float] = None, **kwargs) -> requests.Response:
+        """Faz uma requisição HTTP com correção automática de redirecionamentos incorretos"""
+        timeout = timeout or self.config['TIMEOUT']
+        response = self.session.request(metodo, url, timeout=timeout, allow_redirects=False,
+                                        verify=False, **kwargs)
+
+        if response.status_code in CODIGOS_REDIRECIONAMENTO:
+            redirect_url = response.headers.get('Location', '')
+            destino = self._corrigir_redirect(redirect_url)
+            if destino is None:
+                self.logger.error(f"Redirecionamento para domínio desconhecido em {descricao}: {redirect_url}")
+                return response
+            self.logger.warning(f"Redirecionamento em {descricao}, seguindo para: {destino}")
+            response = self.session.request(metodo, destino, timeout=timeout, verify=False, **kwargs)
+
+        return response
+
+    # ------------------------------------------------------------------
+    # Escrita
+    # ------------------------------------------------------------------
+
+    def escrever_batch(self, operations: List[Dict], descricao: str = "escrita batch",
+                       timeout_multiplicador: int = 3, medicao=None) -> Tuple[bool, List[str]]:
+        """
+        Envia operações de escrita em um único POST tag_write_batch
+
+        Args:
+            medicao: MedicaoSincronizacao opcional; recebe as fases 'serializacao',
+                     'envio' e 'resposta' e os bytes do payload
+
+        Returns:
+            Tupla (sucesso, lista_de_erros)
+        """
+        if not operations:
+            return True, []
+
+        fase = medicao.fase if medicao else (lambda nome: nullcontext())
+
+        with fase('serializacao'):
+            corpo = json.dumps({
+                "clp_address": self.config['CLP_IP'],
+                "operations": operations
+            }).encode('utf-8')
+        if medicao:
+            medicao.registrar('bytes_payload', len(corpo))
+        url_batch = f"{self.config['API_BASE_URL']}/tag_write_batch"
+
+        try:
+            with fase('envio'):
+                response = self.requisitar('POST', url_batch, descricao,
+                                           timeout=self.config['TIMEOUT'] * timeout_multiplicador,
+                                           data=corpo, headers={'Content-Type': 'application/json'})
+        except requests.exceptions.Timeout:
+            return False, [f"Timeout na {descricao}"]
+        except requests.exceptions.ConnectionError as e:
+            return False, [f"Erro de conexão na {descricao}: {str(e)}"]
+
+        with fase('resposta'):
+            if response.status_code == 401:
+                return False, [f"Erro de autenticação na {descricao}"]
+            if response.status_code != 200:
+                return False, [f"Erro HTTP na {descricao}: {response.status_code}"]
+
+            try:
+                resultado = response.json()
+            except ValueError as e:
+                return False, [f"Erro ao processar resposta da {descricao}: {str(e)}"]
+
+            if not resultado.get('success'):
+                return False, [f"{descricao} falhou: {resultado.get('error', 'erro desconhecido')}"]
+
+            erros = []
+            for tag_address, item in resultado.get('results', {}).items():
+                if not item.get('success'):
+                    erros.append(f"Falha na tag {tag_address}: {item.get('error', 'erro desconhecido')}")
+
+            sucesso = resultado.get('summary', {}).get('failed', len(erros)) == 0 and not erros
+            if medicao:
+                medicao.registrar('tags_com_falha', len(erros))
+            return sucesso, erros
+
+    # ------------------------------------------------------------------
+    # Leitura
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _converter_valor(valor) -> Optional[int]:
+        """Converte o valor retornado pelo gateway para inteiro (None se ilegível)"""
+        if valor is None:
+            return None
+        try:
+            return int(float(str(valor).strip()))
+        except (TypeError, ValueError):
+            return None
+
+    def _url_leitura(self, tag: str) -> str:
+        # O gateway espera o ':' duplamente codificado (N33:0 -> N33%253A0)
+        return f"{self.config['API_BASE_URL']}/tag_read/{self.config['CLP_IP']}/{tag.replace(':', '%253A')}"
+
+    def ler_tag(self, tag: str) -> Optional[int]:
+        """Lê uma única tag do CLP (None em caso de falha)"""
+        try:
+            response = self.requisitar('GET', self._url_leitura(tag), f"leitura da tag {tag}")
+            if response.status_code != 200:
+                self.logger.debug(f"Leitura da tag {tag} retornou HTTP {response.status_code}")
+                return None
+            return self._converter_valor(response.json().get('valor'))
+        except Exception as e:
+            self.logger.debug(f"Erro ao ler tag {tag}: {e}")
+            return None
+
+    def _ler_tags_batch(self, tags: List[str]) -> Optional[Dict[str, Optional[int]]]:
+        """
+        Tenta ler as tags com um único POST tag_read_batch.
+        Retorna None se o gateway não oferecer leitura em lote.
+        """
+        url_batch = f"{self.config['API_BASE_URL']}/tag_read_batch"
+        payload = {"clp_address": self.config['CLP_IP'], "tags": tags}
+
+        response = self.requisitar('POST', url_batch, "leitura batch",
+                                   timeout=self.config['TIMEOUT'] * 2,
+                                   json=payload, headers={'Content-Type': 'application/json'})
+
+        if response.status_code in (404, 405, 501):
+            self.logger.info("Gateway não suporta tag_read_batch, usando leitura paralela")
+            self._leitura_batch_disponivel = False
+            return None
+        if response.status_code != 200:
+            raise requests.exceptions.RequestException(f"HTTP {response.status_code} na leitura batch")
+
+        resultado = response.json()
+        if not resultado.get('success') and 'results' not in resultado:
+            raise requests.exceptions.RequestException(resultado.get('error', 'leitura batch falhou'))
+
+        self._leitura_batch_disponivel = True
+        itens = resultado.get('results', {})
+        valores = {}
+        for tag in tags:
+            item = itens.get(tag) or {}
+            if item.get('success', True):
+                valores[tag] = self._converter_valor(item.get('valor', item.get('value')))
+            else:
+                valores[tag] = None
+        return valores
+
+    def ler_tags_em_uma_requisicao(self, tags: List[str]) -> Optional[Dict[str, Optional[int]]]:
+        """
+        Lê as tags em um único POST tag_read_batch
+
+        Returns:
+            Valores por tag, ou None se o gateway não oferecer leitura em lote
+            (erros de conexão são propagados)
+        """
+        if self._leitura_batch_disponivel is False:
+            return None
+        return self._ler_tags_batch(tags)
+
+    def _ler_tags_paralelo(self, tags: List[str]) -> Dict[str, Optional[int]]:
+        """Lê as tags com requisições individuais em paralelo sobre a mesma sessão"""
+        max_workers = max(1, min(self.config.get('LEITURAS_PARALELAS', 8), len(tags)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='leitura-clp') as executor:
+            return dict(zip(tags, executor.map(self.ler_tag, tags)))
+
+    def ler_tags(self, tags: List[str]) -> Tuple[Dict[str, Optional[int]], str]:
+        """
+        Lê várias tags do CLP
+
+        Returns:
+            Tupla (valores_por_tag, modo_leitura) onde modo_leitura é 'batch' ou 'paralelo'
+        """
+        if not tags:
+            return {}, 'batch'
+
+        if self._leitura_batch_disponivel is not False:
+            try:
+                valores = self._ler_tags_batch(tags)
+                if valores is not None:
+                    return valores, 'batch'
+            except Exception as e:
+                self.logger.warning(f"Leitura batch falhou ({e}), usando leitura paralela")
+
+        return self._ler_tags_paralelo(tags), 'paralelo'
+
+    # ------------------------------------------------------------------
+    # Verificação pós-escrita
+    # ------------------------------------------------------------------
+
+    def verificar_escrita(self, operations: List[Dict], tentativas: int = 3) -> Dict:
+        """
+        Lê de volta as tags escritas, compara com a matriz pretendida e reescreve
+        apenas as tags divergentes, até o número de tentativas configurado.
+
+        Returns:
+            Dicionário com o resultado da verificação
+        """
+        esperado = {op['tag_address']: self._converter_valor(op['value']) for op in operations}
+        pendentes = list(esperado.keys())
+        divergentes: Dict[str, Optional[int]] = {}
+        reescritas = 0
+        modo_leitura = None
+        erros: List[str] = []
+        rodadas = 0
+
+        for rodada in range(tentativas + 1):
+            rodadas = rodada + 1
+            lidos, modo_leitura = self.ler_tags(pendentes)
+            divergentes = {tag: lidos.get(tag) for tag in pendentes if lidos.get(tag) != esperado[tag]}
+
+            if not divergentes or rodada == tentativas:
+                break
+
+            self.logger.warning(f"Verificação: {len(divergentes)} tags divergentes, reescrevendo "
+                                f"(tentativa {rodada + 1}/{tentativas})")
+            ops_retry = [{"tag_address": tag, "value": str(esperado[tag])} for tag in divergentes]
+            _, erros_rodada = self.escrever_batch(ops_retry, "reescrita de tags divergentes")
+            erros.extend(f"Reescrita {rodada + 1}: {erro}" for erro in erros_rodada)
+            reescritas += len(ops_retry)
+            pendentes = list(divergentes.keys())
+
+        resultado = {
+            'verificado': not divergentes,
+            'tags_verificadas': len(esperado),
+            'tags_reescritas': reescritas,
+            'rodadas_leitura': rodadas,
+            'modo_leitura': modo_leitura,
+            'tags_divergentes': {
+                tag: {'esperado': esperado[tag], 'lido': lido} for tag, lido in divergentes.items()
+            },
+            'erros': erros
+        }
+
+        if divergentes:
+            self.logger.error(f"Verificação pós-escrita falhou: {len(divergentes)} tags divergentes após "
+                              f"{tentativas} tentativas: {sorted(divergentes)[:10]}")
+        else:
+            self.logger.info(f"Verificação pós-escrita OK: {len(esperado)} tags conferidas "
+                             f"({reescritas} reescritas, leitura {modo_leitura})")
+
+        return resultado
@@ -0,0 +1,227 @@
+# app/utils/DespachanteNotificacoes.py
+"""
+Despachante da saída de notificações
+
+Uma thread por processo reserva os envios vencidos de SaidaNotificacoes e os
+entrega ao transmissor (NotificacaoEventos.transmitir), com no máximo um envio
+em andamento por canal: canais independentes (WhatsApp, e-mail) seguem em
+paralelo, cada um dentro do seu limite de taxa (LimitadorTaxa). Um canal sem
+token fica fora das reservas até o balde reabastecer, sem segurar os demais.
+O resultado é gravado na mesma linha. Falhas temporárias voltam para a saída
+com backoff exponencial (NOTIFICACOES_BACKOFF_BASE_SEGUNDOS, 2x, 4x... até
+NOTIFICACOES_BACKOFF_MAX_SEGUNDOS) até NOTIFICACOES_MAX_TENTATIVAS; recusas
+definitivas da API (4xx exceto 408/429) encerram o envio na hora.
+
+Com vários processos, todos gravam na saída compartilhada, mas só o líder
+(LiderancaProcessos) despacha: os limites de taxa valem por processo, e um
+único despachante mantém a API dentro deles. A reserva na saída é atômica e
+tem validade (NOTIFICACOES_RESERVA_SEGUNDOS), então na troca de líder cada
+tentativa continua sendo feita por um só processo e a de um processo que
+caiu é retomada pelo novo líder ao expirar.
+"""
+import logging
+import os
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from threading import Thread, Condition, Lock
+from typing import Callable, Dict, Optional, Set
+
+from ..config import NOTIFICACOES_CONFIG, WHATSAPP_API
+from .LiderancaProcessos import LiderancaProcessos
+from .LimitadorTaxa import LimitadorTaxa
+from .SaidaNotificacoes import SaidaNotificacoes
+
+
+class DespachanteNotificacoes:
+    """Thread que drena a saída persistente de notificações, um envio por canal por vez (singleton)"""
+
+    _instance = None
+    _inst_lock = Lock()
+
+    def __init__(self):
+        self.logger = logging.getLogger('EventosFeriados.DespachanteNotificacoes')
+        self.config = NOTIFICACOES_CONFIG
+        self.saida = SaidaNotificacoes.get_instance()
+        self.limitador = LimitadorTaxa.get_instance()
+        self.lideranca = LiderancaProcessos.get_instance()
+        self.lideranca.ao_assumir(self.acordar)
+        self.dono = f"{socket.gethostname()}:{os.getpid()}"
+        # A reserva precisa cobrir o timeout da requisição com folga
+        self.reserva_segundos = max(self.config['RESERVA_SEGUNDOS'], 2 * WHATSAPP_API.get('TIMEOUT', 30))
+
+        self._transmissor: Optional[Callable[[Dict], Dict]] = None
+        self._cond = Condition()
+        self._worker: Optional[Thread] = None
+        self._executando = False
+        self._acordado = False
+        # Canais com envio em andamento e canais sem token até o instante (monotônico)
+        self._ocupados: Set[str] = set()
+        self._bloqueados: Dict[str, float] = {}
+        canais = [c for c in self.config['LIMITES_TAXA'] if c != 'padrao']
+        self._executor = ThreadPoolExecutor(max_workers=max(len(canais), 1),
+                                            thread_name_prefix='despachante-canal')
+
+        self._enviados = 0
+        self._reagendados = 0
+        self._desistencias = 0
+
+    @classmethod
+    def get_instance(cls) -> 'DespachanteNotificacoes':
+        if cls._instance is None:
+            with cls._inst_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def iniciar(self, transmissor: Callable[[Dict], Dict]):
+        """
+        Inicia a thread de despacho, retomando envios pendentes de execuções anteriores
+
+        Args:
+            transmissor: Recebe a linha reservada da saída e devolve
+                         {'ok', 'status_code', 'duracao_ms', 'erro', 'retentar', 'detalhes'}
+        """
+        with self._cond:
+            self._transmissor = transmissor
+            if self._executando:
+                self._cond.notify_all()
+                return
+            self._executando = True
+
+        pendentes = self.saida.resumo().get('por_status', {})
+        retomados = pendentes.get('pendente', 0) + pendentes.get('enviando', 0)
+        if retomados:
+            self.logger.info(f"Retomando {retomados} envios pendentes da saída de notificações")
+
+        self._worker = Thread(target=self._loop_worker, name='despachante-notificacoes', daemon=True)
+        self._worker.start()
+        self.logger.info(f"Despachante de notificações iniciado ({self.dono})")
+
+    def acordar(self):
+        """Avisa que há envio novo na saída (evita esperar a próxima consulta)"""
+        with self._cond:
+            self._acordado = True
+            self._cond.notify_all()
+
+    def parar(self):
+        """Sinaliza o encerramento da thread"""
+        with self._cond:
+            self._executando = False
+            self._cond.notify_all()
+
+    def _calcular_backoff(self, tentativas: int) -> float:
+        """Backoff exponencial limitado: base, 2*base, 4*base, ... até o máximo"""
+        return min(self.config['BACKOFF_BASE_SEGUNDOS'] * (2 ** max(tentativas - 1, 0)),
+                   self.config['BACKOFF_MAX_SEGUNDOS'])
+
+    def _canais_indisponiveis(self) -> Set[str]:
+        """Canais ocupados ou ainda sem token (chamar com self._cond)"""
+        agora = time.monotonic()
+        for canal, ate in list(self._bloqueados.items()):
+            if ate <= agora:
+                del self._bloqueados[canal]
+        return self._ocupados | set(self._bloqueados)
+
+    def _loop_worker(self):
+        while True:
+            with self._cond:
+                if not self._executando:
+                    return
+                self._acordado = False
+                if not self.lideranca.eh_lider:
+                    # Seguidor: o líder despacha os envios gravados por todos
+                    self._cond.wait()
+                    continue
+                indisponiveis = self._canais_indisponiveis()
+
+            envio = self.saida.reservar(self.dono, self.reserva_segundos, indisponiveis)
+            if envio is not None:
+                canal = envio['canal']
+                espera = self.limitador.tentar_reservar(canal)
+                with self._cond:
+                    if espera > 0:
+                        self._bloqueados[canal] = time.monotonic() + espera
+                    else:
+                        self._ocupados.add(canal)
+                if espera > 0:
+                    self.saida.devolver(envio, self.dono)
+                    self.logger.debug(f"Canal {canal} no limite de taxa; próximo envio em {espera:.1f}s")
+                else:
+                    self._executor.submit(self._despachar, envio)
+                continue
+
+            # Nada vencido nos canais livres: dorme até o próximo vencimento ou
+            # desbloqueio, limitado ao intervalo de consulta (envios gravados por
+            # outros processos); o fim de um envio também acorda o laço
+            espera = self.config['INTERVALO_CONSULTA_SEGUNDOS']
+            proximo = self.saida.proximo_vencimento(indisponiveis)
+            if proximo is not None:
+                espera = min(espera, (proximo - datetime.now()).total_seconds())
+            with self._cond:
+                if self._bloqueados:
+                    espera = min(espera, min(self._bloqueados.values()) - time.monotonic())
+                if self._executando and not self._acordado:
+                    self._cond.wait(timeout=max(espera, 0.05))
+
+    def _despachar(self, envio: Dict):
+        try:
+            self._tentar_envio(envio)
+        except Exception as e:
+            self.logger.error(f"Erro ao despachar envio #{envio['id']}: {e}")
+        finally:
+            with self._cond:
+                self._ocupados.discard(envio['canal'])
+                self._acordado = True
+                self._cond.notify_all()
+
+    def _tentar_envio(self, envio: Dict):
+        descricao = f"{envio['canal']}/{envio['funcao']} #{envio['id']}"
+        try:
+            resultado = self._transmissor(envio)
+        except Exception as e:
+            resultado = {'ok': False, 'erro': str(e), 'retentar': True}
+
+        if resultado.get('ok'):
+            self.saida.concluir(envio, self.dono, resultado.get('duracao_ms'),
+                                resultado.get('status_code'), resultado.get('detalhes'))
+            if (resultado.get('detalhes') or {}).get('status_url'):
+                # Aceito de forma assíncrona: a entrega passa a ser acompanhada
+                from .AcompanhamentoEntregas import AcompanhamentoEntregas
+                AcompanhamentoEntregas.get_instance().acordar()
+            with self._cond:
+                self._enviados += 1
+            if envio['tentativas'] > 1:
+                self.logger.info(f"Envio {descricao} concluído na tentativa {envio['tentativas']}")
+            return
+
+        erro = resultado.get('erro') or f"HTTP {resultado.get('status_code')}"
+        if resultado.get('retentar', True) and envio['tentativas'] < envio['max_tentativas']:
+            atraso = self._calcular_backoff(envio['tentativas'])
+            with self._cond:
+                self._reagendados += 1
+            self.logger.warning(f"Envio {descricao} falhou (tentativa {envio['tentativas']}/"
+                                f"{envio['max_tentativas']}): {erro}; nova tentativa em {atraso:.0f}s")
+        else:
+            atraso = None
+            with self._cond:
+                self._desistencias += 1
+            self.logger.error(f"Envio {descricao} abandonado após {envio['tentativas']} tentativa(s): {erro}")
+
+        self.saida.registrar_falha(envio, self.dono, erro, atraso,
+                                   resultado.get('duracao_ms'), resultado.get('status_code'))
+
+    def status(self) -> Dict:
+        """Estado da thread, contadores deste processo e resumo da saída"""
+        return {
+            'ativo': bool(self._worker and self._worker.is_alive()),
+            'processo': self.dono,
+            'lider': self.lideranca.eh_lider,
+            'enviados': self._enviados,
+            'reagendados': self._reagendados,
+            'desistencias': self._desistencias,
+            'canais_ocupados': sorted(self._ocupados),
+            'limites_taxa': self.limitador.status(),
+            'saida': self.saida.resumo()
+        }
@@ -0,0 +1,103 @@
+# app/utils/EstadoConfirmadoCLP.py
+"""
+Último estado confirmado das tags de um CLP
+
+Guarda o valor de cada tag escrita com sucesso (e conferido, quando a
+verificação pós-escrita está habilitada). Serve de base para o planejamento
+(dry-run) das próximas sincronizações.
+"""
+import json
+import os
+import logging
+from datetime import datetime
+from threading import Lock
+from typing import Dict, List, Optional
+
+
+class EstadoConfirmadoCLP:
+    """Matriz tag -> valor confirmada no controlador, persistida em JSON"""
+
+    def __init__(self, arquivo: str, logger: Optional[logging.Logger] = None):
+        self.arquivo = arquivo
+        self.logger = logger or logging.getLogger('EventosFeriados.EstadoConfirmadoCLP')
+        self._lock = Lock()
+        self.tags: Dict[str, int] = {}
+        self.atualizado_em: Optional[str] = None
+        self.versao_dados: Optional[int] = None
+        # Incrementada a cada alteração, usada para invalidar caches de planejamento
+        self.versao = 0
+        self._carregar()
+
+    def _carregar(self):
+        if not os.path.exists(self.arquivo):
+            return
+        try:
+            with open(self.arquivo, 'r', encoding='utf-8') as f:
+                dados = json.load(f)
+            self.tags = {tag: int(valor) for tag, valor in dados.get('tags', {}).items()}
+            self.atualizado_em = dados.get('atualizado_em')
+            self.versao_dados = dados.get('versao_dados')
+        except Exception as e:
+            self.logger.error(f"Erro ao carregar estado confirmado do CLP: {e}")
+
+    def _salvar(self) -> bool:
+        try:
+            os.makedirs(os.path.dirname(self.arquivo), exist_ok=True)
+            with open(self.arquivo, 'w', encoding='utf-8') as f:
+                json.dump({
+                    'atualizado_em': self.atualizado_em,
+                    'versao_dados': self.versao_dados,
+                    'tags': self.tags
+                }, f, ensure_ascii=False)
+            return True
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar estado confirmado do CLP: {e}")
+            return False
+
+    def conhecido(self) -> bool:
+        """Indica se já existe alguma escrita confirmada"""
+        return bool(self.tags)
+
+    def esperado(self, tags: List[str]) -> Dict[str, Optional[int]]:
+        """Valores confirmados das tags (None para tags nunca escritas)"""
+        with self._lock:
+            return {tag: self.tags.get(tag) for tag in tags}
+
+    def atualizar(self, operations: List[Dict], versao_dados: Optional[int] = None) -> bool:
+        """Incorpora ao estado as operações confirmadas no CLP"""
+        with self._lock:
+            for op in operations:
+                self.tags[op['tag_address']] = int(op['value'])
+            self.atualizado_em = datetime.now().isoformat()
+            if versao_dados is not None:
+                self.versao_dados = versao_dados
+            self.versao += 1
+            return self._salvar()
+
+    def comparar(self, operations: List[Dict]) -> Dict:
+        """
+        Compara operações pretendidas com o estado confirmado
+
+        Returns:
+            Dicionário com as tags que mudariam e o total inalterado
+        """
+        with self._lock:
+            alteradas = []
+            inalteradas = 0
+            for op in operations:
+                tag = op['tag_address']
+                novo = int(op['value'])
+                atual = self.tags.get(tag)
+                if atual == novo:
+                    inalteradas += 1
+                else:
+                    alteradas.append({'tag': tag, 'atual': atual, 'novo': novo})
+
+            return {
+                'estado_conhecido': bool(self.tags),
+                'base_atualizada_em': self.atualizado_em,
+                'base_versao_dados': self.versao_dados,
+                'total_alteradas': len(alteradas),
+                'total_inalteradas': inalteradas,
+                'alteradas': alteradas
+            }
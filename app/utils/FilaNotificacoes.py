@@ -0,0 +1,150 @@
+# app/utils/FilaNotificacoes.py
+"""
+Pool fixo de envio das notificações
+
+As notificações de evento (criado/alterado/cancelado, resumos de lote) entram
+numa fila limitada consumida por NOTIFICACOES_TRABALHADORES threads, em vez de
+uma thread por envio. Com a fila cheia o chamador espera até
+NOTIFICACOES_ESPERA_FILA_CHEIA_SEGUNDOS por uma vaga e, depois disso, o envio é
+descartado; as esperas e os descartes ficam nas métricas de status().
+
+Os trabalhadores só montam as mensagens e as gravam na saída persistente
+(SaidaNotificacoes); a chamada à API e as novas tentativas ficam com o
+DespachanteNotificacoes.
+"""
+import logging
+import queue
+import time
+from threading import Lock, Thread
+from typing import Callable, Dict, List
+
+from ..config import NOTIFICACOES_CONFIG
+
+
+class FilaNotificacoes:
+    """Fila limitada + pool fixo de trabalhadores para os envios (singleton)"""
+
+    _instance = None
+    _lock = Lock()
+
+    def __init__(self):
+        self.logger = logging.getLogger('EventosFeriados.FilaNotificacoes')
+        self.trabalhadores = max(1, NOTIFICACOES_CONFIG['TRABALHADORES'])
+        self.capacidade = max(1, NOTIFICACOES_CONFIG['CAPACIDADE_FILA'])
+        self.espera_fila_cheia = NOTIFICACOES_CONFIG['ESPERA_FILA_CHEIA_SEGUNDOS']
+        self._fila: queue.Queue = queue.Queue(maxsize=self.capacidade)
+        self._threads: List[Thread] = []
+
+        self._metricas_lock = Lock()
+        self._em_execucao = 0
+        self._pico = 0
+        self._enfileirados = 0
+        self._concluidos = 0
+        self._falhas = 0
+        self._descartados = 0
+        self._esperas_fila_cheia = 0
+        self._espera_produtor_ms = 0.0
+        self._espera_fila_total_ms = 0.0
+        self._espera_fila_max_ms = 0.0
+
+    @classmethod
+    def get_instance(cls) -> 'FilaNotificacoes':
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def iniciar(self):
+        """Sobe os trabalhadores (idempotente; enviar() também inicia sob demanda)"""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.trabalhadores):
+                thread = Thread(target=self._trabalhador, name=f'notificacoes-{i + 1}', daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        self.logger.info(f"Fila de notificações iniciada: {self.trabalhadores} trabalhadores, "
+                         f"capacidade {self.capacidade}")
+
+    def enviar(self, descricao: str, funcao: Callable, *args) -> bool:
+        """
+        Coloca um envio na fila
+
+        Args:
+            descricao: Identificação do envio nos logs
+            funcao: Chamada que faz o envio (roda em um trabalhador do pool)
+
+        Returns:
+            True se enfileirado; False se descartado por fila cheia
+        """
+        if not self._threads:
+            self.iniciar()
+
+        item = (time.monotonic(), descricao, funcao, args)
+        try:
+            self._fila.put_nowait(item)
+        except queue.Full:
+            inicio = time.monotonic()
+            try:
+                self._fila.put(item, timeout=self.espera_fila_cheia)
+            except queue.Full:
+                with self._metricas_lock:
+                    self._esperas_fila_cheia += 1
+                    self._espera_produtor_ms += (time.monotonic() - inicio) * 1000
+                    self._descartados += 1
+                self.logger.error(f"Fila de notificações cheia ({self.capacidade}); envio descartado: {descricao}")
+                return False
+            with self._metricas_lock:
+                self._esperas_fila_cheia += 1
+                self._espera_produtor_ms += (time.monotonic() - inicio) * 1000
+            self.logger.warning(f"Fila de notificações cheia; envio aguardou "
+                                f"{(time.monotonic() - inicio) * 1000:.0f} ms por uma vaga: {descricao}")
+
+        with self._metricas_lock:
+            self._enfileirados += 1
+            self._pico = max(self._pico, self._fila.qsize())
+        return True
+
+    def _trabalhador(self):
+        while True:
+            enfileirado_em, descricao, funcao, args = self._fila.get()
+            espera_ms = (time.monotonic() - enfileirado_em) * 1000
+            with self._metricas_lock:
+                self._em_execucao += 1
+                self._espera_fila_total_ms += espera_ms
+                self._espera_fila_max_ms = max(self._espera_fila_max_ms, espera_ms)
+            falhou = False
+            try:
+                funcao(*args)
+            except Exception as e:
+                falhou = True
+                self.logger.error(f"Erro no envio '{descricao}': {e}")
+            finally:
+                with self._metricas_lock:
+                    self._em_execucao -= 1
+                    self._concluidos += 1
+                    if falhou:
+                        self._falhas += 1
+                self._fila.task_done()
+
+    def status(self) -> Dict:
+        """Profundidade da fila e métricas de pressão desde o início do processo"""
+        with self._metricas_lock:
+            atendidos = self._concluidos + self._em_execucao
+            return {
+                'trabalhadores': self.trabalhadores,
+                'ativos': bool(self._threads),
+                'capacidade': self.capacidade,
+                'na_fila': self._fila.qsize(),
+                'em_execucao': self._em_execucao,
+                'pico_fila': self._pico,
+                'enfileirados': self._enfileirados,
+                'concluidos': self._concluidos,
+                'falhas': self._falhas,
+                'descartados': self._descartados,
+                'esperas_fila_cheia': self._esperas_fila_cheia,
+                'espera_produtor_ms': round(self._espera_produtor_ms, 2),
+                'espera_fila_media_ms': round(self._espera_fila_total_ms / atendidos, 2) if atendidos else None,
+                'espera_fila_max_ms': round(self._espera_fila_max_ms, 2)
+            }
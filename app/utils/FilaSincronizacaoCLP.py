@@ -0,0 +1,243 @@
+# app/utils/FilaSincronizacaoCLP.py
+"""
+Fila persistente de sincronizações pendentes dos CLPs
+
+Cada destino (controlador) tem no máximo uma intenção pendente: novos pedidos
+para o mesmo destino são coalescidos na linha existente. A fila sobrevive a
+reinícios do serviço, permitindo retomar sincronizações interrompidas.
+"""
+import sqlite3
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Lock
+from typing import Optional, List, Dict, Any, Iterable
+
+logger = logging.getLogger('EventosFeriados.fila_sincronizacao_clp')
+
+
+class FilaSincronizacaoCLP:
+    """Gerencia as intenções de sincronização por CLP em um banco SQLite"""
+
+    _instance = None
+    _lock = Lock()
+
+    def __init__(self, db_path: str = None):
+        """
+        Inicializa a fila de sincronização
+
+        Args:
+            db_path: Caminho para o banco de dados SQLite
+        """
+        if db_path is None:
+            from ..config import DATA_DIR
+            db_path = Path(DATA_DIR) / 'fila_sincronizacao_clp.db'
+
+        self.db_path = str(db_path)
+        self._init_database()
+        logger.info(f"Fila de sincronização CLP inicializada: {self.db_path}")
+
+    @classmethod
+    def get_instance(cls, db_path: str = None) -> 'FilaSincronizacaoCLP':
+        """Retorna a instância singleton da fila"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(db_path)
+        return cls._instance
+
+    def _conectar(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        """Inicializa o banco de dados e cria a tabela se não existir"""
+        try:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+            conn = self._conectar()
+            cursor = conn.cursor()
+
+            # Uma linha por destino: pedidos repetidos são coalescidos
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS fila_sincronizacao (
+                    destino TEXT PRIMARY KEY,
+                    motivo TEXT,
+                    criado_em TEXT NOT NULL,
+                    atualizado_em TEXT NOT NULL,
+                    disponivel_em TEXT NOT NULL,
+                    versao INTEGER NOT NULL DEFAULT 1,
+                    pedidos INTEGER NOT NULL DEFAULT 1,
+                    tentativas INTEGER NOT NULL DEFAULT 0,
+                    ultimo_erro TEXT
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_fila_disponivel
+                ON fila_sincronizacao(disponivel_em)
+            ''')
+
+            conn.commit()
+            conn.close()
+
+        except Exception as e:
+            logger.error(f"Erro ao inicializar fila de sincronização CLP: {e}")
+            raise
+
+    def enfileirar(self, destino: str, motivo: Optional[str] = None, atraso_segundos: float = 0) -> bool:
+        """
+        Registra (ou coalesce) uma intenção de sincronização para o destino
+
+        Um novo pedido adia a execução para agora + atraso (debounce) e
+        incrementa a versão, para que uma sincronização já em andamento não
+        descarte a alteração recebida durante a sua execução.
+
+        Args:
+            destino: Chave do CLP ('plenario', 'auditorio', ...)
+            motivo: Descrição da origem do pedido
+            atraso_segundos: Janela de debounce antes de executar
+
+        Returns:
+            True se registrado com sucesso
+        """
+        try:
+            agora = datetime.now()
+            disponivel_em = (agora + timedelta(seconds=atraso_segundos)).isoformat()
+
+            conn = self._conectar()
+            conn.execute('''
+                INSERT INTO fila_sincronizacao (destino, motivo, criado_em, atualizado_em, disponivel_em)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(destino) DO UPDATE SET
+                    motivo = excluded.motivo,
+                    atualizado_em = excluded.atualizado_em,
+                    disponivel_em = excluded.disponivel_em,
+                    versao = fila_sincronizacao.versao + 1,
+                    pedidos = fila_sincronizacao.pedidos + 1
+            ''', (destino, motivo, agora.isoformat(), agora.isoformat(), disponivel_em))
+            conn.commit()
+            conn.close()
+
+            logger.debug(f"Sincronização enfileirada: destino={destino}, motivo={motivo}, disponível em {disponivel_em}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Erro ao enfileirar sincronização para '{destino}': {e}")
+            return False
+
+    def proxima(self, destinos: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Retorna a intenção com execução mais próxima (vencida ou não)
+
+        Args:
+            destinos: Considera só estes destinos (os que têm integrador);
+                      None considera todos
+        """
+        try:
+            filtro, params = '', []
+            if destinos is not None:
+                params = list(destinos)
+                if not params:
+                    return None
+                filtro = f"WHERE destino IN ({', '.join('?' * len(params))})"
+            conn = self._conectar()
+            row = conn.execute(
+                f"SELECT * FROM fila_sincronizacao {filtro} ORDER BY disponivel_em ASC LIMIT 1", params
+            ).fetchone()
+            conn.close()
+            return dict(row) if row else None
+        except Exception as e:
+            logger.error(f"Erro ao consultar fila de sincronização: {e}")
+            return None
+
+    def concluir(self, destino: str, versao: int) -> bool:
+        """
+        Remove a intenção após sincronização bem-sucedida
+
+        A linha só é removida se nenhum novo pedido chegou durante a execução
+        (mesma versão); caso contrário permanece para uma nova rodada.
+        """
+        try:
+            conn = self._conectar()
+            cursor = conn.execute(
+                "DELETE FROM fila_sincronizacao WHERE destino = ? AND versao = ?",
+                (destino, versao)
+            )
+            removido = cursor.rowcount > 0
+            conn.commit()
+            conn.close()
+            return removido
+        except Exception as e:
+            logger.error(f"Erro ao concluir sincronização de '{destino}': {e}")
+            return False
+
+    def registrar_falha(self, destino: str, versao: int, erro: str, atraso_segundos: float) -> int:
+        """
+        Registra falha e reagenda a intenção com o atraso (backoff) informado
+
+        Returns:
+            Número de tentativas acumuladas
+        """
+        try:
+            disponivel_em = (datetime.now() + timedelta(seconds=atraso_segundos)).isoformat()
+            conn = self._conectar()
+            # Se chegou pedido novo durante a execução, mantém o debounce dele
+            conn.execute('''
+                UPDATE fila_sincronizacao
+                SET tentativas = tentativas + 1,
+                    ultimo_erro = ?,
+                    disponivel_em = CASE WHEN versao = ? THEN ? ELSE MAX(disponivel_em, ?) END
+                WHERE destino = ?
+            ''', (erro[:500], versao, disponivel_em, disponivel_em, destino))
+            row = conn.execute(
+                "SELECT tentativas FROM fila_sincronizacao WHERE destino = ?", (destino,)
+            ).fetchone()
+            conn.commit()
+            conn.close()
+            return row['tentativas'] if row else 0
+        except Exception as e:
+            logger.error(f"Erro ao registrar falha de sincronização de '{destino}': {e}")
+            return 0
+
+    def descartar(self, destino: str, versao: int) -> bool:
+        """
+        Remove a intenção que esgotou as tentativas
+
+        Se chegou pedido novo durante a execução (outra versão), a linha fica
+        com a contagem de tentativas zerada, como um pedido novo.
+
+        Returns:
+            True se a intenção foi removida
+        """
+        try:
+            conn = self._conectar()
+            cursor = conn.execute(
+                "DELETE FROM fila_sincronizacao WHERE destino = ? AND versao = ?",
+                (destino, versao)
+            )
+            removido = cursor.rowcount > 0
+            if not removido:
+                conn.execute(
+                    "UPDATE fila_sincronizacao SET tentativas = 0 WHERE destino = ?", (destino,)
+                )
+            conn.commit()
+            conn.close()
+            return removido
+        except Exception as e:
+            logger.error(f"Erro ao descartar sincronização de '{destino}': {e}")
+            return False
+
+    def listar_pendentes(self) -> List[Dict[str, Any]]:
+        """Lista todas as intenções pendentes"""
+        try:
+            conn = self._conectar()
+            rows = conn.execute(
+                "SELECT * FROM fila_sincronizacao ORDER BY disponivel_em ASC"
+            ).fetchall()
+            conn.close()
+            return [dict(row) for row in rows]
+        except Exception as e:
+            logger.error(f"Erro ao listar fila de sincronização: {e}")
+            return []
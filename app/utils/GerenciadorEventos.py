@@ -2,9 +2,11 @@
 import json
 import os
 import logging
+from threading import Lock
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional
 from ..config import DATA_DIR
+from .tempo_minutos import para_minutos, para_hhmm, sobrepoe
 
 class GerenciadorEventos:
     _instance = None
@@ -21,7 +23,12 @@ class GerenciadorEventos:
         self.logger.info(f"📄 Arquivo de eventos: {self.arquivo_eventos}")
         
         self.eventos = []
+        # Versão dos dados em memória (incrementada a cada alteração), usada para invalidar caches
+        self.versao = 0
+        self._lock_recarga = Lock()
         self._carregar_eventos()
+        # Arquivo como foi lido/gravado por este processo (detecta gravações de outros processos)
+        self._arquivo_lido = self._assinatura_arquivo()
         
         self.logger.info(f"✅ GerenciadorEventos inicializado com {len(self.eventos)} eventos")
         
@@ -82,6 +89,8 @@ class GerenciadorEventos:
     
     def _salvar_eventos(self):
         """Salva os eventos no arquivo JSON"""
+        # A lista em memória já mudou: caches por versão são invalidados mesmo se a gravação falhar
+        self.versao += 1
         try:
             self.logger.info(f"Iniciando salvamento de {len(self.eventos)} eventos em: {self.arquivo_eventos}")
             
@@ -91,8 +100,12 @@ class GerenciadorEventos:
                 self.logger.warning(f"Diretório não existe, criando: {dir_eventos}")
                 os.makedirs(dir_eventos, exist_ok=True)
             
-            with open(self.arquivo_eventos, 'w', encoding='utf-8') as f:
+            # Arquivo temporário + rename: outro processo nunca lê um arquivo pela metade
+            temporario = f"{self.arquivo_eventos}.tmp"
+            with open(temporario, 'w', encoding='utf-8') as f:
                 json.dump(self.eventos, f, ensure_ascii=False, indent=2)
+            os.replace(temporario, self.arquivo_eventos)
+            self._arquivo_lido = self._assinatura_arquivo()
                 
             # Verificar se o arquivo foi salvo corretamente
             if os.path.exists(self.arquivo_eventos):
@@ -107,14 +120,82 @@ class GerenciadorEventos:
             self.logger.error(f"❌ Erro ao salvar eventos: {e}")
             return False
     
+    def _assinatura_arquivo(self) -> Optional[tuple]:
+        """(mtime, tamanho) do arquivo de eventos, ou None se não existir"""
+        try:
+            estado = os.stat(self.arquivo_eventos)
+            return (estado.st_mtime_ns, estado.st_size)
+        except OSError:
+            return None
+    
+    def recarregar_se_alterado(self) -> bool:
+        """
+        Relê o arquivo de eventos se outro processo o gravou depois da última
+        leitura/gravação deste, incrementando a versão e reagendando os
+        lembretes. Um arquivo ilegível mantém os eventos atuais (nova tentativa
+        na próxima chamada).
+        
+        Returns:
+            True se os eventos foram recarregados
+        """
+        with self._lock_recarga:
+            assinatura = self._assinatura_arquivo()
+            if assinatura is None or assinatura == self._arquivo_lido:
+                return False
+            try:
+                with open(self.arquivo_eventos, 'r', encoding='utf-8') as f:
+                    eventos = json.load(f)
+            except Exception as e:
+                self.logger.warning(f"Falha ao recarregar eventos gravados por outro processo: {e}")
+                return False
+            anteriores = {e['id'] for e in self.eventos}
+            self.eventos = eventos
+            self.versao += 1
+            self._arquivo_lido = assinatura
+        
+        self.logger.info(f"Eventos recarregados (gravados por outro processo): {len(eventos)} eventos")
+        self._reagendar_lembretes(anteriores)
+        return True
+    
+    def _reagendar_lembretes(self, ids_anteriores: set):
+        """Recria os temporizadores de lembrete a partir dos eventos recarregados"""
+        try:
+            from .GerenciadorNotificacaoEventos import GerenciadorNotificacaoEventos
+            lembretes = GerenciadorNotificacaoEventos.get_instance()
+            eventos = list(self.eventos)
+            for evento_id in ids_anteriores - {e['id'] for e in eventos}:
+                lembretes.cancelar_lembretes_evento(evento_id)
+            # Inclusive os inalterados: os temporizadores guardam o objeto do evento
+            ontem = date.today() - timedelta(days=1)
+            for evento in eventos:
+                if date(evento['ano'], evento['mes'], evento['dia']) >= ontem:
+                    lembretes.agendar_lembretes_evento(evento)
+        except Exception as e:
+            self.logger.warning(f"Falha ao reagendar lembretes dos eventos recarregados: {e}")
+    
+    def _atualizar_lembretes(self, evento: Dict, removido: bool = False, id_anterior: Optional[str] = None):
+        """Cria, move ou cancela os temporizadores de lembrete do evento"""
+        try:
+            from .GerenciadorNotificacaoEventos import GerenciadorNotificacaoEventos
+            lembretes = GerenciadorNotificacaoEventos.get_instance()
+            if id_anterior and id_anterior != evento['id']:
+                lembretes.cancelar_lembretes_evento(id_anterior)
+            if removido:
+                lembretes.cancelar_lembretes_evento(evento['id'])
+            else:
+                lembretes.agendar_lembretes_evento(evento)
+        except Exception as e:
+            self.logger.warning(f"Falha ao atualizar lembretes do evento {evento.get('id')}: {e}")
+    
     def _validar_conflito_horario(self, local: str, dia: int, mes: int, ano: int, 
-                                  hora_inicio: str, hora_fim: str, evento_id: Optional[str] = None) -> bool:
-        """Verifica se há conflito de horário no local especificado"""
-        # Converter horários para comparação
-        inicio_novo = datetime.strptime(hora_inicio, '%H:%M').time()
-        fim_novo = datetime.strptime(hora_fim, '%H:%M').time()
+                                  hora_inicio: str, hora_fim: str, evento_id: Optional[str] = None,
+                                  eventos: Optional[List[Dict]] = None) -> bool:
+        """Verifica se há conflito de horário no local especificado (em self.eventos ou na lista dada)"""
+        # Comparação em minutos desde 00:00
+        inicio_novo = para_minutos(hora_inicio)
+        fim_novo = para_minutos(hora_fim)
         
-        for evento in self.eventos:
+        for evento in (self.eventos if eventos is None else eventos):
             # Pular o próprio evento em caso de atualização
             if evento_id and evento['id'] == evento_id:
                 continue
@@ -125,11 +206,8 @@ class GerenciadorEventos:
                 evento['mes'] == mes and 
                 evento['ano'] == ano):
                 
-                inicio_existente = datetime.strptime(evento['hora_inicio'], '%H:%M').time()
-                fim_existente = datetime.strptime(evento['hora_fim'], '%H:%M').time()
-                
-                # Verificar sobreposição de horários
-                if not (fim_novo <= inicio_existente or inicio_novo >= fim_existente):
+                if sobrepoe(inicio_novo, fim_novo,
+                            para_minutos(evento['hora_inicio']), para_minutos(evento['hora_fim'])):
                     return True
         
         return False
@@ -169,42 +247,50 @@ class GerenciadorEventos:
                 return evento
         return None
     
+    def _validar_dados_evento(self, dados: Dict, evento_id: Optional[str] = None,
+                              eventos: Optional[List[Dict]] = None) -> Dict:
+        """
+        Valida campos obrigatórios, local, data, horários e conflito de horário
+        
+        Returns:
+            Cópia dos dados com horários normalizados (HH:MM com dois dígitos)
+        """
+        # Validar dados obrigatórios
+        campos_obrigatorios = ['nome', 'local', 'dia', 'mes', 'ano', 'hora_inicio', 'hora_fim']
+        for campo in campos_obrigatorios:
+            if campo not in dados:
+                raise ValueError(f"Campo obrigatório ausente: {campo}")
+        
+        # Validar local
+        if dados['local'] not in self.LOCAIS_VALIDOS:
+            raise ValueError(f"Local inválido. Locais válidos: {', '.join(self.LOCAIS_VALIDOS)}")
+        
+        # Validar data
+        try:
+            date(dados['ano'], dados['mes'], dados['dia'])
+        except ValueError:
+            raise ValueError("Data inválida")
+        
+        # Validar horários (armazenados sempre como HH:MM com dois dígitos)
+        minuto_inicio = para_minutos(dados['hora_inicio'])
+        minuto_fim = para_minutos(dados['hora_fim'])
+        
+        if minuto_inicio >= minuto_fim:
+            raise ValueError("Hora de início deve ser anterior à hora de término")
+        
+        dados = {**dados, 'hora_inicio': para_hhmm(minuto_inicio), 'hora_fim': para_hhmm(minuto_fim)}
+        
+        # Verificar conflito de horário
+        if self._validar_conflito_horario(dados['local'], dados['dia'], dados['mes'], dados['ano'],
+                                          dados['hora_inicio'], dados['hora_fim'], evento_id, eventos):
+            raise ValueError(f"Conflito de horário no {dados['local']} para esta data e horário")
+        
+        return dados
+    
     def adicionar_evento(self, dados: Dict) -> Dict:
         """Adiciona um novo evento"""
         try:
-            # Validar dados obrigatórios
-            campos_obrigatorios = ['nome', 'local', 'dia', 'mes', 'ano', 'hora_inicio', 'hora_fim']
-            for campo in campos_obrigatorios:
-                if campo not in dados:
-                    raise ValueError(f"Campo obrigatório ausente: {campo}")
-            
-            # Validar local
-            if dados['local'] not in self.LOCAIS_VALIDOS:
-                raise ValueError(f"Local inválido. Locais válidos: {', '.join(self.LOCAIS_VALIDOS)}")
-            
-            # Validar data
-            try:
-                data_teste = date(dados['ano'], dados['mes'], dados['dia'])
-            except ValueError:
-                raise ValueError("Data inválida")
-            
-            # Validar horários
-            try:
-                hora_inicio = datetime.strptime(dados['hora_inicio'], '%H:%M')
-                hora_fim = datetime.strptime(dados['hora_fim'], '%H:%M')
-                
-                if hora_inicio >= hora_fim:
-                    raise ValueError("Hora de início deve ser anterior à hora de término")
-                    
-            except ValueError as e:
-                if "time data" in str(e):
-                    raise ValueError("Formato de horário inválido. Use HH:MM")
-                raise
-            
-            # Verificar conflito de horário
-            if self._validar_conflito_horario(dados['local'], dados['dia'], dados['mes'], 
-                                            dados['ano'], dados['hora_inicio'], dados['hora_fim']):
-                raise ValueError(f"Conflito de horário no {dados['local']} para esta data e horário")
+            dados = self._validar_dados_evento(dados)
             
             # Criar novo evento
             novo_evento = {
@@ -225,6 +311,7 @@ class GerenciadorEventos:
             
             self.eventos.append(novo_evento)
             self._salvar_eventos()
+            self._atualizar_lembretes(novo_evento)
             
             # Registrar no histórico
             try:
@@ -241,11 +328,11 @@ class GerenciadorEventos:
             
             # Integração com sistema de notificações em background
             try:
-                import threading
+                from .FilaNotificacoes import FilaNotificacoes
                 from .GerenciadorNotificacaoEventos import GerenciadorNotificacaoEventos
                 
                 def enviar_notificacao_background():
-                    """Envia notificação em thread separada para não bloquear a interface"""
+                    """Envia notificação no pool de notificações para não bloquear a interface"""
                     try:
                         gerenciador_notificacao = GerenciadorNotificacaoEventos.get_instance()
                         gerenciador_notificacao.notificar_evento_criado(novo_evento)
@@ -253,17 +340,16 @@ class GerenciadorEventos:
                     except Exception as e:
                         self.logger.warning(f"Erro ao enviar notificação de evento em background: {e}")
                 
-                # Executar notificação em thread separada (não bloqueante)
-                thread_notificacao = threading.Thread(
-                    target=enviar_notificacao_background,
-                    daemon=True,  # Thread será encerrada quando a aplicação principal terminar
-                    name=f"NotificacaoEvento_{novo_evento['id']}"
-                )
-                thread_notificacao.start()
-                self.logger.debug(f"Thread de notificação iniciada para evento: {novo_evento['nome']}")
+                # Dentro de uma operação em lote a notificação entra no resumo
+                if GerenciadorNotificacaoEventos.get_instance().registrar_intencao(criados=[novo_evento]):
+                    self.logger.debug(f"Notificação agrupada no resumo do lote: {novo_evento['nome']}")
+                else:
+                    # Executar notificação no pool de notificações (não bloqueante)
+                    FilaNotificacoes.get_instance().enviar(
+                        f"evento criado {novo_evento['id']}", enviar_notificacao_background)
                 
             except Exception as e:
-                self.logger.warning(f"Erro ao iniciar thread de notificação: {e}")
+                self.logger.warning(f"Erro ao enfileirar notificação: {e}")
             
             self.logger.info(f"Evento adicionado: {novo_evento['nome']} no {novo_evento['local']}")
             return novo_evento
@@ -297,16 +383,14 @@ class GerenciadorEventos:
                     hora_inicio = dados.get('hora_inicio', evento['hora_inicio'])
                     hora_fim = dados.get('hora_fim', evento['hora_fim'])
                     
-                    try:
-                        h_inicio = datetime.strptime(hora_inicio, '%H:%M')
-                        h_fim = datetime.strptime(hora_fim, '%H:%M')
-                        
-                        if h_inicio >= h_fim:
-                            raise ValueError("Hora de início deve ser anterior à hora de término")
-                    except ValueError as e:
-                        if "time data" in str(e):
-                            raise ValueError("Formato de horário inválido. Use HH:MM")
-                        raise
+                    minuto_inicio = para_minutos(hora_inicio)
+                    minuto_fim = para_minutos(hora_fim)
+                    
+                    if minuto_inicio >= minuto_fim:
+                        raise ValueError("Hora de início deve ser anterior à hora de término")
+                    
+                    hora_inicio = para_hhmm(minuto_inicio)
+                    hora_fim = para_hhmm(minuto_fim)
                     
                     # Verificar conflito de horário
                     local = dados.get('local', evento['local'])
@@ -324,10 +408,13 @@ class GerenciadorEventos:
                     for campo in campos_atualizaveis:
                         if campo in dados:
                             evento[campo] = dados[campo]
+                    evento['hora_inicio'] = hora_inicio
+                    evento['hora_fim'] = hora_fim
                     
                     evento['atualizado_em'] = datetime.now().isoformat()
                     
                     self._salvar_eventos()
+                    self._atualizar_lembretes(evento)
                     
                     # Registrar no histórico
                     try:
@@ -347,24 +434,26 @@ class GerenciadorEventos:
 
                     # Enviar notificação de alteração em background
                     try:
-                        import threading
+                        from .FilaNotificacoes import FilaNotificacoes
                         from .GerenciadorNotificacaoEventos import GerenciadorNotificacaoEventos
+                        # Cópia: o envio pode sair depois de uma nova alteração no mesmo evento
+                        evento_depois = evento.copy()
 
                         def enviar_notificacao_alteracao():
                             try:
                                 ger = GerenciadorNotificacaoEventos.get_instance()
-                                ger.notificar_evento_alterado(evento_antes, evento)
+                                ger.notificar_evento_alterado(evento_antes, evento_depois)
                             except Exception as e:
                                 self.logger.warning(f"Erro ao notificar alteração de evento: {e}")
 
-                        t = threading.Thread(
-                            target=enviar_notificacao_alteracao,
-                            daemon=True,
-                            name=f"NotificacaoAlteracao_{evento_id}"
-                        )
-                        t.start()
+                        if GerenciadorNotificacaoEventos.get_instance().registrar_intencao(
+                                alterados=[(evento_antes, evento)]):
+                            self.logger.debug(f"Notificação agrupada no resumo do lote: {evento['nome']}")
+                        else:
+                            FilaNotificacoes.get_instance().enviar(
+                                f"evento alterado {evento_id}", enviar_notificacao_alteracao)
                     except Exception as e:
-                        self.logger.warning(f"Falha ao iniciar thread de notificação de alteração: {e}")
+                        self.logger.warning(f"Falha ao enfileirar notificação de alteração: {e}")
 
                     return evento
             
@@ -387,6 +476,7 @@ class GerenciadorEventos:
                     # Remover evento
                     del self.eventos[i]
                     self._salvar_eventos()
+                    self._atualizar_lembretes(evento_para_notificar, removido=True)
                     
                     # Registrar no histórico
                     try:
@@ -403,7 +493,7 @@ class GerenciadorEventos:
                     
                     self.logger.info(f"Evento removido: {nome} do {local}")
                     
-                    # Enviar notificação de cancelamento em background thread
+                    # Enviar notificação de cancelamento em background
                     def enviar_notificacao_cancelamento():
                         try:
                             from .GerenciadorNotificacaoEventos import GerenciadorNotificacaoEventos
@@ -413,18 +503,18 @@ class GerenciadorEventos:
                         except Exception as e:
                             self.logger.warning(f"Erro ao enviar notificação de cancelamento em background: {e}")
                     
-                    # Executar notificação em thread separada (não bloqueante)
+                    # Executar notificação no pool de notificações (não bloqueante)
                     try:
-                        import threading
-                        thread_notificacao = threading.Thread(
-                            target=enviar_notificacao_cancelamento,
-                            daemon=True,
-                            name=f"NotificacaoCancelamento_{evento_id}"
-                        )
-                        thread_notificacao.start()
-                        self.logger.debug(f"Thread de notificação de cancelamento iniciada para evento: {nome}")
+                        from .FilaNotificacoes import FilaNotificacoes
+                        from .GerenciadorNotificacaoEventos import GerenciadorNotificacaoEventos
+                        if GerenciadorNotificacaoEventos.get_instance().registrar_intencao(
+                                removidos=[evento_para_notificar]):
+                            self.logger.debug(f"Notificação agrupada no resumo do lote: {nome}")
+                        else:
+                            FilaNotificacoes.get_instance().enviar(
+                                f"evento cancelado {evento_id}", enviar_notificacao_cancelamento)
                     except Exception as e:
-                        self.logger.warning(f"Erro ao iniciar thread de notificação de cancelamento: {e}")
+                        self.logger.warning(f"Erro ao enfileirar notificação de cancelamento: {e}")
                     
                     return True
             
@@ -434,6 +524,138 @@ class GerenciadorEventos:
             self.logger.error(f"Erro ao remover evento: {e}")
             return False
     
+    def aplicar_lote(self, criar: Optional[List[Dict]] = None, atualizar: Optional[Dict[str, Dict]] = None,
+                     remover: Optional[List[str]] = None, origem: str = 'Sincronização automática',
+                     usuario: Optional[str] = None, usuario_nome: Optional[str] = None) -> Dict:
+        """
+        Aplica um conjunto de alterações como uma única transação: uma gravação
+        do arquivo, um insert em lote no histórico, uma notificação resumida e
+        uma sincronização de CLP por local afetado.
+        
+        As remoções são aplicadas antes das atualizações e estas antes das
+        criações, e os conflitos de horário são verificados contra o estado já
+        com o lote. Itens inválidos (dados incompletos, conflito, id inexistente
+        ou repetido) são rejeitados individualmente sem impedir os demais; se a
+        gravação do arquivo falhar, nada é aplicado.
+        
+        Args:
+            criar: Eventos novos, já com o 'id' definitivo
+            atualizar: {id: campos a alterar}
+            remover: IDs dos eventos a remover
+            origem: Descrição usada na notificação resumida
+            usuario, usuario_nome: Responsável registrado no histórico
+            
+        Returns:
+            {'criados': [...], 'atualizados': [(antes, depois)], 'removidos': [...],
+             'rejeitados': [{'id', 'erro'}]}
+        """
+        resultado = {'criados': [], 'atualizados': [], 'removidos': [], 'rejeitados': []}
+        agora = datetime.now().isoformat()
+        
+        # Trabalha sobre uma nova lista: self.eventos só é trocada após a gravação
+        ids_remover = set(remover or [])
+        eventos = []
+        for evento in self.eventos:
+            if evento['id'] in ids_remover:
+                resultado['removidos'].append(evento)
+            else:
+                eventos.append(evento)
+        for evento_id in ids_remover - {e['id'] for e in resultado['removidos']}:
+            resultado['rejeitados'].append({'id': evento_id, 'erro': 'Evento não encontrado'})
+        
+        indice = {e['id']: i for i, e in enumerate(eventos)}
+        for evento_id, dados in (atualizar or {}).items():
+            try:
+                if evento_id not in indice:
+                    raise ValueError("Evento não encontrado")
+                antes = eventos[indice[evento_id]]
+                campos = {k: v for k, v in dados.items() if k not in ('id', 'criado_em')}
+                depois = self._validar_dados_evento({**antes, **campos}, evento_id, eventos)
+                depois['atualizado_em'] = agora
+                eventos[indice[evento_id]] = depois
+                resultado['atualizados'].append((antes, depois))
+            except ValueError as e:
+                resultado['rejeitados'].append({'id': evento_id, 'erro': str(e)})
+        
+        for dados in criar or []:
+            evento_id = dados.get('id')
+            try:
+                if not evento_id:
+                    raise ValueError("Campo obrigatório ausente: id")
+                if evento_id in indice:
+                    raise ValueError("Já existe um evento com este id")
+                novo_evento = {
+                    'descricao': '',
+                    'responsavel': '',
+                    'participantes_estimados': 0,
+                    **self._validar_dados_evento(dados, eventos=eventos),
+                    'criado_em': agora,
+                    'atualizado_em': agora
+                }
+                indice[evento_id] = len(eventos)
+                eventos.append(novo_evento)
+                resultado['criados'].append(novo_evento)
+            except ValueError as e:
+                resultado['rejeitados'].append({'id': evento_id, 'erro': str(e)})
+        
+        for rejeitado in resultado['rejeitados']:
+            self.logger.warning(f"Alteração em lote rejeitada ({rejeitado['id']}): {rejeitado['erro']}")
+        
+        criados, atualizados, removidos = resultado['criados'], resultado['atualizados'], resultado['removidos']
+        if not (criados or atualizados or removidos):
+            return resultado
+        
+        anteriores = self.eventos
+        self.eventos = eventos
+        if not self._salvar_eventos():
+            self.eventos = anteriores
+            raise Exception("Erro ao persistir alterações em lote")
+        
+        for evento in removidos:
+            self._atualizar_lembretes(evento, removido=True)
+        for evento in criados + [depois for _, depois in atualizados]:
+            self._atualizar_lembretes(evento)
+        
+        # Registrar no histórico (uma transação)
+        try:
+            from .GerenciadorHistorico import GerenciadorHistorico
+            responsavel = {'usuario': usuario, 'usuario_nome': usuario_nome}
+            GerenciadorHistorico.get_instance().registrar_alteracoes_lote(
+                [{'tipo_entidade': 'evento', 'entidade_id': e['id'], 'operacao': 'excluir',
+                  'dados_anteriores': e, **responsavel} for e in removidos] +
+                [{'tipo_entidade': 'evento', 'entidade_id': d['id'], 'operacao': 'editar',
+                  'dados_anteriores': a, 'dados_novos': d, **responsavel} for a, d in atualizados] +
+                [{'tipo_entidade': 'evento', 'entidade_id': e['id'], 'operacao': 'criar',
+                  'dados_novos': e, **responsavel} for e in criados]
+            )
+        except Exception as e_hist:
+            self.logger.warning(f"Falha ao registrar lote no histórico: {e_hist}")
+        
+        self.logger.info(f"Lote aplicado ({origem}): {len(criados)} criados, {len(atualizados)} atualizados, "
+                         f"{len(removidos)} removidos, {len(resultado['rejeitados'])} rejeitados")
+        
+        # Notificação resumida (entra no resumo de um agrupamento externo, se houver)
+        try:
+            from .GerenciadorNotificacaoEventos import GerenciadorNotificacaoEventos
+            notificacoes = GerenciadorNotificacaoEventos.get_instance()
+            with notificacoes.agrupar_notificacoes(origem):
+                notificacoes.registrar_intencao(criados, atualizados, removidos)
+        except Exception as e:
+            self.logger.warning(f"Falha ao notificar alterações do lote: {e}")
+        
+        # Uma sincronização de CLP por local afetado
+        try:
+            from .AutoSyncCLP import AutoSyncCLP
+            autosync = AutoSyncCLP.get_instance()
+            locais = {e['local'] for e in criados + removidos}
+            locais.update(ev['local'] for par in atualizados for ev in par)
+            for local in sorted(locais):
+                autosync.trigger_for_local(local)
+        except Exception as e:
+            self.logger.warning(f"Falha ao agendar sincronização de CLP do lote: {e}")
+        
+        return resultado
+    
     def obter_eventos_por_data(self, dia: int, mes: int, ano: int) -> List[Dict]:
         """Obtém todos os eventos de uma data específica"""
         eventos_data = []
@@ -515,6 +737,7 @@ class GerenciadorEventos:
                 raise Exception("Erro ao persistir encerramento do evento")
             
             self.logger.info(f"✅ Evento '{evento['nome']}' marcado como encerrado em {timestamp_encerramento}")
+            self._atualizar_lembretes(self.eventos[evento_index])
             
             # Retornar dados do evento para processamento externo
             return {
@@ -569,6 +792,7 @@ class GerenciadorEventos:
                 raise Exception("Erro ao persistir reativação do evento")
             
             self.logger.info(f"✅ Evento '{evento['nome']}' reativado (estava encerrado desde {encerrado_em_anterior})")
+            self._atualizar_lembretes(self.eventos[evento_index])
             
             return self.eventos[evento_index]
             
@@ -2,10 +2,12 @@
 import json
 import os
 import logging
+from threading import Lock
 from datetime import datetime, date
 from typing import List, Dict, Optional
 import holidays
 from ..config import DATA_DIR
+from .tempo_minutos import horario_valido, para_minutos
 
 class GerenciadorFeriados:
     _instance = None
@@ -19,9 +21,14 @@ class GerenciadorFeriados:
         self.logger.info(f"📄 Arquivo de feriados: {self.arquivo_feriados}")
         
         self.feriados = []
+        # Versão dos dados em memória (incrementada a cada alteração), usada para invalidar caches
+        self.versao = 0
         self._carregar_feriados()
         # Sempre remover duplicatas na inicialização para garantir integridade
         self._remover_duplicatas_inicializacao()
+        # Arquivo como foi lido/gravado por este processo (detecta gravações de outros processos)
+        self._lock_recarga = Lock()
+        self._arquivo_lido = self._assinatura_arquivo()
         
         self.logger.info(f"✅ GerenciadorFeriados inicializado com {len(self.feriados)} feriados")
         
@@ -252,6 +259,8 @@ class GerenciadorFeriados:
     
     def _salvar_feriados(self):
         """Salva os feriados no arquivo JSON"""
+        # A lista em memória já mudou: caches por versão são invalidados mesmo se a gravação falhar
+        self.versao += 1
         try:
             self.logger.info(f"Iniciando salvamento de {len(self.feriados)} feriados em: {self.arquivo_feriados}")
             
@@ -261,8 +270,12 @@ class GerenciadorFeriados:
                 self.logger.warning(f"Diretório não existe, criando: {dir_feriados}")
                 os.makedirs(dir_feriados, exist_ok=True)
             
-            with open(self.arquivo_feriados, 'w', encoding='utf-8') as f:
+            # Arquivo temporário + rename: outro processo nunca lê um arquivo pela metade
+            temporario = f"{self.arquivo_feriados}.tmp"
+            with open(temporario, 'w', encoding='utf-8') as f:
                 json.dump(self.feriados, f, ensure_ascii=False, indent=2)
+            os.replace(temporario, self.arquivo_feriados)
+            self._arquivo_lido = self._assinatura_arquivo()
                 
             # Verificar se o arquivo foi salvo corretamente
             if os.path.exists(self.arquivo_feriados):
@@ -277,6 +290,40 @@ class GerenciadorFeriados:
             self.logger.error(f"❌ Erro ao salvar feriados: {e}")
             return False
     
+    def _assinatura_arquivo(self) -> Optional[tuple]:
+        """(mtime, tamanho) do arquivo de feriados, ou None se não existir"""
+        try:
+            estado = os.stat(self.arquivo_feriados)
+            return (estado.st_mtime_ns, estado.st_size)
+        except OSError:
+            return None
+    
+    def recarregar_se_alterado(self) -> bool:
+        """
+        Relê o arquivo de feriados se outro processo o gravou depois da última
+        leitura/gravação deste, incrementando a versão. Um arquivo ilegível
+        mantém os feriados atuais (nova tentativa na próxima chamada).
+        
+        Returns:
+            True se os feriados foram recarregados
+        """
+        with self._lock_recarga:
+            assinatura = self._assinatura_arquivo()
+            if assinatura is None or assinatura == self._arquivo_lido:
+                return False
+            try:
+                with open(self.arquivo_feriados, 'r', encoding='utf-8') as f:
+                    feriados = json.load(f)
+            except Exception as e:
+                self.logger.warning(f"Falha ao recarregar feriados gravados por outro processo: {e}")
+                return False
+            self.feriados = feriados
+            self.versao += 1
+            self._arquivo_lido = assinatura
+        
+        self.logger.info(f"Feriados recarregados (gravados por outro processo): {len(feriados)} feriados")
+        return True
+    
     def listar_feriados(self, ano: Optional[int] = None, mes: Optional[int] = None, ano_minimo: Optional[int] = None) -> List[Dict]:
         """Lista todos os feriados ou filtra por ano/mês"""
         feriados_filtrados = self.feriados
@@ -317,11 +364,8 @@ class GerenciadorFeriados:
                 raise ValueError("Data inválida")
             
             # Validar horários
-            try:
-                datetime.strptime(dados['hora_inicio'], '%H:%M')
-                datetime.strptime(dados['hora_fim'], '%H:%M')
-            except ValueError:
-                raise ValueError("Formato de horário inválido. Use HH:MM")
+            para_minutos(dados['hora_inicio'])
+            para_minutos(dados['hora_fim'])
             
             # Criar novo feriado
             novo_feriado = {
@@ -396,17 +440,11 @@ class GerenciadorFeriados:
                             raise ValueError("Data inválida")
                     
                     # Validar horários se fornecidos
-                    if 'hora_inicio' in dados:
-                        try:
-                            datetime.strptime(dados['hora_inicio'], '%H:%M')
-                        except ValueError:
-                            raise ValueError("Formato de hora_inicio inválido")
+                    if 'hora_inicio' in dados and not horario_valido(dados['hora_inicio']):
+                        raise ValueError("Formato de hora_inicio inválido")
                     
-                    if 'hora_fim' in dados:
-                        try:
-                            datetime.strptime(dados['hora_fim'], '%H:%M')
-                        except ValueError:
-                            raise ValueError("Formato de hora_fim inválido")
+                    if 'hora_fim' in dados and not horario_valido(dados['hora_fim']):
+                        raise ValueError("Formato de hora_fim inválido")
                     
                     # Atualizar campos
                     for campo in ['nome', 'descricao', 'dia', 'mes', 'ano', 'hora_inicio', 'hora_fim', 'tipo']:
@@ -120,6 +120,61 @@ class GerenciadorHistorico:
         except:
             return 'sistema', 'Sistema', None, None
     
+    _SQL_INSERIR = '''
+        INSERT INTO historico (
+            tipo_entidade, entidade_id, operacao, usuario, usuario_nome,
+            dados_anteriores, dados_novos, campos_alterados,
+            ip_origem, user_agent
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    def _montar_linha(
+        self,
+        tipo_entidade: str,
+        entidade_id: str,
+        operacao: str,
+        dados_anteriores: Optional[Dict] = None,
+        dados_novos: Optional[Dict] = None,
+        usuario: Optional[str] = None,
+        usuario_nome: Optional[str] = None
+    ) -> tuple:
+        """Valores de uma linha da tabela historico, na ordem de _SQL_INSERIR"""
+        # Obter informações do usuário se não fornecidas
+        if usuario is None or usuario_nome is None:
+            user, user_nome, ip, ua = self._get_usuario_atual()
+            usuario = usuario or user
+            usuario_nome = usuario_nome or user_nome
+        else:
+            ip, ua = None, None
+        
+        # Identificar campos alterados (para operação de edição)
+        campos_alterados = []
+        if operacao == 'editar' and dados_anteriores and dados_novos:
+            for campo in dados_novos.keys():
+                if campo in dados_anteriores:
+                    if dados_anteriores[campo] != dados_novos[campo]:
+                        campos_alterados.append(campo)
+                else:
+                    campos_alterados.append(campo)
+        
+        # Serializar dados para JSON
+        dados_anteriores_json = json.dumps(dados_anteriores, ensure_ascii=False) if dados_anteriores else None
+        dados_novos_json = json.dumps(dados_novos, ensure_ascii=False) if dados_novos else None
+        campos_alterados_json = json.dumps(campos_alterados, ensure_ascii=False) if campos_alterados else None
+        
+        return (
+            tipo_entidade,
+            entidade_id,
+            operacao,
+            usuario,
+            usuario_nome,
+            dados_anteriores_json,
+            dados_novos_json,
+            campos_alterados_json,
+            ip,
+            ua
+        )
+    
     def registrar_alteracao(
         self,
         tipo_entidade: str,
@@ -146,57 +201,20 @@ class GerenciadorHistorico:
             ID do registro criado
         """
         try:
-            # Obter informações do usuário se não fornecidas
-            if usuario is None or usuario_nome is None:
-                user, user_nome, ip, ua = self._get_usuario_atual()
-                usuario = usuario or user
-                usuario_nome = usuario_nome or user_nome
-            else:
-                ip, ua = None, None
-            
-            # Identificar campos alterados (para operação de edição)
-            campos_alterados = []
-            if operacao == 'editar' and dados_anteriores and dados_novos:
-                for campo in dados_novos.keys():
-                    if campo in dados_anteriores:
-                        if dados_anteriores[campo] != dados_novos[campo]:
-                            campos_alterados.append(campo)
-                    else:
-                        campos_alterados.append(campo)
-            
-            # Serializar dados para JSON
-            dados_anteriores_json = json.dumps(dados_anteriores, ensure_ascii=False) if dados_anteriores else None
-            dados_novos_json = json.dumps(dados_novos, ensure_ascii=False) if dados_novos else None
-            campos_alterados_json = json.dumps(campos_alterados, ensure_ascii=False) if campos_alterados else None
+            linha = self._montar_linha(tipo_entidade, entidade_id, operacao,
+                                       dados_anteriores, dados_novos, usuario, usuario_nome)
             
             # Inserir no banco
             conn = sqlite3.connect(self.db_path)
             cursor = conn.cursor()
             
-            cursor.execute('''
-                INSERT INTO historico (
-                    tipo_entidade, entidade_id, operacao, usuario, usuario_nome,
-                    dados_anteriores, dados_novos, campos_alterados,
-                    ip_origem, user_agent
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                tipo_entidade,
-                entidade_id,
-                operacao,
-                usuario,
-                usuario_nome,
-                dados_anteriores_json,
-                dados_novos_json,
-                campos_alterados_json,
-                ip,
-                ua
-            ))
+            cursor.execute(self._SQL_INSERIR, linha)
             
             registro_id = cursor.lastrowid
             conn.commit()
             conn.close()
             
-            logger.info(f"Alteração registrada: {operacao} {tipo_entidade} {entidade_id} por {usuario}")
+            logger.info(f"Alteração registrada: {operacao} {tipo_entidade} {entidade_id} por {linha[3]}")
             
             return registro_id
             
@@ -204,6 +222,39 @@ class GerenciadorHistorico:
             logger.error(f"Erro ao registrar alteração: {e}")
             raise
     
+    def registrar_alteracoes_lote(self, alteracoes: List[Dict]) -> int:
+        """
+        Registra várias alterações em uma única transação (aplicação em lote,
+        como a sincronização do TCE)
+        
+        Args:
+            alteracoes: Lista de dicionários com os argumentos de registrar_alteracao
+                        (tipo_entidade, entidade_id, operacao, dados_anteriores,
+                        dados_novos, usuario, usuario_nome)
+        
+        Returns:
+            Quantidade de registros criados
+        """
+        if not alteracoes:
+            return 0
+        try:
+            linhas = [self._montar_linha(**alteracao) for alteracao in alteracoes]
+            
+            conn = sqlite3.connect(self.db_path)
+            try:
+                with conn:
+                    conn.executemany(self._SQL_INSERIR, linhas)
+            finally:
+                conn.close()
+            
+            logger.info(f"{len(linhas)} alterações registradas em lote por {linhas[0][3]}")
+            
+            return len(linhas)
+            
+        except Exception as e:
+            logger.error(f"Erro ao registrar alterações em lote: {e}")
+            raise
+    
     def obter_historico(
         self,
         tipo_entidade: Optional[str] = None,
@@ -124,7 +124,7 @@ class GerenciadorHistoricoNotificacoes:
             tipo: Tipo de notificação (lembrete_1h, lembrete_30min, evento_hoje, etc.)
             canal: Canal de envio (whatsapp, email)
             mensagem: Conteúdo da mensagem enviada
-            status: Status do envio (sucesso, erro, pendente)
+            status: Status do envio (sucesso, erro, pendente, aceito)
             destinatarios: Lista de destinatários (telefones ou emails)
             assunto: Assunto (para emails)
             detalhes: Informações adicionais em formato dict
@@ -139,35 +139,103 @@ class GerenciadorHistoricoNotificacoes:
         """
         try:
             conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            timestamp = datetime.now().isoformat()
-            destinatarios_json = json.dumps(destinatarios) if destinatarios else None
-            detalhes_json = json.dumps(detalhes, ensure_ascii=False) if detalhes else None
-            
-            cursor.execute('''
-                INSERT INTO historico_notificacoes (
-                    timestamp, tipo, canal, destinatarios, assunto, mensagem,
-                    status, detalhes, evento_id, evento_titulo, duracao_ms,
-                    response_code, error_message
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                timestamp, tipo, canal, destinatarios_json, assunto, mensagem,
-                status, detalhes_json, evento_id, evento_titulo, duracao_ms,
-                response_code, error_message
-            ))
-            
-            notificacao_id = cursor.lastrowid
+            notificacao_id = self.inserir_registro(
+                conn.cursor(), tipo, canal, mensagem, status, destinatarios, assunto, detalhes,
+                evento_id, evento_titulo, duracao_ms, response_code, error_message
+            )
             conn.commit()
             conn.close()
-            
+
             logger.debug(f"Notificação registrada: ID={notificacao_id}, tipo={tipo}, canal={canal}, status={status}")
             return notificacao_id
-            
+
         except Exception as e:
             logger.error(f"Erro ao registrar notificação: {e}")
             return None
-    
+
+    def inserir_registro(
+        self,
+        cursor: sqlite3.Cursor,
+        tipo: str,
+        canal: str,
+        mensagem: str,
+        status: str,
+        destinatarios: Optional[List[str]] = None,
+        assunto: Optional[str] = None,
+        detalhes: Optional[Dict[str, Any]] = None,
+        evento_id: Optional[int] = None,
+        evento_titulo: Optional[str] = None,
+        duracao_ms: Optional[int] = None,
+        response_code: Optional[int] = None,
+        error_message: Optional[str] = None
+    ) -> int:
+        """
+        Insere o registro na transação do chamador (mesmos campos de registrar_notificacao)
+
+        Usado pela saída de notificações para gravar a intenção de envio e o
+        registro do histórico atomicamente, no mesmo banco.
+        """
+        destinatarios_json = json.dumps(destinatarios) if destinatarios else None
+        detalhes_json = json.dumps(detalhes, ensure_ascii=False) if detalhes else None
+
+        cursor.execute('''
+            INSERT INTO historico_notificacoes (
+                timestamp, tipo, canal, destinatarios, assunto, mensagem,
+                status, detalhes, evento_id, evento_titulo, duracao_ms,
+                response_code, error_message
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            datetime.now().isoformat(), tipo, canal, destinatarios_json, assunto, mensagem,
+            status, detalhes_json, evento_id, evento_titulo, duracao_ms,
+            response_code, error_message
+        ))
+        return cursor.lastrowid
+
+    def atualizar_registro(
+        self,
+        cursor: sqlite3.Cursor,
+        notificacao_id: int,
+        status: str,
+        detalhes: Optional[Dict[str, Any]] = None,
+        duracao_ms: Optional[int] = None,
+        response_code: Optional[int] = None,
+        error_message: Optional[str] = None
+    ) -> bool:
+        """
+        Atualiza o resultado de um registro na transação do chamador
+
+        Os detalhes informados são mesclados aos já gravados; duração e código
+        HTTP não informados são mantidos, assim como o timestamp original
+        (momento do pedido de envio).
+
+        Returns:
+            True se o registro existia
+        """
+        row = cursor.execute(
+            "SELECT detalhes FROM historico_notificacoes WHERE id = ?", (notificacao_id,)
+        ).fetchone()
+        if row is None:
+            return False
+
+        atuais = {}
+        if row[0]:
+            try:
+                atuais = json.loads(row[0])
+            except ValueError:
+                pass
+        atuais.update(detalhes or {})
+
+        cursor.execute('''
+            UPDATE historico_notificacoes
+            SET status = ?, detalhes = ?, duracao_ms = COALESCE(?, duracao_ms),
+                response_code = COALESCE(?, response_code), error_message = ?
+            WHERE id = ?
+        ''', (
+            status, json.dumps(atuais, ensure_ascii=False) if atuais else None,
+            duracao_ms, response_code, error_message, notificacao_id
+        ))
+        return True
+
     def buscar_notificacoes(
         self,
         limite: int = 100,
@@ -1,12 +1,13 @@
 import logging
-import schedule
-import time
 import threading
-from datetime import datetime, timedelta
-from typing import Optional
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
 from app.alarmes.NotificacaoEventos import NotificacaoEventos
 from app.alarmes.ClassesSistema import ConfigNotificacao
 from app.utils.GerenciadorEventos import GerenciadorEventos
+from app.utils.AgendadorTarefas import AgendadorTarefas
+from app.utils.tempo_minutos import hora_minuto, para_minutos
 
 logger = logging.getLogger('EventosFeriados')
 
@@ -23,20 +24,24 @@ class GerenciadorNotificacaoEventos:
     
     _instance = None
     
-    def __init__(self):
+    def __init__(self, gerenciador_eventos: Optional[GerenciadorEventos] = None,
+                 gerenciador_feriados=None):
+        # Gerenciadores compartilhados recebidos de ServicosAplicacao (padrão: instâncias únicas)
+        self.gerenciador_eventos = (gerenciador_eventos if gerenciador_eventos is not None
+                                    else GerenciadorEventos.get_instance())
+        self.gerenciador_feriados = gerenciador_feriados
         self.notificacao_eventos: Optional[NotificacaoEventos] = None
-        self.scheduler_thread: Optional[threading.Thread] = None
         self.running = False
-        # Controle simples para evitar lembretes 1h duplicados (por execução)
-        # Mapeia id do evento → timestamp do último envio
-        self._ultimo_envio_1h = {}
+        # Resumo em montagem pela operação em lote da thread atual (agrupar_notificacoes)
+        self._agrupamento = threading.local()
         self._inicializar_notificacao()
         
     @classmethod
-    def get_instance(cls):
-        """Retorna a instância única do gerenciador (Singleton)"""
+    def get_instance(cls, gerenciador_eventos: Optional[GerenciadorEventos] = None,
+                     gerenciador_feriados=None):
+        """Retorna a instância única do gerenciador (Singleton); os gerenciadores valem só na criação"""
         if cls._instance is None:
-            cls._instance = cls()
+            cls._instance = cls(gerenciador_eventos, gerenciador_feriados)
         return cls._instance
     
     def _inicializar_notificacao(self):
@@ -53,7 +58,8 @@ class GerenciadorNotificacaoEventos:
             
             # Cria a instância de notificação (sem técnicos locais; API externa cuida do envio por função)
             self.notificacao_eventos = NotificacaoEventos(
-                config_notificacao=config
+                config_notificacao=config,
+                gerenciador_feriados=self.gerenciador_feriados
             )
             
             logger.info("Sistema de notificação de eventos inicializado com sucesso")
@@ -120,60 +126,226 @@ class GerenciadorNotificacaoEventos:
             logger.error(f"Erro ao enviar notificação de evento alterado: {e}")
             return False
     
+    def notificar_lote_eventos(self, criados: list, alterados: list, removidos: list,
+                               origem: str = 'Sincronização automática') -> bool:
+        """
+        Notifica técnicos com um resumo único de alterações aplicadas em lote.
+        
+        Args:
+            criados (list): Eventos criados
+            alterados (list): Pares (evento_anterior, evento_atual)
+            removidos (list): Eventos removidos
+            origem (str): Descrição de quem aplicou as alterações
+        """
+        if not self.notificacao_eventos:
+            logger.error("Sistema de notificação não está inicializado")
+            return False
+        try:
+            self.notificacao_eventos.notificar_lote_eventos(criados, alterados, removidos, origem)
+            logger.info(f"Notificação de alterações em lote enviada: {len(criados)} criados, "
+                        f"{len(alterados)} alterados, {len(removidos)} removidos")
+            return True
+        except Exception as e:
+            logger.error(f"Erro ao enviar notificação de alterações em lote: {e}")
+            return False
+    
+    @contextmanager
+    def agrupar_notificacoes(self, origem: str):
+        """
+        Suprime as notificações imediatas (criado/alterado/cancelado) das
+        operações feitas na thread atual dentro do bloco e envia, ao sair, um
+        único resumo pelo canal dessas notificações (e-mail por função EVENTOS).
+        
+        Blocos aninhados entram no resumo do bloco mais externo. Um evento
+        alterado várias vezes aparece uma vez, com o estado inicial e o final;
+        um evento criado e removido no mesmo bloco não aparece.
+        
+        Uso:
+            with gerenciador.agrupar_notificacoes('Importação de eventos'):
+                for dados in lote:
+                    GerenciadorEventos.get_instance().adicionar_evento(dados)
+        """
+        if getattr(self._agrupamento, 'intencoes', None) is not None:
+            yield
+            return
+        
+        self._agrupamento.intencoes = {}
+        try:
+            yield
+        finally:
+            intencoes = self._agrupamento.intencoes
+            self._agrupamento.intencoes = None
+            self._enviar_resumo(intencoes, origem)
+    
+    def registrar_intencao(self, criados: list = (), alterados: list = (), removidos: list = ()) -> bool:
+        """
+        Guarda as notificações no resumo da operação em lote da thread atual
+        
+        Args:
+            criados (list): Eventos criados
+            alterados (list): Pares (evento_anterior, evento_atual)
+            removidos (list): Eventos removidos
+        
+        Returns:
+            bool: True se há agrupamento ativo (o chamador não deve notificar)
+        """
+        intencoes = getattr(self._agrupamento, 'intencoes', None)
+        if intencoes is None:
+            return False
+        
+        # Cópias: atualizar_evento altera o dicionário do evento no lugar
+        for evento in criados:
+            self._combinar_intencao(intencoes, evento['id'], 'criar', None, dict(evento))
+        for anterior, atual in alterados:
+            self._combinar_intencao(intencoes, atual['id'], 'editar', dict(anterior), dict(atual))
+        for evento in removidos:
+            self._combinar_intencao(intencoes, evento['id'], 'excluir', dict(evento), None)
+        return True
+    
+    @staticmethod
+    def _combinar_intencao(intencoes: Dict, evento_id: str, operacao: str,
+                           anterior: Optional[dict], atual: Optional[dict]):
+        """Combina a nova operação com a já registrada para o mesmo evento"""
+        existente = intencoes.get(evento_id)
+        if existente is None:
+            intencoes[evento_id] = (operacao, anterior, atual)
+            return
+        
+        operacao_existente, anterior_existente, _ = existente
+        if operacao_existente == 'criar':
+            if operacao == 'excluir':
+                del intencoes[evento_id]
+            else:
+                intencoes[evento_id] = ('criar', None, atual)
+        elif operacao == 'excluir':
+            intencoes[evento_id] = ('excluir', anterior_existente, None)
+        else:
+            # editar após editar, ou recriado após exclusão: uma alteração do estado inicial ao final
+            intencoes[evento_id] = ('editar', anterior_existente, atual)
+    
+    def _enviar_resumo(self, intencoes: Dict, origem: str):
+        """Envia o resumo agrupado pelo pool de notificações (não bloqueia a operação em lote)"""
+        criados = [atual for op, _, atual in intencoes.values() if op == 'criar']
+        alterados = [(anterior, atual) for op, anterior, atual in intencoes.values() if op == 'editar']
+        removidos = [anterior for op, anterior, _ in intencoes.values() if op == 'excluir']
+        if not (criados or alterados or removidos):
+            return
+        
+        logger.info(f"Resumo de notificações agrupadas ({origem}): {len(criados)} criados, "
+                    f"{len(alterados)} alterados, {len(removidos)} removidos")
+        try:
+            from app.utils.FilaNotificacoes import FilaNotificacoes
+            FilaNotificacoes.get_instance().enviar(
+                f"resumo {origem}", self.notificar_lote_eventos, criados, alterados, removidos, origem)
+        except Exception as e:
+            logger.error(f"Erro ao enfileirar resumo de notificações: {e}")
+    
+    # Véspera e limpeza pós-evento saem às 08:00; o lembrete curto, 60 min antes do início
+    HORARIO_LEMBRETES = '08:00'
+    ANTECEDENCIA_LEMBRETE_MINUTOS = 60
+    
     def iniciar_scheduler_lembretes(self):
-        """Inicia o agendador para envio de lembretes diários"""
+        """Cria os temporizadores de lembrete de todos os eventos futuros"""
         if self.running:
             logger.warning("Scheduler de lembretes já está em execução")
             return
             
-        # Agenda verificação diária às 8:00 (lembrete 1 dia antes)
-        schedule.every().day.at("08:00").do(self._verificar_eventos_amanha)
-        # Agenda verificação minuciosa para lembretes 1h antes
-        schedule.every(1).minutes.do(self._verificar_eventos_1h)
-        # Agenda notificação de limpeza pós-evento às 8:00 (eventos de ontem)
-        schedule.every().day.at("08:00").do(self._verificar_eventos_ontem_limpeza)
-        
         self.running = True
-        self.scheduler_thread = threading.Thread(target=self._executar_scheduler, daemon=True)
-        self.scheduler_thread.start()
+        AgendadorTarefas.get_instance().iniciar()
         
-        logger.info("Scheduler de lembretes iniciado: amanhã 08:00, 1h antes, limpeza pós-evento 08:00")
+        eventos = list(self.gerenciador_eventos.eventos)
+        for evento in eventos:
+            self.agendar_lembretes_evento(evento)
+        
+        logger.info(f"Scheduler de lembretes iniciado ({len(eventos)} eventos avaliados): "
+                    f"véspera {self.HORARIO_LEMBRETES}, {self.ANTECEDENCIA_LEMBRETE_MINUTOS} min antes, "
+                    f"limpeza pós-evento {self.HORARIO_LEMBRETES}")
     
     def parar_scheduler_lembretes(self):
-        """Para o agendador de lembretes"""
+        """Remove todos os temporizadores de lembrete do agendador de tarefas"""
         if not self.running:
             return
             
         self.running = False
-        schedule.clear()
-        
-        if self.scheduler_thread and self.scheduler_thread.is_alive():
-            self.scheduler_thread.join(timeout=5)
+        AgendadorTarefas.get_instance().cancelar_prefixo('lembretes.')
             
         logger.info("Scheduler de lembretes de eventos parado")
     
-    def _executar_scheduler(self):
-        """Executa o loop do agendador em thread separada"""
-        while self.running:
-            try:
-                schedule.run_pending()
-                time.sleep(60)  # Verifica a cada minuto
-            except Exception as e:
-                logger.error(f"Erro no scheduler de lembretes: {e}")
-                time.sleep(60)
+    def _no_horario_lembretes(self, dia: date) -> datetime:
+        hora, minuto = hora_minuto(para_minutos(self.HORARIO_LEMBRETES))
+        return datetime(dia.year, dia.month, dia.day, hora, minuto)
     
-    def _verificar_eventos_amanha(self):
-        """Verifica se há eventos para amanhã e envia lembretes"""
+    def agendar_lembretes_evento(self, evento: dict):
+        """
+        Cria ou move os temporizadores de um evento (chamado ao criar, alterar,
+        encerrar ou reativar): lembrete antes do início, lembretes da véspera e
+        limpeza do dia seguinte. Instantes recentes que já passaram também são
+        entregues ao agendador, que só os executa se constarem como perdidos no
+        registro de tarefas (serviço fora do ar) e a política de recuperação permitir.
+        """
+        if not self.running:
+            return
+        
+        agendador = AgendadorTarefas.get_instance()
+        agora = datetime.now()
+        data_evento = date(evento['ano'], evento['mes'], evento['dia'])
+        
+        hora, minuto = hora_minuto(para_minutos(evento['hora_inicio']))
+        inicio = datetime(evento['ano'], evento['mes'], evento['dia'], hora, minuto)
+        nome_lembrete = f"lembretes.1h.{evento['id']}"
+        if evento.get('encerrado_em') or inicio <= agora:
+            agendador.cancelar(nome_lembrete)
+        else:
+            # Recuperado só enquanto o evento ainda não começou
+            agendador.agendar_unico(nome_lembrete, inicio - timedelta(minutes=self.ANTECEDENCIA_LEMBRETE_MINUTOS),
+                                    self._enviar_lembrete_1h, (evento,),
+                                    recuperacao='janela', janela_minutos=self.ANTECEDENCIA_LEMBRETE_MINUTOS)
+        
+        # Um temporizador por data (todos os eventos do dia saem juntos)
+        if data_evento >= agora.date():
+            agendador.agendar_unico(f"lembretes.vespera.{data_evento.isoformat()}",
+                                    self._no_horario_lembretes(data_evento - timedelta(days=1)),
+                                    self._verificar_eventos_amanha, (data_evento,))
+        
+        if data_evento >= agora.date() - timedelta(days=1):
+            agendador.agendar_unico(f"lembretes.limpeza.{data_evento.isoformat()}",
+                                    self._no_horario_lembretes(data_evento + timedelta(days=1)),
+                                    self._verificar_eventos_ontem_limpeza, (data_evento,))
+    
+    def cancelar_lembretes_evento(self, evento_id: str):
+        """
+        Cancela o lembrete antes do início de um evento removido (ou que trocou de id).
+        Os temporizadores por data consultam os eventos do dia ao disparar.
+        """
+        if self.running:
+            AgendadorTarefas.get_instance().cancelar(f"lembretes.1h.{evento_id}")
+    
+    def _enviar_lembrete_1h(self, evento: dict):
+        """Temporizador do lembrete antes do início de um evento"""
+        if not self.notificacao_eventos:
+            logger.error("Sistema de notificação não está disponível para lembretes 1h")
+            return
+        
+        # O evento pode ter sido removido ou encerrado depois do agendamento
+        if self.gerenciador_eventos.obter_evento(evento['id']) is not evento or evento.get('encerrado_em'):
+            logger.debug(f"Lembrete 1h descartado (evento removido ou encerrado): {evento.get('nome', '')}")
+            return
+        
+        self.notificacao_eventos.notificar_lembrete_evento_1h(evento)
+        logger.info(f"Lembrete 1h enviado para evento: {evento['nome']}")
+    
+    def _verificar_eventos_amanha(self, data_evento: Optional[date] = None):
+        """Envia os lembretes da véspera dos eventos de uma data (padrão: amanhã)"""
         if not self.notificacao_eventos:
             logger.error("Sistema de notificação não está disponível para lembretes")
             return
             
         try:
-            # Calcula a data de amanhã
-            amanha = datetime.now() + timedelta(days=1)
+            # Data dos eventos (amanhã, quando disparado pelo temporizador da véspera)
+            amanha = data_evento or (datetime.now() + timedelta(days=1)).date()
             
             # Busca eventos para amanhã
-            gerenciador_eventos = GerenciadorEventos.get_instance()
+            gerenciador_eventos = self.gerenciador_eventos
             eventos_amanha = gerenciador_eventos.obter_eventos_por_data(
                 dia=amanha.day,
                 mes=amanha.month,
@@ -192,78 +364,24 @@ class GerenciadorNotificacaoEventos:
                     self.notificacao_eventos.notificar_lembrete_evento(evento)
                     logger.info(f"Lembrete enviado para evento: {evento['nome']}")
                     
-                    # Pequena pausa entre as notificações
-                    time.sleep(2)
-                    
                 except Exception as e:
                     logger.error(f"Erro ao enviar lembrete para evento {evento['nome']}: {e}")
                     
         except Exception as e:
             logger.error(f"Erro ao verificar eventos de amanhã: {e}")
 
-    def _verificar_eventos_1h(self):
-        """Verifica eventos que iniciarão em ~1 hora e envia lembrete via WhatsApp."""
-        if not self.notificacao_eventos:
-            logger.error("Sistema de notificação não está disponível para lembretes 1h")
-            return
-
-        try:
-            agora = datetime.now()
-            gerenciador_eventos = GerenciadorEventos.get_instance()
-            eventos_hoje = gerenciador_eventos.obter_eventos_por_data(
-                dia=agora.day,
-                mes=agora.month,
-                ano=agora.year
-            )
-
-            if not eventos_hoje:
-                return
-
-            TOLERANCIA_MINUTOS = 2
-
-            # Limpeza simples do mapa de envios (remover envios com mais de 6 horas)
-            try:
-                limite = agora - timedelta(hours=6)
-                self._ultimo_envio_1h = {
-                    k: v for k, v in self._ultimo_envio_1h.items() if v >= limite
-                }
-            except Exception:
-                pass
-
-            for evento in eventos_hoje:
-                try:
-                    # Monta datetime do início do evento
-                    hora, minuto = evento['hora_inicio'].split(':')
-                    dt_inicio = datetime(evento['ano'], evento['mes'], evento['dia'], int(hora), int(minuto))
-                    minutos_para_inicio = (dt_inicio - agora).total_seconds() / 60.0
-
-                    if 60 - TOLERANCIA_MINUTOS <= minutos_para_inicio <= 60 + TOLERANCIA_MINUTOS:
-                        ultimo_envio = self._ultimo_envio_1h.get(evento['id'])
-                        if ultimo_envio and (agora - ultimo_envio).total_seconds() < 60 * 55:
-                            # Já enviou nos últimos 55 minutos; evita duplicidade
-                            continue
-
-                        self.notificacao_eventos.notificar_lembrete_evento_1h(evento)
-                        self._ultimo_envio_1h[evento['id']] = agora
-                        logger.info(f"Lembrete 1h enviado para evento: {evento['nome']}")
-
-                except Exception as e:
-                    logger.error(f"Erro ao processar lembrete 1h do evento {evento.get('nome','')}: {e}")
-        except Exception as e:
-            logger.error(f"Erro ao verificar eventos 1h: {e}")
-    
-    def _verificar_eventos_ontem_limpeza(self):
-        """Verifica eventos que ocorreram ontem e notifica equipe de limpeza às 08:00."""
+    def _verificar_eventos_ontem_limpeza(self, data_evento: Optional[date] = None):
+        """Notifica a equipe de limpeza sobre os eventos de uma data (padrão: ontem)."""
         if not self.notificacao_eventos:
             logger.error("Sistema de notificação não está disponível para notificação de limpeza")
             return
 
         try:
-            # Calcula a data de ontem
-            ontem = datetime.now() - timedelta(days=1)
+            # Data dos eventos (ontem, quando disparado pelo temporizador de limpeza)
+            ontem = data_evento or (datetime.now() - timedelta(days=1)).date()
             
             # Busca eventos de ontem
-            gerenciador_eventos = GerenciadorEventos.get_instance()
+            gerenciador_eventos = self.gerenciador_eventos
             eventos_ontem = gerenciador_eventos.obter_eventos_por_data(
                 dia=ontem.day,
                 mes=ontem.month,
@@ -282,9 +400,6 @@ class GerenciadorNotificacaoEventos:
                     self.notificacao_eventos.notificar_limpeza_pos_evento(evento)
                     logger.info(f"Notificação de limpeza enviada para evento: {evento['nome']}")
                     
-                    # Pequena pausa entre as notificações
-                    time.sleep(2)
-                    
                 except Exception as e:
                     logger.error(f"Erro ao enviar notificação de limpeza para evento {evento['nome']}: {e}")
                     
@@ -3,6 +3,8 @@ from datetime import datetime, date, timedelta
 from typing import Dict, List, Optional
 import logging
 from .SincronizadorCLP import SincronizadorCLP
+from .ProjecaoCLP import ProjecaoCLP
+from .tempo_minutos import hora_minuto, minutos_do_dia, para_minutos
 
 class IntegracaoCLP:
     """
@@ -15,6 +17,8 @@ class IntegracaoCLP:
         self.gerenciador_feriados = gerenciador_feriados
         self.gerenciador_eventos = gerenciador_eventos
         self.sincronizador = SincronizadorCLP.get_instance()
+        # Índices por data/mês compartilhados com a sincronização (uma passada por versão dos dados)
+        self.projecao = ProjecaoCLP.para(gerenciador_eventos, gerenciador_feriados)
     
     def obter_status_sincronizacao(self) -> Dict:
         """Obtém status completo da sincronização com CLP"""
@@ -27,13 +31,21 @@ class IntegracaoCLP:
             self.gerenciador_eventos
         )
     
+    def planejar_sincronizacao(self) -> Dict:
+        """Simula a sincronização com CLP sem acessar a rede (dry-run)"""
+        return self.sincronizador.planejar_sincronizacao(
+            self.gerenciador_feriados,
+            self.gerenciador_eventos
+        )
+    
     def verificar_conectividade(self) -> Dict:
         """Verifica conectividade com CLP"""
-        conectado, mensagem = self.sincronizador.verificar_conectividade_clp()
+        saude = self.sincronizador.monitor_saude.obter(forcar=True)
         return {
-            'conectado': conectado,
-            'mensagem': mensagem,
-            'timestamp': datetime.now().isoformat()
+            'conectado': saude['conectado'],
+            'mensagem': saude['mensagem'],
+            'latencia_ms': saude['latencia_ms'],
+            'timestamp': saude['verificado_em']
         }
     
     def obter_status_data(self, dia: int, mes: int, ano: int) -> Dict:
@@ -42,11 +54,13 @@ class IntegracaoCLP:
         Retorna informações sobre feriado e eventos do dia
         """
         try:
+            data_consulta = date(ano, mes, dia)
+            
             # Verificar se é feriado
-            feriado = self.gerenciador_feriados.verificar_feriado(dia, mes, ano)
+            feriado = self.projecao.feriado_do_dia(data_consulta)
             
             # Obter eventos do dia
-            eventos = self.gerenciador_eventos.obter_eventos_por_data(dia, mes, ano)
+            eventos = self.projecao.eventos_do_dia(data_consulta)
             
             # Preparar resposta otimizada para CLP
             status = {
@@ -97,10 +111,10 @@ class IntegracaoCLP:
         """
         try:
             # Obter feriados do mês
-            feriados = self.gerenciador_feriados.listar_feriados(ano=ano, mes=mes)
+            feriados = self.projecao.feriados_do_mes(ano, mes)
             
             # Obter eventos do mês
-            eventos = self.gerenciador_eventos.listar_eventos(ano=ano, mes=mes)
+            eventos = self.projecao.eventos_do_mes(ano, mes)
             
             # Criar estrutura de calendário
             calendario = {
@@ -145,7 +159,7 @@ class IntegracaoCLP:
         try:
             agora = datetime.now()
             hoje = agora.date()
-            hora_atual = agora.time()
+            minuto_atual = minutos_do_dia(agora)
             
             # Obter eventos futuros
             eventos_futuros = []
@@ -153,33 +167,29 @@ class IntegracaoCLP:
             # Verificar próximos 365 dias
             for dias in range(365):
                 data_verificar = hoje + timedelta(days=dias)
-                eventos_dia = self.gerenciador_eventos.obter_eventos_por_data(
-                    data_verificar.day, 
-                    data_verificar.month, 
-                    data_verificar.year
-                )
+                eventos_dia = self.projecao.eventos_do_dia(data_verificar)
                 
                 for evento in eventos_dia:
+                    inicio = para_minutos(evento['hora_inicio'])
+                    
                     # Se é hoje, verificar se o horário ainda não passou
                     if dias == 0:
-                        hora_evento = datetime.strptime(evento['hora_inicio'], '%H:%M').time()
-                        if hora_evento <= hora_atual:
+                        if inicio <= minuto_atual:
                             continue
                     
                     # Filtrar por local se especificado
                     if local and evento['local'] != local:
                         continue
                     
-                    # Adicionar timestamp para ordenação
-                    evento['timestamp'] = int(datetime(
+                    # Timestamp para ordenação (sem alterar o evento armazenado)
+                    timestamp = int(datetime(
                         evento['ano'], 
                         evento['mes'], 
                         evento['dia'],
-                        int(evento['hora_inicio'].split(':')[0]),
-                        int(evento['hora_inicio'].split(':')[1])
+                        *hora_minuto(inicio)
                     ).timestamp())
                     
-                    eventos_futuros.append(evento)
+                    eventos_futuros.append((timestamp, evento))
                 
                 # Se encontrou eventos, não precisa verificar mais dias
                 if eventos_futuros:
@@ -189,8 +199,8 @@ class IntegracaoCLP:
                 return None
             
             # Ordenar por timestamp e pegar o primeiro
-            eventos_futuros.sort(key=lambda x: x['timestamp'])
-            proximo = eventos_futuros[0]
+            eventos_futuros.sort(key=lambda x: x[0])
+            timestamp, proximo = eventos_futuros[0]
             
             # Preparar resposta simplificada
             return {
@@ -199,7 +209,7 @@ class IntegracaoCLP:
                 'data': f"{proximo['dia']:02d}/{proximo['mes']:02d}/{proximo['ano']}",
                 'inicio': proximo['hora_inicio'],
                 'fim': proximo['hora_fim'],
-                'timestamp': proximo['timestamp'],
+                'timestamp': timestamp,
                 'em_dias': dias,
                 'descricao': proximo.get('descricao', '')
             }
@@ -274,14 +284,15 @@ class IntegracaoCLP:
                 
                 for dias in range(30):
                     data = agora.date() + timedelta(days=dias)
-                    status = self.obter_status_data(data.day, data.month, data.year)
+                    e_feriado = self.projecao.feriado_do_dia(data) is not None
+                    total_eventos = len(self.projecao.eventos_do_dia(data))
                     
-                    if status['e_feriado'] or status['total_eventos'] > 0:
+                    if e_feriado or total_eventos > 0:
                         dados['proximos_30_dias'].append({
                             'd': data.day,
                             'm': data.month,
-                            'f': 1 if status['e_feriado'] else 0,
-                            'e': status['total_eventos']
+                            'f': 1 if e_feriado else 0,
+                            'e': total_eventos
                         })
                 
             else:  # completo
@@ -3,6 +3,8 @@ import logging
 from datetime import datetime, date, timedelta
 from typing import List, Dict, Optional
 from .SincronizadorCLPAuditorio import SincronizadorCLPAuditorio
+from .ProjecaoCLP import ProjecaoCLP
+from .tempo_minutos import hora_minuto, minutos_do_dia, para_minutos
 
 class IntegracaoCLPAuditorio:
     """
@@ -15,6 +17,8 @@ class IntegracaoCLPAuditorio:
         self.logger = logging.getLogger('EventosFeriados.IntegracaoCLPAuditorio')
         self.gerenciador_eventos = gerenciador_eventos
         self.sincronizador = SincronizadorCLPAuditorio.get_instance()
+        # Mesma projeção usada pela sincronização (feriados do gerenciador vinculado ao CLP)
+        self.projecao = ProjecaoCLP.para(gerenciador_eventos, self.sincronizador.gerenciador_feriados)
     
     def obter_status_sincronizacao(self) -> Dict:
         """Obtém status completo da sincronização com CLP Auditório"""
@@ -24,13 +28,19 @@ class IntegracaoCLPAuditorio:
         """Executa sincronização manual com CLP Auditório"""
         return self.sincronizador.sincronizar_manual(self.gerenciador_eventos)
     
+    def planejar_sincronizacao(self) -> Dict:
+        """Simula a sincronização com CLP Auditório sem acessar a rede (dry-run)"""
+        return self.sincronizador.planejar_sincronizacao(self.gerenciador_eventos)
+    
     def verificar_conectividade(self) -> Dict:
-        """Verifica conectividade com CLP Auditório"""
-        conectado, mensagem = self.sincronizador.verificar_conectividade_clp()
+        """Conectividade com CLP Auditório (última verificação do monitor, sem acessar a rede)"""
+        saude = self.sincronizador.monitor_saude.obter()
         return {
-            'conectado': conectado,
-            'mensagem': mensagem,
-            'timestamp': datetime.now().isoformat()
+            'conectado': saude['conectado'],
+            'mensagem': saude['mensagem'],
+            'latencia_ms': saude['latencia_ms'],
+            'timestamp': saude['verificado_em'],
+            'idade_segundos': saude['idade_segundos']
         }
     
     def obter_status_data(self, dia: int, mes: int, ano: int) -> Dict:
@@ -41,11 +51,10 @@ class IntegracaoCLPAuditorio:
         try:
             # Obter eventos do dia para os locais do Auditório
             eventos_auditorio = []
+            eventos_dia = self.projecao.eventos_do_dia(date(ano, mes, dia))
             
             for local in self.sincronizador.config['LOCAIS_GERENCIADOS']:
-                eventos_local = self.gerenciador_eventos.obter_eventos_por_data(dia, mes, ano)
-                eventos_local = [e for e in eventos_local if e['local'] == local]
-                eventos_auditorio.extend(eventos_local)
+                eventos_auditorio.extend(e for e in eventos_dia if e['local'] == local)
             
             # Preparar resposta otimizada para CLP
             status = {
@@ -89,10 +98,10 @@ class IntegracaoCLPAuditorio:
         try:
             # Obter eventos do mês para os locais do Auditório
             eventos_auditorio = []
-            
+            eventos_mes = self.projecao.eventos_do_mes(ano, mes)
+
             for local in self.sincronizador.config['LOCAIS_GERENCIADOS']:
-                eventos_local = self.gerenciador_eventos.listar_eventos(ano=ano, mes=mes, local=local)
-                eventos_auditorio.extend(eventos_local)
+                eventos_auditorio.extend(e for e in eventos_mes if e['local'] == local)
             
             # Criar estrutura de calendário
             calendario = {
@@ -134,7 +143,7 @@ class IntegracaoCLPAuditorio:
         try:
             agora = datetime.now()
             data_atual = agora.date()
-            hora_atual = agora.time()
+            minuto_atual = minutos_do_dia(agora)
             
             eventos_futuros = []
             
@@ -143,34 +152,30 @@ class IntegracaoCLPAuditorio:
                 data_verificar = data_atual + timedelta(days=dias_adicionais)
                 
                 # Obter eventos do dia
-                eventos_dia = self.gerenciador_eventos.obter_eventos_por_data(
-                    data_verificar.day, data_verificar.month, data_verificar.year
-                )
-                
-                # Filtrar apenas eventos dos locais do Auditório
-                eventos_dia = [e for e in eventos_dia if e['local'] in self.sincronizador.config['LOCAIS_GERENCIADOS']]
+                eventos_dia = self.projecao.eventos_do_dia(
+                    data_verificar, self.sincronizador.config['LOCAIS_GERENCIADOS'])
                 
                 for evento in eventos_dia:
+                    inicio = para_minutos(evento['hora_inicio'])
+                    
                     # Se for hoje, verificar se ainda não passou
                     if data_verificar == data_atual:
-                        hora_evento = datetime.strptime(evento['hora_inicio'], '%H:%M').time()
-                        if hora_evento <= hora_atual:
+                        if inicio <= minuto_atual:
                             continue
                     
                     # Filtrar por local se especificado
                     if local and evento['local'] != local:
                         continue
                     
-                    # Adicionar timestamp para ordenação
-                    evento['timestamp'] = int(datetime(
+                    # Timestamp para ordenação (sem alterar o evento armazenado)
+                    timestamp = int(datetime(
                         evento['ano'], 
                         evento['mes'], 
                         evento['dia'],
-                        int(evento['hora_inicio'].split(':')[0]),
-                        int(evento['hora_inicio'].split(':')[1])
+                        *hora_minuto(inicio)
                     ).timestamp())
                     
-                    eventos_futuros.append(evento)
+                    eventos_futuros.append((timestamp, evento))
                 
                 # Se encontrou eventos, não precisa verificar mais dias
                 if eventos_futuros:
@@ -180,13 +185,8 @@ class IntegracaoCLPAuditorio:
                 return None
             
             # Ordenar por timestamp e pegar o primeiro
-            eventos_futuros.sort(key=lambda x: x['timestamp'])
-            proximo = eventos_futuros[0]
-            
-            # Remover timestamp antes de retornar
-            del proximo['timestamp']
-            
-            return proximo
+            eventos_futuros.sort(key=lambda x: x[0])
+            return dict(eventos_futuros[0][1])
             
         except Exception as e:
             self.logger.error(f"Erro ao obter próximo evento: {e}")
@@ -254,15 +254,16 @@ class IntegracaoCLPAuditorio:
                     'dados': []
                 }
                 
+                locais = self.sincronizador.config['LOCAIS_GERENCIADOS']
                 for i in range(7):
                     data = agora.date() + timedelta(days=i)
-                    status = self.obter_status_data(data.day, data.month, data.year)
+                    total_eventos = len(self.projecao.eventos_do_dia(data, locais))
                     
-                    if status['total_eventos_auditorio'] > 0:
+                    if total_eventos > 0:
                         dados['dados'].append({
                             'd': data.day,
                             'm': data.month,
-                            'e': status['total_eventos_auditorio']
+                            'e': total_eventos
                         })
                 
             else:  # completo
@@ -0,0 +1,164 @@
+# app/utils/LiderancaProcessos.py
+"""
+Eleição de líder entre processos do serviço
+
+Todos os processos registram as mesmas tarefas (sincronizações diárias,
+lembretes, fila de autosync), mas só o líder as executa; os seguidores apenas
+gravam pedidos na fila compartilhada (FilaSincronizacaoCLP) e no registro de
+tarefas, que o líder consome.
+
+Os seguidores também gravam eventos.json/feriados.json; antes de cada tarefa
+(e a cada heartbeat) o líder executa as ações de antes_de_executar, que relêem
+os arquivos alterados por outro processo (ServicosAplicacao.recarregar_alterados),
+para sincronizar os CLPs e agendar lembretes a partir dos dados atuais.
+
+A liderança é uma concessão com validade gravada no SQLite do registro de
+tarefas. O líder a renova a cada heartbeat; se o processo cair, a concessão
+expira e o primeiro seguidor a renovar assume, recuperando os disparos que
+ficaram sem executar.
+"""
+import atexit
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime
+from threading import Event, Lock, Thread
+from typing import Callable, Dict, List, Optional
+
+from .RegistroTarefasAgendadas import RegistroTarefasAgendadas
+
+
+class LiderancaProcessos:
+    """Concessão de liderança renovada por heartbeat (singleton por processo)"""
+
+    _instance = None
+    _lock = Lock()
+
+    def __init__(self):
+        from ..config import LIDERANCA_CONFIG
+
+        self.logger = logging.getLogger('EventosFeriados.LiderancaProcessos')
+        self.config = LIDERANCA_CONFIG
+        self.habilitada = self.config['HABILITADA']
+        self.identificador = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.registro = RegistroTarefasAgendadas.get_instance()
+
+        # Sem eleição (processo único), este processo é sempre o líder
+        self._lider = not self.habilitada
+        self._desde: Optional[datetime] = datetime.now() if self._lider else None
+        self._validade_local = 0.0  # monotonic até quando a última renovação garante a concessão
+        self._ao_assumir: List[Callable] = []
+        self._antes_de_executar: List[Callable] = []
+        self._parar = Event()
+        self._thread: Optional[Thread] = None
+
+    @classmethod
+    def get_instance(cls) -> 'LiderancaProcessos':
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @property
+    def eh_lider(self) -> bool:
+        return self._lider
+
+    def ao_assumir(self, callback: Callable):
+        """Registra uma ação para quando este processo se tornar líder"""
+        self._ao_assumir.append(callback)
+
+    def antes_de_executar(self, callback: Callable):
+        """Registra uma ação para o líder executar antes de cada tarefa em segundo plano"""
+        self._antes_de_executar.append(callback)
+
+    def preparar_execucao(self):
+        """
+        Executa as ações de antes_de_executar (ex.: reler dados gravados pelos
+        seguidores). Sem eleição não há outro processo gravando: nada a fazer.
+        """
+        if not self.habilitada:
+            return
+        for callback in self._antes_de_executar:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Erro ao preparar execução ({getattr(callback, '__qualname__', callback)}): {e}")
+
+    def iniciar(self):
+        """Disputa a liderança já (bloqueante) e mantém o heartbeat em segundo plano"""
+        if not self.habilitada:
+            self.logger.info("Eleição de líder desabilitada: este processo executa as tarefas em segundo plano")
+            return
+        if self._thread is not None:
+            return
+
+        self._renovar()
+        if not self._lider:
+            atual = self.registro.obter_lideranca()
+            self.logger.info(f"Processo {self.identificador} iniciado como seguidor "
+                             f"(líder: {atual['dono'] if atual else 'desconhecido'})")
+
+        self._thread = Thread(target=self._loop, name='lideranca', daemon=True)
+        self._thread.start()
+        atexit.register(self.liberar)
+
+    def liberar(self):
+        """Para o heartbeat e devolve a concessão (desligamento normal)"""
+        self._parar.set()
+        if self.habilitada and self._lider:
+            self._lider = False
+            self._desde = None
+            self.registro.liberar_lideranca(self.identificador)
+            self.logger.info(f"Processo {self.identificador} liberou a liderança")
+
+    def _loop(self):
+        while not self._parar.wait(self.config['HEARTBEAT_SEGUNDOS']):
+            self._renovar()
+            if self._lider:
+                # Lembretes de eventos criados nos seguidores precisam existir antes de vencer
+                self.preparar_execucao()
+
+    def _renovar(self):
+        inicio = time.monotonic()
+        lider = self.registro.renovar_lideranca(self.identificador, self.config['CONCESSAO_SEGUNDOS'])
+
+        if lider is None:
+            # Banco indisponível: mantém o papel enquanto a última concessão for válida
+            if self._lider and time.monotonic() > self._validade_local:
+                self._rebaixar("concessão expirada sem renovação")
+            return
+
+        if lider:
+            self._validade_local = inicio + self.config['CONCESSAO_SEGUNDOS']
+            if not self._lider:
+                self._promover()
+        elif self._lider:
+            self._rebaixar("concessão assumida por outro processo")
+
+    def _promover(self):
+        self._lider = True
+        self._desde = datetime.now()
+        self.logger.info(f"Processo {self.identificador} assumiu a liderança")
+        self.preparar_execucao()
+        for callback in self._ao_assumir:
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Erro ao assumir liderança ({getattr(callback, '__qualname__', callback)}): {e}")
+
+    def _rebaixar(self, motivo: str):
+        self._lider = False
+        self._desde = None
+        self.logger.warning(f"Processo {self.identificador} deixou de ser líder: {motivo}")
+
+    def status(self) -> Dict:
+        return {
+            'habilitada': self.habilitada,
+            'lider': self._lider,
+            'processo': self.identificador,
+            'lider_desde': self._desde.isoformat() if self._desde else None,
+            'concessao': self.registro.obter_lideranca() if self.habilitada else None
+        }
@@ -0,0 +1,105 @@
+# app/utils/LimitadorTaxa.py
+"""
+Limitador de taxa por endpoint da API de envio (balde de tokens)
+
+Cada endpoint (canal 'whatsapp', 'email') tem o seu balde, com taxa e rajada
+configuráveis em NOTIFICACOES_CONFIG['LIMITES_TAXA']. O chamador tenta
+reservar um token antes da requisição: o lock do balde só protege a conta dos
+tokens, nunca a chamada HTTP, e um canal sem token não atrasa os demais.
+"""
+import logging
+import time
+from threading import Lock
+from typing import Dict, Optional
+
+from ..config import NOTIFICACOES_CONFIG
+
+
+class BaldeTokens:
+    """Balde de tokens: `rajada` envios imediatos, reabastecido a `por_minuto` tokens por minuto"""
+
+    def __init__(self, por_minuto: int, rajada: int):
+        self.por_segundo = max(por_minuto, 1) / 60.0
+        self.rajada = max(rajada, 1)
+        self._tokens = float(self.rajada)
+        self._atualizado = time.monotonic()
+        self._lock = Lock()
+        self.concedidos = 0
+        self.negados = 0
+
+    def _reabastecer(self, agora: float):
+        self._tokens = min(self.rajada, self._tokens + (agora - self._atualizado) * self.por_segundo)
+        self._atualizado = agora
+
+    def tentar_reservar(self) -> float:
+        """
+        Retira um token se houver
+
+        Returns:
+            0.0 se o token foi reservado; senão, segundos até haver um token
+            (nada é consumido)
+        """
+        with self._lock:
+            self._reabastecer(time.monotonic())
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.concedidos += 1
+                return 0.0
+            self.negados += 1
+            return (1 - self._tokens) / self.por_segundo
+
+    def status(self) -> Dict:
+        with self._lock:
+            self._reabastecer(time.monotonic())
+            return {
+                'por_minuto': round(self.por_segundo * 60, 2),
+                'rajada': self.rajada,
+                'tokens': round(self._tokens, 2),
+                'concedidos': self.concedidos,
+                'negados': self.negados
+            }
+
+
+class LimitadorTaxa:
+    """Baldes de tokens por endpoint, criados sob demanda (singleton)"""
+
+    _instance = None
+    _inst_lock = Lock()
+
+    def __init__(self, limites: Optional[Dict[str, Dict]] = None):
+        self.logger = logging.getLogger('EventosFeriados.LimitadorTaxa')
+        self.limites = limites if limites is not None else NOTIFICACOES_CONFIG['LIMITES_TAXA']
+        self._baldes: Dict[str, BaldeTokens] = {}
+        self._lock = Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'LimitadorTaxa':
+        if cls._instance is None:
+            with cls._inst_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _balde(self, endpoint: str) -> BaldeTokens:
+        balde = self._baldes.get(endpoint)
+        if balde is None:
+            with self._lock:
+                balde = self._baldes.get(endpoint)
+                if balde is None:
+                    limite = self.limites.get(endpoint) or self.limites['padrao']
+                    balde = self._baldes[endpoint] = BaldeTokens(limite['POR_MINUTO'], limite['RAJADA'])
+                    self.logger.info(f"Limite de taxa '{endpoint}': {limite['POR_MINUTO']}/min, "
+                                     f"rajada {limite['RAJADA']}")
+        return balde
+
+    def tentar_reservar(self, endpoint: str) -> float:
+        """
+        Reserva um envio no balde do endpoint
+
+        Returns:
+            0.0 se pode enviar agora; senão, segundos até o próximo token
+        """
+        return self._balde(endpoint).tentar_reservar()
+
+    def status(self) -> Dict:
+        return {endpoint: balde.status() for endpoint, balde in self._baldes.items()}
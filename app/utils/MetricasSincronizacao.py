@@ -0,0 +1,215 @@
+# app/utils/MetricasSincronizacao.py
+"""
+Métricas das sincronizações (CLPs e API do TCE)
+
+Cada execução é medida com relógio monotônico, fase a fase (preparação,
+backup, envio, resposta, verificação...), junto com valores como bytes do
+payload e quantidade de operações. As últimas execuções de cada origem ficam
+em uma janela móvel, de onde saem percentis, histogramas de duração e a taxa
+de sucesso expostos em /api/metricas e resumidos em /api/status.
+"""
+import logging
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime
+from threading import Lock
+from typing import Dict, Iterable, List, Optional
+
+from ..config import METRICAS_CONFIG
+
+
+def _percentil(ordenados: List[float], p: float) -> Optional[float]:
+    """Percentil pelo método do posto mais próximo (lista já ordenada)"""
+    if not ordenados:
+        return None
+    indice = max(0, min(len(ordenados) - 1, math.ceil(p / 100 * len(ordenados)) - 1))
+    return ordenados[indice]
+
+
+def _estatisticas(valores: Iterable[float], faixas: Optional[List[float]] = None) -> Dict:
+    """Resumo de uma série: contagem, mínimo, máximo, média, p50/p90/p99 e histograma opcional"""
+    ordenados = sorted(valores)
+    resumo = {
+        'amostras': len(ordenados),
+        'min': ordenados[0] if ordenados else None,
+        'max': ordenados[-1] if ordenados else None,
+        'media': round(sum(ordenados) / len(ordenados), 2) if ordenados else None,
+        'p50': _percentil(ordenados, 50),
+        'p90': _percentil(ordenados, 90),
+        'p99': _percentil(ordenados, 99)
+    }
+
+    if faixas:
+        histograma = {f"<={limite}": 0 for limite in faixas}
+        histograma[f">{faixas[-1]}"] = 0
+        for valor in ordenados:
+            for limite in faixas:
+                if valor <= limite:
+                    histograma[f"<={limite}"] += 1
+                    break
+            else:
+                histograma[f">{faixas[-1]}"] += 1
+        resumo['histograma'] = histograma
+
+    return resumo
+
+
+class MedicaoSincronizacao:
+    """Medição de uma execução: duração por fase, valores registrados e resultado"""
+
+    def __init__(self, origem: str):
+        self.origem = origem
+        self.inicio = time.monotonic()
+        self.iniciada_em = datetime.now()
+        self.fases: Dict[str, float] = {}
+        self.valores: Dict[str, float] = {}
+        self.sucesso = False
+        self.duracao_ms: Optional[float] = None
+
+    @contextmanager
+    def fase(self, nome: str):
+        """Cronometra um trecho; fases repetidas na mesma execução são somadas"""
+        inicio = time.monotonic()
+        try:
+            yield
+        finally:
+            decorrido = (time.monotonic() - inicio) * 1000
+            self.fases[nome] = round(self.fases.get(nome, 0) + decorrido, 2)
+
+    def registrar(self, nome: str, valor: float):
+        """Registra um valor numérico da execução (ex.: bytes_payload, operacoes)"""
+        self.valores[nome] = valor
+
+    def finalizar(self):
+        self.duracao_ms = round((time.monotonic() - self.inicio) * 1000, 2)
+
+    def para_dict(self) -> Dict:
+        return {
+            'iniciada_em': self.iniciada_em.isoformat(),
+            'duracao_ms': self.duracao_ms,
+            'sucesso': self.sucesso,
+            'fases': dict(self.fases),
+            'valores': dict(self.valores)
+        }
+
+
+class MetricasSincronizacao:
+    """Janela móvel de execuções por origem ('clp.plenario', 'tce', ...)"""
+
+    _instance = None
+    _lock = Lock()
+
+    def __init__(self):
+        self.logger = logging.getLogger('EventosFeriados.MetricasSincronizacao')
+        self.amostras = METRICAS_CONFIG['AMOSTRAS_POR_SERIE']
+        self.faixas = METRICAS_CONFIG['FAIXAS_DURACAO_MS']
+        self._execucoes: Dict[str, deque] = {}
+        self._totais: Dict[str, Dict[str, int]] = {}
+        self._lock_series = Lock()
+
+    @classmethod
+    def get_instance(cls) -> 'MetricasSincronizacao':
+        """Retorna a instância única das métricas (Singleton)"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @contextmanager
+    def medir(self, origem: str):
+        """
+        Mede uma execução de sincronização
+
+        Uso:
+            with metricas.medir('clp.plenario') as medicao:
+                with medicao.fase('preparacao'):
+                    ...
+                medicao.sucesso = True
+
+        Exceções propagadas pelo bloco contam como falha.
+        """
+        medicao = MedicaoSincronizacao(origem)
+        try:
+            yield medicao
+        except Exception:
+            medicao.sucesso = False
+            raise
+        finally:
+            medicao.finalizar()
+            self._registrar(medicao)
+
+    def _registrar(self, medicao: MedicaoSincronizacao):
+        with self._lock_series:
+            serie = self._execucoes.setdefault(medicao.origem, deque(maxlen=self.amostras))
+            serie.append(medicao.para_dict())
+            totais = self._totais.setdefault(medicao.origem, {'execucoes': 0, 'falhas': 0})
+            totais['execucoes'] += 1
+            if not medicao.sucesso:
+                totais['falhas'] += 1
+
+        fases = ', '.join(f"{nome} {ms:.0f} ms" for nome, ms in medicao.fases.items())
+        self.logger.info(f"Sincronização {medicao.origem} {'OK' if medicao.sucesso else 'com falha'} "
+                         f"em {medicao.duracao_ms:.0f} ms ({fases or 'sem fases'})")
+
+    def origens(self) -> List[str]:
+        with self._lock_series:
+            return sorted(self._execucoes.keys())
+
+    def resumo(self, origem: str) -> Optional[Dict]:
+        """Estatísticas completas de uma origem (durações, fases, valores e histogramas)"""
+        with self._lock_series:
+            if origem not in self._execucoes:
+                return None
+            execucoes = list(self._execucoes[origem])
+            totais = dict(self._totais[origem])
+
+        fases: Dict[str, List[float]] = {}
+        valores: Dict[str, List[float]] = {}
+        for execucao in execucoes:
+            for nome, ms in execucao['fases'].items():
+                fases.setdefault(nome, []).append(ms)
+            for nome, valor in execucao['valores'].items():
+                valores.setdefault(nome, []).append(valor)
+
+        sucessos = len([e for e in execucoes if e['sucesso']])
+        return {
+            'origem': origem,
+            'execucoes_total': totais['execucoes'],
+            'falhas_total': totais['falhas'],
+            'janela': len(execucoes),
+            'taxa_sucesso': round(sucessos / len(execucoes), 4) if execucoes else None,
+            'duracao_ms': _estatisticas((e['duracao_ms'] for e in execucoes), self.faixas),
+            'fases_ms': {nome: _estatisticas(serie, self.faixas) for nome, serie in fases.items()},
+            'valores': {nome: _estatisticas(serie) for nome, serie in valores.items()},
+            'ultima_execucao': execucoes[-1] if execucoes else None
+        }
+
+    def resumo_geral(self) -> Dict:
+        """Estatísticas completas de todas as origens (endpoint de métricas)"""
+        return {
+            'amostras_por_serie': self.amostras,
+            'faixas_duracao_ms': self.faixas,
+            'origens': {origem: self.resumo(origem) for origem in self.origens()},
+            'timestamp': datetime.now().isoformat()
+        }
+
+    def resumo_compacto(self) -> Dict:
+        """Resumo curto por origem, incluído em /api/status"""
+        compacto = {}
+        for origem in self.origens():
+            resumo = self.resumo(origem)
+            if not resumo:
+                continue
+            ultima = resumo['ultima_execucao'] or {}
+            compacto[origem] = {
+                'execucoes': resumo['execucoes_total'],
+                'taxa_sucesso': resumo['taxa_sucesso'],
+                'duracao_p50_ms': resumo['duracao_ms']['p50'],
+                'duracao_p90_ms': resumo['duracao_ms']['p90'],
+                'ultima_em': ultima.get('iniciada_em'),
+                'ultima_sucesso': ultima.get('sucesso')
+            }
+        return compacto
@@ -0,0 +1,125 @@
+# app/utils/MonitorSaudeCLP.py
+"""
+Monitor de saúde (conectividade) de um CLP
+
+Executa a verificação de conectividade em segundo plano em intervalo fixo e
+mantém o último resultado em cache, com horário da verificação e latência.
+Consultas de status usam o cache sem bloquear; chamadas que exigem uma
+verificação imediata compartilham uma única sonda em andamento.
+"""
+import logging
+import time
+from datetime import datetime
+from threading import Thread, Event, Lock
+from typing import Callable, Dict, Optional, Tuple
+
+
+class MonitorSaudeCLP:
+    """Sonda periódica de conectividade com cache e execução única (single-flight)"""
+
+    def __init__(self, nome: str, sonda: Callable[[], Tuple[bool, str]], intervalo: int = 60,
+                 logger: Optional[logging.Logger] = None):
+        self.nome = nome
+        self.sonda = sonda
+        self.intervalo = max(5, intervalo)
+        self.logger = logger or logging.getLogger('EventosFeriados.MonitorSaudeCLP')
+
+        self._lock = Lock()
+        self._em_andamento: Optional[Event] = None
+        self._resultado: Optional[Dict] = None
+        self._parar = Event()
+        self._thread: Optional[Thread] = None
+
+    def iniciar(self):
+        """Inicia a verificação periódica em segundo plano"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._parar.clear()
+        self._thread = Thread(target=self._loop, name=f'saude-clp-{self.nome}', daemon=True)
+        self._thread.start()
+        self.logger.info(f"Monitor de saúde do CLP '{self.nome}' iniciado (intervalo {self.intervalo}s)")
+
+    def parar(self):
+        self._parar.set()
+
+    def _loop(self):
+        while not self._parar.is_set():
+            try:
+                self.atualizar()
+            except Exception as e:
+                self.logger.error(f"Erro no monitor de saúde do CLP '{self.nome}': {e}")
+            self._parar.wait(self.intervalo)
+
+    def _executar_sonda(self) -> Dict:
+        inicio = time.monotonic()
+        try:
+            conectado, mensagem = self.sonda()
+        except Exception as e:
+            conectado, mensagem = False, f"Erro inesperado: {str(e)}"
+        latencia_ms = int((time.monotonic() - inicio) * 1000)
+
+        anterior = self._resultado
+        if anterior is not None and anterior['conectado'] != conectado:
+            nivel = logging.INFO if conectado else logging.WARNING
+            self.logger.log(nivel, f"CLP '{self.nome}' mudou para {'online' if conectado else 'offline'}: {mensagem}")
+
+        return {
+            'conectado': conectado,
+            'mensagem': mensagem,
+            'verificado_em': datetime.now().isoformat(),
+            'latencia_ms': latencia_ms,
+            '_monotonic': time.monotonic()
+        }
+
+    def atualizar(self) -> Dict:
+        """
+        Executa uma verificação imediata. Se já houver uma em andamento,
+        aguarda e reutiliza o resultado dela em vez de abrir outra conexão.
+        """
+        with self._lock:
+            evento = self._em_andamento
+            responsavel = evento is None
+            if responsavel:
+                evento = self._em_andamento = Event()
+
+        if not responsavel:
+            evento.wait()
+            return self._publico(self._resultado)
+
+        try:
+            resultado = self._executar_sonda()
+            with self._lock:
+                self._resultado = resultado
+            return self._publico(resultado)
+        finally:
+            with self._lock:
+                self._em_andamento = None
+            evento.set()
+
+    def obter(self, forcar: bool = False) -> Dict:
+        """
+        Retorna o último resultado de conectividade
+
+        Args:
+            forcar: Executa (ou aguarda) uma verificação imediata
+
+        Sem monitor em execução, um resultado mais velho que dois intervalos
+        também dispara uma nova verificação.
+        """
+        resultado = self._resultado
+        if forcar:
+            return self.atualizar()
+        if self._thread and self._thread.is_alive():
+            # O monitor atualiza o cache; uma sonda lenta não bloqueia o status
+            return self._publico(resultado)
+        expirado = (resultado is None or
+                    time.monotonic() - resultado['_monotonic'] > 2 * self.intervalo)
+        return self.atualizar() if expirado else self._publico(resultado)
+
+    def _publico(self, resultado: Optional[Dict]) -> Dict:
+        if resultado is None:
+            return {'conectado': False, 'mensagem': 'Conectividade ainda não verificada',
+                    'verificado_em': None, 'latencia_ms': None, 'idade_segundos': None}
+        publico = {k: v for k, v in resultado.items() if not k.startswith('_')}
+        publico['idade_segundos'] = round(time.monotonic() - resultado['_monotonic'], 1)
+        return publico
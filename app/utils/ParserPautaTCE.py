@@ -0,0 +1,124 @@
+# app/utils/ParserPautaTCE.py
+"""
+Parser da pauta mensal do TCE (API catalogodeservicos /api/pauta/datas)
+
+Extrai as sessões vespertinas do Tribunal Pleno e as consolida em um registro
+por dia, em uma única passada pelos itens da API. Não depende do restante da
+aplicação, para que tools/benchmark-pauta-tce.py possa carregá-lo isolado e
+medir velocidade e saída exata contra o corpus gravado.
+"""
+import logging
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+PREFIXO_TRIBUNAL_PLENO = 'Tribunal Pleno:'
+HORA_MINIMA_VESPERTINA = 12
+
+_HORARIO = re.compile(r'às (\d{1,2}):(\d{2}) hora')
+
+
+@dataclass(slots=True)
+class SessaoPautaTCE:
+    """Uma sessão do Tribunal Pleno como veio na pauta"""
+    titulo: str
+    horario: str  # HH:MM
+
+    @property
+    def tipo(self) -> Optional[str]:
+        """'Ordinária', 'Extraordinária' ou None"""
+        if 'Ordinária' in self.titulo:
+            return 'Ordinária'
+        if 'Extraordinária' in self.titulo:
+            return 'Extraordinária'
+        return None
+
+
+@dataclass(slots=True)
+class DiaPautaTCE:
+    """Sessões vespertinas do Tribunal Pleno em um dia, na ordem da pauta"""
+    dia: int
+    sessoes: List[SessaoPautaTCE] = field(default_factory=list)
+
+    @property
+    def quantidade_eventos(self) -> int:
+        return len(self.sessoes)
+
+    @property
+    def eventos_detalhados(self) -> List[str]:
+        return [s.titulo for s in self.sessoes]
+
+    @property
+    def hora_original(self) -> str:
+        return ', '.join(s.horario for s in self.sessoes)
+
+    @property
+    def titulo(self) -> str:
+        if len(self.sessoes) == 1:
+            return self.sessoes[0].titulo
+        # Múltiplas sessões no mesmo dia: tipos distintos na ordem em que aparecem
+        tipos = list(dict.fromkeys(s.tipo for s in self.sessoes if s.tipo))
+        if len(tipos) == 1:
+            return f"{PREFIXO_TRIBUNAL_PLENO} {tipos[0]} (múltiplas sessões)"
+        return f"{PREFIXO_TRIBUNAL_PLENO} {' e '.join(tipos)} (múltiplas sessões)"
+
+    def como_dict(self) -> Dict:
+        """Formato consumido pelo SincronizadorTCE"""
+        return {
+            'dia': self.dia,
+            'titulo': self.titulo,
+            'hora_original': self.hora_original,
+            'quantidade_eventos': self.quantidade_eventos,
+            'eventos_detalhados': self.eventos_detalhados
+        }
+
+
+class ParserPautaTCE:
+    """Converte os itens da API da pauta em DiaPautaTCE"""
+
+    def __init__(self, logger: Optional[logging.Logger] = None):
+        self.logger = logger or logging.getLogger('EventosFeriados.ParserPautaTCE')
+
+    def processar(self, dados_json: Iterable[Dict]) -> List[DiaPautaTCE]:
+        """
+        Filtra as sessões do Tribunal Pleno a partir das 12h e agrupa por dia
+
+        Itens sem dia, sem título, de outros colegiados ou sem horário
+        reconhecível no título são ignorados.
+
+        Returns:
+            Um DiaPautaTCE por dia, na ordem da primeira sessão do dia na pauta
+        """
+        dias: Dict[int, DiaPautaTCE] = {}
+        horario = _HORARIO.search
+
+        for item in dados_json:
+            dia = item.get('dia')
+            titulo = item.get('titulo')
+            if not dia or not titulo:
+                continue
+
+            # Limpar quebras de linha do título
+            titulo = titulo.replace('\n', ' ').strip()
+            if not titulo.startswith(PREFIXO_TRIBUNAL_PLENO):
+                continue
+
+            encontrado = horario(titulo)
+            if not encontrado:
+                continue
+            hora = int(encontrado.group(1))
+            if hora < HORA_MINIMA_VESPERTINA:
+                continue
+
+            registro = dias.get(dia)
+            if registro is None:
+                registro = dias[dia] = DiaPautaTCE(dia)
+            registro.sessoes.append(SessaoPautaTCE(titulo, f"{hora:02d}:{encontrado.group(2)}"))
+
+        resultado = list(dias.values())
+        self.logger.info(f"Filtrados {len(resultado)} dias com eventos do Tribunal Pleno vespertinos "
+                         f"({sum(d.quantidade_eventos for d in resultado)} sessões)")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            for registro in resultado:
+                self.logger.debug(f"Dia {registro.dia}: {registro.quantidade_eventos} evento(s) - {registro.hora_original}")
+        return resultado
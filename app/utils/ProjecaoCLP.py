@@ -0,0 +1,201 @@
+# app/utils/ProjecaoCLP.py
+"""
+Projeção única dos dados de eventos e feriados para os CLPs
+
+Uma só passada pelos armazenamentos de eventos e feriados produz:
+  - a janela de sincronização (última semana + futuro do ano corrente),
+    separada por local e já ordenada;
+  - índices por data e por mês, usados pelas exportações e consultas de status.
+
+O resultado é reaproveitado por todos os controladores (sincronização,
+planejamento, /clp/exportar e páginas de status) enquanto a versão dos
+gerenciadores e o dia não mudarem. O payload de slots de cada controlador é
+calculado uma vez por versão e memorizado na própria projeção.
+"""
+import logging
+import time
+from datetime import datetime, date, timedelta
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
+
+
+class ProjecaoCLP:
+    """Snapshot indexado de eventos/feriados, em cache por versão dos dados"""
+
+    _lock_instancias = Lock()
+
+    def __init__(self, gerenciador_eventos, gerenciador_feriados=None):
+        self.logger = logging.getLogger('EventosFeriados.ProjecaoCLP')
+        self.gerenciador_eventos = gerenciador_eventos
+        self.gerenciador_feriados = gerenciador_feriados
+        self._lock = Lock()
+        self._snapshot: Optional[Dict] = None
+
+    @classmethod
+    def para(cls, gerenciador_eventos, gerenciador_feriados=None) -> 'ProjecaoCLP':
+        """
+        Retorna a projeção compartilhada para o par de gerenciadores
+
+        As projeções ficam no próprio gerenciador de eventos (uma por
+        gerenciador de feriados) e são liberadas junto com ele.
+        """
+        with cls._lock_instancias:
+            projecoes = getattr(gerenciador_eventos, '_projecoes_clp', None)
+            if projecoes is None:
+                projecoes = gerenciador_eventos._projecoes_clp = {}
+            projecao = projecoes.get(gerenciador_feriados)
+            if projecao is None:
+                projecao = projecoes[gerenciador_feriados] = cls(gerenciador_eventos, gerenciador_feriados)
+            return projecao
+
+    def _chave_atual(self) -> Tuple:
+        return (
+            getattr(self.gerenciador_eventos, 'versao', None),
+            getattr(self.gerenciador_feriados, 'versao', None),
+            date.today()
+        )
+
+    def obter(self) -> Dict:
+        """Snapshot da versão atual (recalculado apenas quando os dados ou o dia mudam)"""
+        chave = self._chave_atual()
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot['chave'] == chave:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot['chave'] != chave:
+                self._snapshot = self._calcular(chave)
+            return self._snapshot
+
+    def _calcular(self, chave: Tuple) -> Dict:
+        inicio = time.monotonic()
+        agora = datetime.now()
+        ano_atual = agora.year
+        data_atual = agora.date()
+        uma_semana_atras = data_atual - timedelta(days=7)
+
+        eventos_por_data: Dict[date, List[Dict]] = {}
+        eventos_por_mes: Dict[Tuple[int, int], List[Dict]] = {}
+        janela_eventos: Dict[str, List[Tuple[Dict, date, str]]] = {}
+
+        for evento in self.gerenciador_eventos.eventos:
+            try:
+                data_evento = date(evento['ano'], evento['mes'], evento['dia'])
+            except ValueError:
+                self.logger.warning(f"Data inválida ignorada: {evento['dia']}/{evento['mes']}/{evento['ano']}")
+                continue
+
+            eventos_por_data.setdefault(data_evento, []).append(evento)
+            eventos_por_mes.setdefault((evento['ano'], evento['mes']), []).append(evento)
+
+            # Janela de sincronização: eventos encerrados não vão para o CLP
+            if evento['ano'] != ano_atual or evento.get('encerrado_em'):
+                continue
+            if uma_semana_atras <= data_evento <= data_atual:
+                janela_eventos.setdefault(evento['local'], []).append((evento, data_evento, 'passado'))
+            elif data_evento > data_atual:
+                janela_eventos.setdefault(evento['local'], []).append((evento, data_evento, 'futuro'))
+
+        for eventos_dia in eventos_por_data.values():
+            eventos_dia.sort(key=lambda e: e['hora_inicio'])
+        for eventos_mes in eventos_por_mes.values():
+            eventos_mes.sort(key=lambda e: (e['dia'], e['hora_inicio']))
+        for janela in janela_eventos.values():
+            janela.sort(key=lambda x: (x[2] == 'futuro', x[1], x[0]['hora_inicio']))
+
+        feriados_por_data: Dict[date, Dict] = {}
+        feriados_por_mes: Dict[Tuple[int, int], List[Dict]] = {}
+        janela_feriados: List[Tuple[Dict, date, str]] = []
+
+        if self.gerenciador_feriados is not None:
+            for feriado in self.gerenciador_feriados.feriados:
+                try:
+                    data_feriado = date(feriado['ano'], feriado['mes'], feriado['dia'])
+                except ValueError:
+                    # Data inválida (ex: 29/02 em ano não bissexto)
+                    self.logger.warning(f"Data inválida ignorada: {feriado['dia']}/{feriado['mes']}/{feriado['ano']}")
+                    continue
+
+                feriados_por_data.setdefault(data_feriado, feriado)
+                feriados_por_mes.setdefault((feriado['ano'], feriado['mes']), []).append(feriado)
+
+                if feriado['ano'] != ano_atual:
+                    continue
+                if uma_semana_atras <= data_feriado <= data_atual:
+                    janela_feriados.append((feriado, data_feriado, 'passado'))
+                elif data_feriado > data_atual:
+                    janela_feriados.append((feriado, data_feriado, 'futuro'))
+
+            for feriados_mes in feriados_por_mes.values():
+                feriados_mes.sort(key=lambda f: f['dia'])
+            janela_feriados.sort(key=lambda x: (x[2] == 'futuro', x[1]))
+
+        duracao_ms = round((time.monotonic() - inicio) * 1000, 2)
+        self.logger.debug(f"Projeção CLP recalculada em {duracao_ms} ms (versões {chave[:2]})")
+
+        return {
+            'chave': chave,
+            'ano': ano_atual,
+            'gerado_em': agora.isoformat(),
+            'duracao_ms': duracao_ms,
+            'eventos_por_data': eventos_por_data,
+            'eventos_por_mes': eventos_por_mes,
+            'feriados_por_data': feriados_por_data,
+            'feriados_por_mes': feriados_por_mes,
+            'janela_eventos': janela_eventos,
+            'janela_feriados': janela_feriados,
+            'controladores': {}
+        }
+
+    # ------------------------------------------------------------------
+    # Payload por controlador
+    # ------------------------------------------------------------------
+
+    def dados_controlador(self, sincronizador) -> Dict:
+        """
+        Payload de slots do controlador (mesmo formato de _preparar_dados_para_clp),
+        calculado uma vez por versão dos dados
+        """
+        snapshot = self.obter()
+        dados = snapshot['controladores'].get(sincronizador.chave)
+        if dados is not None:
+            return dados
+
+        with self._lock:
+            dados = snapshot['controladores'].get(sincronizador.chave)
+            if dados is None:
+                locais = sincronizador.config['LOCAIS_GERENCIADOS']
+                eventos = []
+                for ordem, local in enumerate(locais):
+                    eventos.extend((item, ordem) for item in snapshot['janela_eventos'].get(local, []))
+                # Listas por local já ordenadas: a ordem do local só desempata horários iguais
+                eventos.sort(key=lambda x: (x[0][2] == 'futuro', x[0][1], x[0][0]['hora_inicio'], x[1]))
+
+                feriados = snapshot['janela_feriados'] if sincronizador.tem_feriados else []
+                dados = sincronizador._montar_dados(
+                    feriados, [item for item, _ in eventos], snapshot['ano'], snapshot['gerado_em'])
+                snapshot['controladores'][sincronizador.chave] = dados
+            return dados
+
+    # ------------------------------------------------------------------
+    # Consultas por data (exportação e status)
+    # ------------------------------------------------------------------
+
+    def eventos_do_dia(self, data: date, locais: Optional[List[str]] = None) -> List[Dict]:
+        """Eventos da data ordenados por hora de início (opcionalmente só dos locais)"""
+        eventos = self.obter()['eventos_por_data'].get(data, [])
+        if locais is not None:
+            eventos = [e for e in eventos if e['local'] in locais]
+        return list(eventos)
+
+    def feriado_do_dia(self, data: date) -> Optional[Dict]:
+        return self.obter()['feriados_por_data'].get(data)
+
+    def eventos_do_mes(self, ano: int, mes: int, locais: Optional[List[str]] = None) -> List[Dict]:
+        eventos = self.obter()['eventos_por_mes'].get((ano, mes), [])
+        if locais is not None:
+            eventos = [e for e in eventos if e['local'] in locais]
+        return list(eventos)
+
+    def feriados_do_mes(self, ano: int, mes: int) -> List[Dict]:
+        return list(self.obter()['feriados_por_mes'].get((ano, mes), []))
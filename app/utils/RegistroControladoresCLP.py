@@ -0,0 +1,89 @@
+# app/utils/RegistroControladoresCLP.py
+"""
+Registro dos CLPs habilitados (settings.CLP_CONTROLADORES)
+
+Cria um sincronizador por controlador e resolve qual CLP atende cada local.
+Agendador, autosync e encerramento antecipado percorrem este registro em vez
+de tratar cada CLP separadamente.
+"""
+import logging
+from threading import Lock
+from typing import Dict, List, Optional
+
+from ..config import CLP_CONTROLADORES
+from .SincronizadorControladorCLP import SincronizadorControladorCLP
+from .SincronizadorCLP import SincronizadorCLP
+from .SincronizadorCLPAuditorio import SincronizadorCLPAuditorio
+
+# Controladores com especialização própria (singletons usados pelas rotas legadas)
+_ESPECIALIZACOES = {
+    'plenario': SincronizadorCLP,
+    'auditorio': SincronizadorCLPAuditorio
+}
+
+
+class RegistroControladoresCLP:
+    """Sincronizadores por chave de controlador e mapa local -> controlador"""
+
+    _instance = None
+    _lock = Lock()
+
+    def __init__(self):
+        self.logger = logging.getLogger('EventosFeriados.RegistroControladoresCLP')
+        self._sincronizadores: Dict[str, SincronizadorControladorCLP] = {}
+        self._por_local: Dict[str, str] = {}
+
+        for chave, config in CLP_CONTROLADORES.items():
+            if not config.get('HABILITADO', True):
+                self.logger.info(f"CLP '{chave}' desabilitado (IP ou tags de eventos não configurados)")
+                continue
+
+            especializacao = _ESPECIALIZACOES.get(chave)
+            sincronizador = especializacao.get_instance() if especializacao else SincronizadorControladorCLP(config)
+            self._sincronizadores[chave] = sincronizador
+
+            for local in config['LOCAIS_GERENCIADOS']:
+                if local in self._por_local:
+                    self.logger.warning(f"Local '{local}' já gerenciado pelo CLP '{self._por_local[local]}', "
+                                        f"ignorado para '{chave}'")
+                    continue
+                self._por_local[local] = chave
+
+        self.logger.info(f"Controladores CLP registrados: {list(self._sincronizadores.keys())}")
+
+    @classmethod
+    def get_instance(cls) -> 'RegistroControladoresCLP':
+        """Retorna a instância única do registro (Singleton)"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def vincular_gerenciadores(self, gerenciador_feriados, gerenciador_eventos):
+        """Vincula os gerenciadores a todos os sincronizadores (usados pelo agendador e autosync)"""
+        for sincronizador in self._sincronizadores.values():
+            sincronizador.vincular_gerenciadores(gerenciador_eventos, gerenciador_feriados)
+
+    def chaves(self) -> List[str]:
+        return list(self._sincronizadores.keys())
+
+    def sincronizadores(self) -> Dict[str, SincronizadorControladorCLP]:
+        return dict(self._sincronizadores)
+
+    def obter_sincronizador(self, chave: str) -> Optional[SincronizadorControladorCLP]:
+        return self._sincronizadores.get(chave)
+
+    def controlador_por_local(self, local: Optional[str]) -> Optional[str]:
+        """Chave do CLP que atende o local (None se o local não tem automação)"""
+        if not local:
+            return None
+        return self._por_local.get(local)
+
+    def sincronizador_por_local(self, local: Optional[str]) -> Optional[SincronizadorControladorCLP]:
+        chave = self.controlador_por_local(local)
+        return self._sincronizadores.get(chave) if chave else None
+
+    def listar(self) -> List[Dict]:
+        """Resumo de cada controlador registrado (status da conectividade vindo do cache)"""
+        return [sincronizador.obter_status_sincronizacao() for sincronizador in self._sincronizadores.values()]
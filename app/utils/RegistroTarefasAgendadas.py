@@ -0,0 +1,305 @@
+# app/utils/RegistroTarefasAgendadas.py
+"""
+Estado persistente das tarefas do agendador
+
+Para cada tarefa (sincronizações diárias, lembretes) guarda quando foi
+registrada, o último disparo previsto que chegou a executar, o resultado e o
+próximo disparo previsto. Depois de um reinício, o agendador compara esses
+dados com os horários da tarefa para detectar execuções perdidas enquanto o
+serviço estava fora do ar.
+
+Cada execução também vira uma linha do histórico (execucoes_tarefas), com
+duração e resultado, podado diariamente pela tarefa de retenção.
+
+O mesmo banco guarda a concessão de liderança entre processos (uma linha com
+o dono e a validade), usada por LiderancaProcessos.
+"""
+import sqlite3
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from threading import Lock
+from typing import Optional, Dict, Any, List
+
+logger = logging.getLogger('EventosFeriados.registro_tarefas_agendadas')
+
+
+class RegistroTarefasAgendadas:
+    """Gerencia o estado das tarefas agendadas em um banco SQLite"""
+
+    _instance = None
+    _lock = Lock()
+
+    def __init__(self, db_path: str = None):
+        """
+        Inicializa o registro de tarefas
+
+        Args:
+            db_path: Caminho para o banco de dados SQLite
+        """
+        if db_path is None:
+            from ..config import DATA_DIR
+            db_path = Path(DATA_DIR) / 'tarefas_agendadas.db'
+
+        self.db_path = str(db_path)
+        self._init_database()
+        logger.info(f"Registro de tarefas agendadas inicializado: {self.db_path}")
+
+    @classmethod
+    def get_instance(cls, db_path: str = None) -> 'RegistroTarefasAgendadas':
+        """Retorna a instância singleton do registro"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(db_path)
+        return cls._instance
+
+    def _conectar(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        """Inicializa o banco de dados e cria a tabela se não existir"""
+        try:
+            Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+
+            conn = self._conectar()
+            cursor = conn.cursor()
+
+            # Uma linha por tarefa (nome único no agendador)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS tarefas_agendadas (
+                    nome TEXT PRIMARY KEY,
+                    tipo TEXT NOT NULL,
+                    criada_em TEXT NOT NULL,
+                    proxima_execucao TEXT,
+                    ultima_prevista TEXT,
+                    ultimo_inicio TEXT,
+                    ultima_duracao_ms REAL,
+                    ultimo_resultado TEXT,
+                    ultimo_erro TEXT,
+                    execucoes INTEGER NOT NULL DEFAULT 0,
+                    falhas INTEGER NOT NULL DEFAULT 0
+                )
+            ''')
+
+            # Histórico de execuções (inclusive tarefas não persistentes, em intervalo)
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS execucoes_tarefas (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    nome TEXT NOT NULL,
+                    prevista TEXT,
+                    inicio TEXT NOT NULL,
+                    duracao_ms REAL,
+                    resultado TEXT NOT NULL,
+                    erro TEXT
+                )
+            ''')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_execucoes_nome ON execucoes_tarefas(nome, id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_execucoes_inicio ON execucoes_tarefas(inicio)')
+
+            # Concessão de liderança: linha única, renovada pelo processo líder
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS lideranca (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    dono TEXT NOT NULL,
+                    desde TEXT NOT NULL,
+                    renovada_em TEXT NOT NULL,
+                    expira_em TEXT NOT NULL
+                )
+            ''')
+
+            conn.commit()
+            conn.close()
+
+        except Exception as e:
+            logger.error(f"Erro ao inicializar registro de tarefas agendadas: {e}")
+            raise
+
+    def obter(self, nome: str) -> Optional[Dict[str, Any]]:
+        """Estado persistido de uma tarefa, ou None se nunca foi registrada"""
+        try:
+            conn = self._conectar()
+            row = conn.execute("SELECT * FROM tarefas_agendadas WHERE nome = ?", (nome,)).fetchone()
+            conn.close()
+            return dict(row) if row else None
+        except Exception as e:
+            logger.error(f"Erro ao consultar tarefa agendada '{nome}': {e}")
+            return None
+
+    def registrar(self, nome: str, tipo: str, proxima: Optional[datetime]):
+        """Cria a tarefa ou atualiza o próximo disparo previsto (mantém o histórico)"""
+        try:
+            conn = self._conectar()
+            conn.execute('''
+                INSERT INTO tarefas_agendadas (nome, tipo, criada_em, proxima_execucao)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(nome) DO UPDATE SET
+                    tipo = excluded.tipo,
+                    proxima_execucao = excluded.proxima_execucao
+            ''', (nome, tipo, datetime.now().isoformat(), proxima.isoformat() if proxima else None))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Erro ao registrar tarefa agendada '{nome}': {e}")
+
+    def iniciar_execucao(self, nome: str, prevista: datetime, inicio: datetime):
+        """Marca o disparo previsto como executado (antes de rodar, para não repetir após queda)"""
+        try:
+            conn = self._conectar()
+            conn.execute('''
+                UPDATE tarefas_agendadas SET ultima_prevista = ?, ultimo_inicio = ? WHERE nome = ?
+            ''', (prevista.isoformat(), inicio.isoformat(), nome))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Erro ao registrar início da tarefa '{nome}': {e}")
+
+    def concluir_execucao(self, nome: str, prevista: datetime, inicio: datetime, sucesso: bool,
+                          duracao_ms: float, erro: Optional[str], proxima: Optional[datetime]):
+        """Grava o resultado no histórico e, para tarefas persistidas, o próximo disparo previsto"""
+        erro = (erro or '')[:500] or None
+        try:
+            conn = self._conectar()
+            conn.execute('''
+                INSERT INTO execucoes_tarefas (nome, prevista, inicio, duracao_ms, resultado, erro)
+                VALUES (?, ?, ?, ?, ?, ?)
+            ''', (nome, prevista.isoformat(), inicio.isoformat(), duracao_ms,
+                  'sucesso' if sucesso else 'falha', erro))
+            conn.execute('''
+                UPDATE tarefas_agendadas
+                SET ultimo_resultado = ?,
+                    ultima_duracao_ms = ?,
+                    ultimo_erro = ?,
+                    execucoes = execucoes + 1,
+                    falhas = falhas + ?,
+                    proxima_execucao = ?
+                WHERE nome = ?
+            ''', ('sucesso' if sucesso else 'falha', duracao_ms, erro,
+                  0 if sucesso else 1, proxima.isoformat() if proxima else None, nome))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Erro ao registrar resultado da tarefa '{nome}': {e}")
+
+    def ultimas_execucoes(self, limite: int = 10, prefixo: str = '') -> Dict[str, List[Dict[str, Any]]]:
+        """Últimas N execuções de cada tarefa (mais recentes primeiro), agrupadas por nome"""
+        try:
+            conn = self._conectar()
+            rows = conn.execute('''
+                SELECT nome, prevista, inicio, duracao_ms, resultado, erro FROM (
+                    SELECT *, ROW_NUMBER() OVER (PARTITION BY nome ORDER BY id DESC) AS ordem
+                    FROM execucoes_tarefas
+                    WHERE substr(nome, 1, ?) = ?
+                )
+                WHERE ordem <= ?
+                ORDER BY nome, ordem
+            ''', (len(prefixo), prefixo, limite)).fetchall()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Erro ao consultar histórico de execuções: {e}")
+            return {}
+
+        execucoes: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            item = dict(row)
+            execucoes.setdefault(item.pop('nome'), []).append(item)
+        return execucoes
+
+    def limpar_execucoes_antigas(self, dias: int = 30) -> int:
+        """Remove do histórico as execuções iniciadas há mais de N dias"""
+        try:
+            limite = (datetime.now() - timedelta(days=dias)).isoformat()
+            conn = self._conectar()
+            cursor = conn.execute("DELETE FROM execucoes_tarefas WHERE inicio < ?", (limite,))
+            removidas = cursor.rowcount
+            conn.commit()
+            conn.close()
+            return removidas
+        except Exception as e:
+            logger.error(f"Erro ao limpar histórico de execuções: {e}")
+            return 0
+
+    def remover(self, nome: str):
+        try:
+            conn = self._conectar()
+            conn.execute("DELETE FROM tarefas_agendadas WHERE nome = ?", (nome,))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Erro ao remover tarefa agendada '{nome}': {e}")
+
+    def limpar_unicas_antigas(self, dias: int = 30) -> int:
+        """Remove tarefas de disparo único cujo disparo previsto passou há mais de N dias"""
+        try:
+            limite = (datetime.now() - timedelta(days=dias)).isoformat()
+            conn = self._conectar()
+            cursor = conn.execute('''
+                DELETE FROM tarefas_agendadas
+                WHERE tipo = 'unica' AND COALESCE(proxima_execucao, ultima_prevista, criada_em) < ?
+            ''', (limite,))
+            removidas = cursor.rowcount
+            conn.commit()
+            conn.close()
+            return removidas
+        except Exception as e:
+            logger.error(f"Erro ao limpar tarefas agendadas antigas: {e}")
+            return 0
+
+    def renovar_lideranca(self, dono: str, duracao_segundos: int) -> Optional[bool]:
+        """
+        Adquire a liderança (se livre ou expirada) ou renova a concessão do dono atual
+
+        Returns:
+            True se o dono é o líder, False se outro processo detém a concessão,
+            None se o banco não pôde ser consultado
+        """
+        agora = datetime.now()
+        try:
+            conn = self._conectar()
+            try:
+                conn.execute('BEGIN IMMEDIATE')
+                row = conn.execute("SELECT dono, expira_em FROM lideranca WHERE id = 1").fetchone()
+                if row and row['dono'] != dono and row['expira_em'] > agora.isoformat():
+                    conn.rollback()
+                    return False
+
+                conn.execute('''
+                    INSERT INTO lideranca (id, dono, desde, renovada_em, expira_em)
+                    VALUES (1, ?, ?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET
+                        desde = CASE WHEN lideranca.dono = excluded.dono THEN lideranca.desde ELSE excluded.desde END,
+                        dono = excluded.dono,
+                        renovada_em = excluded.renovada_em,
+                        expira_em = excluded.expira_em
+                ''', (dono, agora.isoformat(), agora.isoformat(),
+                      (agora + timedelta(seconds=duracao_segundos)).isoformat()))
+                conn.commit()
+                return True
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"Erro ao renovar concessão de liderança: {e}")
+            return None
+
+    def liberar_lideranca(self, dono: str):
+        """Encerra a concessão (desligamento normal), permitindo que outro processo assuma já"""
+        try:
+            conn = self._conectar()
+            conn.execute("DELETE FROM lideranca WHERE id = 1 AND dono = ?", (dono,))
+            conn.commit()
+            conn.close()
+        except Exception as e:
+            logger.error(f"Erro ao liberar concessão de liderança: {e}")
+
+    def obter_lideranca(self) -> Optional[Dict[str, Any]]:
+        """Concessão atual (dono, desde, renovada_em, expira_em), ou None"""
+        try:
+            conn = self._conectar()
+            row = conn.execute("SELECT dono, desde, renovada_em, expira_em FROM lideranca WHERE id = 1").fetchone()
+            conn.close()
+            return dict(row) if row else None
+        except Exception as e:
+            logger.error(f"Erro ao consultar concessão de liderança: {e}")
+            return None
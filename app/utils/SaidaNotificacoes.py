@@ -0,0 +1,429 @@
+# app/utils/SaidaNotificacoes.py
+"""
+Saída persistente das notificações (outbox) para a API de envio por função
+
+Cada pedido de envio (WhatsApp ou e-mail por função) é gravado como uma linha
+em saida_notificacoes, na mesma transação que cria o registro 'pendente' em
+historico_notificacoes (mesmo banco). O DespachanteNotificacoes reserva as
+linhas vencidas, tenta o envio e atualiza a mesma linha e o mesmo registro do
+histórico a cada tentativa, com backoff exponencial até o máximo de
+tentativas. Pedidos interrompidos por reinício (linha 'enviando' com reserva
+vencida) são retomados: a entrega é pelo menos uma vez.
+
+Estados: pendente -> enviando -> enviado | pendente (nova tentativa) | falhou
+
+Um envio aceito de forma assíncrona (202 com status_url) fica 'aceito' no
+histórico e passa a ser acompanhado por AcompanhamentoEntregas.
+"""
+import json
+import sqlite3
+import logging
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Optional, List, Dict, Any
+
+from .GerenciadorHistoricoNotificacoes import GerenciadorHistoricoNotificacoes
+
+logger = logging.getLogger('EventosFeriados.saida_notificacoes')
+
+
+class SaidaNotificacoes:
+    """Intenções de envio de notificações em um banco SQLite (singleton)"""
+
+    _instance = None
+    _lock = Lock()
+
+    def __init__(self, historico: GerenciadorHistoricoNotificacoes = None):
+        """
+        Inicializa a saída no banco do histórico de notificações
+
+        Args:
+            historico: Histórico cujo banco recebe a tabela da saída
+        """
+        self.historico = historico or GerenciadorHistoricoNotificacoes.get_instance()
+        self.db_path = self.historico.db_path
+        self._init_database()
+        logger.info(f"Saída de notificações inicializada: {self.db_path}")
+
+    @classmethod
+    def get_instance(cls) -> 'SaidaNotificacoes':
+        """Retorna a instância singleton da saída"""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    def _conectar(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _init_database(self):
+        """Cria a tabela da saída se não existir"""
+        try:
+            conn = self._conectar()
+            cursor = conn.cursor()
+
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS saida_notificacoes (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    criado_em TEXT NOT NULL,
+                    atualizado_em TEXT NOT NULL,
+                    canal TEXT NOT NULL,
+                    funcao TEXT NOT NULL,
+                    assunto TEXT,
+                    mensagem TEXT NOT NULL,
+                    opcoes TEXT,
+                    status TEXT NOT NULL DEFAULT 'pendente',
+                    tentativas INTEGER NOT NULL DEFAULT 0,
+                    max_tentativas INTEGER NOT NULL,
+                    proxima_tentativa TEXT NOT NULL,
+                    reservado_por TEXT,
+                    reservado_ate TEXT,
+                    ultimo_erro TEXT,
+                    response_code INTEGER,
+                    historico_id INTEGER
+                )
+            ''')
+
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_saida_status_proxima
+                ON saida_notificacoes(status, proxima_tentativa)
+            ''')
+
+            conn.commit()
+            conn.close()
+
+        except Exception as e:
+            logger.error(f"Erro ao inicializar saída de notificações: {e}")
+            raise
+
+    def registrar(self, canal: str, funcao: str, mensagem: str, max_tentativas: int,
+                  assunto: Optional[str] = None, opcoes: Optional[Dict[str, Any]] = None) -> Optional[int]:
+        """
+        Grava um pedido de envio e o registro 'pendente' do histórico na mesma transação
+
+        Args:
+            canal: 'whatsapp' ou 'email'
+            funcao: Função destinatária na API (EVENTOS, LIMPEZA)
+            mensagem: Conteúdo a enviar
+            max_tentativas: Tentativas antes de desistir do envio
+            assunto: Assunto (e-mail)
+            opcoes: Parâmetros adicionais do envio (ex.: apenas_disponiveis)
+
+        Returns:
+            ID da linha na saída ou None em caso de erro
+        """
+        try:
+            agora = datetime.now().isoformat()
+            conn = self._conectar()
+            with conn:
+                cursor = conn.cursor()
+                historico_id = self.historico.inserir_registro(
+                    cursor,
+                    tipo=f'{canal}_funcao',
+                    canal=canal,
+                    mensagem=mensagem,
+                    status='pendente',
+                    destinatarios=[funcao],
+                    assunto=assunto,
+                    detalhes={'funcao': funcao, **(opcoes or {})}
+                )
+                cursor.execute('''
+                    INSERT INTO saida_notificacoes (
+                        criado_em, atualizado_em, canal, funcao, assunto, mensagem, opcoes,
+                        max_tentativas, proxima_tentativa, historico_id
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', (
+                    agora, agora, canal, funcao, assunto, mensagem,
+                    json.dumps(opcoes, ensure_ascii=False) if opcoes else None,
+                    max_tentativas, agora, historico_id
+                ))
+                saida_id = cursor.lastrowid
+                self.historico.atualizar_registro(cursor, historico_id, 'pendente', {'saida_id': saida_id})
+            conn.close()
+
+            logger.debug(f"Envio registrado na saída: id={saida_id}, canal={canal}, função={funcao}")
+            return saida_id
+
+        except Exception as e:
+            logger.error(f"Erro ao registrar envio {canal}/{funcao} na saída: {e}")
+            return None
+
+    @staticmethod
+    def _filtro_canais(excluir_canais) -> tuple:
+        """Trecho SQL e parâmetros para ignorar os canais informados"""
+        canais = sorted(excluir_canais or ())
+        if not canais:
+            return '', []
+        return f" AND canal NOT IN ({', '.join('?' * len(canais))})", canais
+
+    def reservar(self, dono: str, reserva_segundos: float, excluir_canais=()) -> Optional[Dict[str, Any]]:
+        """
+        Reserva o envio vencido mais antigo para o dono informado
+
+        Considera pendentes cuja próxima tentativa já venceu e envios 'enviando'
+        cuja reserva expirou (processo que caiu no meio do envio). A tentativa
+        é contada já na reserva, para que uma mensagem que derruba o processo
+        não seja tentada indefinidamente: reservas expiradas que já usaram
+        todas as tentativas são encerradas como 'falhou' (histórico 'erro').
+
+        Args:
+            excluir_canais: Canais que o chamador não pode atender agora
+                            (envio em andamento ou sem token no limite de taxa)
+
+        Returns:
+            Linha reservada (tentativas já incrementado) ou None
+        """
+        try:
+            agora = datetime.now()
+            filtro, params = self._filtro_canais(excluir_canais)
+            conn = self._conectar()
+            # BEGIN IMMEDIATE: dois processos não reservam a mesma linha
+            conn.execute("BEGIN IMMEDIATE")
+            self._encerrar_esgotados(conn, agora)
+            row = conn.execute(f'''
+                SELECT id FROM saida_notificacoes
+                WHERE ((status = 'pendente' AND proxima_tentativa <= ?)
+                    OR (status = 'enviando' AND reservado_ate <= ?)){filtro}
+                ORDER BY proxima_tentativa ASC
+                LIMIT 1
+            ''', (agora.isoformat(), agora.isoformat(), *params)).fetchone()
+            if row is None:
+                conn.commit()  # grava os envios esgotados encerrados acima
+                conn.close()
+                return None
+
+            conn.execute('''
+                UPDATE saida_notificacoes
+                SET status = 'enviando', tentativas = tentativas + 1,
+                    reservado_por = ?, reservado_ate = ?, atualizado_em = ?
+                WHERE id = ?
+            ''', (dono, (agora + timedelta(seconds=reserva_segundos)).isoformat(), agora.isoformat(), row['id']))
+            envio = dict(conn.execute("SELECT * FROM saida_notificacoes WHERE id = ?", (row['id'],)).fetchone())
+            conn.commit()
+            conn.close()
+
+            envio['opcoes'] = json.loads(envio['opcoes']) if envio['opcoes'] else {}
+            return envio
+
+        except Exception as e:
+            logger.error(f"Erro ao reservar envio da saída de notificações: {e}")
+            return None
+
+    def _encerrar_esgotados(self, conn: sqlite3.Connection, agora: datetime):
+        """Encerra reservas expiradas sem tentativas restantes (dentro da transação do chamador)"""
+        erro = 'Reserva expirada na última tentativa (processo interrompido durante o envio)'
+        esgotados = conn.execute('''
+            SELECT id, historico_id, tentativas, max_tentativas FROM saida_notificacoes
+            WHERE status = 'enviando' AND reservado_ate <= ? AND tentativas >= max_tentativas
+        ''', (agora.isoformat(),)).fetchall()
+        for esgotado in esgotados:
+            cursor = conn.execute('''
+                UPDATE saida_notificacoes
+                SET status = 'falhou', atualizado_em = ?, ultimo_erro = ?,
+                    reservado_por = NULL, reservado_ate = NULL
+                WHERE id = ?
+            ''', (agora.isoformat(), erro, esgotado['id']))
+            if esgotado['historico_id']:
+                self.historico.atualizar_registro(
+                    cursor, esgotado['historico_id'], 'erro',
+                    detalhes={'tentativas': esgotado['tentativas'],
+                              'max_tentativas': esgotado['max_tentativas']},
+                    error_message=erro
+                )
+            logger.error(f"Envio {esgotado['id']} da saída abandonado após {esgotado['tentativas']} "
+                         f"tentativa(s): {erro}")
+
+    def proximo_vencimento(self, excluir_canais=()) -> Optional[datetime]:
+        """Instante em que o próximo envio fica disponível para reserva (None se não houver)"""
+        try:
+            filtro, params = self._filtro_canais(excluir_canais)
+            conn = self._conectar()
+            row = conn.execute(f'''
+                SELECT MIN(CASE WHEN status = 'pendente' THEN proxima_tentativa ELSE reservado_ate END)
+                FROM saida_notificacoes
+                WHERE status IN ('pendente', 'enviando'){filtro}
+            ''', params).fetchone()
+            conn.close()
+            return datetime.fromisoformat(row[0]) if row and row[0] else None
+        except Exception as e:
+            logger.error(f"Erro ao consultar saída de notificações: {e}")
+            return None
+
+    def devolver(self, envio: Dict[str, Any], dono: str) -> bool:
+        """
+        Desfaz uma reserva sem tentar o envio (ex.: endpoint sem token no limite de taxa)
+
+        A linha volta a 'pendente' com a mesma posição na fila e a tentativa
+        contada na reserva é descontada.
+        """
+        try:
+            conn = self._conectar()
+            with conn:
+                cursor = conn.execute('''
+                    UPDATE saida_notificacoes
+                    SET status = 'pendente', tentativas = tentativas - 1,
+                        reservado_por = NULL, reservado_ate = NULL
+                    WHERE id = ? AND status = 'enviando' AND reservado_por = ?
+                ''', (envio['id'], dono))
+            conn.close()
+            return cursor.rowcount > 0
+        except Exception as e:
+            logger.error(f"Erro ao devolver envio {envio['id']} à saída de notificações: {e}")
+            return False
+
+    def concluir(self, envio: Dict[str, Any], dono: str, duracao_ms: Optional[int] = None,
+                 response_code: Optional[int] = None, detalhes: Optional[Dict[str, Any]] = None) -> bool:
+        """
+        Marca o envio como entregue à API e atualiza o registro do histórico
+
+        Com status_url nos detalhes (202), o histórico fica 'aceito' e a tarefa
+        entra no acompanhamento de entregas na mesma transação. Só altera a
+        linha se a reserva ainda for deste dono (uma reserva vencida pode ter
+        sido assumida por outro processo).
+        """
+        aceito = bool((detalhes or {}).get('status_url'))
+        return self._finalizar(envio, dono, 'enviado', 'aceito' if aceito else 'sucesso', None,
+                               duracao_ms, response_code, detalhes)
+
+    def registrar_falha(self, envio: Dict[str, Any], dono: str, erro: str,
+                        atraso_segundos: Optional[float], duracao_ms: Optional[int] = None,
+                        response_code: Optional[int] = None) -> bool:
+        """
+        Registra uma tentativa malsucedida
+
+        Args:
+            atraso_segundos: Espera até a próxima tentativa; None desiste do
+                             envio (status 'falhou', histórico 'erro')
+        """
+        if atraso_segundos is None:
+            return self._finalizar(envio, dono, 'falhou', 'erro', erro, duracao_ms, response_code)
+
+        proxima = (datetime.now() + timedelta(seconds=atraso_segundos)).isoformat()
+        return self._finalizar(envio, dono, 'pendente', 'pendente', erro, duracao_ms, response_code,
+                               proxima_tentativa=proxima)
+
+    def _finalizar(self, envio: Dict[str, Any], dono: str, status: str, status_historico: str,
+                   erro: Optional[str], duracao_ms: Optional[int], response_code: Optional[int],
+                   detalhes: Optional[Dict[str, Any]] = None, proxima_tentativa: Optional[str] = None) -> bool:
+        try:
+            erro = erro[:500] if erro else None
+            conn = self._conectar()
+            with conn:
+                cursor = conn.execute('''
+                    UPDATE saida_notificacoes
+                    SET status = ?, atualizado_em = ?, ultimo_erro = ?, response_code = ?,
+                        proxima_tentativa = COALESCE(?, proxima_tentativa),
+                        reservado_por = NULL, reservado_ate = NULL
+                    WHERE id = ? AND status = 'enviando' AND reservado_por = ?
+                ''', (status, datetime.now().isoformat(), erro, response_code, proxima_tentativa,
+                      envio['id'], dono))
+                atualizado = cursor.rowcount > 0
+                if atualizado and envio.get('historico_id'):
+                    self.historico.atualizar_registro(
+                        cursor, envio['historico_id'], status_historico,
+                        detalhes={
+                            'tentativas': envio['tentativas'],
+                            'max_tentativas': envio['max_tentativas'],
+                            'proxima_tentativa': proxima_tentativa,
+                            **(detalhes or {})
+                        },
+                        duracao_ms=duracao_ms,
+                        response_code=response_code,
+                        error_message=erro
+                    )
+                    if status_historico == 'aceito':
+                        from .AcompanhamentoEntregas import AcompanhamentoEntregas
+                        AcompanhamentoEntregas.get_instance().inserir_registro(
+                            cursor, envio['historico_id'], envio['canal'], detalhes.get('task_id'),
+                            detalhes['status_url'], envio['criado_em']
+                        )
+            conn.close()
+
+            if not atualizado:
+                logger.warning(f"Envio {envio['id']} da saída não está mais reservado por {dono}; "
+                               f"resultado '{status}' ignorado")
+            return atualizado
+
+        except Exception as e:
+            logger.error(f"Erro ao atualizar envio {envio['id']} da saída de notificações: {e}")
+            return False
+
+    def listar(self, status: Optional[str] = None, limite: int = 100) -> List[Dict[str, Any]]:
+        """Lista os envios da saída, mais recentes primeiro"""
+        try:
+            conn = self._conectar()
+            query = "SELECT * FROM saida_notificacoes"
+            params: list = []
+            if status:
+                query += " WHERE status = ?"
+                params.append(status)
+            query += " ORDER BY id DESC LIMIT ?"
+            params.append(limite)
+            rows = conn.execute(query, params).fetchall()
+            conn.close()
+
+            envios = []
+            for row in rows:
+                envio = dict(row)
+                envio['opcoes'] = json.loads(envio['opcoes']) if envio['opcoes'] else {}
+                envios.append(envio)
+            return envios
+
+        except Exception as e:
+            logger.error(f"Erro ao listar saída de notificações: {e}")
+            return []
+
+    def resumo(self) -> Dict[str, Any]:
+        """Quantidade de envios por status e idade do pendente mais antigo"""
+        try:
+            conn = self._conectar()
+            por_status = {
+                row[0]: row[1] for row in conn.execute(
+                    "SELECT status, COUNT(*) FROM saida_notificacoes GROUP BY status"
+                ).fetchall()
+            }
+            row = conn.execute(
+                "SELECT MIN(criado_em) FROM saida_notificacoes WHERE status IN ('pendente', 'enviando')"
+            ).fetchone()
+            conn.close()
+
+            mais_antigo = datetime.fromisoformat(row[0]) if row and row[0] else None
+            return {
+                'por_status': por_status,
+                'pendente_mais_antigo_segundos': (
+                    round((datetime.now() - mais_antigo).total_seconds()) if mais_antigo else None
+                )
+            }
+
+        except Exception as e:
+            logger.error(f"Erro ao resumir saída de notificações: {e}")
+            return {}
+
+    def limpar_antigos(self, dias: int = 90) -> int:
+        """
+        Remove envios concluídos (enviado/falhou) sem atualização há mais de N dias
+
+        Returns:
+            Número de linhas removidas
+        """
+        try:
+            data_limite = (datetime.now() - timedelta(days=dias)).isoformat()
+            conn = self._conectar()
+            cursor = conn.execute(
+                "DELETE FROM saida_notificacoes WHERE status IN ('enviado', 'falhou') AND atualizado_em < ?",
+                (data_limite,)
+            )
+            removidos = cursor.rowcount
+            conn.commit()
+            conn.close()
+
+            if removidos > 0:
+                logger.info(f"Removidos {removidos} envios antigos da saída de notificações (>{dias} dias)")
+            return removidos
+
+        except Exception as e:
+            logger.error(f"Erro ao limpar saída de notificações: {e}")
+            return 0
@@ -0,0 +1,81 @@
+# app/utils/ServicosAplicacao.py
+"""
+Serviços compartilhados da aplicação
+
+Montados uma única vez em create_app, na ordem de dependência: cada conjunto de
+dados (feriados.json, eventos.json, históricos) é carregado uma só vez e os
+componentes recebem os mesmos gerenciadores, com uma única visão em memória.
+Um serviço que falha ao iniciar fica None e os que dependem dele também.
+"""
+import logging
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class ServicosAplicacao:
+    """Gerenciadores compartilhados entre rotas, integrações e agendadores"""
+    historico: Optional[object] = None
+    feriados: Optional[object] = None
+    eventos: Optional[object] = None
+    historico_notificacoes: Optional[object] = None
+    notificacoes: Optional[object] = None
+    sincronizador_tce: Optional[object] = None
+
+    @classmethod
+    def montar(cls, logger: Optional[logging.Logger] = None) -> 'ServicosAplicacao':
+        """Cria os gerenciadores, injetando em cada um os que ele usa"""
+        logger = logger or logging.getLogger('EventosFeriados.ServicosAplicacao')
+        servicos = cls()
+
+        try:
+            from .GerenciadorHistorico import GerenciadorHistorico
+            servicos.historico = GerenciadorHistorico.get_instance()
+            logger.info("Gerenciador de histórico iniciado")
+        except Exception as e:
+            logger.error(f"Erro ao inicializar gerenciador de histórico: {e}")
+
+        try:
+            from .GerenciadorFeriados import GerenciadorFeriados
+            servicos.feriados = GerenciadorFeriados.get_instance()
+            logger.info("Gerenciador de feriados iniciado")
+        except Exception as e:
+            logger.error(f"Erro ao inicializar gerenciador de feriados: {e}")
+
+        try:
+            from .GerenciadorEventos import GerenciadorEventos
+            servicos.eventos = GerenciadorEventos.get_instance()
+            logger.info("Gerenciador de eventos iniciado")
+        except Exception as e:
+            logger.error(f"Erro ao inicializar gerenciador de eventos: {e}")
+
+        try:
+            from .GerenciadorHistoricoNotificacoes import GerenciadorHistoricoNotificacoes
+            servicos.historico_notificacoes = GerenciadorHistoricoNotificacoes.get_instance()
+        except Exception as e:
+            logger.error(f"Erro ao inicializar histórico de notificações: {e}")
+
+        if servicos.eventos is not None and servicos.feriados is not None:
+            try:
+                from .GerenciadorNotificacaoEventos import GerenciadorNotificacaoEventos
+                servicos.notificacoes = GerenciadorNotificacaoEventos.get_instance(
+                    servicos.eventos, servicos.feriados)
+            except Exception as e:
+                logger.error(f"Erro ao inicializar gerenciador de notificações de eventos: {e}")
+
+            try:
+                from .SincronizadorTCE import SincronizadorTCE
+                servicos.sincronizador_tce = SincronizadorTCE.get_instance(
+                    servicos.eventos, servicos.notificacoes)
+            except Exception as e:
+                logger.error(f"Erro ao inicializar sincronizador TCE: {e}")
+        else:
+            logger.warning("Notificações e sincronização TCE sem gerenciadores - não iniciadas")
+
+        return servicos
+
+    def recarregar_alterados(self):
+        """Relê feriados e eventos gravados por outro processo (ver LiderancaProcessos)"""
+        for gerenciador in (self.feriados, self.eventos):
+            if gerenciador is not None:
+                gerenciador.recarregar_se_alterado()
@@ -0,0 +1,825 @@
+# app/utils/SincronizadorControladorCLP.py
+"""
+Sincronizador genérico de um CLP de feriados/eventos
+
+Uma única implementação parametrizada pela configuração do controlador
+(settings.CLP_CONTROLADORES): IP, layout de tags, locais gerenciados,
+política de ajuste de horário e quantidade de slots. Os sincronizadores do
+Plenário e do Auditório são especializações finas desta classe.
+"""
+import json
+import os
+import logging
+import requests
+from datetime import datetime, date
+from typing import Dict, List, Optional, Tuple
+from threading import Lock
+from requests.auth import HTTPBasicAuth
+from .ClienteCLP import ClienteCLP
+from .EstadoConfirmadoCLP import EstadoConfirmadoCLP
+from .MonitorSaudeCLP import MonitorSaudeCLP
+from .MetricasSincronizacao import MetricasSincronizacao
+from .SnapshotsCLP import SnapshotsCLP
+from .ProjecaoCLP import ProjecaoCLP
+from .tempo_minutos import FIM_DIA, expandir, hora_minuto, para_hhmm, para_minutos
+import urllib3
+
+# Desabilitar avisos de SSL não verificado
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+# Campo do evento preparado -> chave da tag em TAGS_EVENTOS
+CAMPOS_EVENTO_TAGS = (
+    ('dia', 'DIA'),
+    ('mes', 'MES'),
+    ('hora_inicio', 'HORA_INICIO'),
+    ('minuto_inicio', 'MIN_INICIO'),
+    ('hora_fim', 'HORA_FIM'),
+    ('minuto_fim', 'MIN_FIM')
+)
+
+
+class SincronizadorControladorCLP:
+    """
+    Sincronização de feriados e eventos com um CLP descrito por sua configuração
+    Gerencia preparação dos dados, escrita em lote, verificação, status e limpeza
+    """
+
+    # Nome legado do contador de eventos no resultado da sincronização
+    # (ex.: 'eventos_plenario'), mantido pelas especializações
+    CAMPO_EVENTOS_LEGADO: Optional[str] = None
+
+    def __init__(self, config: Dict, logger: Optional[logging.Logger] = None):
+        self.config = config
+        self.chave = config['CHAVE']
+        self.nome = config['NOME']
+        self.logger = logger or logging.getLogger(f"EventosFeriados.SincronizadorCLP.{self.chave}")
+        self.status_file = self.config['STATUS_FILE']
+        self.backup_file = self.config['BACKUP_FILE']
+        self.ultimo_status = self._carregar_status()
+        self._sincronizacao_em_andamento = False
+
+        # Gerenciadores usados pelas sincronizações disparadas sem argumentos
+        # (agendador, autosync)
+        self.gerenciador_feriados = None
+        self.gerenciador_eventos = None
+
+        # Configurar sessão HTTP com configurações específicas
+        self.session = requests.Session()
+        self.session.auth = HTTPBasicAuth(self.config['AUTH_USER'], self.config['AUTH_PASS'])
+        self.cliente = ClienteCLP(self.session, self.config, self.logger)
+
+        # Último estado confirmado das tags e cache do planejamento (dry-run)
+        self.estado = EstadoConfirmadoCLP(self.config['ESTADO_FILE'], self.logger)
+        self._plano_cache = None
+        self._lock_plano = Lock()
+
+        # Anel de snapshots das matrizes gravadas (restauração após reset do CLP)
+        self.snapshots = SnapshotsCLP(self.config['SNAPSHOTS_DIR'], self.config.get('SNAPSHOTS_MANTIDOS', 20),
+                                      self.logger)
+
+        # Watchdog de reset (conferência das tags sentinela feita pela sonda de saúde)
+        self.ultimo_watchdog: Optional[Dict] = None
+        self._divergencia_sinalizada: Optional[int] = None
+
+        # Verificação de conectividade periódica com resultado em cache
+        self.monitor_saude = MonitorSaudeCLP(self.chave, self.verificar_conectividade_clp,
+                                             self.config['HEALTH_INTERVALO'], self.logger)
+
+        self.logger.info(f"Sincronizador do CLP {self.nome} inicializado - API: {self.config['API_BASE_URL']}, "
+                         f"CLP_IP: {self.config['CLP_IP']}, locais: {self.config['LOCAIS_GERENCIADOS']}")
+
+    @property
+    def tem_feriados(self) -> bool:
+        """Indica se o controlador recebe a tabela de feriados"""
+        return bool(self.config.get('TAGS_FERIADOS'))
+
+    @property
+    def slots_feriados(self) -> int:
+        """Quantidade de feriados enviados a cada sincronização"""
+        if not self.tem_feriados:
+            return 0
+        return min(self.config.get('FERIADOS_ENVIADOS', 10), self.config['MAX_FERIADOS'])
+
+    def vincular_gerenciadores(self, gerenciador_eventos, gerenciador_feriados=None):
+        """Define os gerenciadores usados quando a sincronização é disparada sem argumentos"""
+        self.gerenciador_eventos = gerenciador_eventos
+        self.gerenciador_feriados = gerenciador_feriados
+
+    def gerencia_local(self, local: Optional[str]) -> bool:
+        """Indica se o local é atendido por este CLP"""
+        return bool(local) and local in self.config['LOCAIS_GERENCIADOS']
+
+    def _carregar_status(self) -> Dict:
+        """Carrega o status da última sincronização"""
+        if os.path.exists(self.status_file):
+            try:
+                with open(self.status_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                self.logger.error(f"Erro ao carregar status: {e}")
+
+        return {
+            'ultima_sincronizacao': None,
+            'ultima_tentativa': None,
+            'status': 'nunca_sincronizado',
+            'erros': [],
+            'dados_sincronizados': 0,
+            'feriados_sincronizados': 0,
+            'eventos_sincronizados': 0,
+            'clp_disponivel': False,
+            'versao_dados': 0
+        }
+
+    def _salvar_status(self, status: Dict) -> bool:
+        """Salva o status atual da sincronização"""
+        try:
+            os.makedirs(os.path.dirname(self.status_file), exist_ok=True)
+            with open(self.status_file, 'w', encoding='utf-8') as f:
+                json.dump(status, f, indent=2, ensure_ascii=False)
+            return True
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar status: {e}")
+            return False
+
+    def _fazer_backup_dados(self, dados: Dict) -> bool:
+        """Faz backup dos dados antes da sincronização"""
+        try:
+            backup = {
+                'timestamp': datetime.now().isoformat(),
+                'dados': dados,
+                'versao': self.ultimo_status.get('versao_dados', 0) + 1
+            }
+            os.makedirs(os.path.dirname(self.backup_file), exist_ok=True)
+            with open(self.backup_file, 'w', encoding='utf-8') as f:
+                json.dump(backup, f, indent=2, ensure_ascii=False)
+            return True
+        except Exception as e:
+            self.logger.error(f"Erro ao fazer backup: {e}")
+            return False
+
+    def _tags_sentinela(self) -> List[str]:
+        """Slot 0 de dia/mês de cada tabela; a primeira é a tag lida pela sonda simples"""
+        tabelas = ([self.config['TAGS_FERIADOS']] if self.tem_feriados else []) + [self.config['TAGS_EVENTOS']]
+        return [f"{tabela[campo]}:0" for tabela in tabelas for campo in ('DIA', 'MES')]
+
+    def _conferir_sentinelas(self, valores: Dict[str, Optional[int]]):
+        """
+        Watchdog de reset: compara as sentinelas lidas pela sonda com o último
+        estado confirmado. Valores zerados ou estranhos indicam que o CLP perdeu
+        (ou teve alterados) os dados e enfileiram uma ressincronização imediata,
+        uma única vez por estado confirmado.
+        """
+        if (not self.config.get('WATCHDOG_RESET', True) or self._sincronizacao_em_andamento
+                or not self.estado.conhecido()):
+            return
+
+        versao_estado = self.estado.versao
+        esperados = self.estado.esperado(list(valores.keys()))
+        divergentes = {
+            tag: {'esperado': esperados[tag], 'lido': lido}
+            for tag, lido in valores.items()
+            if lido is not None and esperados[tag] is not None and lido != esperados[tag]
+        }
+        self.ultimo_watchdog = {
+            'verificado_em': datetime.now().isoformat(),
+            'sentinelas': sorted(valores.keys()),
+            'divergentes': divergentes,
+            'resync_enfileirado': bool(divergentes) and self._divergencia_sinalizada == versao_estado
+        }
+
+        if not divergentes:
+            self._divergencia_sinalizada = None
+            return
+        if self._divergencia_sinalizada == versao_estado:
+            return  # Ressincronização já pedida para este estado (a fila cuida das novas tentativas)
+
+        zeradas = all(item['lido'] == 0 for item in divergentes.values())
+        motivo = (f"reset detectado no CLP {self.nome}: "
+                  f"{'tags zeradas' if zeradas else 'valores divergentes'} em {sorted(divergentes)}")
+        self.logger.warning(f"{motivo} - ressincronização imediata enfileirada")
+
+        from .AutoSyncCLP import AutoSyncCLP
+        AutoSyncCLP.get_instance().trigger_imediato(self.chave, self, motivo)
+        self._divergencia_sinalizada = versao_estado
+        self.ultimo_watchdog['resync_enfileirado'] = True
+
+    def verificar_conectividade_clp(self) -> Tuple[bool, str]:
+        """
+        Verifica se o CLP está acessível lendo as tags sentinela
+
+        Com leitura em lote disponível, todas as sentinelas vêm em um único POST;
+        caso contrário apenas o slot 0 da primeira tabela é lido (um GET). Em
+        ambos os casos os valores alimentam o watchdog de reset sem requisições
+        adicionais.
+        """
+        if not self.config['API_BASE_URL']:
+            return False, "URL da API não configurada"
+
+        sentinelas = self._tags_sentinela()
+        url_teste = (f"{self.config['API_BASE_URL']}/tag_read/{self.config['CLP_IP']}/"
+                     f"{sentinelas[0].replace(':', '%253A')}")
+
+        try:
+            if self.config.get('WATCHDOG_RESET', True) and self.estado.conhecido():
+                try:
+                    valores = self.cliente.ler_tags_em_uma_requisicao(sentinelas)
+                except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+                    raise
+                except Exception as e:
+                    self.logger.debug(f"Leitura em lote das sentinelas falhou ({e}), usando leitura simples")
+                    valores = None
+                if valores is not None:
+                    self._conferir_sentinelas(valores)
+                    return True, f"CLP {self.nome} conectado e responsivo"
+
+            response = self.cliente.requisitar('GET', url_teste, "teste de conectividade")
+
+            if response.status_code == 200:
+                try:
+                    data = response.json()
+                except ValueError as e:
+                    self.logger.error(f"Erro ao fazer parse JSON da conectividade: {e}")
+                    return False, f"Erro no parse da resposta: {str(e)}"
+                if 'valor' in data:
+                    self.logger.debug(f"CLP {self.nome} conectado - valor lido: {data.get('valor')}")
+                    self._conferir_sentinelas({sentinelas[0]: self.cliente._converter_valor(data.get('valor'))})
+                    return True, f"CLP {self.nome} conectado e responsivo"
+                self.logger.error(f"CLP {self.nome} respondeu mas formato inesperado: {data}")
+                return False, f"CLP {self.nome} respondeu mas formato inesperado"
+            elif response.status_code == 401:
+                return False, "Erro de autenticação (credenciais inválidas)"
+            elif response.status_code == 403:
+                return False, "Acesso negado (sem permissão)"
+            else:
+                self.logger.error(f"CLP {self.nome} respondeu com status inesperado: {response.status_code}")
+                return False, f"CLP {self.nome} respondeu com status {response.status_code}"
+
+        except requests.exceptions.Timeout:
+            self.logger.error("Timeout na verificação de conectividade")
+            return False, f"Timeout na conexão com CLP {self.nome}"
+        except requests.exceptions.ConnectionError as e:
+            self.logger.error(f"Erro de conexão na verificação: {e}")
+            return False, f"Erro de conexão com CLP {self.nome}"
+        except Exception as e:
+            self.logger.error(f"Erro inesperado na verificação de conectividade: {e}")
+            return False, f"Erro inesperado: {str(e)}"
+
+    def _ajustar_horario(self, evento: Dict) -> Tuple[int, int, bool]:
+        """
+        Aplica a política de ajuste de horário do controlador (AJUSTE_HORARIO)
+
+        Antecipa o início e estende o fim para preparar a infraestrutura (luzes,
+        refrigeração), respeitando a hora mínima e sem passar do mesmo dia.
+
+        Returns:
+            Tupla (inicio, fim, foi_ajustado), em minutos desde 00:00
+        """
+        inicio = para_minutos(evento['hora_inicio'])
+        fim = para_minutos(evento['hora_fim'])
+
+        politica = self.config.get('AJUSTE_HORARIO')
+        if not politica:
+            return inicio, fim, False
+
+        try:
+            hora_minima = para_minutos(politica.get('HORA_MINIMA') or '00:00')
+            hora_maxima = para_minutos(politica.get('HORA_MAXIMA') or '23:59')
+        except ValueError:
+            hora_minima, hora_maxima = para_minutos('05:30'), FIM_DIA
+
+        inicio_ajustado, fim_ajustado = expandir(
+            inicio, fim,
+            antes=politica.get('ANTES_MINUTOS', 0),
+            depois=politica.get('DEPOIS_MINUTOS', 0),
+            minimo=hora_minima,
+            maximo=hora_maxima
+        )
+
+        self.logger.debug(f"Horário ajustado - Original: {evento['hora_inicio']}-{evento['hora_fim']} -> "
+                          f"Ajustado: {para_hhmm(inicio_ajustado)}-{para_hhmm(fim_ajustado)} "
+                          f"(evento: {evento['nome'][:20]}...)")
+
+        return inicio_ajustado, fim_ajustado, True
+
+    def _preparar_feriados(self, feriados_janela: List[Tuple[Dict, date, str]], dados_clp: Dict):
+        """Distribui nos slots os feriados da janela (já ordenados: passados, depois futuros)"""
+        limite = self.slots_feriados
+
+        for i, (feriado, data_feriado, categoria) in enumerate(feriados_janela[:limite]):
+            dados_clp['feriados'].append({
+                'slot': i,
+                'dia': feriado['dia'],
+                'mes': feriado['mes'],
+                'nome': feriado['nome'][:30],  # Para log/debug
+                'tipo': feriado['tipo'],
+                'categoria': categoria,  # 'passado' ou 'futuro'
+                'data': data_feriado.strftime('%Y-%m-%d')
+            })
+
+        # Registrar feriados que ficaram de fora pelo limite de slots
+        for feriado, data_feriado, categoria in feriados_janela[limite:]:
+            dados_clp['feriados_descartados'].append({
+                'nome': feriado['nome'],
+                'categoria': categoria,
+                'data': data_feriado.strftime('%Y-%m-%d')
+            })
+
+    def _preparar_eventos(self, eventos_janela: List[Tuple[Dict, date, str]], dados_clp: Dict):
+        """Distribui nos slots os eventos da janela (já filtrados e ordenados por data e hora)"""
+        limite = self.config['MAX_EVENTOS']
+
+        for i, (evento, data_evento, categoria) in enumerate(eventos_janela[:limite]):
+            inicio, fim, foi_ajustado = self._ajustar_horario(evento)
+            hora_inicio, minuto_inicio = hora_minuto(inicio)
+            hora_fim, minuto_fim = hora_minuto(fim)
+
+            evento_clp = {
+                'slot': i,
+                'dia': evento['dia'],
+                'mes': evento['mes'],
+                'hora_inicio': hora_inicio,
+                'minuto_inicio': minuto_inicio,
+                'hora_fim': hora_fim,
+                'minuto_fim': minuto_fim,
+                'nome': evento['nome'][:30],  # Para log/debug
+                'local': evento['local'],
+                'categoria': categoria,  # 'passado' ou 'futuro'
+                'data': data_evento.strftime('%Y-%m-%d')
+            }
+
+            if foi_ajustado:
+                evento_clp['horario_original'] = f"{evento['hora_inicio']}-{evento['hora_fim']}"
+                evento_clp['horario_ajustado'] = f"{para_hhmm(inicio)}-{para_hhmm(fim)}"
+                evento_clp['ajuste_aplicado'] = self.chave
+            else:
+                evento_clp['ajuste_aplicado'] = 'nenhum'
+
+            dados_clp['eventos'].append(evento_clp)
+
+        # Registrar eventos que ficaram de fora pelo limite de slots
+        for evento, data_evento, categoria in eventos_janela[limite:]:
+            dados_clp['eventos_descartados'].append({
+                'id': evento.get('id'),
+                'nome': evento['nome'],
+                'local': evento['local'],
+                'hora_inicio': evento['hora_inicio'],
+                'hora_fim': evento['hora_fim'],
+                'categoria': categoria,
+                'data': data_evento.strftime('%Y-%m-%d')
+            })
+
+    def _montar_dados(self, feriados_janela: List[Tuple[Dict, date, str]],
+                      eventos_janela: List[Tuple[Dict, date, str]], ano: int, timestamp: str) -> Dict:
+        """Monta o payload de slots a partir das janelas calculadas pela ProjecaoCLP"""
+        dados_clp = {
+            'ano': ano,
+            'feriados': [],
+            'eventos': [],
+            'feriados_descartados': [],
+            'eventos_descartados': [],
+            'timestamp': timestamp
+        }
+
+        try:
+            if self.tem_feriados:
+                self._preparar_feriados(feriados_janela, dados_clp)
+
+            self._preparar_eventos(eventos_janela, dados_clp)
+
+            ajustados = len([e for e in dados_clp['eventos'] if e['ajuste_aplicado'] != 'nenhum'])
+            self.logger.info(f"Dados preparados para CLP {self.nome}: {len(dados_clp['feriados'])} feriados, "
+                             f"{len(dados_clp['eventos'])} eventos ({ajustados} com ajuste de horário)")
+
+            descartados = len(dados_clp['feriados_descartados']) + len(dados_clp['eventos_descartados'])
+            if descartados:
+                self.logger.info(f"{descartados} itens além da capacidade do CLP {self.nome} ficaram de fora "
+                                 f"(enviados apenas os mais próximos/recentes)")
+
+            return dados_clp
+
+        except Exception as e:
+            self.logger.error(f"Erro ao preparar dados: {e}")
+            raise
+
+    def _preparar_dados_para_clp(self, gerenciador_eventos, gerenciador_feriados=None) -> Dict:
+        """
+        Payload do CLP vindo da projeção compartilhada dos gerenciadores
+
+        A projeção faz uma única passada pelos eventos/feriados para todos os
+        controladores e guarda o resultado até a próxima alteração dos dados.
+        """
+        return ProjecaoCLP.para(gerenciador_eventos, gerenciador_feriados).dados_controlador(self)
+
+    def _operacoes_evento(self, slot: int, valores: Optional[Dict] = None) -> List[Dict]:
+        """Operações de um slot de evento (valores None = limpar o slot)"""
+        tags = self.config['TAGS_EVENTOS']
+        return [
+            {"tag_address": f"{tags[tag]}:{slot}", "value": str(valores[campo]) if valores else "0"}
+            for campo, tag in CAMPOS_EVENTO_TAGS
+        ]
+
+    def _operacoes_feriado(self, slot: int, valores: Optional[Dict] = None) -> List[Dict]:
+        """Operações de um slot de feriado (valores None = limpar o slot)"""
+        tags = self.config['TAGS_FERIADOS']
+        return [
+            {"tag_address": f"{tags['DIA']}:{slot}", "value": str(valores['dia']) if valores else "0"},
+            {"tag_address": f"{tags['MES']}:{slot}", "value": str(valores['mes']) if valores else "0"}
+        ]
+
+    def _montar_operacoes(self, dados: Dict) -> List[Dict]:
+        """Monta a matriz de operações (tag -> valor) pretendida para o CLP"""
+        operations = []
+
+        if self.tem_feriados:
+            feriados = dados.get('feriados', [])
+            for feriado in feriados:
+                operations.extend(self._operacoes_feriado(feriado['slot'], feriado))
+            # Limpar slots de feriados não utilizados
+            for i in range(len(feriados), self.slots_feriados):
+                operations.extend(self._operacoes_feriado(i))
+
+        eventos = dados.get('eventos', [])
+        for evento in eventos:
+            operations.extend(self._operacoes_evento(evento['slot'], evento))
+        # Limpar slots de eventos não utilizados
+        for i in range(len(eventos), self.config['MAX_EVENTOS']):
+            operations.extend(self._operacoes_evento(i))
+
+        return operations
+
+    def _escrever_operacoes(self, operations: List[Dict], descricao: str,
+                            timeout_multiplicador: int = 3, medicao=None) -> Tuple[bool, List[str]]:
+        """Envia operações em lote, registrando os erros por tag"""
+        if not self.config['API_BASE_URL']:
+            return False, ["URL da API não configurada"]
+
+        if not operations:
+            self.logger.info(f"Nenhuma operação necessária para o CLP {self.nome}")
+            return True, []
+
+        self.logger.info(f"Enviando {len(operations)} operações ({descricao}) para o CLP {self.nome}")
+        sucesso, erros = self.cliente.escrever_batch(operations, descricao, timeout_multiplicador, medicao)
+
+        if sucesso:
+            self.logger.info(f"{descricao.capitalize()} no CLP {self.nome} concluída: {len(operations)} operações")
+        else:
+            for erro in erros:
+                self.logger.error(erro)
+        return sucesso, erros
+
+    def _escrever_dados_batch(self, dados: Dict, medicao=None) -> Tuple[bool, List[str]]:
+        """Escreve dados no CLP usando a API batch"""
+        try:
+            operations = self._montar_operacoes(dados)
+            if medicao:
+                medicao.registrar('operacoes', len(operations))
+            return self._escrever_operacoes(operations, "operação batch", medicao=medicao)
+        except Exception as e:
+            erro = f"Erro geral na operação batch: {str(e)}"
+            self.logger.error(erro)
+            return False, [erro]
+
+    def _verificar_escrita(self, dados: Dict) -> Dict:
+        """Lê de volta as tags escritas e reescreve apenas as que divergirem do pretendido"""
+        return self.cliente.verificar_escrita(self._montar_operacoes(dados), self.config['RETRY_COUNT'])
+
+    def _resolver_gerenciadores(self, gerenciador_eventos, gerenciador_feriados):
+        gerenciador_eventos = gerenciador_eventos or self.gerenciador_eventos
+        gerenciador_feriados = gerenciador_feriados or self.gerenciador_feriados
+        if gerenciador_eventos is None:
+            raise ValueError(f"Gerenciador de eventos não vinculado ao CLP {self.nome}")
+        return gerenciador_eventos, gerenciador_feriados
+
+    def sincronizar(self, gerenciador_eventos=None, gerenciador_feriados=None) -> Dict:
+        """Executa sincronização com o CLP (gerenciadores vinculados por padrão)"""
+        if self._sincronizacao_em_andamento:
+            return {
+                'sucesso': False,
+                'erro': 'Sincronização já em andamento',
+                'timestamp': datetime.now().isoformat()
+            }
+
+        try:
+            self._sincronizacao_em_andamento = True
+            gerenciador_eventos, gerenciador_feriados = self._resolver_gerenciadores(
+                gerenciador_eventos, gerenciador_feriados)
+            self.logger.info(f"Iniciando sincronização com CLP {self.nome}")
+
+            with MetricasSincronizacao.get_instance().medir(f"clp.{self.chave}") as medicao:
+                # Verificar conectividade (sonda imediata, compartilhada com chamadas simultâneas)
+                with medicao.fase('conectividade'):
+                    saude = self.monitor_saude.obter(forcar=True)
+                conectado, msg_conectividade = saude['conectado'], saude['mensagem']
+                if not conectado:
+                    return {
+                        'sucesso': False,
+                        'erro': f'CLP {self.nome} não acessível: {msg_conectividade}',
+                        'timestamp': datetime.now().isoformat()
+                    }
+
+                # Preparar dados
+                with medicao.fase('preparacao'):
+                    dados = self._preparar_dados_para_clp(gerenciador_eventos, gerenciador_feriados)
+
+                # Fazer backup
+                with medicao.fase('backup'):
+                    self._fazer_backup_dados(dados)
+
+                # Escrever dados usando API batch (fases serializacao/envio/resposta medidas no cliente)
+                sucesso_escrita, erros_escrita = self._escrever_dados_batch(dados, medicao)
+
+                # Conferir os valores gravados e reescrever apenas as tags divergentes
+                verificacao = None
+                if sucesso_escrita and self.config.get('VERIFICAR_ESCRITA', True):
+                    with medicao.fase('verificacao'):
+                        verificacao = self._verificar_escrita(dados)
+                    medicao.registrar('tags_reescritas', verificacao['tags_reescritas'])
+                    if not verificacao['verificado']:
+                        sucesso_escrita = False
+                        erros_escrita = erros_escrita + verificacao['erros'] + [
+                            f"Verificação pós-escrita: {len(verificacao['tags_divergentes'])} tags divergentes no CLP {self.nome}"
+                        ]
+
+                total_feriados = len(dados['feriados'])
+                total_eventos = len(dados['eventos'])
+                medicao.sucesso = sucesso_escrita
+
+                # Atualizar status
+                with medicao.fase('status'):
+                    novo_status = self.ultimo_status.copy()
+                    novo_status.update({
+                        'ultima_tentativa': datetime.now().isoformat(),
+                        'clp_disponivel': conectado,
+                        'erros': erros_escrita,
+                        'ultima_verificacao': verificacao
+                    })
+
+                    if sucesso_escrita:
+                        novo_status.update({
+                            'ultima_sincronizacao': datetime.now().isoformat(),
+                            'status': 'sincronizado',
+                            'dados_sincronizados': total_feriados + total_eventos,
+                            'feriados_sincronizados': total_feriados,
+                            'eventos_sincronizados': total_eventos,
+                            'versao_dados': novo_status.get('versao_dados', 0) + 1
+                        })
+                        operations = self._montar_operacoes(dados)
+                        self.estado.atualizar(operations, novo_status['versao_dados'])
+                        self.snapshots.salvar(novo_status['versao_dados'], operations, self.config['CLP_IP'],
+                                              {'feriados': total_feriados, 'eventos': total_eventos})
+                        self.logger.info(f"Sincronização com CLP {self.nome} concluída com sucesso")
+                    else:
+                        novo_status['status'] = 'erro_sincronizacao'
+                        self.logger.error(f"Sincronização com CLP {self.nome} falhou")
+
+                    self.ultimo_status = novo_status
+                    self._salvar_status(novo_status)
+
+                resultado = {
+                    'sucesso': sucesso_escrita,
+                    'clp': self.chave,
+                    'dados_sincronizados': total_feriados + total_eventos,
+                    'eventos': total_eventos,
+                    'slots_utilizados_eventos': f"{total_eventos}/{self.config['MAX_EVENTOS']}",
+                    'erros': erros_escrita,
+                    'verificacao': verificacao,
+                    'timestamp': datetime.now().isoformat()
+                }
+                if self.tem_feriados:
+                    resultado['feriados'] = total_feriados
+                    resultado['slots_utilizados_feriados'] = f"{total_feriados}/{self.config['MAX_FERIADOS']}"
+                if self.CAMPO_EVENTOS_LEGADO:
+                    resultado[self.CAMPO_EVENTOS_LEGADO] = total_eventos
+                return resultado
+
+        except Exception as e:
+            erro = f"Erro na sincronização: {str(e)}"
+            self.logger.error(erro)
+            return {
+                'sucesso': False,
+                'erro': erro,
+                'timestamp': datetime.now().isoformat()
+            }
+        finally:
+            self._sincronizacao_em_andamento = False
+
+    def listar_snapshots(self) -> List[Dict]:
+        """Snapshots disponíveis para restauração, do mais recente para o mais antigo"""
+        return self.snapshots.listar()
+
+    def restaurar_snapshot(self, versao: int) -> Dict:
+        """
+        Reenvia ao CLP a matriz de tags de um snapshot em uma única escrita em lote
+
+        Não consulta os gerenciadores: grava exatamente o que foi confirmado na
+        versão escolhida (ex.: após reset do controlador ou sincronização ruim).
+        """
+        snapshot = self.snapshots.carregar(versao)
+        if snapshot is None:
+            return {'sucesso': False, 'erro': f'Snapshot {versao} não encontrado', 'encontrado': False,
+                    'timestamp': datetime.now().isoformat()}
+        if not snapshot['integro']:
+            return {'sucesso': False, 'erro': f'Snapshot {versao} corrompido (checksum não confere)',
+                    'encontrado': True, 'timestamp': datetime.now().isoformat()}
+
+        if self._sincronizacao_em_andamento:
+            return {'sucesso': False, 'erro': 'Sincronização já em andamento', 'encontrado': True,
+                    'timestamp': datetime.now().isoformat()}
+
+        try:
+            self._sincronizacao_em_andamento = True
+            operations = self.snapshots.operacoes(snapshot)
+            self.logger.info(f"Restaurando snapshot {versao} no CLP {self.nome} ({len(operations)} tags)")
+
+            with MetricasSincronizacao.get_instance().medir(f"clp.{self.chave}.restauracao") as medicao:
+                medicao.registrar('operacoes', len(operations))
+                sucesso, erros = self._escrever_operacoes(operations, "restauração de snapshot", medicao=medicao)
+
+                verificacao = None
+                if sucesso and self.config.get('VERIFICAR_ESCRITA', True):
+                    with medicao.fase('verificacao'):
+                        verificacao = self.cliente.verificar_escrita(operations, self.config['RETRY_COUNT'])
+                    if not verificacao['verificado']:
+                        sucesso = False
+                        erros = erros + verificacao['erros'] + [
+                            f"Verificação pós-escrita: {len(verificacao['tags_divergentes'])} tags divergentes no CLP {self.nome}"
+                        ]
+                medicao.sucesso = sucesso
+
+            novo_status = self.ultimo_status.copy()
+            novo_status.update({
+                'ultima_tentativa': datetime.now().isoformat(),
+                'erros': erros,
+                'ultima_verificacao': verificacao
+            })
+            if sucesso:
+                self.estado.atualizar(operations)
+                novo_status['ultima_restauracao'] = {
+                    'versao': versao,
+                    'snapshot_criado_em': snapshot.get('criado_em'),
+                    'restaurado_em': datetime.now().isoformat()
+                }
+                self.logger.info(f"Snapshot {versao} restaurado no CLP {self.nome}")
+            else:
+                self.logger.error(f"Falha ao restaurar snapshot {versao} no CLP {self.nome}")
+            self.ultimo_status = novo_status
+            self._salvar_status(novo_status)
+
+            return {
+                'sucesso': sucesso,
+                'clp': self.chave,
+                'versao': versao,
+                'snapshot_criado_em': snapshot.get('criado_em'),
+                'tags_escritas': len(operations),
+                'erros': erros,
+                'verificacao': verificacao,
+                'encontrado': True,
+                'timestamp': datetime.now().isoformat()
+            }
+
+        except Exception as e:
+            erro = f"Erro na restauração do snapshot {versao}: {str(e)}"
+            self.logger.error(erro)
+            return {'sucesso': False, 'erro': erro, 'encontrado': True, 'timestamp': datetime.now().isoformat()}
+        finally:
+            self._sincronizacao_em_andamento = False
+
+    def sincronizar_dados(self) -> Dict:
+        """Sincroniza usando os gerenciadores vinculados (interface usada pelo autosync)"""
+        return self.sincronizar()
+
+    def planejar(self, gerenciador_eventos=None, gerenciador_feriados=None) -> Dict:
+        """
+        Simula a sincronização sem acessar a rede (dry-run)
+
+        Retorna as operações exatas que seriam enviadas, os slots utilizados,
+        os itens descartados pelo limite de slots e a diferença em relação ao
+        último estado confirmado no CLP. O resultado fica em cache enquanto os
+        dados, o dia e o estado confirmado não mudarem.
+        """
+        gerenciador_eventos, gerenciador_feriados = self._resolver_gerenciadores(
+            gerenciador_eventos, gerenciador_feriados)
+        chave = (
+            getattr(gerenciador_feriados, 'versao', None) if self.tem_feriados else None,
+            getattr(gerenciador_eventos, 'versao', None),
+            date.today(),
+            self.estado.versao
+        )
+
+        with self._lock_plano:
+            if self._plano_cache and self._plano_cache[0] == chave:
+                return dict(self._plano_cache[1], cache=True)
+
+            dados = self._preparar_dados_para_clp(gerenciador_eventos, gerenciador_feriados)
+            operations = self._montar_operacoes(dados)
+
+            plano = {
+                'clp': self.chave,
+                'clp_ip': self.config['CLP_IP'],
+                'gerado_em': datetime.now().isoformat(),
+                'total_operacoes': len(operations),
+                'operacoes': operations,
+                'slots': {
+                    'eventos': {'utilizados': len(dados['eventos']), 'capacidade': self.config['MAX_EVENTOS']}
+                },
+                'eventos': dados['eventos'],
+                'descartados': {
+                    'eventos': dados['eventos_descartados']
+                },
+                'diferencas': self.estado.comparar(operations),
+                'cache': False
+            }
+            if self.tem_feriados:
+                plano['slots']['feriados'] = {'utilizados': len(dados['feriados']), 'capacidade': self.slots_feriados}
+                plano['feriados'] = dados['feriados']
+                plano['descartados']['feriados'] = dados['feriados_descartados']
+
+            self._plano_cache = (chave, plano)
+            return plano
+
+    def obter_status_sincronizacao(self) -> Dict:
+        """Retorna o status atual da sincronização (conectividade vinda do cache do monitor)"""
+        saude = self.monitor_saude.obter()
+
+        status = self.ultimo_status.copy()
+        if self.CAMPO_EVENTOS_LEGADO and 'eventos_sincronizados' not in status:
+            # Status gravado antes da unificação dos sincronizadores
+            status['eventos_sincronizados'] = status.get(f'{self.CAMPO_EVENTOS_LEGADO}_sincronizados', 0)
+
+        status.update({
+            'clp': self.chave,
+            'nome': self.nome,
+            'clp_online': saude['conectado'],
+            'msg_conectividade': saude['mensagem'],
+            'conectividade_verificada_em': saude['verificado_em'],
+            'latencia_ms': saude['latencia_ms'],
+            'sincronizacao_em_andamento': self._sincronizacao_em_andamento,
+            'horarios_sincronizacao': self.config['SYNC_TIMES'],
+            'sync_automatica_habilitada': self.config['SYNC_ENABLED'],
+            'max_eventos': self.config['MAX_EVENTOS'],
+            'locais_gerenciados': self.config['LOCAIS_GERENCIADOS'],
+            'clp_ip': self.config['CLP_IP'],
+            'watchdog_reset': self.ultimo_watchdog
+        })
+
+        return status
+
+    def limpar_todos_dados_clp(self) -> Tuple[bool, List[str]]:
+        """Zera todos os slots de feriados e eventos do CLP em uma única operação batch"""
+        try:
+            operations = []
+            if self.tem_feriados:
+                for i in range(self.config['MAX_FERIADOS']):
+                    operations.extend(self._operacoes_feriado(i))
+            for i in range(self.config['MAX_EVENTOS']):
+                operations.extend(self._operacoes_evento(i))
+
+            sucesso, erros = self._escrever_operacoes(operations, "limpeza batch")
+            if sucesso:
+                self.estado.atualizar(operations)
+            return sucesso, erros
+
+        except Exception as e:
+            erro = f"Erro geral na limpeza batch: {str(e)}"
+            self.logger.error(erro)
+            return False, [erro]
+
+    def get_status(self) -> Dict:
+        """Retorna o status atual da sincronização"""
+        return self.ultimo_status.copy()
+
+    def is_sincronizacao_em_andamento(self) -> bool:
+        """Verifica se há sincronização em andamento"""
+        return self._sincronizacao_em_andamento
+
+    def remover_eventos_do_dia(self, dia: int, mes: int) -> Tuple[bool, List[str]]:
+        """
+        Remove os eventos de um dia específico do CLP.
+        Usado para encerrar eventos mais cedo.
+
+        Sem leitura prévia dos slots, todos os slots de eventos são zerados;
+        a próxima sincronização reprograma os eventos que continuam ativos.
+
+        Args:
+            dia: Dia do evento (1-31)
+            mes: Mês do evento (1-12)
+
+        Returns:
+            Tupla (sucesso, lista_de_erros)
+        """
+        try:
+            self.logger.info(f"Removendo eventos do dia {dia:02d}/{mes:02d} do CLP {self.nome}...")
+
+            operations = []
+            for i in range(self.config['MAX_EVENTOS']):
+                operations.extend(self._operacoes_evento(i))
+
+            sucesso, erros = self._escrever_operacoes(operations, "remoção de eventos", timeout_multiplicador=2)
+            if sucesso:
+                self.estado.atualizar(operations)
+            return sucesso, erros
+
+        except Exception as e:
+            erro = f"Erro ao remover eventos do dia: {str(e)}"
+            self.logger.error(erro)
+            return False, [erro]
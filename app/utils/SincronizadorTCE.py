@@ -2,10 +2,16 @@
 import requests
 import json
 import logging
-import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+from ..config import TCE_CONFIG
+from .CacheRespostasTCE import CacheRespostasTCE
 from .GerenciadorEventos import GerenciadorEventos
+from .MetricasSincronizacao import MetricasSincronizacao
+from .ParserPautaTCE import ParserPautaTCE
 import urllib3
 
 # Desabilitar avisos de SSL não verificado
@@ -19,42 +25,79 @@ class SincronizadorTCE:
     
     _instance = None
     
-    def __init__(self):
+    def __init__(self, gerenciador_eventos: Optional[GerenciadorEventos] = None, notificacoes=None):
         self.logger = logging.getLogger('EventosFeriados.SincronizadorTCE')
-        self.gerenciador_eventos = GerenciadorEventos.get_instance()
+        # Gerenciadores compartilhados recebidos de ServicosAplicacao (padrão: instâncias únicas)
+        self.gerenciador_eventos = (gerenciador_eventos if gerenciador_eventos is not None
+                                    else GerenciadorEventos.get_instance())
+        self.notificacoes = notificacoes
         self.base_url = "https://catalogodeservicos.tce.go.gov.br/api/pauta/datas"
         self.prefixo_id_tce = "tce_tribunal_pleno"
+        self.timeout = TCE_CONFIG['TIMEOUT']
+        self.cache = CacheRespostasTCE(TCE_CONFIG['CACHE_DIR'], self.logger)
+        self.sessao = requests.Session()  # reaproveita a conexão TLS entre meses
+        self.parser = ParserPautaTCE()
         
     @classmethod
-    def get_instance(cls):
-        """Retorna a instância única do sincronizador (Singleton)"""
+    def get_instance(cls, gerenciador_eventos: Optional[GerenciadorEventos] = None, notificacoes=None):
+        """Retorna a instância única do sincronizador (Singleton); os gerenciadores valem só na criação"""
         if cls._instance is None:
-            cls._instance = cls()
+            cls._instance = cls(gerenciador_eventos, notificacoes)
         return cls._instance
     
-    def _obter_dados_json_tce(self, mes: int, ano: int) -> Optional[List[Dict]]:
+    def _obter_dados_json_tce(self, mes: int, ano: int, medicao=None) -> Optional[Dict]:
         """
         Obtém os dados JSON da API do TCE para um mês/ano específico
         
+        A requisição é condicional (If-None-Match / If-Modified-Since) quando há
+        resposta do mês em cache; um 304 devolve o conteúdo do cache.
+        
         Args:
             mes: Mês (1-12)
             ano: Ano (ex: 2025)
+            medicao: MedicaoSincronizacao opcional (fases 'requisicao' e 'parse', bytes da resposta)
             
         Returns:
-            Lista de dicionários com dados dos eventos ou None em caso de erro
+            {'dados': lista de eventos da API, 'sha256': hash do conteúdo,
+             'origem': 'api' ou 'cache'} ou None em caso de erro
         """
+        fase = medicao.fase if medicao else (lambda nome: nullcontext())
         try:
             url = f"{self.base_url}/{mes:02d}/{ano}"
-            self.logger.info(f"Consultando API do TCE: {url}")
+            em_cache = self.cache.carregar(mes, ano)
+            cabecalhos = {}
+            if em_cache:
+                if em_cache.get('etag'):
+                    cabecalhos['If-None-Match'] = em_cache['etag']
+                if em_cache.get('last_modified'):
+                    cabecalhos['If-Modified-Since'] = em_cache['last_modified']
+            self.logger.info(f"Consultando API do TCE: {url}{' (condicional)' if cabecalhos else ''}")
+            
+            with fase('requisicao'):
+                response = self.sessao.get(url, timeout=self.timeout, verify=False, headers=cabecalhos)
+                if response.status_code == 304 and em_cache:
+                    self.cache.confirmar(mes, ano)
+                else:
+                    response.raise_for_status()
+            
+            if response.status_code == 304 and em_cache:
+                if medicao:
+                    medicao.registrar('bytes_resposta', 0)
+                self.logger.info(f"Pauta do TCE para {mes:02d}/{ano} não modificada (304) - usando cache")
+                return {'dados': em_cache['dados'], 'sha256': em_cache['sha256'], 'origem': 'cache'}
             
-            response = requests.get(url, timeout=30, verify=False)
-            response.raise_for_status()
+            if medicao:
+                medicao.registrar('bytes_resposta', len(response.content))
             
             # Parse do JSON
-            dados = response.json()
+            with fase('parse'):
+                dados = response.json()
+                sha256 = self.cache.checksum(dados)
             
+            self.cache.salvar(mes, ano, url, dados, sha256,
+                              response.headers.get('ETag'), response.headers.get('Last-Modified'))
             self.logger.info(f"Dados obtidos com sucesso da API do TCE para {mes:02d}/{ano} - {len(dados)} eventos")
-            return dados
+            return {'dados': dados, 'sha256': sha256, 'origem': 'api'}
             
         except requests.exceptions.Timeout:
             self.logger.error(f"Timeout ao consultar API do TCE para {mes:02d}/{ano}")
@@ -69,10 +112,15 @@ class SincronizadorTCE:
             self.logger.error(f"Erro inesperado ao consultar API do TCE: {e}")
             return None
     
+    def _assinatura_local(self, mes: int, ano: int) -> str:
+        """Hash dos eventos TCE do mês como estão no sistema (detecta edições locais)"""
+        eventos = [e for e in self.gerenciador_eventos.listar_eventos(ano=ano, mes=mes) if e.get('fonte_tce', False)]
+        return self.cache.checksum(sorted(eventos, key=lambda e: e['id']))
+    
     def _processar_eventos_json(self, dados_json: List[Dict]) -> List[Dict]:
         """
         Processa os dados JSON e extrai eventos do Tribunal Pleno vespertinos
-        Agrupa múltiplos eventos do mesmo dia em um único evento
+        Agrupa múltiplos eventos do mesmo dia em um único evento (ParserPautaTCE)
         
         Args:
             dados_json: Lista de dicionários com dados da API
@@ -80,91 +128,8 @@ class SincronizadorTCE:
         Returns:
             Lista de dicionários com eventos filtrados e agrupados por dia
         """
-        eventos_por_dia = {}  # Agrupa eventos por dia
-        
         try:
-            for evento_api in dados_json:
-                dia = evento_api.get('dia')
-                titulo = evento_api.get('titulo', '')
-                
-                if not dia or not titulo:
-                    continue
-                
-                # Limpar quebras de linha do título
-                titulo = titulo.replace('\n', ' ').strip()
-                
-                # Filtrar apenas eventos do Tribunal Pleno
-                if not titulo.startswith('Tribunal Pleno:'):
-                    continue
-                
-                # Extrair horário do título usando regex
-                match_horario = re.search(r'às (\d{1,2}):(\d{2}) hora', titulo)
-                if not match_horario:
-                    continue
-                
-                hora = int(match_horario.group(1))
-                minuto = int(match_horario.group(2))
-                
-                # Filtrar apenas eventos vespertinos (a partir das 12h)
-                if hora < 12:
-                    continue
-                
-                # Agrupar eventos por dia
-                if dia not in eventos_por_dia:
-                    eventos_por_dia[dia] = {
-                        'dia': dia,
-                        'eventos': [],
-                        'horarios_originais': []
-                    }
-                
-                eventos_por_dia[dia]['eventos'].append(titulo)
-                eventos_por_dia[dia]['horarios_originais'].append(f"{hora:02d}:{minuto:02d}")
-            
-            # Converter para lista de eventos consolidados
-            eventos_filtrados = []
-            for dia, info in eventos_por_dia.items():
-                # Criar título consolidado
-                if len(info['eventos']) == 1:
-                    titulo_consolidado = info['eventos'][0]
-                    horarios_originais = info['horarios_originais'][0]
-                else:
-                    # Múltiplos eventos no mesmo dia
-                    tipos_sessao = []
-                    for evento in info['eventos']:
-                        # Extrair tipo de sessão (Ordinária, Extraordinária, etc.)
-                        if 'Ordinária' in evento:
-                            if 'Ordinária' not in tipos_sessao:
-                                tipos_sessao.append('Ordinária')
-                        elif 'Extraordinária' in evento:
-                            if 'Extraordinária' not in tipos_sessao:
-                                tipos_sessao.append('Extraordinária')
-                    
-                    if len(tipos_sessao) == 1:
-                        titulo_consolidado = f"Tribunal Pleno: {tipos_sessao[0]} (múltiplas sessões)"
-                    else:
-                        titulo_consolidado = f"Tribunal Pleno: {' e '.join(tipos_sessao)} (múltiplas sessões)"
-                    
-                    horarios_originais = ', '.join(info['horarios_originais'])
-                
-                eventos_filtrados.append({
-                    'dia': dia,
-                    'titulo': titulo_consolidado,
-                    'hora_original': horarios_originais,
-                    'quantidade_eventos': len(info['eventos']),
-                    'eventos_detalhados': info['eventos']
-                })
-            
-            self.logger.info(f"Filtrados {len(eventos_filtrados)} dias com eventos do Tribunal Pleno vespertinos")
-            
-            # Log detalhado dos eventos consolidados
-            for evento in eventos_filtrados:
-                if evento['quantidade_eventos'] > 1:
-                    self.logger.info(f"Dia {evento['dia']}: {evento['quantidade_eventos']} eventos consolidados - {evento['hora_original']}")
-                else:
-                    self.logger.info(f"Dia {evento['dia']}: 1 evento - {evento['hora_original']}")
-            
-            return eventos_filtrados
-            
+            return [dia.como_dict() for dia in self.parser.processar(dados_json)]
         except Exception as e:
             self.logger.error(f"Erro ao processar eventos do JSON: {e}")
             return []
@@ -183,9 +148,9 @@ class SincronizadorTCE:
         """
         return f"{self.prefixo_id_tce}_{ano}{mes:02d}{dia:02d}"
     
-    def _criar_evento_sistema(self, evento_tce: Dict, mes: int, ano: int) -> Optional[Dict]:
+    def _montar_evento_sistema(self, evento_tce: Dict, mes: int, ano: int) -> Dict:
         """
-        Cria um evento no sistema baseado nos dados do TCE
+        Monta o evento do sistema correspondente a um dia consolidado do TCE
         
         Args:
             evento_tce: Dados do evento consolidado do TCE
@@ -193,131 +158,100 @@ class SincronizadorTCE:
             ano: Ano do evento
             
         Returns:
-            Evento criado ou None em caso de erro
+            Dados do evento, já com o ID no padrão TCE (um por dia)
         """
-        try:
-            # Preparar descrição detalhada
-            if evento_tce['quantidade_eventos'] > 1:
-                descricao = f"Evento sincronizado automaticamente da API do TCE - {evento_tce['quantidade_eventos']} sessões do Tribunal Pleno:\n"
-                for i, evento_detalhe in enumerate(evento_tce['eventos_detalhados'], 1):
-                    descricao += f"{i}. {evento_detalhe}\n"
-            else:
-                descricao = f"Evento sincronizado automaticamente da API do TCE - {evento_tce['titulo']}"
-            
-            dados_evento = {
-                'nome': evento_tce['titulo'],
-                'descricao': descricao,
-                'local': 'Plenário',
-                'dia': evento_tce['dia'],
-                'mes': mes,
-                'ano': ano,
-                'hora_inicio': '13:00',  # Horário fixo para eventos vespertinos
-                'hora_fim': '18:00',     # Horário fixo para eventos vespertinos
-                'responsavel': 'Sistema - TCE',
-                'participantes_estimados': 0,
-                'fonte_tce': True,  # Marca para identificar eventos do TCE
-                'hora_original_tce': evento_tce['hora_original'],
-                'quantidade_eventos_tce': evento_tce['quantidade_eventos'],
-                'eventos_detalhados_tce': evento_tce.get('eventos_detalhados', [])
-            }
-            
-            # Gerar ID customizado para eventos do TCE (um por dia)
-            evento_id = self._gerar_id_evento_tce(evento_tce['dia'], mes, ano)
-            
-            # Verificar se já existe um evento TCE para este dia
-            evento_existente = self.gerenciador_eventos.obter_evento(evento_id)
-            if evento_existente:
-                # Verificar se houve mudanças nos eventos
-                quantidade_atual = evento_existente.get('quantidade_eventos_tce', 1)
-                eventos_atuais = evento_existente.get('eventos_detalhados_tce', [evento_existente['nome']])
-                
-                if (quantidade_atual != evento_tce['quantidade_eventos'] or 
-                    set(eventos_atuais) != set(evento_tce['eventos_detalhados'])):
-                    
-                    # Atualizar evento existente com novas informações
-                    self.logger.info(f"Atualizando evento TCE existente: {evento_tce['titulo']} - {evento_tce['dia']}/{mes}/{ano}")
-                    
-                    dados_atualizacao = {
-                        'nome': evento_tce['titulo'],
-                        'descricao': descricao,
-                        'hora_original_tce': evento_tce['hora_original'],
-                        'quantidade_eventos_tce': evento_tce['quantidade_eventos'],
-                        'eventos_detalhados_tce': evento_tce['eventos_detalhados']
-                    }
-                    
-                    evento_atualizado = self.gerenciador_eventos.atualizar_evento(evento_id, dados_atualizacao)
-                    return evento_atualizado
-                else:
-                    self.logger.info(f"Evento TCE já existe e está atualizado: {evento_tce['titulo']} - {evento_tce['dia']}/{mes}/{ano}")
-                    return evento_existente
-            
-            # Criar novo evento
-            novo_evento = self.gerenciador_eventos.adicionar_evento(dados_evento)
-            
-            # Atualizar o ID para usar o padrão TCE e adicionar campos específicos
-            for i, evento in enumerate(self.gerenciador_eventos.eventos):
-                if evento['id'] == novo_evento['id']:
-                    self.gerenciador_eventos.eventos[i]['id'] = evento_id
-                    self.gerenciador_eventos.eventos[i]['fonte_tce'] = True
-                    self.gerenciador_eventos.eventos[i]['hora_original_tce'] = evento_tce['hora_original']
-                    self.gerenciador_eventos.eventos[i]['quantidade_eventos_tce'] = evento_tce['quantidade_eventos']
-                    self.gerenciador_eventos.eventos[i]['eventos_detalhados_tce'] = evento_tce.get('eventos_detalhados', [])
-                    break
-            
-            self.gerenciador_eventos._salvar_eventos()
-            
-            if evento_tce['quantidade_eventos'] > 1:
-                self.logger.info(f"Evento TCE consolidado criado: {evento_tce['titulo']} - {evento_tce['dia']}/{mes}/{ano} ({evento_tce['quantidade_eventos']} sessões)")
-            else:
-                self.logger.info(f"Evento TCE criado: {evento_tce['titulo']} - {evento_tce['dia']}/{mes}/{ano}")
-                
-            return novo_evento
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao criar evento do TCE: {e}")
-            return None
+        # Preparar descrição detalhada
+        if evento_tce['quantidade_eventos'] > 1:
+            descricao = f"Evento sincronizado automaticamente da API do TCE - {evento_tce['quantidade_eventos']} sessões do Tribunal Pleno:\n"
+            for i, evento_detalhe in enumerate(evento_tce['eventos_detalhados'], 1):
+                descricao += f"{i}. {evento_detalhe}\n"
+        else:
+            descricao = f"Evento sincronizado automaticamente da API do TCE - {evento_tce['titulo']}"
+        
+        return {
+            'id': self._gerar_id_evento_tce(evento_tce['dia'], mes, ano),
+            'nome': evento_tce['titulo'],
+            'descricao': descricao,
+            'local': 'Plenário',
+            'dia': evento_tce['dia'],
+            'mes': mes,
+            'ano': ano,
+            'hora_inicio': '13:00',  # Horário fixo para eventos vespertinos
+            'hora_fim': '18:00',     # Horário fixo para eventos vespertinos
+            'responsavel': 'Sistema - TCE',
+            'participantes_estimados': 0,
+            'fonte_tce': True,  # Marca para identificar eventos do TCE
+            'hora_original_tce': evento_tce['hora_original'],
+            'quantidade_eventos_tce': evento_tce['quantidade_eventos'],
+            'eventos_detalhados_tce': evento_tce.get('eventos_detalhados', [])
+        }
     
-    def _remover_eventos_tce_obsoletos(self, mes: int, ano: int, eventos_atuais_tce: List[Dict]):
+    def _calcular_alteracoes(self, eventos_tce: List[Dict], mes: int, ano: int) -> Dict:
         """
-        Remove eventos do TCE que não estão mais na API
+        Compara a pauta do TCE com os eventos TCE do mês no sistema
         
         Args:
+            eventos_tce: Eventos consolidados da API
             mes: Mês de referência
             ano: Ano de referência
-            eventos_atuais_tce: Lista de eventos atuais da API
-        """
-        try:
-            # Obter todos os eventos do TCE para o mês/ano
-            eventos_sistema = self.gerenciador_eventos.listar_eventos(ano=ano, mes=mes)
-            eventos_tce_sistema = [e for e in eventos_sistema if e.get('fonte_tce', False)]
-            
-            # Criar set com IDs dos eventos atuais do TCE
-            ids_eventos_atuais = set()
-            for evento_tce in eventos_atuais_tce:
-                evento_id = self._gerar_id_evento_tce(evento_tce['dia'], mes, ano)
-                ids_eventos_atuais.add(evento_id)
-            
-            # Remover eventos que não estão mais na API
-            eventos_removidos = 0
-            for evento_sistema in eventos_tce_sistema:
-                if evento_sistema['id'] not in ids_eventos_atuais:
-                    if self.gerenciador_eventos.remover_evento(evento_sistema['id']):
-                        eventos_removidos += 1
-                        self.logger.info(f"Evento TCE removido: {evento_sistema['nome']} - {evento_sistema['dia']}/{evento_sistema['mes']}/{evento_sistema['ano']}")
             
-            if eventos_removidos > 0:
-                self.logger.info(f"Total de eventos TCE obsoletos removidos: {eventos_removidos}")
-            
-        except Exception as e:
-            self.logger.error(f"Erro ao remover eventos TCE obsoletos: {e}")
+        Returns:
+            {'criar': [eventos], 'atualizar': {id: campos}, 'remover': [ids],
+             'inalterados': quantidade}, no formato de GerenciadorEventos.aplicar_lote
+        """
+        existentes = {e['id']: e for e in self.gerenciador_eventos.listar_eventos(ano=ano, mes=mes)
+                      if e.get('fonte_tce', False)}
+        alteracoes = {'criar': [], 'atualizar': {}, 'remover': [], 'inalterados': 0}
+        
+        for evento_tce in eventos_tce:
+            dados_evento = self._montar_evento_sistema(evento_tce, mes, ano)
+            evento_id = dados_evento['id']
+            evento_existente = existentes.pop(evento_id, None) or self.gerenciador_eventos.obter_evento(evento_id)
+            
+            if not evento_existente:
+                alteracoes['criar'].append(dados_evento)
+                continue
+            
+            # Verificar se houve mudanças nos eventos
+            quantidade_atual = evento_existente.get('quantidade_eventos_tce', 1)
+            eventos_atuais = evento_existente.get('eventos_detalhados_tce', [evento_existente['nome']])
+            
+            if (quantidade_atual != evento_tce['quantidade_eventos'] or 
+                set(eventos_atuais) != set(evento_tce['eventos_detalhados'])):
+                self.logger.info(f"Atualizando evento TCE existente: {evento_tce['titulo']} - {evento_tce['dia']}/{mes}/{ano}")
+                alteracoes['atualizar'][evento_id] = {
+                    campo: dados_evento[campo] for campo in
+                    ('nome', 'descricao', 'hora_original_tce', 'quantidade_eventos_tce', 'eventos_detalhados_tce')
+                }
+            else:
+                alteracoes['inalterados'] += 1
+        
+        # Eventos TCE do mês que não estão mais na API
+        for evento_sistema in existentes.values():
+            self.logger.info(f"Evento TCE obsoleto: {evento_sistema['nome']} - {evento_sistema['dia']}/{evento_sistema['mes']}/{evento_sistema['ano']}")
+            alteracoes['remover'].append(evento_sistema['id'])
+        
+        return alteracoes
+    
+    def _consultar_mes(self, mes: int, ano: int) -> Dict:
+        """Consulta da API cronometrada, para execução no pool do sincronizar_intervalo"""
+        inicio = time.monotonic()
+        resposta = self._obter_dados_json_tce(mes, ano)
+        return {'resposta': resposta, 'consulta_ms': round((time.monotonic() - inicio) * 1000, 2)}
     
-    def sincronizar_mes(self, mes: int, ano: int) -> Dict:
+    def sincronizar_mes(self, mes: int, ano: int, forcar: bool = False, consulta: Optional[Dict] = None) -> Dict:
         """
         Sincroniza eventos do TCE para um mês específico
         
+        Se a pauta do mês tem o mesmo hash do último processamento concluído e os
+        eventos TCE locais do mês não foram alterados desde então, o
+        processamento (remoção de obsoletos e criação/atualização) é pulado.
+        
         Args:
             mes: Mês (1-12)
             ano: Ano (ex: 2025)
+            forcar: Reprocessa mesmo com a pauta inalterada
+            consulta: Resultado de _consultar_mes já obtido (sem nova requisição)
             
         Returns:
             Dicionário com resultado da sincronização
@@ -328,33 +262,79 @@ class SincronizadorTCE:
             'ano': ano,
             'eventos_criados': 0,
             'eventos_removidos': 0,
+            'inalterado': False,
+            'origem': None,
             'erro': None
         }
         
         try:
             self.logger.info(f"Iniciando sincronização TCE para {mes:02d}/{ano}")
             
-            # Obter dados da API
-            dados_json = self._obter_dados_json_tce(mes, ano)
-            if not dados_json:
-                resultado['erro'] = "Erro ao obter dados da API do TCE"
-                return resultado
-            
-            # Processar eventos
-            eventos_tce = self._processar_eventos_json(dados_json)
-            
-            # Remover eventos obsoletos antes de criar novos
-            self._remover_eventos_tce_obsoletos(mes, ano, eventos_tce)
-            
-            # Criar/atualizar eventos
-            eventos_criados = 0
-            for evento_tce in eventos_tce:
-                evento_criado = self._criar_evento_sistema(evento_tce, mes, ano)
-                if evento_criado:
-                    eventos_criados += 1
+            with MetricasSincronizacao.get_instance().medir('tce') as medicao:
+                # Obter dados da API
+                if consulta is None:
+                    resposta = self._obter_dados_json_tce(mes, ano, medicao)
+                else:
+                    resposta = consulta['resposta']
+                    medicao.registrar('consulta_ms', consulta['consulta_ms'])
+                if not resposta or not resposta['dados']:
+                    resultado['erro'] = "Erro ao obter dados da API do TCE"
+                    return resultado
+                dados_json = resposta['dados']
+                resultado['origem'] = resposta['origem']
+                
+                processado = self.cache.assinatura_processada(mes, ano)
+                if (not forcar and processado and processado['sha256'] == resposta['sha256']
+                        and processado['local'] == self._assinatura_local(mes, ano)):
+                    medicao.registrar('inalterado', 1)
+                    medicao.sucesso = True
+                    resultado['sucesso'] = True
+                    resultado['inalterado'] = True
+                    self.logger.info(f"Pauta do TCE para {mes:02d}/{ano} inalterada - processamento ignorado")
+                    return resultado
+                
+                # Processar eventos
+                with medicao.fase('processamento'):
+                    eventos_tce = self._processar_eventos_json(dados_json)
+                medicao.registrar('eventos_recebidos', len(eventos_tce))
+                
+                with medicao.fase('calculo_alteracoes'):
+                    alteracoes = self._calcular_alteracoes(eventos_tce, mes, ano)
+                
+                # Aplicar criações, atualizações e remoções como uma transação
+                with medicao.fase('gravacao'):
+                    aplicado = self.gerenciador_eventos.aplicar_lote(
+                        criar=alteracoes['criar'],
+                        atualizar=alteracoes['atualizar'],
+                        remover=alteracoes['remover'],
+                        origem=f"Sincronização da pauta do TCE ({mes:02d}/{ano})",
+                        usuario='sistema',
+                        usuario_nome='Sincronização TCE'
+                    )
+                eventos_criados = (alteracoes['inalterados'] + len(aplicado['criados'])
+                                   + len(aplicado['atualizados']))
+                medicao.registrar('eventos_processados', eventos_criados)
+                medicao.registrar('eventos_removidos', len(aplicado['removidos']))
+                medicao.registrar('eventos_rejeitados', len(aplicado['rejeitados']))
+                medicao.sucesso = True
+            
+            if aplicado['rejeitados']:
+                # Itens recusados (ex.: conflito com evento manual) devem ser
+                # tentados de novo mesmo com a pauta inalterada
+                self.cache.desmarcar_processado(mes, ano)
+            else:
+                self.cache.marcar_processado(mes, ano, resposta['sha256'], self._assinatura_local(mes, ano))
             
             resultado['sucesso'] = True
             resultado['eventos_criados'] = eventos_criados
+            resultado['eventos_removidos'] = len(aplicado['removidos'])
+            resultado['alteracoes'] = {
+                'criados': len(aplicado['criados']),
+                'atualizados': len(aplicado['atualizados']),
+                'removidos': len(aplicado['removidos']),
+                'inalterados': alteracoes['inalterados'],
+                'rejeitados': aplicado['rejeitados']
+            }
             
             self.logger.info(f"Sincronização TCE concluída para {mes:02d}/{ano} - {eventos_criados} eventos processados")
             
@@ -364,9 +344,93 @@ class SincronizadorTCE:
         
         return resultado
     
-    def sincronizar_periodo_atual(self) -> Dict:
+    def sincronizar_intervalo(self, de: Tuple[int, int], ate: Tuple[int, int], forcar: bool = False) -> Dict:
+        """
+        Sincroniza um intervalo de meses (ex.: reprocessar um ano inteiro)
+        
+        As consultas à API rodam em paralelo num pool limitado (TCE_CONSULTAS_PARALELAS);
+        os resultados são aplicados um a um em ordem cronológica, à medida que
+        cada mês fica disponível. As alterações de todos os meses são notificadas
+        em um único resumo ao final.
+        
+        Args:
+            de: (ano, mes) inicial
+            ate: (ano, mes) final, inclusive
+            forcar: Reprocessa os meses mesmo com a pauta inalterada
+            
+        Returns:
+            Dicionário com o resultado e os tempos de consulta e aplicação de cada mês
+        
+        Raises:
+            ValueError: intervalo invertido ou maior que TCE_MAX_MESES_INTERVALO
+        """
+        meses = []
+        ano, mes = de
+        while (ano, mes) <= ate:
+            meses.append((ano, mes))
+            ano, mes = (ano + 1, 1) if mes == 12 else (ano, mes + 1)
+        
+        if not meses:
+            raise ValueError("Intervalo inválido: 'de' posterior a 'ate'")
+        if len(meses) > TCE_CONFIG['MAX_MESES_INTERVALO']:
+            raise ValueError(f"Intervalo maior que {TCE_CONFIG['MAX_MESES_INTERVALO']} meses")
+        
+        resultado = {
+            'sucesso': False,
+            'de': f"{de[0]}-{de[1]:02d}",
+            'ate': f"{ate[0]}-{ate[1]:02d}",
+            'meses': [],
+            'total_eventos_criados': 0,
+            'meses_inalterados': 0,
+            'duracao_ms': None,
+            'erro': None
+        }
+        inicio = time.monotonic()
+        paralelas = max(1, min(TCE_CONFIG['CONSULTAS_PARALELAS'], len(meses)))
+        self.logger.info(f"Sincronizando TCE de {resultado['de']} a {resultado['ate']} "
+                         f"({len(meses)} meses, {paralelas} consultas em paralelo)")
+        
+        # Um resumo de notificações para o intervalo inteiro, não um por mês
+        if self.notificacoes is None:
+            from .GerenciadorNotificacaoEventos import GerenciadorNotificacaoEventos
+            self.notificacoes = GerenciadorNotificacaoEventos.get_instance()
+        agrupamento = self.notificacoes.agrupar_notificacoes(
+            f"Sincronização da pauta do TCE ({resultado['de']} a {resultado['ate']})")
+        
+        with agrupamento, ThreadPoolExecutor(max_workers=paralelas, thread_name_prefix='consulta-tce') as executor:
+            consultas = [(ano, mes, executor.submit(self._consultar_mes, mes, ano)) for ano, mes in meses]
+            
+            for ano, mes, futuro in consultas:
+                try:
+                    consulta = futuro.result()
+                except Exception as e:
+                    consulta = {'resposta': None, 'consulta_ms': None}
+                    self.logger.error(f"Erro na consulta TCE de {mes:02d}/{ano}: {e}")
+                
+                inicio_aplicacao = time.monotonic()
+                resultado_mes = self.sincronizar_mes(mes, ano, forcar, consulta)
+                resultado_mes['consulta_ms'] = consulta['consulta_ms']
+                resultado_mes['aplicacao_ms'] = round((time.monotonic() - inicio_aplicacao) * 1000, 2)
+                resultado['meses'].append(resultado_mes)
+        
+        erros = [f"{r['mes']:02d}/{r['ano']}: {r['erro']}" for r in resultado['meses'] if not r['sucesso']]
+        resultado['sucesso'] = not erros
+        resultado['erro'] = "; ".join(erros) or None
+        resultado['total_eventos_criados'] = sum(r['eventos_criados'] for r in resultado['meses'])
+        resultado['meses_inalterados'] = sum(1 for r in resultado['meses'] if r.get('inalterado'))
+        resultado['duracao_ms'] = round((time.monotonic() - inicio) * 1000, 2)
+        
+        self.logger.info(f"Sincronização TCE {resultado['de']} a {resultado['ate']} concluída em "
+                         f"{resultado['duracao_ms']:.0f} ms - {resultado['total_eventos_criados']} eventos processados, "
+                         f"{resultado['meses_inalterados']} meses inalterados, {len(erros)} com erro")
+        return resultado
+    
+    def sincronizar_periodo_atual(self, forcar: bool = False) -> Dict:
         """
-        Sincroniza eventos do mês atual e próximo mês
+        Sincroniza eventos do mês atual e próximo mês (consultas em paralelo)
+        
+        Args:
+            forcar: Reprocessa os meses mesmo com a pauta inalterada
         
         Returns:
             Dicionário com resultado da sincronização
@@ -380,21 +444,16 @@ class SincronizadorTCE:
         
         try:
             agora = datetime.now()
+            proximo_mes = (agora + timedelta(days=32)).replace(day=1)
             
-            # Sincronizar mês atual
-            resultado_atual = self.sincronizar_mes(agora.month, agora.year)
-            resultado['sincronizacoes'].append(resultado_atual)
-            
-            # Sincronizar próximo mês
-            proximo_mes = agora + timedelta(days=32)
-            proximo_mes = proximo_mes.replace(day=1)
-            
-            resultado_proximo = self.sincronizar_mes(proximo_mes.month, proximo_mes.year)
-            resultado['sincronizacoes'].append(resultado_proximo)
+            intervalo = self.sincronizar_intervalo((agora.year, agora.month),
+                                                   (proximo_mes.year, proximo_mes.month), forcar)
+            resultado_atual, resultado_proximo = intervalo['meses']
+            resultado['sincronizacoes'] = intervalo['meses']
             
             # Consolidar resultados
-            resultado['sucesso'] = resultado_atual['sucesso'] and resultado_proximo['sucesso']
-            resultado['total_eventos_criados'] = resultado_atual['eventos_criados'] + resultado_proximo['eventos_criados']
+            resultado['sucesso'] = intervalo['sucesso']
+            resultado['total_eventos_criados'] = intervalo['total_eventos_criados']
             
             if not resultado['sucesso']:
                 erros = []
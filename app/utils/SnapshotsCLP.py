@@ -0,0 +1,140 @@
+# app/utils/SnapshotsCLP.py
+"""
+Snapshots versionados da matriz de tags gravada em um CLP
+
+A cada sincronização bem-sucedida, a matriz exata (tag -> valor) enviada ao
+controlador é gravada em um arquivo compacto com checksum SHA-256, em um anel
+dos N snapshots mais recentes. Depois de uma sincronização ruim ou de um reset
+do CLP, um snapshot pode ser reenviado em uma única escrita em lote, sem
+recalcular nada a partir dos gerenciadores.
+"""
+import hashlib
+import json
+import logging
+import os
+from datetime import datetime
+from threading import Lock
+from typing import Dict, List, Optional
+
+
+class SnapshotsCLP:
+    """Anel de snapshots checksummed de um controlador (um arquivo por versão)"""
+
+    def __init__(self, diretorio: str, mantidos: int = 20, logger: Optional[logging.Logger] = None):
+        self.diretorio = diretorio
+        self.mantidos = max(1, mantidos)
+        self.logger = logger or logging.getLogger('EventosFeriados.SnapshotsCLP')
+        self._lock = Lock()
+
+    @staticmethod
+    def _checksum(tags: Dict[str, int]) -> str:
+        """SHA-256 da matriz em forma canônica (chaves ordenadas, sem espaços)"""
+        canonico = json.dumps(tags, sort_keys=True, separators=(',', ':'))
+        return hashlib.sha256(canonico.encode('utf-8')).hexdigest()
+
+    def _arquivo(self, versao: int) -> str:
+        return os.path.join(self.diretorio, f"snapshot_{versao:06d}.json")
+
+    def _versoes(self) -> List[int]:
+        if not os.path.isdir(self.diretorio):
+            return []
+        versoes = []
+        for nome in os.listdir(self.diretorio):
+            if nome.startswith('snapshot_') and nome.endswith('.json'):
+                try:
+                    versoes.append(int(nome[len('snapshot_'):-len('.json')]))
+                except ValueError:
+                    continue
+        return sorted(versoes)
+
+    def _versoes_por_idade(self) -> List[int]:
+        """
+        Versões do snapshot mais antigo para o mais recente (data de gravação)
+
+        A numeração pode recomeçar (ex.: arquivo de status do CLP perdido), então
+        a idade vem do arquivo, não do número da versão.
+        """
+        def gravado_em(versao: int) -> float:
+            try:
+                return os.path.getmtime(self._arquivo(versao))
+            except OSError:
+                return 0.0
+        return sorted(self._versoes(), key=lambda versao: (gravado_em(versao), versao))
+
+    def salvar(self, versao: int, operations: List[Dict], clp_ip: str, resumo: Optional[Dict] = None) -> bool:
+        """Grava o snapshot da versão e descarta os mais antigos além do limite do anel"""
+        tags = {op['tag_address']: int(op['value']) for op in operations}
+        snapshot = {
+            'versao': versao,
+            'criado_em': datetime.now().isoformat(),
+            'clp_ip': clp_ip,
+            'total_tags': len(tags),
+            'resumo': resumo or {},
+            'sha256': self._checksum(tags),
+            'tags': tags
+        }
+
+        with self._lock:
+            try:
+                os.makedirs(self.diretorio, exist_ok=True)
+                arquivo = self._arquivo(versao)
+                temporario = f"{arquivo}.tmp"
+                with open(temporario, 'w', encoding='utf-8') as f:
+                    json.dump(snapshot, f, ensure_ascii=False, separators=(',', ':'))
+                os.replace(temporario, arquivo)
+
+                # Poda pelos mais antigos em data de gravação; o recém-gravado sempre fica
+                outras = [v for v in self._versoes_por_idade() if v != versao]
+                excesso = len(outras) - (self.mantidos - 1)
+                for antiga in outras[:max(excesso, 0)]:
+                    os.remove(self._arquivo(antiga))
+                return True
+            except Exception as e:
+                self.logger.error(f"Erro ao gravar snapshot {versao} do CLP: {e}")
+                return False
+
+    def carregar(self, versao: int) -> Optional[Dict]:
+        """
+        Lê um snapshot e confere o checksum
+
+        Returns:
+            Snapshot com o campo 'integro' indicando se o checksum confere,
+            ou None se a versão não existir
+        """
+        arquivo = self._arquivo(versao)
+        if not os.path.exists(arquivo):
+            return None
+        try:
+            with open(arquivo, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except Exception as e:
+            self.logger.error(f"Erro ao ler snapshot {versao} do CLP: {e}")
+            return {'versao': versao, 'integro': False, 'tags': {}}
+
+        tags = {tag: int(valor) for tag, valor in snapshot.get('tags', {}).items()}
+        snapshot['tags'] = tags
+        snapshot['integro'] = snapshot.get('sha256') == self._checksum(tags)
+        return snapshot
+
+    def listar(self) -> List[Dict]:
+        """Metadados dos snapshots disponíveis, do mais recente para o mais antigo"""
+        itens = []
+        for versao in reversed(self._versoes_por_idade()):
+            snapshot = self.carregar(versao)
+            if snapshot is None:
+                continue
+            itens.append({
+                'versao': versao,
+                'criado_em': snapshot.get('criado_em'),
+                'clp_ip': snapshot.get('clp_ip'),
+                'total_tags': snapshot.get('total_tags', len(snapshot['tags'])),
+                'resumo': snapshot.get('resumo', {}),
+                'sha256': snapshot.get('sha256'),
+                'integro': snapshot['integro']
+            })
+        return itens
+
+    @staticmethod
+    def operacoes(snapshot: Dict) -> List[Dict]:
+        """Converte a matriz do snapshot em operações de escrita em lote"""
+        return [{"tag_address": tag, "value": str(valor)} for tag, valor in snapshot['tags'].items()]
@@ -0,0 +1,50 @@
+# app/utils/retencao_historico.py
+"""
+Tarefa diária de retenção dos históricos
+
+Poda, no horário AGENDADOR_HORARIO_RETENCAO, o histórico de execuções do
+agendador, os temporizadores de disparo único antigos do registro de tarefas e
+os envios já concluídos da saída de notificações. Os históricos de alterações
+e de notificações (auditoria) só são podados se RETENCAO_HISTORICO_DIAS /
+RETENCAO_NOTIFICACOES_DIAS forem configurados (padrão 0: desativado).
+"""
+import logging
+from typing import Dict
+
+from ..config import AGENDADOR_CONFIG
+from .AgendadorTarefas import AgendadorTarefas
+
+logger = logging.getLogger('EventosFeriados.retencao_historico')
+
+NOME_TAREFA = 'retencao.historico'
+
+
+def executar_retencao() -> Dict:
+    """Remove registros além do prazo de retenção de cada histórico"""
+    from .GerenciadorHistorico import GerenciadorHistorico
+    from .GerenciadorHistoricoNotificacoes import GerenciadorHistoricoNotificacoes
+    from .SaidaNotificacoes import SaidaNotificacoes
+
+    registro = AgendadorTarefas.get_instance().registro
+    removidos = {
+        'execucoes': registro.limpar_execucoes_antigas(AGENDADOR_CONFIG['RETENCAO_EXECUCOES_DIAS']),
+        'temporizadores': registro.limpar_unicas_antigas(),
+        'saida_notificacoes': SaidaNotificacoes.get_instance().limpar_antigos(
+            AGENDADOR_CONFIG['RETENCAO_SAIDA_NOTIFICACOES_DIAS'])
+    }
+    # Auditoria: apagada automaticamente só com prazo configurado explicitamente
+    if AGENDADOR_CONFIG['RETENCAO_HISTORICO_DIAS'] > 0:
+        removidos['alteracoes'] = GerenciadorHistorico.get_instance().limpar_historico_antigo(
+            AGENDADOR_CONFIG['RETENCAO_HISTORICO_DIAS'])
+    if AGENDADOR_CONFIG['RETENCAO_NOTIFICACOES_DIAS'] > 0:
+        removidos['notificacoes'] = GerenciadorHistoricoNotificacoes.get_instance().limpar_antigos(
+            AGENDADOR_CONFIG['RETENCAO_NOTIFICACOES_DIAS'])
+    logger.info(f"Retenção de históricos concluída: {removidos}")
+    return {'sucesso': True, 'removidos': removidos}
+
+
+def agendar_retencao():
+    """Registra a tarefa diária de retenção no agendador de tarefas"""
+    tarefas = AgendadorTarefas.get_instance()
+    tarefas.agendar_diario(NOME_TAREFA, [AGENDADOR_CONFIG['HORARIO_RETENCAO']], executar_retencao)
+    tarefas.iniciar()
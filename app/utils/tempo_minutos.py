@@ -0,0 +1,87 @@
+# app/utils/tempo_minutos.py
+"""
+Aritmética de horários em minutos inteiros desde 00:00
+
+Os horários continuam armazenados e expostos como 'HH:MM' (JSON, API, telas),
+mas toda comparação, ajuste ou divisão em hora/minuto é feita sobre inteiros:
+a string é convertida uma vez na entrada e formatada de volta só na saída.
+"""
+from datetime import datetime
+from typing import Optional, Tuple
+
+MINUTOS_POR_DIA = 24 * 60
+INICIO_DIA = 0
+FIM_DIA = MINUTOS_POR_DIA - 1  # 23:59
+
+MENSAGEM_FORMATO_INVALIDO = "Formato de horário inválido. Use HH:MM"
+
+
+def para_minutos(horario: str) -> int:
+    """
+    Converte 'HH:MM' (ou 'H:MM') em minutos desde 00:00
+
+    Raises:
+        ValueError: se o horário não estiver no formato HH:MM ou fora de 00:00-23:59
+    """
+    try:
+        hora, minuto = str(horario).strip().split(':')
+        if not (hora.isdigit() and minuto.isdigit()) or len(hora) > 2 or len(minuto) > 2:
+            raise ValueError
+        hora, minuto = int(hora), int(minuto)
+    except ValueError:
+        raise ValueError(MENSAGEM_FORMATO_INVALIDO)
+
+    if hora > 23 or minuto > 59:
+        raise ValueError(MENSAGEM_FORMATO_INVALIDO)
+    return hora * 60 + minuto
+
+
+def para_hhmm(minutos: int) -> str:
+    """Formata minutos desde 00:00 como 'HH:MM'"""
+    hora, minuto = hora_minuto(minutos)
+    return f"{hora:02d}:{minuto:02d}"
+
+
+def hora_minuto(minutos: int) -> Tuple[int, int]:
+    """Separa minutos desde 00:00 em (hora, minuto), como gravado nas tags do CLP"""
+    return divmod(minutos, 60)
+
+
+def normalizar(horario: str) -> str:
+    """Valida e devolve o horário com dois dígitos ('8:05' -> '08:05')"""
+    return para_hhmm(para_minutos(horario))
+
+
+def horario_valido(horario: str) -> bool:
+    try:
+        para_minutos(horario)
+        return True
+    except ValueError:
+        return False
+
+
+def minutos_do_dia(momento: Optional[datetime] = None) -> int:
+    """Minutos desde 00:00 de um datetime (agora, se omitido), descartando segundos"""
+    momento = momento or datetime.now()
+    return momento.hour * 60 + momento.minute
+
+
+def limitar(minutos: int, minimo: int = INICIO_DIA, maximo: int = FIM_DIA) -> int:
+    """Mantém o valor entre minimo e maximo (por padrão, dentro do mesmo dia)"""
+    return max(minimo, min(maximo, minutos))
+
+
+def sobrepoe(inicio_a: int, fim_a: int, inicio_b: int, fim_b: int) -> bool:
+    """Intervalos [inicio, fim) se sobrepõem? Encostar (fim_a == inicio_b) não conta"""
+    return inicio_a < fim_b and inicio_b < fim_a
+
+
+def expandir(inicio: int, fim: int, antes: int = 0, depois: int = 0,
+             minimo: int = INICIO_DIA, maximo: int = FIM_DIA) -> Tuple[int, int]:
+    """
+    Antecipa o início e estende o fim (folgas de preparação), sem sair de [minimo, maximo]
+
+    Usado no ajuste do Auditório: liga ANTES_MINUTOS antes e desliga DEPOIS_MINUTOS
+    depois, nunca antes de HORA_MINIMA nem depois de HORA_MAXIMA.
+    """
+    return limitar(inicio - antes, minimo, maximo), limitar(fim + depois, minimo, maximo)
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Benchmark e Saída de Referência do Parser da Pauta TCE
+===========================================================
+Roda app/utils/ParserPautaTCE.py sobre o corpus de pautas mensais gravadas
+em tools/corpus_pauta_tce/ e mede velocidade e saída exata.
+
+Uso:
+    python tools/benchmark-pauta-tce.py verificar           # compara com *.esperado.json
+    python tools/benchmark-pauta-tce.py benchmark [-n 200]  # tempo por pauta
+    python tools/benchmark-pauta-tce.py gravar 2025-10 ...  # grava pautas da API no corpus
+    python tools/benchmark-pauta-tce.py atualizar           # regrava *.esperado.json
+
+Alterações no parser devem manter 'verificar' sem diferenças; se a mudança
+de saída for intencional, rode 'atualizar' e revise o diff dos arquivos
+esperados no mesmo commit.
+"""
+
+import argparse
+import importlib.util
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# ============================================================
+# Configuração
+# ============================================================
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CORPUS_DIR = Path(__file__).parent / 'corpus_pauta_tce'
+PARSER_FILE = PROJECT_ROOT / 'app' / 'utils' / 'ParserPautaTCE.py'
+URL_PAUTA = "https://catalogodeservicos.tce.go.gov.br/api/pauta/datas/{mes:02d}/{ano}"
+
+
+def carregar_parser():
+    """Carrega o parser direto do arquivo, sem inicializar a aplicação"""
+    spec = importlib.util.spec_from_file_location('ParserPautaTCE', PARSER_FILE)
+    modulo = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = modulo  # dataclasses resolve o módulo pelo nome
+    spec.loader.exec_module(modulo)
+    logger = logging.getLogger('benchmark-pauta-tce')
+    logger.disabled = True
+    return modulo.ParserPautaTCE(logger)
+
+
+def arquivos_corpus():
+    return sorted(p for p in CORPUS_DIR.glob('pauta_*.json') if not p.name.endswith('.esperado.json'))
+
+
+def arquivo_esperado(arquivo: Path) -> Path:
+    return arquivo.with_name(arquivo.stem + '.esperado.json')
+
+
+def ler_json(arquivo: Path):
+    with open(arquivo, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def gravar_json(arquivo: Path, dados):
+    with open(arquivo, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def saida(parser, dados):
+    return [dia.como_dict() for dia in parser.processar(dados)]
+
+
+# ============================================================
+# Comandos
+# ============================================================
+
+def cmd_verificar(args) -> int:
+    parser = carregar_parser()
+    falhas = 0
+    for arquivo in arquivos_corpus():
+        esperado_path = arquivo_esperado(arquivo)
+        if not esperado_path.exists():
+            print(f"⚠️  {arquivo.name}: sem {esperado_path.name} (rode 'atualizar')")
+            falhas += 1
+            continue
+
+        obtido = saida(parser, ler_json(arquivo))
+        esperado = ler_json(esperado_path)
+        if obtido == esperado:
+            print(f"✅ {arquivo.name}: {len(obtido)} dias")
+            continue
+
+        falhas += 1
+        print(f"❌ {arquivo.name}: saída diferente da referência")
+        por_dia_obtido = {d['dia']: d for d in obtido}
+        por_dia_esperado = {d['dia']: d for d in esperado}
+        for dia in sorted(set(por_dia_obtido) | set(por_dia_esperado)):
+            if por_dia_obtido.get(dia) != por_dia_esperado.get(dia):
+                print(f"   dia {dia}:")
+                print(f"     esperado: {json.dumps(por_dia_esperado.get(dia), ensure_ascii=False)}")
+                print(f"     obtido:   {json.dumps(por_dia_obtido.get(dia), ensure_ascii=False)}")
+        if [d['dia'] for d in obtido] != [d['dia'] for d in esperado]:
+            print("   ordem dos dias diferente")
+
+    print(f"\n{'❌' if falhas else '✅'} {falhas} arquivo(s) com diferença")
+    return 1 if falhas else 0
+
+
+def cmd_atualizar(args) -> int:
+    parser = carregar_parser()
+    for arquivo in arquivos_corpus():
+        resultado = saida(parser, ler_json(arquivo))
+        gravar_json(arquivo_esperado(arquivo), resultado)
+        print(f"📝 {arquivo_esperado(arquivo).name}: {len(resultado)} dias")
+    return 0
+
+
+def cmd_benchmark(args) -> int:
+    parser = carregar_parser()
+    corpus = [(arquivo.name, ler_json(arquivo)) for arquivo in arquivos_corpus()]
+    if not corpus:
+        print(f"❌ Corpus vazio em {CORPUS_DIR}")
+        return 1
+
+    print(f"{'arquivo':<28}{'itens':>7}{'mediana µs':>13}{'mínimo µs':>12}{'itens/s':>12}")
+    total_itens = 0
+    total_mediana = 0.0
+    for nome, dados in corpus:
+        for _ in range(min(args.repeticoes, 10)):  # aquecimento
+            saida(parser, dados)
+        tempos = []
+        for _ in range(args.repeticoes):
+            inicio = time.perf_counter()
+            saida(parser, dados)
+            tempos.append(time.perf_counter() - inicio)
+        mediana = statistics.median(tempos)
+        total_itens += len(dados)
+        total_mediana += mediana
+        print(f"{nome:<28}{len(dados):>7}{mediana * 1e6:>13.1f}{min(tempos) * 1e6:>12.1f}"
+              f"{len(dados) / mediana:>12.0f}")
+
+    print(f"\n{len(corpus)} pautas, {total_itens} itens, {args.repeticoes} repetições: "
+          f"{total_mediana * 1e6:.1f} µs por passada no corpus ({total_itens / total_mediana:.0f} itens/s)")
+    return 0
+
+
+def cmd_gravar(args) -> int:
+    import requests
+    import urllib3
+    urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
+
+    CORPUS_DIR.mkdir(parents=True, exist_ok=True)
+    falhas = 0
+    for referencia in args.meses:
+        try:
+            ano, mes = (int(parte) for parte in referencia.split('-'))
+            url = URL_PAUTA.format(mes=mes, ano=ano)
+            resposta = requests.get(url, timeout=args.timeout, verify=False)
+            resposta.raise_for_status()
+            dados = resposta.json()
+        except Exception as e:
+            print(f"❌ {referencia}: {e}")
+            falhas += 1
+            continue
+        arquivo = CORPUS_DIR / f"pauta_{ano}_{mes:02d}.json"
+        gravar_json(arquivo, dados)
+        print(f"💾 {arquivo.name}: {len(dados)} itens")
+
+    if not falhas:
+        print("\n💡 Rode 'atualizar' e revise a saída esperada das pautas novas antes do commit")
+    return 1 if falhas else 0
+
+
+def main() -> int:
+    argumentos = argparse.ArgumentParser(description='Benchmark e saída de referência do parser da pauta TCE')
+    comandos = argumentos.add_subparsers(dest='comando', required=True)
+
+    comandos.add_parser('verificar', help='compara a saída do parser com os arquivos *.esperado.json')
+    comandos.add_parser('atualizar', help='regrava os arquivos *.esperado.json com a saída atual')
+
+    benchmark = comandos.add_parser('benchmark', help='mede o tempo do parser (até os dicts do SincronizadorTCE) por pauta')
+    benchmark.add_argument('-n', '--repeticoes', type=int, default=200)
+
+    gravar = comandos.add_parser('gravar', help='grava pautas da API do TCE no corpus')
+    gravar.add_argument('meses', nargs='+', metavar='AAAA-MM')
+    gravar.add_argument('--timeout', type=int, default=30)
+
+    args = argumentos.parse_args()
+    return {
+        'verificar': cmd_verificar,
+        'atualizar': cmd_atualizar,
+        'benchmark': cmd_benchmark,
+        'gravar': cmd_gravar
+    }[args.comando](args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())